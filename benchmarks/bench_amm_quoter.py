@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+"""
+Off-chain quote throughput: V2 paths and multi-tick V3 swaps, no RPC.
+
+"v2" sizes a two-hop V2 path over a grid of candidate inputs with
+``amounts_out_many``; "v3" quotes the same grid through a V3 pool whose
+liquidity is spread over many initialized ticks, so large sizes cross
+several of them. Both report quotes per second; each quote is bit-exact
+with what the contracts would return for the same state.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_amm_quoter.py [--paths 2000] [--sizes 16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from on1builder.engines.amm_quoter import (
+    Q96,
+    V3PoolState,
+    amounts_out_many,
+    quote_exact_input_many,
+)
+
+
+def size_grid(count: int) -> List[int]:
+    """Geometric grid from 0.01 to ~100 ETH."""
+    return [int(10**16 * 1.8**i) for i in range(count)]
+
+
+def build_v3_pool(rng: random.Random) -> V3PoolState:
+    ticks = {}
+    for i in range(1, 40):
+        liquidity = rng.randrange(10**17, 10**19)
+        ticks[-i * 60] = ticks.get(-i * 60, 0) + liquidity
+        ticks[i * 60] = ticks.get(i * 60, 0) - liquidity
+    return V3PoolState(
+        sqrt_price_x96=Q96,
+        tick=0,
+        liquidity=sum(v for t, v in ticks.items() if t < 0),
+        fee=3000,
+        tick_spacing=60,
+        ticks=ticks,
+    )
+
+
+def measure(name: str, fn: Callable[[int], List[int]], paths: int, sizes: int):
+    started = time.perf_counter()
+    for i in range(paths):
+        fn(i)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name:<4} {paths / elapsed:>10.0f} paths/s"
+        f" {paths * sizes / elapsed:>12.0f} quotes/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--paths", type=int, default=2000)
+    parser.add_argument("--sizes", type=int, default=16)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    grid = size_grid(args.sizes)
+    v2_paths = [
+        [
+            (rng.randrange(10**20, 10**23), rng.randrange(10**9, 10**13)),
+            (rng.randrange(10**9, 10**13), rng.randrange(10**20, 10**23)),
+        ]
+        for _ in range(64)
+    ]
+    v3_pools = [build_v3_pool(rng) for _ in range(8)]
+
+    measure(
+        "v2",
+        lambda i: amounts_out_many(grid, v2_paths[i % len(v2_paths)]),
+        args.paths,
+        args.sizes,
+    )
+    measure(
+        "v3",
+        lambda i: quote_exact_input_many(v3_pools[i % len(v3_pools)], i % 2 == 0, grid),
+        max(1, args.paths // 10),
+        args.sizes,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+"""
+Decode-rate benchmark for each calldata decoder plugin.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_calldata_decoders.py [--iterations 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Dict, List
+
+import eth_abi
+
+from on1builder.monitoring.selector_index import get_selector_index
+
+TOKEN_A = "0x" + "aa" * 20
+TOKEN_B = "0x" + "bb" * 20
+TOKEN_C = "0x" + "cc" * 20
+RECIPIENT = "0x" + "dd" * 20
+
+
+def _v3_path(token_in: str, fee: int, token_out: str) -> bytes:
+    return (
+        bytes.fromhex(token_in[2:])
+        + fee.to_bytes(3, "big")
+        + bytes.fromhex(token_out[2:])
+    )
+
+
+def sample_calldata() -> Dict[str, List[bytes]]:
+    """Representative calldata per decoder source."""
+    v2_swap = bytes.fromhex("38ed1739") + eth_abi.encode(
+        ["uint256", "uint256", "address[]", "address", "uint256"],
+        [10**18, 10**17, [TOKEN_A, TOKEN_B, TOKEN_C], RECIPIENT, 1],
+    )
+    v3_single = bytes.fromhex("414bf389") + eth_abi.encode(
+        ["(address,address,uint24,address,uint256,uint256,uint256,uint160)"],
+        [(TOKEN_A, TOKEN_B, 3000, RECIPIENT, 1, 10**18, 1, 0)],
+    )
+    inner = bytes.fromhex("04e45aaf") + eth_abi.encode(
+        ["(address,address,uint24,address,uint256,uint256,uint160)"],
+        [(TOKEN_A, TOKEN_C, 500, RECIPIENT, 10**18, 1, 0)],
+    )
+    multicall = bytes.fromhex("5ae401dc") + eth_abi.encode(
+        ["uint256", "bytes[]"], [1, [inner, bytes.fromhex("12210e8a")]]
+    )
+    ur_input = eth_abi.encode(
+        ["address", "uint256", "uint256", "bytes", "bool"],
+        [RECIPIENT, 10**18, 1, _v3_path(TOKEN_A, 500, TOKEN_B), True],
+    )
+    universal = bytes.fromhex("3593564c") + eth_abi.encode(
+        ["bytes", "bytes[]", "uint256"], [bytes([0x00]), [ur_input], 1]
+    )
+    oneinch = bytes.fromhex("12aa3caf") + eth_abi.encode(
+        [
+            "address",
+            "(address,address,address,address,uint256,uint256,uint256)",
+            "bytes",
+            "bytes",
+        ],
+        [RECIPIENT, (TOKEN_A, TOKEN_B, RECIPIENT, RECIPIENT, 10**18, 1, 0), b"", b""],
+    )
+    return {
+        "abi": [v2_swap, v3_single],
+        "uniswap_swap_router": [multicall],
+        "uniswap_universal_router": [universal],
+        "aggregators": [oneinch],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    index = get_selector_index()
+    print(f"{'decoder':<26} {'decodes/s':>12} {'us/decode':>10}")
+    for source, samples in sample_calldata().items():
+        entries = [(index.lookup(calldata), calldata) for calldata in samples]
+        decoded = 0
+        started = time.perf_counter()
+        for i in range(args.iterations):
+            entry, calldata = entries[i % len(entries)]
+            if entry.decoder(calldata[4:], 0):
+                decoded += 1
+        elapsed = time.perf_counter() - started
+        assert decoded == args.iterations, f"{source} failed to decode samples"
+        rate = args.iterations / elapsed
+        print(f"{source:<26} {rate:>12,.0f} {1e6 / rate:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
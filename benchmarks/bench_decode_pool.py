@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+"""
+Scaling benchmark: TxPoolScanner throughput with calldata decoded in the
+event loop versus the sharded DecodePool with 1..N worker processes.
+
+Full transaction bodies are pushed through ``submit_pending`` in bursts and
+drained by the scanner's ingest workers, so the pool only sees the batches
+the scanner actually hands it. Besides wall-clock throughput it reports the
+CPU time the main (event loop) process spends per transaction, which is what
+the pool is meant to free up, and the average transactions per shard
+round-trip.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_decode_pool.py [--txs 50000] [--max-processes 4] [--burst 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from bench_calldata_decoders import sample_calldata
+
+from on1builder.config.loaders import settings
+from on1builder.monitoring.mempool_replay import OpportunitySink, ReplayWeb3
+from on1builder.monitoring.txpool_scanner import TxPoolScanner
+
+CHAIN_ID = 1
+
+
+def build_corpus(count: int) -> List[Dict[str, Any]]:
+    samples = [calldata for group in sample_calldata().values() for calldata in group]
+    return [
+        {
+            "hash": os.urandom(32),
+            "from": "0x" + os.urandom(20).hex(),
+            "nonce": 0,
+            "to": "0x" + os.urandom(20).hex(),
+            "value": 10**18,
+            "gas": 250_000,
+            "gasPrice": 10**9,
+            "input": samples[i % len(samples)],
+        }
+        for i in range(count)
+    ]
+
+
+def report(
+    name: str, count: int, wall: float, cpu: float, baseline: float, batch: str
+) -> float:
+    rate = count / wall
+    print(
+        f"{name:<14} {rate:>12,.0f} {1e6 * cpu / count:>14.1f} "
+        f"{rate / baseline if baseline else 1.0:>8.2f}x {batch:>10}"
+    )
+    return rate
+
+
+async def run_scanner(
+    processes: int, corpus: List[Dict[str, Any]], batch_size: int, burst: int
+) -> Tuple[float, float, Optional[float]]:
+    settings.txpool_chain_overrides = {
+        CHAIN_ID: {
+            "txpool_decode_processes": processes,
+            "txpool_decode_batch_size": batch_size,
+            "txpool_ingest_queue_size": len(corpus) + burst,
+            "txpool_load_shedding": False,
+        }
+    }
+    scanner = TxPoolScanner(ReplayWeb3([], CHAIN_ID), OpportunitySink(), CHAIN_ID)
+    await scanner.start(subscribe=False)
+    try:
+        # Spawn workers and build their selector indexes outside the timed region
+        for tx in build_corpus(processes * batch_size * 2):
+            scanner.submit_pending(tx)
+        await scanner.wait_idle()
+        warmup = scanner._decode_pool.get_stats() if scanner._decode_pool else None
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        for start in range(0, len(corpus), burst):
+            for tx in corpus[start : start + burst]:
+                scanner.submit_pending(tx)
+            # Let the workers run between bursts
+            await asyncio.sleep(0)
+        await scanner.wait_idle()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    finally:
+        await scanner.stop()
+
+    avg_batch = None
+    if warmup is not None:
+        stats = scanner._decode_pool.get_stats()
+        batches = stats["batches"] - warmup["batches"]
+        avg_batch = (stats["items"] - warmup["items"]) / batches if batches else 0.0
+    return wall, cpu, avg_batch
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--txs", type=int, default=50_000)
+    parser.add_argument("--max-processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--burst", type=int, default=1000)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.txs)
+    burst = max(1, args.burst)
+    print(f"Scanning {len(corpus):,} transactions in bursts of {burst:,}")
+    print(
+        f"{'stage':<14} {'tx/s':>12} {'loop cpu us/tx':>14} {'speedup':>9} "
+        f"{'avg batch':>10}"
+    )
+
+    wall, cpu, _ = asyncio.run(run_scanner(0, corpus, args.batch_size, burst))
+    baseline = report("in-loop", len(corpus), wall, cpu, 0.0, "-")
+
+    for processes in range(1, args.max_processes + 1):
+        wall, cpu, avg_batch = asyncio.run(
+            run_scanner(processes, corpus, args.batch_size, burst)
+        )
+        report(
+            f"{processes} process(es)",
+            len(corpus),
+            wall,
+            cpu,
+            baseline,
+            f"{avg_batch:.1f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
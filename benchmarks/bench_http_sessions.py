@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+"""
+Per-call relay/simulation HTTP latency: a new session per call vs pooled keep-alive.
+
+A local aiohttp server stands in for a relay or fork RPC and answers every
+JSON-RPC POST immediately. "cold" opens a fresh ``aiohttp.ClientSession``
+per call, as the transaction path used to; "warm" reuses the
+``HttpSessionPool`` session for the host. Both report per-call latency
+percentiles and how many TCP connections the server saw. The server is
+plain HTTP on loopback, so real relays (TLS, network RTT) widen the gap.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_http_sessions.py [--calls 500] [--concurrency 1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Set
+
+import aiohttp
+from aiohttp import web
+
+from on1builder.utils.http_session_pool import HttpSessionPool
+from on1builder.utils.latency_tracker import percentile
+
+PAYLOAD = {"jsonrpc": "2.0", "id": 1, "method": "eth_sendBundle", "params": []}
+
+
+async def start_server(peers: Set[int]) -> web.AppRunner:
+    async def rpc(request: web.Request) -> web.Response:
+        peers.add(request.transport.get_extra_info("peername")[1])
+        await request.read()
+        return web.json_response({"jsonrpc": "2.0", "id": 1, "result": "0x1"})
+
+    app = web.Application()
+    app.router.add_post("/", rpc)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+async def measure(
+    name: str,
+    call: Callable[[], Awaitable[None]],
+    calls: int,
+    concurrency: int,
+    peers: Set[int],
+) -> None:
+    peers.clear()
+    latencies: List[float] = []
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with gate:
+            started = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(calls)))
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name:<5} p50 {percentile(latencies, 50):>7.3f} ms"
+        f"  p90 {percentile(latencies, 90):>7.3f} ms"
+        f"  max {max(latencies):>7.3f} ms"
+        f"  {calls / elapsed:>8.0f} calls/s"
+        f"  {len(peers):>5} connections"
+    )
+
+
+async def run(calls: int, concurrency: int) -> None:
+    peers: Set[int] = set()
+    runner = await start_server(peers)
+    port = runner.addresses[0][1]
+    url = f"http://127.0.0.1:{port}/"
+    pool = HttpSessionPool()
+
+    async def cold() -> None:
+        async with aiohttp.ClientSession() as session:
+            async with session.post(url, json=PAYLOAD) as resp:
+                await resp.json()
+
+    async def warm() -> None:
+        async with pool.session(url).post(url, json=PAYLOAD) as resp:
+            await resp.json()
+
+    try:
+        # One untimed call each so imports and the server are warmed up
+        await cold()
+        await warm()
+        await measure("cold", cold, calls, concurrency, peers)
+        await measure("warm", warm, calls, concurrency, peers)
+    finally:
+        await pool.close()
+        await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, max(1, args.concurrency)))
+
+
+if __name__ == "__main__":
+    main()
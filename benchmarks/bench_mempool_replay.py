@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+"""
+Replay a recorded mempool stream through TxPoolScanner with no network.
+
+Record a live stream by setting TXPOOL_RECORD_PATH, or synthesize one:
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_mempool_replay.py --synthesize 20000 mempool.bin
+    PYTHONPATH=src python benchmarks/bench_mempool_replay.py mempool.bin [--speed max|1|10] [--mode full|hashes]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+import eth_abi
+
+from on1builder.monitoring.mempool_recorder import MempoolRecorder, load_records
+from on1builder.monitoring.mempool_replay import MempoolReplayer
+
+V2_ROUTER = "0x7a250d5630b4cf539739df2c5dacb4c659f2488d"
+TOKENS = ["0x" + f"{i:02x}" * 20 for i in range(1, 6)]
+
+
+def synthesize(path: str, count: int, chain_id: int, rate: float, seed: int = 11):
+    """Write a synthetic stream: ~30% V2 router swaps, the rest plain transfers."""
+    rng = random.Random(seed)
+    recorder = MempoolRecorder(path, chain_id)
+    arrival = time.time()
+    for nonce in range(count):
+        arrival += rng.expovariate(rate)
+        tx = {
+            "hash": os.urandom(32),
+            "from": "0x" + os.urandom(20).hex(),
+            "nonce": nonce,
+            "gas": 250_000,
+            "gasPrice": rng.randint(5, 80) * 10**9,
+            "value": rng.randint(0, 20) * 10**18,
+        }
+        if rng.random() < 0.3:
+            path_tokens = rng.sample(TOKENS, 2)
+            tx["to"] = V2_ROUTER
+            tx["input"] = bytes.fromhex("38ed1739") + eth_abi.encode(
+                ["uint256", "uint256", "address[]", "address", "uint256"],
+                [tx["value"] or 10**18, 1, path_tokens, tx["from"], 2**32],
+            )
+        else:
+            tx["to"] = "0x" + os.urandom(20).hex()
+            tx["input"] = b""
+        recorder.record(tx, arrival)
+    recorder.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("recording")
+    parser.add_argument("--synthesize", type=int, metavar="N")
+    parser.add_argument("--chain-id", type=int, default=1)
+    parser.add_argument("--rate", type=float, default=200.0, help="synthetic tx/s")
+    parser.add_argument("--speed", default="max", help="max, or a multiplier")
+    parser.add_argument("--mode", choices=MempoolReplayer.MODES, default="full")
+    args = parser.parse_args()
+
+    if args.synthesize:
+        synthesize(args.recording, args.synthesize, args.chain_id, args.rate)
+        print(f"Wrote {args.synthesize:,} synthetic transactions to {args.recording}")
+        return
+
+    records = load_records(args.recording)
+    speed = None if args.speed == "max" else float(args.speed)
+    report = asyncio.run(MempoolReplayer(records, speed, args.mode).run())
+
+    latency = report["analysis_latency"]
+    decision = report["decision_latency"]
+    print(f"records          {report['records']:>10,}")
+    print(f"processed        {report['processed']:>10,}   shed={report['shed']}")
+    print(f"throughput       {report['tx_per_s']:>10,.0f} tx/s")
+    print(
+        f"decode latency   p50={latency['p50_ms']:.3f}ms "
+        f"p90={latency['p90_ms']:.3f}ms p99={latency['p99_ms']:.3f}ms"
+    )
+    print(
+        f"decision latency p50={decision['p50_ms']:.3f}ms "
+        f"p90={decision['p90_ms']:.3f}ms p99={decision['p99_ms']:.3f}ms"
+    )
+    print(
+        f"opportunities    {report['opportunities']:>10,}   "
+        f"{report['opportunities_by_strategy']}"
+    )
+    load = report["load_shedding"]
+    if load:
+        print(
+            f"load shedding    {load['shed']:>10,}   mode={load['mode']} "
+            f"transitions={load['transitions']} "
+            f"utilization={load['utilization']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+"""
+Micro-benchmark: per-transaction classification cost of the legacy regex
+MEV_PATTERNS scan versus the 4-byte selector index.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_selector_index.py [--txs 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import re
+import time
+from typing import List, Tuple
+
+import eth_abi
+
+from on1builder.monitoring.selector_index import get_selector_index
+
+# Patterns as they were applied to hex calldata before the selector index
+LEGACY_MEV_PATTERNS = {
+    "sandwich_attack": re.compile(
+        r"swapExactTokensForTokens|swapTokensForExactTokens", re.IGNORECASE
+    ),
+    "arbitrage": re.compile(r"multicall|batchSwap", re.IGNORECASE),
+    "liquidation": re.compile(r"liquidate|seize", re.IGNORECASE),
+    "flash_loan": re.compile(r"flashLoan|flashSwap", re.IGNORECASE),
+}
+
+
+def build_corpus(count: int, seed: int = 7) -> List[bytes]:
+    """Mix of router swaps, token transfers and opaque calldata."""
+    rng = random.Random(seed)
+    swap_args = eth_abi.encode(
+        ["uint256", "uint256", "address[]", "address", "uint256"],
+        [10**18, 10**17, ["0x" + "11" * 20, "0x" + "22" * 20], "0x" + "33" * 20, 1],
+    )
+    transfer_args = eth_abi.encode(["address", "uint256"], ["0x" + "44" * 20, 5])
+    templates = [
+        bytes.fromhex("38ed1739") + swap_args,
+        bytes.fromhex("8803dbee") + swap_args,
+        bytes.fromhex("a9059cbb") + transfer_args,
+        bytes.fromhex("ac9650d8") + os.urandom(320),
+        os.urandom(4) + os.urandom(rng.choice([64, 256, 1024])),
+    ]
+    return [rng.choice(templates) for _ in range(count)]
+
+
+def classify_legacy(calldata: bytes):
+    input_hex = "0x" + calldata.hex()
+    for mev_type, pattern in LEGACY_MEV_PATTERNS.items():
+        if pattern.search(input_hex):
+            return mev_type
+    return None
+
+
+def make_classify_indexed():
+    index = get_selector_index()
+
+    def classify(calldata: bytes):
+        entry = index.lookup(calldata)
+        return entry.mev_type if entry else None
+
+    return classify
+
+
+def run(name: str, fn, corpus: List[bytes]) -> Tuple[float, int]:
+    started = time.perf_counter()
+    hits = sum(1 for calldata in corpus if fn(calldata))
+    elapsed = time.perf_counter() - started
+    per_tx_ns = elapsed / len(corpus) * 1e9
+    print(f"{name:<16} {per_tx_ns:>10.0f} ns/tx   classified={hits}")
+    return per_tx_ns, hits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--txs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.txs)
+    print(f"Classifying {len(corpus)} transactions")
+    legacy_ns, _ = run("regex (legacy)", classify_legacy, corpus)
+    indexed_ns, _ = run("selector index", make_classify_indexed(), corpus)
+    print(f"speedup          {legacy_ns / indexed_ns:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+"""
+Per-swap calldata build time: web3 contract objects versus precomputed encoders.
+
+"contract" mirrors the old TransactionManager path for a token->token V2
+swap: a router contract and two ERC-20 contracts built from their ABIs, the
+balanceOf/allowance reads and the swap call encoded through them. "encoder"
+is the same work through the selector/argument encoders in
+``on1builder.core.call_encoders``. Both produce identical bytes.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_swap_calldata.py [--swaps 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from web3 import AsyncWeb3, Web3
+
+from on1builder.core.call_encoders import ALLOWANCE, BALANCE_OF, encode_v2_swap
+
+ABI_DIR = (
+    Path(__file__).resolve().parents[1] / "src" / "on1builder" / "resources" / "abi"
+)
+ROUTER = "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+DAI = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
+ME = Web3.to_checksum_address("0x" + "ab" * 20)
+
+
+def load_abis() -> Dict[str, List[dict]]:
+    return {
+        name: json.loads((ABI_DIR / f"{name}.json").read_text())
+        for name in ("uniswap_abi", "erc20_abi")
+    }
+
+
+def build_with_contracts(web3: AsyncWeb3, abis: Dict[str, List[dict]], i: int):
+    router = web3.eth.contract(address=ROUTER, abi=abis["uniswap_abi"])
+    token = web3.eth.contract(address=USDC, abi=abis["erc20_abi"])
+    balance_call = token.functions.balanceOf(ME)._encode_transaction_data()
+    token = web3.eth.contract(address=USDC, abi=abis["erc20_abi"])
+    allowance_call = token.functions.allowance(ME, ROUTER)._encode_transaction_data()
+    swap = router.functions.swapExactTokensForTokens(
+        10**18 + i, 10**6, [USDC, WETH, DAI], ME, 1_700_000_000
+    )._encode_transaction_data()
+    return balance_call, allowance_call, swap
+
+
+def build_with_encoders(i: int):
+    balance_call = BALANCE_OF.encode_hex(ME)
+    allowance_call = ALLOWANCE.encode_hex(ME, ROUTER)
+    data, _ = encode_v2_swap(
+        [USDC, WETH, DAI], 10**18 + i, 10**6, ME, 1_700_000_000, WETH.lower()
+    )
+    return balance_call, allowance_call, "0x" + data.hex()
+
+
+def measure(name: str, fn: Callable[[int], tuple], swaps: int) -> float:
+    started = time.perf_counter()
+    for i in range(swaps):
+        fn(i)
+    per_swap_us = (time.perf_counter() - started) / swaps * 1e6
+    print(f"{name:<10} {per_swap_us:>12.1f} µs/swap")
+    return per_swap_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--swaps", type=int, default=5000)
+    args = parser.parse_args()
+
+    web3 = AsyncWeb3()
+    abis = load_abis()
+    assert build_with_contracts(web3, abis, 0) == build_with_encoders(0)
+
+    before = measure(
+        "contract", lambda i: build_with_contracts(web3, abis, i), args.swaps
+    )
+    after = measure("encoder", build_with_encoders, args.swaps)
+    print(f"speedup    {before / after:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
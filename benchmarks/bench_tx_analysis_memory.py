@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+"""
+Memory benchmark: bytes per cached transaction analysis for the legacy
+20-key dict versus the slotted TxAnalysis record.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_tx_analysis_memory.py [--entries 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+import eth_abi
+
+from on1builder.monitoring.tx_analysis import TxAnalysis
+
+SWAP_ARGS = eth_abi.encode(
+    ["uint256", "uint256", "address[]", "address", "uint256"],
+    [10**18, 10**17, ["0x" + "11" * 20, "0x" + "22" * 20], "0x" + "33" * 20, 1],
+)
+CALLDATA = bytes.fromhex("38ed1739") + SWAP_ARGS
+SENDER = "0x" + "44" * 20
+ROUTER = "0x7a250d5630b4cf539739df2c5dacb4c659f2488d"
+
+
+def _swap_intent() -> Dict[str, Any]:
+    return {
+        "path": ["0x" + "11" * 20, "0x" + "22" * 20],
+        "amount_in": 10**18,
+        "amount_out_min": 10**17,
+        "fees": None,
+        "pool_fee": None,
+        "recipient": "0x" + "33" * 20,
+        "deadline": 1,
+        "dex": None,
+        "legs": 1,
+        "mev_type": None,
+    }
+
+
+def legacy_entry(i: int) -> Dict[str, Any]:
+    """Analysis dict as built before TxAnalysis."""
+    tx_hash = os.urandom(32).hex()
+    intent = _swap_intent()
+    return {
+        "tx_hash": tx_hash,
+        "hash": tx_hash,
+        "from": SENDER,
+        "to": ROUTER,
+        "value_eth": float(i) / 1000,
+        "value_wei": i * 10**15,
+        "gas_price": 30 * 10**9 + i,
+        "gasPrice": 30 * 10**9 + i,
+        "gas_limit": 250_000,
+        "timestamp": datetime.now(),
+        "input_data": "0x" + CALLDATA.hex(),
+        "mev_type": "sandwich_attack",
+        "target_dex": "uniswap_v2",
+        "estimated_profit_potential": 0.01,
+        "risk_score": 0.5,
+        "swap_path": intent["path"],
+        "amount_in": intent["amount_in"],
+        "amount_out_min": intent["amount_out_min"],
+        "pool_fee": None,
+        "fees": None,
+        "swap_intent": intent,
+        "priority_score": 0.9,
+    }
+
+
+def slotted_entry(i: int) -> TxAnalysis:
+    return TxAnalysis(
+        tx_hash=os.urandom(32),
+        sender=SENDER,
+        to=ROUTER,
+        value_wei=i * 10**15,
+        gas_price=30 * 10**9 + i,
+        gas_limit=250_000,
+        calldata=CALLDATA,
+        observed_at=time.monotonic(),
+        mev_type="sandwich_attack",
+        target_dex="uniswap_v2",
+        swap_intent=_swap_intent(),
+        priority_score=0.9,
+        estimated_profit_potential=0.01,
+        risk_score=0.5,
+    )
+
+
+def measure(factory: Callable[[int], Any], entries: int) -> float:
+    """Return traced bytes per retained entry."""
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    retained: List[Any] = [factory(i) for i in range(entries)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(retained) == entries
+    return (current - baseline) / entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # Calldata is shared by every entry here; real cache entries each hold
+    # their own copy, which the legacy layout doubles via the hex string.
+    print(f"Retaining {args.entries:,} analyses")
+    legacy = measure(legacy_entry, args.entries)
+    slotted = measure(slotted_entry, args.entries)
+    print(f"{'dict (legacy)':<16} {legacy:>10,.0f} bytes/entry")
+    print(f"{'TxAnalysis':<16} {slotted:>10,.0f} bytes/entry")
+    print(f"{'saving':<16} {1 - slotted / legacy:>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
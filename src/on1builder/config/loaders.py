@@ -70,6 +70,8 @@ class _EnvSettings(BaseSettings):
     # Transaction settings
     transaction_retry_count: int = 3
     transaction_retry_delay: float = 2.0
+    nonce_gap_grace_blocks: int = 3
+    nonce_gap_fill: bool = False
     max_gas_price_gwei: int = 200
     gas_price_multiplier: float = 1.1
     default_gas_limit: int = 500000
@@ -78,12 +80,20 @@ class _EnvSettings(BaseSettings):
     submission_mode: str = "public"
     simulation_backend: str = "eth_call"
     simulation_concurrency: int = 5
+    multicall_enabled: bool = True
+    multicall_address: str = "0xcA11bde05977b3631167028862bE2a173976CA11"
+    multicall_window_ms: float = 2.0
+    multicall_max_batch_size: int = 100
+    pool_cache_enabled: bool = True
+    pool_cache_max_pools: int = 5000
     private_rpc_url: Optional[str] = None
+    private_rpc_urls: str = ""
     tenderly_base_url: str = "https://api.tenderly.co/api/v1"
     tenderly_account_slug: Optional[str] = None
     tenderly_project_slug: Optional[str] = None
     tenderly_access_token: Optional[str] = None
     bundle_relay_url: Optional[str] = None
+    bundle_relay_urls: str = ""
     bundle_relay_auth_token: Optional[str] = None
     bundle_signer_key: Optional[str] = Field(default=None, alias="BUNDLE_SIGNER_KEY")
     bundle_signer_key_path: Path = Field(
@@ -92,6 +102,10 @@ class _EnvSettings(BaseSettings):
     )
     bundle_target_block_offset: int = 1
     bundle_timeout_seconds: int = 30
+    bundle_target_blocks: int = 3
+    http_pool_limit_per_host: int = 16
+    http_keepalive_seconds: float = 30.0
+    http_dns_cache_seconds: int = 300
     allow_insufficient_funds_tests: bool = Field(
         False, alias="ALLOW_INSUFFICIENT_FUNDS_TESTS"
     )
@@ -157,6 +171,30 @@ class _EnvSettings(BaseSettings):
     back_running_enabled: bool = True
     sandwich_attacks_enabled: bool = False
 
+    # Mempool scanner ingest
+    txpool_ingest_queue_size: int = 10000
+    txpool_ingest_workers: int = 8
+    txpool_shed_policy: str = "drop_oldest"
+    txpool_subscription_mode: str = "auto"
+    txpool_fetch_batch_size: int = 50
+    txpool_fetch_linger_ms: float = 5.0
+    txpool_chain_overrides: str = Field("{}", alias="TXPOOL_CHAIN_OVERRIDES")
+    txpool_websocket_urls: str = Field("{}", alias="TXPOOL_WEBSOCKET_URLS")
+    txpool_fanin_dedup_size: int = 50000
+    txpool_fanin_window_s: float = 30.0
+    txpool_decode_processes: int = 0
+    txpool_decode_batch_size: int = 64
+    txpool_decode_linger_ms: float = 2.0
+    txpool_state_max_entries: int = 50000
+    txpool_state_max_per_sender: int = 16
+    txpool_max_concurrent_executions: int = 2
+    txpool_opportunity_queue_size: int = 1000
+    txpool_load_shedding: bool = True
+    txpool_shed_enter_utilization: float = 0.9
+    txpool_shed_exit_utilization: float = 0.6
+    txpool_shed_min_value_eth: float = 1.0
+    txpool_record_path: Optional[str] = None
+
     # Risk management
     max_position_size_percent: float = 20.0
     daily_loss_limit_percent: float = 5.0
@@ -200,7 +238,7 @@ class _EnvSettings(BaseSettings):
     oracle_stale_seconds: int = Field(3600, alias="ORACLE_STALE_SECONDS")
 
 
-def _parse_json_env(value: Any, default: Any) -> Any:
+def _parse_json_env(value: Any, default: Any, name: str = "ORACLE_FEEDS") -> Any:
     if isinstance(value, dict):
         return value
     if isinstance(value, str):
@@ -211,7 +249,7 @@ def _parse_json_env(value: Any, default: Any) -> Any:
             try:
                 return json.loads(stripped)
             except json.JSONDecodeError:
-                logger.warning("Invalid JSON for ORACLE_FEEDS; using defaults.")
+                logger.warning(f"Invalid JSON for {name}; using defaults.")
                 return default
     return default
 
@@ -311,6 +349,12 @@ def load_settings(env_path: Optional[Path] = None) -> GlobalSettings:
     final_config_data = env_settings.model_dump()
     final_config_data.update(_gather_dynamic_env_vars())
     final_config_data["oracle_feeds"] = _parse_json_env(env_settings.oracle_feeds, {})
+    final_config_data["txpool_chain_overrides"] = _parse_json_env(
+        env_settings.txpool_chain_overrides, {}, "TXPOOL_CHAIN_OVERRIDES"
+    )
+    final_config_data["txpool_websocket_urls"] = _parse_json_env(
+        env_settings.txpool_websocket_urls, {}, "TXPOOL_WEBSOCKET_URLS"
+    )
 
     # Populate nested models
     final_config_data["api"] = api_settings
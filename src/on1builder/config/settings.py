@@ -120,6 +120,16 @@ class GlobalSettings(BaseModel):
             return chain_ids
         return v
 
+    @field_validator("private_rpc_urls", "bundle_relay_urls", mode="before")
+    @classmethod
+    def split_urls(cls, v):
+        """Split comma-separated endpoint URLs."""
+        if v is None:
+            return []
+        if isinstance(v, str):
+            return [item.strip() for item in v.split(",") if item.strip()]
+        return v
+
     @field_validator("wallet_address", mode="after")
     @classmethod
     def validate_wallet_address(cls, v):
@@ -235,6 +245,15 @@ class GlobalSettings(BaseModel):
     # Transaction & Gas
     transaction_retry_count: int = Field(default=3, gt=0)
     transaction_retry_delay: float = Field(default=2.0, gt=0)
+    nonce_gap_grace_blocks: int = Field(
+        default=3,
+        gt=0,
+        description="Blocks a broadcast nonce may be missing from the node's pending count before it is treated as dropped.",
+    )
+    nonce_gap_fill: bool = Field(
+        default=False,
+        description="Close nonce gaps that block later transactions with no-op self-transfers.",
+    )
     max_gas_price_gwei: int = Field(default=200, gt=0)
     gas_price_multiplier: float = Field(default=1.1, gt=0)
     default_gas_limit: int = Field(default=500000, ge=21000)
@@ -249,6 +268,29 @@ class GlobalSettings(BaseModel):
     simulation_concurrency: int = Field(
         default=5, description="Maximum concurrent simulations in the pipeline."
     )
+    multicall_enabled: bool = Field(
+        default=True,
+        description="Coalesce independent eth_call reads into Multicall3 aggregate3.",
+    )
+    multicall_address: str = Field(
+        default="0xcA11bde05977b3631167028862bE2a173976CA11",
+        description="Multicall3 contract address.",
+    )
+    multicall_window_ms: float = Field(
+        default=2.0,
+        ge=0,
+        description="How long reads are held to coalesce into one multicall.",
+    )
+    multicall_max_batch_size: int = Field(
+        default=100, gt=0, description="Maximum calls per aggregate3 batch."
+    )
+    pool_cache_enabled: bool = Field(
+        default=True,
+        description="Keep pool reserves hot from Sync/Swap/Mint/Burn logs and quote locally.",
+    )
+    pool_cache_max_pools: int = Field(
+        default=5000, gt=0, description="Maximum pools tracked by the reserve cache."
+    )
     submission_mode: str = Field(
         default="public",
         description="Transaction submission mode: public, private, or bundle (MEV-Boost/Flashbots).",
@@ -257,6 +299,10 @@ class GlobalSettings(BaseModel):
         default=None,
         description="Optional private RPC endpoint (e.g., Flashbots Protect) used when submission_mode=private.",
     )
+    private_rpc_urls: List[str] = Field(
+        default_factory=list,
+        description="Additional private RPC endpoints; private transactions are sent to all of them at once.",
+    )
     tenderly_base_url: str = Field(
         default="https://api.tenderly.co/api/v1",
         description="Tenderly API base URL for simulation.",
@@ -274,8 +320,13 @@ class GlobalSettings(BaseModel):
         default=None,
         description="MEV-Boost/Flashbots bundle relay URL when submission_mode=bundle.",
     )
+    bundle_relay_urls: List[str] = Field(
+        default_factory=list,
+        description="Additional bundle relays/builders; bundles are sent to all of them at once.",
+    )
     bundle_relay_auth_token: Optional[str] = Field(
-        default=None, description="Auth token if required by the bundle relay."
+        default=None,
+        description="Auth token if required by the bundle relay (sent to bundle_relay_url only).",
     )
     bundle_signer_key: Optional[str] = Field(
         default=None,
@@ -291,6 +342,26 @@ class GlobalSettings(BaseModel):
     bundle_timeout_seconds: int = Field(
         default=30, description="Max seconds to keep bundle valid."
     )
+    bundle_target_blocks: int = Field(
+        default=3,
+        gt=0,
+        description="Consecutive blocks a signed bundle is re-submitted for until it lands or is invalidated.",
+    )
+    http_pool_limit_per_host: int = Field(
+        default=16,
+        gt=0,
+        description="Max pooled connections per relay/simulation host.",
+    )
+    http_keepalive_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Idle time before a pooled relay/simulation connection is closed.",
+    )
+    http_dns_cache_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="How long resolved relay/simulation hostnames are cached (0 disables).",
+    )
     fallback_gas_price_gwei: int = Field(default=50, gt=0)
     min_wallet_balance: float = Field(default=0.05, ge=0)
     allow_insufficient_funds_tests: bool = Field(
@@ -389,6 +460,116 @@ class GlobalSettings(BaseModel):
         default=False
     )  # Requires careful consideration
 
+    # Mempool scanner ingest
+    txpool_ingest_queue_size: int = Field(
+        default=10000,
+        gt=0,
+        description="Max pending transactions buffered between the websocket and the scanner workers.",
+    )
+    txpool_ingest_workers: int = Field(
+        default=8, gt=0, description="Consumer coroutines draining the ingest queue."
+    )
+    txpool_shed_policy: str = Field(
+        default="drop_oldest",
+        description="Load shedding when the ingest queue is full: drop_oldest or drop_newest.",
+    )
+    txpool_subscription_mode: str = Field(
+        default="auto",
+        description="Pending tx feed: auto (full bodies when supported), full, or hashes.",
+    )
+    txpool_fetch_batch_size: int = Field(
+        default=50,
+        gt=0,
+        description=(
+            "Max hashes per eth_getTransactionByHash JSON-RPC batch, and max queued "
+            "txs an ingest worker takes at once (1 disables batching)."
+        ),
+    )
+    txpool_fetch_linger_ms: float = Field(
+        default=5.0,
+        ge=0,
+        description=(
+            "How long a single-hash fetch waits to fill a batch; ingest batches "
+            "are sent at once."
+        ),
+    )
+    txpool_chain_overrides: Dict[int, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Per-chain overrides for txpool_* settings (chain_id -> setting -> value).",
+    )
+    txpool_websocket_urls: Dict[int, List[str]] = Field(
+        default_factory=dict,
+        description="Extra websocket endpoints per chain whose pending feeds are merged with the primary one.",
+    )
+    txpool_fanin_dedup_size: int = Field(
+        default=50000,
+        gt=0,
+        description="Recent tx hashes remembered for first-seen dedup across endpoints.",
+    )
+    txpool_fanin_window_s: float = Field(
+        default=30.0,
+        gt=0,
+        description="How long a hash stays in the fan-in dedup set.",
+    )
+    txpool_decode_processes: int = Field(
+        default=0,
+        ge=0,
+        description="Worker processes for off-loop calldata decoding, sharded by tx hash (0 decodes in the event loop).",
+    )
+    txpool_decode_batch_size: int = Field(
+        default=64,
+        gt=0,
+        description="Max transactions per decode worker round-trip.",
+    )
+    txpool_decode_linger_ms: float = Field(
+        default=2.0,
+        ge=0,
+        description="How long a decode shard waits to fill a batch.",
+    )
+    txpool_state_max_entries: int = Field(
+        default=50000,
+        gt=0,
+        description="Pending (sender, nonce) slots tracked for replacement and inclusion detection.",
+    )
+    txpool_state_max_per_sender: int = Field(
+        default=16,
+        gt=0,
+        description="Pending nonces tracked per sender in the mempool state.",
+    )
+    txpool_max_concurrent_executions: int = Field(
+        default=2,
+        gt=0,
+        description="Opportunities executed concurrently per chain by the scanner's scheduler.",
+    )
+    txpool_opportunity_queue_size: int = Field(
+        default=1000,
+        gt=0,
+        description="Max opportunities waiting for execution; the lowest-ranked one is shed when full.",
+    )
+    txpool_load_shedding: bool = Field(
+        default=True,
+        description="Switch the scanner to a degraded mode when analysis cannot keep up with the pending rate.",
+    )
+    txpool_shed_enter_utilization: float = Field(
+        default=0.9,
+        gt=0,
+        description="Analysis utilization (arrival rate x per-tx cost) above which degraded mode starts.",
+    )
+    txpool_shed_exit_utilization: float = Field(
+        default=0.6,
+        gt=0,
+        description="Analysis utilization below which degraded mode ends.",
+    )
+    txpool_shed_min_value_eth: float = Field(
+        default=1.0,
+        ge=0,
+        description="Transactions at or above this value are still analysed in degraded mode.",
+    )
+    txpool_record_path: Optional[str] = Field(
+        default=None,
+        description="Append the pending tx stream to this file for offline replay ({chain_id} is substituted).",
+    )
+
     # Risk management
     max_position_size_percent: float = Field(
         default=20.0, gt=0, le=100
@@ -533,6 +533,54 @@ class ConfigValidator:
                     field="simulation_concurrency",
                     value=config_dict.get("simulation_concurrency"),
                 )
+            if config_dict.get("txpool_shed_policy", "drop_oldest") not in (
+                "drop_oldest",
+                "drop_newest",
+            ):
+                raise ValidationError(
+                    "txpool_shed_policy must be 'drop_oldest' or 'drop_newest'",
+                    field="txpool_shed_policy",
+                    value=config_dict.get("txpool_shed_policy"),
+                )
+            if config_dict.get("txpool_subscription_mode", "auto") not in (
+                "auto",
+                "full",
+                "hashes",
+            ):
+                raise ValidationError(
+                    "txpool_subscription_mode must be 'auto', 'full' or 'hashes'",
+                    field="txpool_subscription_mode",
+                    value=config_dict.get("txpool_subscription_mode"),
+                )
+            if (
+                "txpool_ingest_workers" in config_dict
+                and config_dict["txpool_ingest_workers"] <= 0
+            ):
+                raise ValidationError(
+                    "txpool_ingest_workers must be > 0",
+                    field="txpool_ingest_workers",
+                    value=config_dict.get("txpool_ingest_workers"),
+                )
+            for chain_id, urls in (
+                config_dict.get("txpool_websocket_urls") or {}
+            ).items():
+                if not isinstance(urls, list) or not all(
+                    isinstance(url, str) and url.startswith(("ws://", "wss://"))
+                    for url in urls
+                ):
+                    raise ValidationError(
+                        "txpool_websocket_urls must map chain ids to lists of ws:// or wss:// URLs",
+                        field="txpool_websocket_urls",
+                        value=chain_id,
+                    )
+            enter = config_dict.get("txpool_shed_enter_utilization", 0.9)
+            exit_ = config_dict.get("txpool_shed_exit_utilization", 0.6)
+            if not 0 < exit_ < enter:
+                raise ValidationError(
+                    "txpool_shed_exit_utilization must be > 0 and below txpool_shed_enter_utilization",
+                    field="txpool_shed_exit_utilization",
+                    value=exit_,
+                )
 
             # Validate ML settings
             if all(
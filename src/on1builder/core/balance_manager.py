@@ -12,6 +12,8 @@ from datetime import datetime, timedelta
 from web3 import AsyncWeb3
 
 from on1builder.config.loaders import settings
+from on1builder.core.call_encoders import BALANCE_OF, DECIMALS
+from on1builder.core.multicall import get_multicall
 from on1builder.utils.custom_exceptions import (
     InsufficientFundsError,
     ConnectionError as ON1ConnectionError,
@@ -405,33 +407,20 @@ class BalanceManager:
     ) -> Decimal:
         """Get token balance using contract address."""
         try:
-            from on1builder.integrations.abi_registry import ABIRegistry
-
-            abi_registry = ABIRegistry()
-
-            # Get ERC-20 contract ABI
-            erc20_abi = abi_registry.get_abi("ERC20") or abi_registry.get_abi(
-                "erc20_abi"
-            )
-            if not erc20_abi:
-                logger.error("ERC-20 ABI not found in registry")
-                return Decimal("0")
+            multicall = get_multicall(self.web3)
+            token = self.web3.to_checksum_address(token_address)
 
-            # Create contract instance
-            contract = self.web3.eth.contract(
-                address=self.web3.to_checksum_address(token_address), abi=erc20_abi
-            )
-
-            # Get balance and decimals concurrently
+            # balanceOf and decimals share one multicall round-trip
             balance_wei, decimals = await asyncio.gather(
-                contract.functions.balanceOf(self.wallet_address).call(),
-                self._get_token_decimals(contract),
+                multicall.call(BALANCE_OF, token, self.wallet_address),
+                multicall.call(DECIMALS, token),
                 return_exceptions=True,
             )
 
             if isinstance(balance_wei, Exception):
                 raise balance_wei
             if isinstance(decimals, Exception):
+                logger.warning("Could not get token decimals, using default 18")
                 decimals = 18  # Default fallback
 
             # Convert to decimal
@@ -447,14 +436,6 @@ class BalanceManager:
             logger.error(f"Failed to get balance for token {token_address}: {e}")
             return Decimal("0")
 
-    async def _get_token_decimals(self, contract) -> int:
-        """Get token decimals with fallback."""
-        try:
-            return await contract.functions.decimals().call()
-        except Exception:
-            logger.warning("Could not get token decimals, using default 18")
-            return 18
-
     async def _get_chain_id(self) -> int:
         """Get chain ID with proper async handling."""
         try:
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from eth_utils import keccak
+from web3 import AsyncWeb3
+from web3.exceptions import TransactionNotFound
+
+from on1builder.core.head_follower import HeadFollower
+from on1builder.monitoring.mempool_state import normalize_hash
+from on1builder.utils.latency_tracker import percentile
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Bundle outcomes
+INCLUDED = "included"
+INVALIDATED = "invalidated"
+EXPIRED = "expired"
+CANCELLED = "cancelled"
+
+Submit = Callable[[List[bytes], int], Awaitable[str]]
+
+
+class ScheduledBundle:
+    """One signed bundle and the block window it is submitted for."""
+
+    __slots__ = (
+        "raw_txs",
+        "tx_hashes",
+        "nonces",
+        "first_block",
+        "last_block",
+        "bundle_hash",
+        "targets",
+        "outcome",
+    )
+
+    def __init__(
+        self,
+        raw_txs: List[bytes],
+        nonces: List[Tuple[str, int]],
+        first_block: int,
+        last_block: int,
+    ):
+        self.raw_txs = raw_txs
+        self.tx_hashes = [normalize_hash(keccak(raw)) for raw in raw_txs]
+        self.nonces = nonces
+        self.first_block = first_block
+        self.last_block = last_block
+        self.bundle_hash: Optional[str] = None
+        self.targets: List[int] = []
+        self.outcome: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    async def wait(self) -> Dict[str, Any]:
+        """Resolve once the bundle is included, invalidated or expired."""
+        return await asyncio.shield(self.outcome)
+
+
+class BundleScheduler(HeadFollower):
+    """
+    Re-submits signed bundles over a window of future blocks.
+
+    ``schedule`` submits a bundle for its first target block and keeps it
+    live until ``last_block``. On each new head every live bundle is checked
+    against the sender nonces it spends: once any of them is consumed the
+    bundle either landed (its first transaction has a receipt) or was
+    invalidated, and no further blocks are targeted. Live bundles are
+    re-submitted, unchanged, for the next block. Heads are pushed via
+    ``notify_head``; without pushes the scheduler polls ``eth_blockNumber``.
+    """
+
+    def __init__(self, web3: AsyncWeb3, chain_id: int, submit: Submit, window: int = 3):
+        super().__init__(web3)
+        self._chain_id = chain_id
+        self._submit = submit
+        self._window = max(1, int(window))
+        self._bundles: List[ScheduledBundle] = []
+        self._last_processed: Optional[int] = None
+        self._distances: Deque[int] = deque(maxlen=4096)
+        self._counters: Dict[str, int] = {
+            "scheduled": 0,
+            INCLUDED: 0,
+            INVALIDATED: 0,
+            EXPIRED: 0,
+            "submissions": 0,
+            "submit_errors": 0,
+        }
+
+    async def stop(self) -> None:
+        await super().stop()
+        for bundle in self._bundles:
+            self._finish(bundle, CANCELLED)
+        self._bundles.clear()
+
+    async def schedule(
+        self,
+        raw_txs: List[bytes],
+        nonces: List[Tuple[str, int]],
+        first_block: Optional[int] = None,
+        window: Optional[int] = None,
+    ) -> ScheduledBundle:
+        """
+        Submit ``raw_txs`` for ``first_block`` (default: the next block) and
+        the following ``window - 1`` blocks.
+
+        ``nonces`` lists the ``(sender, nonce)`` every transaction in the
+        bundle spends. The first submission is awaited, so a bundle every
+        relay rejects raises and is never scheduled.
+        """
+        if first_block is None:
+            head = self._head
+            if head is None:
+                head = await self._web3.eth.block_number
+            first_block = head + 1
+        window = self._window if window is None else max(1, int(window))
+        bundle = ScheduledBundle(
+            raw_txs, list(nonces), first_block, first_block + window - 1
+        )
+        bundle.bundle_hash = await self._submit(raw_txs, first_block)
+        bundle.targets.append(first_block)
+        self._counters["submissions"] += 1
+        self._counters["scheduled"] += 1
+        self._bundles.append(bundle)
+        return bundle
+
+    def _has_work(self) -> bool:
+        return bool(self._bundles)
+
+    async def _on_head(self) -> None:
+        if self._head is not None and self._head != self._last_processed:
+            await self.process_head(self._head)
+
+    def _on_head_error(self, error: Exception) -> None:
+        logger.debug("Bundle scheduling failed on chain %s: %s", self._chain_id, error)
+
+    async def process_head(self, head: int) -> None:
+        """Settle bundles against ``head`` and re-submit the live ones."""
+        self._last_processed = head
+        live = [bundle for bundle in self._bundles if not bundle.outcome.done()]
+        senders = list({sender for bundle in live for sender, _ in bundle.nonces})
+        counts = await asyncio.gather(
+            *(self._web3.eth.get_transaction_count(s, head) for s in senders)
+        )
+        confirmed = dict(zip(senders, counts))
+
+        resubmit: List[ScheduledBundle] = []
+        for bundle in live:
+            if any(confirmed[sender] > nonce for sender, nonce in bundle.nonces):
+                # A nonce the bundle spends is gone: it landed or never can
+                receipt = await self._receipt(bundle.tx_hashes[0])
+                if receipt is not None:
+                    self._finish(bundle, INCLUDED, int(receipt["blockNumber"]))
+                else:
+                    self._finish(bundle, INVALIDATED)
+            elif head >= bundle.last_block:
+                self._finish(bundle, EXPIRED)
+            elif head + 1 > bundle.targets[-1]:
+                resubmit.append(bundle)
+        self._bundles = [b for b in self._bundles if not b.outcome.done()]
+
+        if resubmit:
+            results = await asyncio.gather(
+                *(self._submit(b.raw_txs, head + 1) for b in resubmit),
+                return_exceptions=True,
+            )
+            for bundle, result in zip(resubmit, results):
+                self._counters["submissions"] += 1
+                if isinstance(result, Exception):
+                    self._counters["submit_errors"] += 1
+                    logger.debug(
+                        "Re-submitting bundle %s for block %s failed: %s",
+                        bundle.bundle_hash,
+                        head + 1,
+                        result,
+                    )
+                    continue
+                bundle.targets.append(head + 1)
+
+    async def _receipt(self, tx_hash: str) -> Optional[Any]:
+        try:
+            return await self._web3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+
+    def _finish(
+        self, bundle: ScheduledBundle, status: str, block: Optional[int] = None
+    ) -> None:
+        if bundle.outcome.done():
+            return
+        distance = None
+        if status == INCLUDED and block is not None:
+            distance = max(0, block - bundle.first_block)
+            self._distances.append(distance)
+        if status in self._counters:
+            self._counters[status] += 1
+        logger.debug(
+            "Bundle %s %s after %s target(s)",
+            bundle.bundle_hash,
+            status,
+            len(bundle.targets),
+        )
+        bundle.outcome.set_result(
+            {
+                "status": status,
+                "bundle_hash": bundle.bundle_hash,
+                "included_block": block,
+                "inclusion_distance": distance,
+                "targets": list(bundle.targets),
+            }
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        distances = list(self._distances)
+        settled = (
+            self._counters[INCLUDED]
+            + self._counters[INVALIDATED]
+            + self._counters[EXPIRED]
+        )
+        return {
+            "live": len(self._bundles),
+            "window": self._window,
+            **self._counters,
+            "inclusion_rate": self._counters[INCLUDED] / settled if settled else 0.0,
+            "inclusion_distance": {
+                "mean": sum(distances) / len(distances) if distances else 0.0,
+                "p50": percentile(distances, 50),
+                "p90": percentile(distances, 90),
+                "max": max(distances) if distances else 0,
+            },
+        }
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+from typing import Any, Sequence, Tuple
+
+import eth_abi
+from eth_utils import function_signature_to_4byte_selector
+
+
+class CallEncoder:
+    """
+    Precomputed selector and argument types for one contract function.
+
+    Encoding is ``selector + eth_abi.encode(arg_types, args)``: no contract
+    object, ABI lookup or provider round-trip, so building calldata for a
+    swap is a pure function of its arguments.
+    """
+
+    __slots__ = ("name", "signature", "selector", "arg_types", "output_types")
+
+    def __init__(
+        self,
+        name: str,
+        arg_types: Sequence[str],
+        output_types: Sequence[str] = (),
+    ):
+        self.name = name
+        self.arg_types: Tuple[str, ...] = tuple(arg_types)
+        self.output_types: Tuple[str, ...] = tuple(output_types)
+        self.signature = f"{name}({','.join(self.arg_types)})"
+        self.selector = function_signature_to_4byte_selector(self.signature)
+
+    def encode(self, *args: Any) -> bytes:
+        return self.selector + eth_abi.encode(self.arg_types, args)
+
+    def encode_hex(self, *args: Any) -> str:
+        return "0x" + self.encode(*args).hex()
+
+    def decode_output(self, data: bytes) -> Any:
+        """Decode return data; a single output is returned unwrapped."""
+        values = eth_abi.decode(self.output_types, bytes(data))
+        return values[0] if len(values) == 1 else values
+
+
+# Uniswap V2-style routers (Uniswap, SushiSwap, PancakeSwap share the interface)
+GET_AMOUNTS_OUT = CallEncoder("getAmountsOut", ("uint256", "address[]"), ("uint256[]",))
+SWAP_EXACT_ETH_FOR_TOKENS = CallEncoder(
+    "swapExactETHForTokens", ("uint256", "address[]", "address", "uint256")
+)
+SWAP_EXACT_TOKENS_FOR_ETH = CallEncoder(
+    "swapExactTokensForETH", ("uint256", "uint256", "address[]", "address", "uint256")
+)
+SWAP_EXACT_TOKENS_FOR_TOKENS = CallEncoder(
+    "swapExactTokensForTokens",
+    ("uint256", "uint256", "address[]", "address", "uint256"),
+)
+
+# Uniswap V3 SwapRouter (struct params include the deadline)
+EXACT_INPUT_SINGLE = CallEncoder(
+    "exactInputSingle",
+    ("(address,address,uint24,address,uint256,uint256,uint256,uint160)",),
+    ("uint256",),
+)
+EXACT_INPUT = CallEncoder(
+    "exactInput", ("(bytes,address,uint256,uint256,uint256)",), ("uint256",)
+)
+
+# ERC-20 reads
+BALANCE_OF = CallEncoder("balanceOf", ("address",), ("uint256",))
+ALLOWANCE = CallEncoder("allowance", ("address", "address"), ("uint256",))
+DECIMALS = CallEncoder("decimals", (), ("uint8",))
+
+# Uniswap V2 pair reads
+GET_RESERVES = CallEncoder("getReserves", (), ("uint112", "uint112", "uint32"))
+TOKEN0 = CallEncoder("token0", (), ("address",))
+TOKEN1 = CallEncoder("token1", (), ("address",))
+
+# Chainlink aggregator (decimals shares the ERC-20 encoder)
+LATEST_ROUND_DATA = CallEncoder(
+    "latestRoundData", (), ("uint80", "int256", "uint256", "uint256", "uint80")
+)
+
+# Uniswap V2 factory lookups (routers expose their factory)
+FACTORY = CallEncoder("factory", (), ("address",))
+GET_PAIR = CallEncoder("getPair", ("address", "address"), ("address",))
+
+# Uniswap V3 pool state
+SLOT0 = CallEncoder(
+    "slot0", (), ("uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool")
+)
+LIQUIDITY = CallEncoder("liquidity", (), ("uint128",))
+POOL_FEE = CallEncoder("fee", (), ("uint24",))
+TICK_SPACING = CallEncoder("tickSpacing", (), ("int24",))
+TICK_BITMAP = CallEncoder("tickBitmap", ("int16",), ("uint256",))
+TICKS = CallEncoder(
+    "ticks",
+    ("int24",),
+    ("uint128", "int128", "uint256", "uint256", "int56", "uint160", "uint32", "bool"),
+)
+
+
+def encode_v2_swap(
+    path: Sequence[str],
+    amount_in: int,
+    amount_out_min: int,
+    recipient: str,
+    deadline: int,
+    wrapped_native: str,
+) -> Tuple[bytes, int]:
+    """
+    Calldata and ``value`` for a V2 exact-input swap along ``path``.
+
+    The ETH variants are picked when the path starts or ends at the wrapped
+    native token, mirroring how the router is called on-chain.
+    """
+    if path[0].lower() == wrapped_native:
+        data = SWAP_EXACT_ETH_FOR_TOKENS.encode(
+            amount_out_min, list(path), recipient, deadline
+        )
+        return data, amount_in
+    encoder = (
+        SWAP_EXACT_TOKENS_FOR_ETH
+        if path[-1].lower() == wrapped_native
+        else SWAP_EXACT_TOKENS_FOR_TOKENS
+    )
+    return (
+        encoder.encode(amount_in, amount_out_min, list(path), recipient, deadline),
+        0,
+    )
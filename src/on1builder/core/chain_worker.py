@@ -13,10 +13,12 @@ from web3 import AsyncWeb3
 from on1builder.config.loaders import settings
 from on1builder.core.balance_manager import BalanceManager
 from on1builder.core.nonce_manager import NonceManager
+from on1builder.core.receipt_tracker import ReceiptTracker
 from on1builder.core.transaction_manager import TransactionManager
 from on1builder.engines.safety_guard import SafetyGuard
 from on1builder.engines.strategy_executor import StrategyExecutor
 from on1builder.monitoring.market_data_feed import MarketDataFeed
+from on1builder.monitoring.pool_state_cache import PoolStateCache
 from on1builder.monitoring.txpool_scanner import TxPoolScanner
 from on1builder.utils.custom_exceptions import InitializationError
 from on1builder.utils.logging_config import get_logger
@@ -46,6 +48,8 @@ class ChainWorker:
         self.market_feed: Optional[MarketDataFeed] = None
         self.tx_scanner: Optional[TxPoolScanner] = None
         self.tx_manager: Optional[TransactionManager] = None
+        self.receipt_tracker: Optional[ReceiptTracker] = None
+        self.pool_cache: Optional[PoolStateCache] = None
         self.strategy_executor: Optional[StrategyExecutor] = None
         self.safety_guard: Optional[SafetyGuard] = None
         self.nonce_manager: Optional[NonceManager] = None
@@ -134,6 +138,31 @@ class ChainWorker:
                 strategy_executor=self.strategy_executor,
                 chain_id=self.chain_id,
             )
+            # Victim tx tracking for back-runs and sandwiches
+            self.tx_manager.set_mempool_state(self.tx_scanner.mempool_state)
+            # One head-driven receipt tracker for every confirmation wait
+            self.receipt_tracker = ReceiptTracker(self.web3, self.chain_id)
+            self.tx_scanner.add_block_listener(self.receipt_tracker.notify_head)
+            self.tx_manager.set_receipt_tracker(self.receipt_tracker)
+            # Per-block nonce gap detection for every wallet execution
+            self.tx_scanner.add_block_listener(self.nonce_manager.notify_head)
+            if self.tx_manager.bundle_scheduler is not None:
+                self.tx_scanner.add_block_listener(
+                    self.tx_manager.bundle_scheduler.notify_head
+                )
+            # Log-driven reserve cache for local quotes and impact estimates
+            if getattr(settings, "pool_cache_enabled", True):
+                ws_urls = getattr(settings, "websocket_urls", {}) or {}
+                ws_url = ws_urls.get(self.chain_id) or ws_urls.get(str(self.chain_id))
+                self.pool_cache = PoolStateCache(
+                    self.web3,
+                    self.chain_id,
+                    ws_url=ws_url,
+                    max_pools=int(getattr(settings, "pool_cache_max_pools", 5000)),
+                )
+                self.tx_scanner.add_block_listener(self.pool_cache.notify_head)
+                self.tx_scanner.set_pool_cache(self.pool_cache)
+                self.tx_manager.set_pool_cache(self.pool_cache)
 
             # Register memory cleanup callbacks
             self._memory_optimizer.register_cleanup_callback(
@@ -177,6 +206,15 @@ class ChainWorker:
 
         logger.debug(f"[Chain {self.chain_id}] Starting ON1Builder background tasks...")
 
+        if self.receipt_tracker:
+            self.receipt_tracker.start()
+        if self.nonce_manager:
+            self.nonce_manager.start()
+        if self.pool_cache:
+            self.pool_cache.start()
+        if self.tx_manager and self.tx_manager.bundle_scheduler:
+            self.tx_manager.bundle_scheduler.start()
+
         # Start core monitoring tasks
         self._tasks.append(asyncio.create_task(self.market_feed.start()))
         self._tasks.append(asyncio.create_task(self.tx_scanner.start()))
@@ -210,6 +248,14 @@ class ChainWorker:
             await self.market_feed.stop()
         if self.tx_scanner:
             await self.tx_scanner.stop()
+        if self.receipt_tracker:
+            await self.receipt_tracker.stop()
+        if self.nonce_manager:
+            await self.nonce_manager.stop()
+        if self.pool_cache:
+            await self.pool_cache.stop()
+        if self.tx_manager:
+            await self.tx_manager.close()
 
         # Final performance report
         await self._generate_final_report()
@@ -324,12 +370,15 @@ class ChainWorker:
 
                 # Get memory metrics
                 memory_metrics = self._memory_optimizer.get_current_metrics()
+                load_stats = self.tx_scanner.get_load_shedding_stats() or {}
 
                 logger.info(
                     f"[Chain {self.chain_id} ON1Builder Heartbeat] "
                     f"Status: Running | "
                     f"Balance: {balance_summary['balance']:.6f} ETH ({balance_summary['balance_tier']}) | "
                     f"Pending TXs: {self.tx_scanner.get_pending_tx_count()} | "
+                    f"Scanner: {load_stats.get('mode', 'normal')} "
+                    f"(shed {load_stats.get('shed', 0)}) | "
                     f"Success Rate: {tx_manager_stats['success_rate_percentage']:.1f}% | "
                     f"Net Profit: {tx_manager_stats['net_profit_eth']:.6f} ETH | "
                     f"Opportunities: {self._performance_stats['opportunities_detected']} | "
@@ -498,6 +547,10 @@ class ChainWorker:
                 },
                 "performance_stats": self._performance_stats,
                 "pending_transactions": self.tx_scanner.get_pending_tx_count(),
+                "receipts": (
+                    self.receipt_tracker.get_stats() if self.receipt_tracker else {}
+                ),
+                "pools": self.pool_cache.get_stats() if self.pool_cache else {},
             }
         except Exception as e:
             logger.error(f"[Chain {self.chain_id}] Failed to get status: {e}")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from web3 import AsyncWeb3
+
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class HeadFollower(ABC):
+    """
+    Base for per-chain components that act on every new head.
+
+    Heads are pushed by the scanner's block feed via ``notify_head``; while
+    nobody pushes and the component has work, it polls ``eth_blockNumber``
+    itself. Subclasses say when they have work (``_has_work``) and what to
+    do with the current head (``_on_head``).
+    """
+
+    POLL_INTERVAL_SECONDS = 1.0
+
+    def __init__(self, web3: AsyncWeb3):
+        self._web3 = web3
+        self._head: Optional[int] = None
+        self._last_push = 0.0
+        self._head_event = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def notify_head(self, block_number: int) -> None:
+        """Block feed hook: record a new head and wake the loop."""
+        self._last_push = time.monotonic()
+        if self._head is None or block_number > self._head:
+            self._head = block_number
+            self._head_event.set()
+
+    @abstractmethod
+    def _has_work(self) -> bool:
+        """True while there is anything to do on a new head."""
+
+    @abstractmethod
+    async def _on_head(self) -> None:
+        """Act on ``self._head``; called on every wake-up with work pending."""
+
+    def _on_head_error(self, error: Exception) -> None:
+        logger.debug("%s head handling failed: %s", type(self).__name__, error)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._head_event.wait(), self.POLL_INTERVAL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._head_event.clear()
+            if not self._has_work():
+                continue
+            try:
+                if time.monotonic() - self._last_push > 2 * self.POLL_INTERVAL_SECONDS:
+                    # No block feed is pushing heads; poll for one
+                    head = await self._web3.eth.block_number
+                    if self._head is None or head > self._head:
+                        self._head = head
+                await self._on_head()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._on_head_error(e)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from web3 import AsyncWeb3
+
+from on1builder.config.loaders import settings
+from on1builder.core.call_encoders import CallEncoder
+from on1builder.utils.custom_exceptions import APICallError
+from on1builder.utils.latency_tracker import LatencyTracker
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Multicall3 is deployed at the same address on practically every EVM chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+AGGREGATE3 = CallEncoder("aggregate3", ("(address,bool,bytes)[]",), ("(bool,bytes)[]",))
+
+# (target, calldata, future)
+_PendingCall = Tuple[str, bytes, asyncio.Future]
+
+
+class MulticallBatcher:
+    """
+    Coalesces independent ``eth_call`` reads into Multicall3 ``aggregate3``.
+
+    Calls submitted within ``window_ms`` of each other (or until
+    ``max_batch_size`` is reached) go out as one ``eth_call``, so reads that
+    used to cost one round-trip each share a single one and are served from
+    the same block. Each caller gets its own decoded result or exception. A
+    batch of one is sent as a plain ``eth_call``; if the aggregate call fails
+    (e.g. Multicall3 is not deployed) the batch falls back to individual
+    calls. With ``enabled=False`` every call is a plain ``eth_call``.
+    """
+
+    def __init__(
+        self,
+        web3: AsyncWeb3,
+        address: str = MULTICALL3_ADDRESS,
+        window_ms: float = 2.0,
+        max_batch_size: int = 100,
+        enabled: bool = True,
+    ):
+        self._web3 = web3
+        self._address = address
+        self._window_s = max(window_ms, 0.0) / 1000.0
+        self._max_batch_size = max(1, max_batch_size)
+        self._enabled = enabled
+        self._pending: List[_PendingCall] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: "set[asyncio.Task]" = set()
+
+        self._batch_latency = LatencyTracker()
+        self._stats: Dict[str, int] = {
+            "calls": 0,
+            "batches": 0,
+            "batched_calls": 0,
+            "aggregated_calls": 0,
+            "max_batch_size": 0,
+            "failed_calls": 0,
+            "fallback_batches": 0,
+        }
+
+    async def call(self, encoder: CallEncoder, target: str, *args: Any) -> Any:
+        """Call ``encoder`` on ``target`` and decode its return value."""
+        data = await self.call_raw(target, encoder.encode(*args))
+        return encoder.decode_output(data)
+
+    async def call_raw(self, target: str, calldata: bytes) -> bytes:
+        """Call ``target`` with encoded ``calldata``; returns the raw output."""
+        self._stats["calls"] += 1
+        if not self._enabled:
+            return await self._eth_call(target, calldata)
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((target, calldata, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._schedule_flush(now=True)
+        elif self._flush_handle is None:
+            self._schedule_flush(now=False)
+        return await future
+
+    def _schedule_flush(self, now: bool) -> None:
+        loop = asyncio.get_running_loop()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if now:
+            self._start_flush()
+        else:
+            self._flush_handle = loop.call_later(self._window_s, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _eth_call(self, target: str, calldata: bytes) -> bytes:
+        result = await self._web3.eth.call(
+            {"to": target, "data": "0x" + calldata.hex()}
+        )
+        return bytes(result)
+
+    async def _flush(self, batch: List[_PendingCall]) -> None:
+        started = time.monotonic()
+        self._stats["batches"] += 1
+        self._stats["batched_calls"] += len(batch)
+        self._stats["max_batch_size"] = max(self._stats["max_batch_size"], len(batch))
+        try:
+            if len(batch) == 1:
+                await self._call_each(batch)
+                return
+            try:
+                results = await self._aggregate(batch)
+            except Exception as e:
+                logger.debug("aggregate3 failed (%s); calling individually.", e)
+                self._stats["fallback_batches"] += 1
+                await self._call_each(batch)
+                return
+            self._stats["aggregated_calls"] += len(batch)
+            for (target, _data, future), (success, output) in zip(batch, results):
+                if future.done():
+                    continue
+                if success:
+                    future.set_result(bytes(output))
+                else:
+                    self._stats["failed_calls"] += 1
+                    future.set_exception(
+                        APICallError(f"Multicall sub-call to {target} reverted")
+                    )
+        finally:
+            self._batch_latency.record_since(started)
+
+    async def _aggregate(self, batch: List[_PendingCall]) -> List[Tuple[bool, bytes]]:
+        calls = [(target, True, data) for target, data, _future in batch]
+        output = await self._eth_call(self._address, AGGREGATE3.encode(calls))
+        results = AGGREGATE3.decode_output(output)
+        if len(results) != len(batch):
+            raise APICallError("aggregate3 returned a mismatched result count")
+        return results
+
+    async def _call_each(self, batch: List[_PendingCall]) -> None:
+        results = await asyncio.gather(
+            *(self._eth_call(target, data) for target, data, _future in batch),
+            return_exceptions=True,
+        )
+        for (_target, _data, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                self._stats["failed_calls"] += 1
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        batches = self._stats["batches"]
+        return {
+            "enabled": self._enabled,
+            **self._stats,
+            "mean_batch_size": (
+                self._stats["batched_calls"] / batches if batches else 0.0
+            ),
+            "batch_latency": self._batch_latency.snapshot(),
+        }
+
+
+_batchers: "weakref.WeakKeyDictionary[Any, MulticallBatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_multicall(web3: AsyncWeb3) -> MulticallBatcher:
+    """Shared batcher for a web3 connection, configured from settings."""
+    try:
+        batcher = _batchers.get(web3)
+    except TypeError:
+        batcher = None
+    if batcher is not None:
+        return batcher
+    batcher = MulticallBatcher(
+        web3,
+        address=getattr(settings, "multicall_address", MULTICALL3_ADDRESS),
+        window_ms=float(getattr(settings, "multicall_window_ms", 2.0)),
+        max_batch_size=int(getattr(settings, "multicall_max_batch_size", 100)),
+        enabled=bool(getattr(settings, "multicall_enabled", True)),
+    )
+    try:
+        _batchers[web3] = batcher
+    except TypeError:
+        # Objects without weakref support (test doubles) get a private batcher
+        pass
+    return batcher
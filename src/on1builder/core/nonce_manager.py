@@ -5,23 +5,58 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from web3 import AsyncWeb3
 
 from on1builder.config.loaders import settings
+from on1builder.core.head_follower import HeadFollower
 from on1builder.utils.custom_exceptions import ConnectionError
 from on1builder.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+GapFiller = Callable[[int], Awaitable[str]]
 
-class NonceManager:
+
+class NonceReservation:
+    """One reserved nonce; settle it with ``commit`` or ``release``."""
+
+    __slots__ = ("nonce", "_manager")
+
+    def __init__(self, manager: "NonceManager", nonce: int):
+        self._manager = manager
+        self.nonce = nonce
+
+    def commit(self, tx_hash: Optional[str] = None) -> None:
+        """The transaction using this nonce was broadcast."""
+        self._manager.commit(self.nonce, tx_hash)
+
+    def release(self) -> None:
+        """The nonce was never broadcast; hand it to the next reservation."""
+        self._manager.release(self.nonce)
+
+
+class NonceManager(HeadFollower):
     """
-    Manages transaction nonces for a single address to prevent race conditions
-    and ensure sequential, unique nonces for all outgoing transactions.
+    Reservation-based nonce allocation for a single address.
+
+    Every nonce handed out is reserved until its holder commits it (the
+    transaction was broadcast) or releases it (it never was). Released nonces
+    are reused before fresh ones, so a failed send does not leave a gap. On
+    each new head the tracked nonces are reconciled with the node's pending
+    count: anything the node already has stops being tracked, and a nonce
+    the node is missing below our high-water mark -- a dropped transaction
+    or a release nobody reused -- is a gap. Gaps are reused first
+    and, with a gap filler set, closed with a no-op self-transfer so the
+    transactions queued behind them can land. ``resync_nonce`` refreshes the
+    high-water mark without dropping in-flight reservations.
     """
 
+    # Reservations neither committed nor released within this are reclaimed
+    RESERVATION_TTL_SECONDS = 300.0
+
     _instances: dict[str, "NonceManager"] = {}
 
     def __new__(cls, web3: AsyncWeb3, address: str):
@@ -36,15 +71,32 @@ class NonceManager:
     def __init__(self, web3: AsyncWeb3, address: str):
         if getattr(self, "_initialized", False):
             if self._web3 is not web3 or self._address != address:
+                # New provider: re-read the chain on next use, keep reservations
                 self._web3 = web3
                 self._address = address
                 self._nonce = None
             return
 
-        self._web3 = web3
+        super().__init__(web3)
         self._address = address
-        self._nonce = None
+        # Next fresh nonce; everything below it is tracked or settled
+        self._nonce: Optional[int] = None
         self._lock = asyncio.Lock()
+        self._reserved: Dict[int, float] = {}
+        self._committed: Dict[int, Tuple[Optional[str], Optional[int]]] = {}
+        self._released: Dict[int, Optional[int]] = {}
+        self._gap_filler: Optional[GapFiller] = None
+        self._last_reconciled: Optional[int] = None
+        self._counters: Dict[str, int] = {
+            "reserved": 0,
+            "reused": 0,
+            "committed": 0,
+            "released": 0,
+            "gaps_detected": 0,
+            "gaps_filled": 0,
+            "gap_fill_errors": 0,
+            "expired_reservations": 0,
+        }
         self._initialized = True
         logger.debug("NonceManager initialized for address: %s", self._address)
 
@@ -59,14 +111,21 @@ class NonceManager:
         """Reset cached instances for tests or manual reinitialization."""
         cls._instances.clear()
 
+    def set_gap_filler(self, filler: Optional[GapFiller]) -> None:
+        """Send a no-op transaction at a given nonce and return its hash."""
+        self._gap_filler = filler
+
     async def _initialize_nonce(self):
         """Fetches the initial nonce from the blockchain."""
         for attempt in range(settings.connection_retry_count):
             try:
                 # 'pending' includes transactions in the mempool
-                self._nonce = await self._web3.eth.get_transaction_count(
+                pending = await self._web3.eth.get_transaction_count(
                     self._address, "pending"
                 )
+                self._absorb_pending(pending)
+                self._nonce = max([pending, *(n + 1 for n in self._in_flight())])
+                self._trim()
                 logger.info(f"Initial nonce for {self._address} set to: {self._nonce}")
                 return
             except Exception as e:
@@ -81,38 +140,206 @@ class NonceManager:
             f"Could not fetch initial nonce for address {self._address} after multiple retries."
         )
 
+    def _in_flight(self) -> List[int]:
+        return [*self._reserved, *self._committed]
+
+    def _absorb_pending(self, pending: int) -> None:
+        """Stop tracking nonces the node already has a transaction for."""
+        for tracked in (self._reserved, self._committed, self._released):
+            for nonce in [n for n in tracked if n < pending]:
+                del tracked[nonce]
+
+    def _trim(self) -> None:
+        """Lower the high-water mark over released nonces at its top."""
+        while self._nonce is not None and self._nonce - 1 in self._released:
+            self._nonce -= 1
+            del self._released[self._nonce]
+
+    def _take(self) -> int:
+        if self._released:
+            nonce = min(self._released)
+            del self._released[nonce]
+            self._counters["reused"] += 1
+        else:
+            nonce = self._nonce
+            self._nonce += 1
+        self._reserved[nonce] = time.monotonic()
+        self._counters["reserved"] += 1
+        return nonce
+
+    async def _ensure_initialized(self) -> None:
+        if self._nonce is None:
+            await self._initialize_nonce()
+        if self._nonce is None:
+            # This should not be reached if _initialize_nonce is successful
+            raise RuntimeError("Nonce could not be initialized.")
+
+    async def reserve(self) -> NonceReservation:
+        """Reserve the lowest free nonce, reusing released ones first."""
+        async with self._lock:
+            await self._ensure_initialized()
+            nonce = self._take()
+        logger.debug(f"Reserved nonce {nonce}, next fresh is {self._nonce}")
+        return NonceReservation(self, nonce)
+
     async def get_next_nonce(self) -> int:
         """
-        Atomically retrieves and increments the current nonce.
-        Initializes the nonce from the blockchain on the first call.
+        Reserve a nonce and return it.
 
-        Returns:
-            The next nonce to be used for a transaction.
+        The caller settles it with ``commit`` once the transaction is
+        broadcast or ``release`` if it never is.
+        """
+        return (await self.reserve()).nonce
+
+    async def get_next_nonces(self, count: int) -> List[int]:
+        """
+        Atomically reserves ``count`` consecutive nonces, e.g. for the
+        transactions of one bundle. These always come from the high-water
+        mark; released nonces are left for single reservations.
         """
         async with self._lock:
-            if self._nonce is None:
-                await self._initialize_nonce()
-
-            if self._nonce is not None:
-                current_nonce = self._nonce
-                self._nonce += 1
-                logger.debug(
-                    f"Providing nonce {current_nonce}, next will be {self._nonce}"
-                )
-                return current_nonce
+            await self._ensure_initialized()
+            first = self._nonce
+            self._nonce += count
+            now = time.monotonic()
+            for nonce in range(first, self._nonce):
+                self._reserved[nonce] = now
+            self._counters["reserved"] += count
+            logger.debug(f"Providing nonces {first}..{self._nonce - 1}")
+            return list(range(first, self._nonce))
 
-            # This should not be reached if _initialize_nonce is successful
-            raise RuntimeError("Nonce could not be initialized.")
+    def commit(self, nonce: int, tx_hash: Optional[str] = None) -> None:
+        """Mark a reserved nonce as broadcast."""
+        if self._reserved.pop(nonce, None) is None:
+            return
+        self._committed[nonce] = (tx_hash, self._head)
+        self._counters["committed"] += 1
+
+    def release(self, nonce: int) -> None:
+        """Return a reserved (or committed but never included) nonce."""
+        if self._reserved.pop(nonce, None) is None:
+            if self._committed.pop(nonce, None) is None:
+                return
+        self._released[nonce] = self._head
+        self._counters["released"] += 1
+        self._trim()
+        logger.debug(f"Released nonce {nonce}")
 
     async def resync_nonce(self) -> None:
         """
-        Forcibly re-synchronizes the nonce with the blockchain.
-        This is useful to recover from a state mismatch or after a manual transaction.
+        Re-synchronizes the high-water mark with the chain's pending count.
+
+        Nonces the node already has are dropped; in-flight reservations above
+        them survive, so concurrent executions keep their nonces.
         """
         async with self._lock:
             logger.warning(
                 f"Forcing nonce re-synchronization for address {self._address}..."
             )
-            # Set nonce to None to trigger re-initialization on the next `get_next_nonce` call
-            self._nonce = None
             await self._initialize_nonce()
+
+    def _has_work(self) -> bool:
+        return self._nonce is not None and bool(
+            self._reserved or self._committed or self._released
+        )
+
+    async def _on_head(self) -> None:
+        if self._head is not None and self._head != self._last_reconciled:
+            await self.reconcile(self._head)
+
+    def _on_head_error(self, error: Exception) -> None:
+        logger.debug(f"Nonce reconciliation failed for {self._address}: {error}")
+
+    async def reconcile(self, head: int) -> List[int]:
+        """
+        Check the tracked nonces against the chain at ``head``.
+
+        Returns the gaps that were filled with no-op transactions.
+        """
+        async with self._lock:
+            gaps = await self._reconcile_locked(head)
+        if not gaps:
+            return []
+        # Gap nonces are reserved already, so fills can run without the lock
+        results = await asyncio.gather(
+            *(self._gap_filler(nonce) for nonce in gaps), return_exceptions=True
+        )
+        filled = []
+        for nonce, result in zip(gaps, results):
+            if isinstance(result, Exception):
+                self._counters["gap_fill_errors"] += 1
+                logger.warning(f"Filling nonce gap {nonce} failed: {result}")
+                self.release(nonce)
+                continue
+            self.commit(nonce, result)
+            self._counters["gaps_filled"] += 1
+            filled.append(nonce)
+            logger.info(f"Filled nonce gap {nonce} with no-op tx {result}")
+        return filled
+
+    async def _reconcile_locked(self, head: int) -> List[int]:
+        """Settle tracked nonces against ``head``; returns gaps to fill."""
+        self._last_reconciled = head
+        self._head = max(head, self._head or head)
+        if self._nonce is None:
+            return []
+        pending = await self._web3.eth.get_transaction_count(self._address, "pending")
+
+        # Settled before any head was seen: count from this one
+        for nonce, (tx_hash, at) in list(self._committed.items()):
+            if at is None:
+                self._committed[nonce] = (tx_hash, head)
+        for nonce, at in list(self._released.items()):
+            if at is None:
+                self._released[nonce] = head
+        now = time.monotonic()
+        for nonce, reserved_at in list(self._reserved.items()):
+            if now - reserved_at > self.RESERVATION_TTL_SECONDS:
+                logger.warning(f"Reclaiming nonce {nonce}: reservation never settled")
+                self._counters["expired_reservations"] += 1
+                self.release(nonce)
+        self._absorb_pending(pending)
+        if pending > self._nonce:
+            # Sent from elsewhere; nothing we track can be below it
+            self._nonce = pending
+        elif pending < self._nonce and pending not in self._released:
+            self._check_gap(pending, head)
+        self._trim()
+
+        if self._gap_filler is None:
+            return []
+        # Gaps that survived a block without reuse while later nonces wait
+        highest = max(self._in_flight(), default=-1)
+        gaps = [
+            nonce
+            for nonce, released_at in sorted(self._released.items())
+            if released_at < head and nonce < highest
+        ]
+        for nonce in gaps:
+            del self._released[nonce]
+            self._reserved[nonce] = now
+        return gaps
+
+    def _check_gap(self, nonce: int, head: int) -> None:
+        """The node is missing ``nonce``; decide whether it is a gap."""
+        if nonce in self._reserved:
+            return  # still being signed or sent
+        committed = self._committed.get(nonce)
+        if committed is not None:
+            # Private and bundle submissions never show up as pending
+            grace = int(getattr(settings, "nonce_gap_grace_blocks", 3))
+            if head - committed[1] < grace:
+                return
+            del self._committed[nonce]
+            logger.info(f"Nonce {nonce} (tx {committed[0]}) was dropped")
+        self._released[nonce] = head
+        self._counters["gaps_detected"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "next_nonce": self._nonce,
+            "in_flight_reserved": len(self._reserved),
+            "in_flight_committed": len(self._committed),
+            "free_released": sorted(self._released),
+            **self._counters,
+        }
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from on1builder.utils.latency_tracker import LatencyTracker
+
+Stage = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class PreflightGraph:
+    """
+    Concurrent pre-trade checks with explicit dependencies.
+
+    Each stage is an async callable that receives the results of the stages
+    it depends on. Stages start as soon as their dependencies finish, so
+    independent reads (quote, balance, allowance, gas price) share one
+    round-trip. The first failing stage cancels every other stage and its
+    exception is re-raised unchanged. Per-stage latency is recorded into
+    ``latency`` under the stage name, plus ``total`` for the whole graph.
+    """
+
+    def __init__(self, latency: Optional[Dict[str, LatencyTracker]] = None):
+        self._stages: Dict[str, Tuple[Stage, Tuple[str, ...]]] = {}
+        self._latency = latency if latency is not None else {}
+
+    def add(self, name: str, stage: Stage, after: Iterable[str] = ()) -> None:
+        after = tuple(after)
+        missing = [dep for dep in after if dep not in self._stages]
+        if missing:
+            raise ValueError(f"Stage {name!r} depends on unknown stages {missing}")
+        self._stages[name] = (stage, after)
+
+    def _tracker(self, name: str) -> LatencyTracker:
+        tracker = self._latency.get(name)
+        if tracker is None:
+            tracker = self._latency[name] = LatencyTracker()
+        return tracker
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every stage; returns results keyed by stage name."""
+        started = time.monotonic()
+        results: Dict[str, Any] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def _run_stage(name: str, stage: Stage, after: Tuple[str, ...]):
+            if after:
+                await asyncio.gather(*(tasks[dep] for dep in after))
+            stage_started = time.monotonic()
+            results[name] = await stage(results)
+            self._tracker(name).record_since(stage_started)
+
+        # Dependencies are always added first, so insertion order is a
+        # valid topological order
+        for name, (stage, after) in self._stages.items():
+            tasks[name] = asyncio.create_task(_run_stage(name, stage, after))
+        try:
+            done, pending = await asyncio.wait(
+                tasks.values(), return_when=asyncio.FIRST_EXCEPTION
+            )
+            failed = next(
+                (
+                    task
+                    for task in tasks.values()
+                    if task in done and not task.cancelled() and task.exception()
+                ),
+                None,
+            )
+            if failed is not None:
+                raise failed.exception()
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+        self._tracker("total").record_since(started)
+        return results
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from web3 import AsyncWeb3
+from web3.exceptions import TransactionNotFound
+
+from on1builder.core.head_follower import HeadFollower
+from on1builder.monitoring.mempool_state import normalize_hash
+from on1builder.utils.latency_tracker import LatencyTracker, percentile
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# JSON-RPC "method not found"
+_METHOD_NOT_FOUND = -32601
+_UNSUPPORTED_MARKERS = (
+    "method not found",
+    "does not exist",
+    "not available",
+    "not supported",
+    "unsupported",
+)
+
+
+def _is_unsupported_method(error: Exception) -> bool:
+    """True when a node rejects the RPC method itself, not one call of it."""
+    for arg in getattr(error, "args", ()):
+        if isinstance(arg, dict) and arg.get("code") == _METHOD_NOT_FOUND:
+            return True
+    text = str(error).lower()
+    return str(_METHOD_NOT_FOUND) in text or any(
+        marker in text for marker in _UNSUPPORTED_MARKERS
+    )
+
+
+class _Waiter:
+    __slots__ = ("future", "waiters", "tracked_at", "tracked_block", "checked")
+
+    def __init__(self, future: asyncio.Future, tracked_block: Optional[int]):
+        self.future = future
+        self.waiters = 0
+        self.tracked_at = time.monotonic()
+        self.tracked_block = tracked_block
+        # False until the hash was looked up directly at least once
+        self.checked = False
+
+
+class ReceiptTracker(HeadFollower):
+    """
+    Per-chain receipt resolution driven by new heads.
+
+    Callers ``await wait(tx_hash, timeout)`` instead of polling for receipts.
+    On each head the tracker fetches the block's receipts with one
+    ``eth_getBlockReceipts`` call and resolves every in-flight hash it
+    contains. Hashes registered since the previous head (which may already
+    be mined) and blocks that could not be scanned are covered by concurrent
+    by-hash lookups. Heads are pushed by the scanner's block feed via
+    ``notify_head``; while nobody pushes and waiters exist, the tracker polls
+    ``eth_blockNumber`` itself.
+    """
+
+    MAX_BLOCK_CATCHUP = 8
+
+    def __init__(self, web3: AsyncWeb3, chain_id: int):
+        super().__init__(web3)
+        self._chain_id = chain_id
+        self._waiters: Dict[str, _Waiter] = {}
+        self._last_scanned: Optional[int] = None
+        # None until the first call tells us whether the node supports it
+        self._block_receipts_supported: Optional[bool] = None
+
+        self._wall_latency = LatencyTracker()
+        self._block_latency: Deque[int] = deque(maxlen=4096)
+        self._counters: Dict[str, int] = {
+            "confirmed": 0,
+            "timed_out": 0,
+            "heads": 0,
+            "block_receipt_calls": 0,
+            "hash_lookups": 0,
+        }
+
+    async def stop(self) -> None:
+        await super().stop()
+        for waiter in self._waiters.values():
+            if not waiter.future.done():
+                waiter.future.set_result(None)
+        self._waiters.clear()
+
+    async def wait(self, tx_hash: Any, timeout: float) -> Optional[Dict[str, Any]]:
+        """Wait for ``tx_hash`` to be mined; ``None`` on timeout."""
+        key = normalize_hash(tx_hash)
+        waiter = self._waiters.get(key)
+        if waiter is None:
+            future = asyncio.get_running_loop().create_future()
+            waiter = _Waiter(future, self._head)
+            self._waiters[key] = waiter
+            # Check it on the next head even if it is already mined
+            self._head_event.set()
+        waiter.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except asyncio.TimeoutError:
+            self._counters["timed_out"] += 1
+            return None
+        finally:
+            waiter.waiters -= 1
+            if waiter.waiters <= 0 and self._waiters.get(key) is waiter:
+                del self._waiters[key]
+
+    def _has_work(self) -> bool:
+        return bool(self._waiters)
+
+    def _on_head_error(self, error: Exception) -> None:
+        logger.debug("Receipt tracking failed on chain %s: %s", self._chain_id, error)
+
+    async def _on_head(self) -> None:
+        """Resolve waiters against every unscanned block up to the head."""
+        head = self._head
+        if head is None:
+            return
+        last = self._last_scanned
+        if last is None or head - last > self.MAX_BLOCK_CATCHUP:
+            # Blocks were skipped: fall back to by-hash lookups for everyone
+            self._mark_unchecked()
+            first = head
+        else:
+            first = last + 1
+        for number in range(first, head + 1):
+            self._counters["heads"] += 1
+            receipts = await self._block_receipts(number)
+            if receipts is None:
+                self._mark_unchecked()
+                continue
+            for receipt in receipts:
+                self._resolve(receipt)
+        self._last_scanned = max(head, last or head)
+        await self._lookup_unchecked()
+
+    def _mark_unchecked(self) -> None:
+        for waiter in self._waiters.values():
+            waiter.checked = False
+
+    async def _block_receipts(self, number: int) -> Optional[List[Any]]:
+        if self._block_receipts_supported is False:
+            return None
+        try:
+            self._counters["block_receipt_calls"] += 1
+            receipts = await self._web3.eth.get_block_receipts(number)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if not _is_unsupported_method(e):
+                # Transient: this block falls back to hash lookups, retry next
+                logger.debug(
+                    "eth_getBlockReceipts(%s) failed on chain %s: %s",
+                    number,
+                    self._chain_id,
+                    e,
+                )
+                return None
+            if self._block_receipts_supported is None:
+                logger.info(
+                    "eth_getBlockReceipts unavailable on chain %s (%s); "
+                    "looking receipts up by hash.",
+                    self._chain_id,
+                    e,
+                )
+                self._block_receipts_supported = False
+            return None
+        self._block_receipts_supported = True
+        return list(receipts or [])
+
+    async def _lookup_unchecked(self) -> None:
+        hashes = [h for h, w in self._waiters.items() if not w.checked]
+        if not hashes:
+            return
+        self._counters["hash_lookups"] += len(hashes)
+        results = await asyncio.gather(
+            *(self._web3.eth.get_transaction_receipt(h) for h in hashes),
+            return_exceptions=True,
+        )
+        for tx_hash, result in zip(hashes, results):
+            waiter = self._waiters.get(tx_hash)
+            if waiter is not None:
+                waiter.checked = True
+            if isinstance(result, TransactionNotFound) or not result:
+                continue
+            if isinstance(result, Exception):
+                logger.debug("Receipt lookup for %s failed: %s", tx_hash, result)
+                if waiter is not None:
+                    waiter.checked = False
+                continue
+            self._resolve(result)
+
+    def _resolve(self, receipt: Any) -> None:
+        tx_hash = receipt.get("transactionHash")
+        if tx_hash is None:
+            return
+        waiter = self._waiters.pop(normalize_hash(tx_hash), None)
+        if waiter is None or waiter.future.done():
+            return
+        self._counters["confirmed"] += 1
+        self._wall_latency.record_since(waiter.tracked_at)
+        block_number = receipt.get("blockNumber")
+        if block_number is not None and waiter.tracked_block is not None:
+            self._block_latency.append(max(0, int(block_number) - waiter.tracked_block))
+        waiter.future.set_result(receipt)
+
+    def get_stats(self) -> Dict[str, Any]:
+        blocks = list(self._block_latency)
+        return {
+            "in_flight": len(self._waiters),
+            "head": self._head,
+            "block_receipts_supported": self._block_receipts_supported,
+            **self._counters,
+            "confirmation_latency": self._wall_latency.snapshot(),
+            "confirmation_blocks": {
+                "mean": sum(blocks) / len(blocks) if blocks else 0.0,
+                "p50": percentile(blocks, 50),
+                "p90": percentile(blocks, 90),
+                "max": max(blocks) if blocks else 0,
+            },
+        }
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from on1builder.monitoring.mempool_state import normalize_hash
+from on1builder.utils.custom_exceptions import StrategyExecutionError
+from on1builder.utils.http_session_pool import HttpSessionPool
+from on1builder.utils.latency_tracker import LatencyTracker
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+Send = Callable[[aiohttp.ClientSession, str], Awaitable[Any]]
+
+
+class _RelayStats:
+    __slots__ = ("sent", "accepted", "errors", "included", "last_error", "latency")
+
+    def __init__(self):
+        self.sent = 0
+        self.accepted = 0
+        self.errors = 0
+        self.included = 0
+        self.last_error: Optional[str] = None
+        self.latency = LatencyTracker()
+
+
+def merge_urls(*groups: Any) -> List[str]:
+    """Flatten URL strings/lists into one ordered list without duplicates."""
+    urls: List[str] = []
+    for group in groups:
+        if not group:
+            continue
+        for url in [group] if isinstance(group, str) else group:
+            url = str(url).strip()
+            if url and url not in urls:
+                urls.append(url)
+    return urls
+
+
+class RelayBroadcaster:
+    """
+    Sends one submission to every configured relay at once.
+
+    ``broadcast`` starts the request to each relay concurrently over pooled
+    keep-alive sessions (shared via ``sessions`` when given) and returns the
+    first accepted result; slower relays keep running in the background so
+    their latency and errors are still counted.
+    The relays that accepted a submission are remembered under its key (the
+    first transaction hash) so an inclusion can be attributed to them.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        timeout: float = 15.0,
+        max_tracked: int = 4096,
+        sessions: Optional[HttpSessionPool] = None,
+    ):
+        if not urls:
+            raise ValueError("RelayBroadcaster needs at least one URL")
+        self._urls = list(urls)
+        self._labels = self._make_labels(self._urls)
+        self._timeout = timeout
+        self._max_tracked = max_tracked
+        self._stats: Dict[str, _RelayStats] = {url: _RelayStats() for url in urls}
+        self._accepted_by: "OrderedDict[str, Set[str]]" = OrderedDict()
+        self._inflight: Set[asyncio.Task] = set()
+        self._owns_sessions = sessions is None
+        self._sessions = sessions or HttpSessionPool(timeout=timeout)
+
+    @staticmethod
+    def _make_labels(urls: Sequence[str]) -> Dict[str, str]:
+        # Host only: relay URLs often carry API keys in the path or query
+        labels: Dict[str, str] = {}
+        for url in urls:
+            host = urlsplit(url).netloc or url
+            label, n = host, 2
+            while label in labels.values():
+                label, n = f"{host}#{n}", n + 1
+            labels[url] = label
+        return labels
+
+    @property
+    def urls(self) -> List[str]:
+        return list(self._urls)
+
+    async def broadcast(self, send: Send, key: Optional[Any] = None) -> Tuple[Any, str]:
+        """
+        Run ``send(session, url)`` against every relay concurrently.
+
+        Returns ``(result, url)`` of the first relay to accept. Raises
+        StrategyExecutionError when every relay fails.
+        """
+        key = normalize_hash(key) if key is not None else None
+        tasks = {
+            asyncio.create_task(
+                self._send_one(send, self._sessions.session(url), url, key)
+            ): url
+            for url in self._urls
+        }
+        pending = set(tasks)
+        errors: List[str] = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                accepted = None
+                for task in done:
+                    error = task.exception()
+                    if error is not None:
+                        errors.append(f"{self._labels[tasks[task]]}: {error}")
+                    elif accepted is None:
+                        accepted = task
+                if accepted is not None:
+                    return accepted.result(), tasks[accepted]
+        finally:
+            # Slower relays finish in the background and still record stats
+            for task in pending:
+                self._inflight.add(task)
+                task.add_done_callback(self._background_done)
+        raise StrategyExecutionError(
+            f"All {len(self._urls)} relays rejected the submission: "
+            + "; ".join(errors)
+        )
+
+    async def _send_one(
+        self, send: Send, session: aiohttp.ClientSession, url: str, key: Optional[str]
+    ) -> Any:
+        stats = self._stats[url]
+        stats.sent += 1
+        started = time.monotonic()
+        try:
+            result = await send(session, url)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            stats.errors += 1
+            stats.last_error = str(e)
+            logger.debug(f"Relay {self._labels[url]} rejected submission: {e}")
+            raise
+        stats.latency.record_since(started)
+        stats.accepted += 1
+        if key is not None:
+            self._accepted_by.setdefault(key, set()).add(url)
+            self._accepted_by.move_to_end(key)
+            while len(self._accepted_by) > self._max_tracked:
+                self._accepted_by.popitem(last=False)
+        return result
+
+    def _background_done(self, task: asyncio.Task) -> None:
+        self._inflight.discard(task)
+        if not task.cancelled():
+            task.exception()  # already counted in the relay's stats
+
+    def record_inclusion(self, key: Any) -> List[str]:
+        """Credit an included submission to the relays that accepted it."""
+        urls = self._accepted_by.pop(normalize_hash(key), ())
+        for url in urls:
+            self._stats[url].included += 1
+        return [self._labels[url] for url in urls]
+
+    async def close(self) -> None:
+        """Cancel background submissions and close the sessions it owns."""
+        for task in list(self._inflight):
+            task.cancel()
+        await asyncio.gather(*self._inflight, return_exceptions=True)
+        if self._owns_sessions:
+            await self._sessions.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        relays = {}
+        for url, stats in self._stats.items():
+            relays[self._labels[url]] = {
+                "sent": stats.sent,
+                "accepted": stats.accepted,
+                "errors": stats.errors,
+                "error_rate": stats.errors / stats.sent if stats.sent else 0.0,
+                "included": stats.included,
+                "inclusion_rate": (
+                    stats.included / stats.accepted if stats.accepted else 0.0
+                ),
+                "last_error": stats.last_error,
+                "accept_latency": stats.latency.snapshot(),
+            }
+        return relays
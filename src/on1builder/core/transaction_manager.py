@@ -10,12 +10,18 @@ import os
 import time
 from pathlib import Path
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
 
 from eth_account import Account
 from eth_account.datastructures import SignedTransaction
 from eth_account.messages import encode_defunct
 from eth_account.signers.local import LocalAccount
+from eth_utils import keccak
+from eth_account.typed_transactions import TypedTransaction
+from eth_account._utils.legacy_transactions import (
+    encode_transaction,
+    serializable_unsigned_transaction_from_dict,
+)
 from web3 import AsyncWeb3
 from web3.types import TxParams, Wei
 from web3.exceptions import TransactionNotFound
@@ -23,11 +29,42 @@ import aiohttp
 
 from on1builder.config.loaders import settings
 from on1builder.core.balance_manager import BalanceManager
-from on1builder.utils.constants import MAX_GAS_LIMIT
+from on1builder.core.bundle_scheduler import INCLUDED as BUNDLE_INCLUDED
+from on1builder.core.bundle_scheduler import BundleScheduler
+from on1builder.core.call_encoders import (
+    ALLOWANCE,
+    BALANCE_OF,
+    EXACT_INPUT,
+    EXACT_INPUT_SINGLE,
+    GET_AMOUNTS_OUT,
+    CallEncoder,
+    encode_v2_swap,
+)
+from on1builder.utils.constants import MAX_GAS_LIMIT, V2_DEX_FEE_BPS
+from on1builder.core.multicall import MulticallBatcher, get_multicall
 from on1builder.core.nonce_manager import NonceManager
+from on1builder.core.preflight import PreflightGraph
+from on1builder.core.receipt_tracker import ReceiptTracker
+from on1builder.core.relay_broadcaster import RelayBroadcaster, merge_urls
+from on1builder.engines.amm_quoter import (
+    V2_FEE_BPS,
+    get_amounts_out,
+    max_sandwich_front_in,
+    project_sandwich,
+)
 from on1builder.engines.safety_guard import SafetyGuard
 from on1builder.integrations.abi_registry import ABIRegistry
 from on1builder.integrations.external_apis import ExternalAPIManager
+from on1builder.monitoring.mempool_state import (
+    DROPPED,
+    INCLUDED,
+    PENDING,
+    REPLACED,
+    UNKNOWN,
+    MempoolState,
+)
+from on1builder.monitoring.pool_state_cache import PoolStateCache
+from on1builder.monitoring.selector_index import is_v2_exact_input
 from on1builder.persistence.db_interface import DatabaseInterface
 from on1builder.utils.custom_exceptions import (
     ConnectionError,
@@ -40,6 +77,8 @@ from on1builder.utils.error_recovery import get_error_recovery_manager
 from on1builder.utils.logging_config import get_logger
 from on1builder.utils.notification_service import NotificationService
 from on1builder.utils.gas_optimizer import GasOptimizer
+from on1builder.utils.http_session_pool import HttpSessionPool
+from on1builder.utils.latency_tracker import LatencyTracker
 from on1builder.utils.profit_calculator import ProfitCalculator
 
 logger = get_logger(__name__)
@@ -66,6 +105,8 @@ class TransactionManager:
 
         self._abi_registry = ABIRegistry()
         self._nonce_manager = NonceManager(web3, self._address)
+        if getattr(settings, "nonce_gap_fill", False):
+            self._nonce_manager.set_gap_filler(self._fill_nonce_gap)
         self._safety_guard = SafetyGuard(
             web3, balance_manager=balance_manager, chain_id=chain_id
         )
@@ -75,6 +116,22 @@ class TransactionManager:
         self._gas_optimizer = GasOptimizer(web3)
         self._profit_calculator = ProfitCalculator(web3)
         self._private_rpc_url = getattr(settings, "private_rpc_url", None)
+        # Keep-alive sessions for relays and simulation backends, one per host
+        self._http = HttpSessionPool(
+            limit_per_host=getattr(settings, "http_pool_limit_per_host", 16),
+            keepalive_timeout=getattr(settings, "http_keepalive_seconds", 30.0),
+            dns_cache_ttl=getattr(settings, "http_dns_cache_seconds", 300),
+        )
+        # Private endpoints and bundle relays; each submission goes to all
+        private_urls = merge_urls(
+            self._private_rpc_url,
+            getattr(settings, "private_rpc_urls", None),
+        )
+        self._private_relays: Optional[RelayBroadcaster] = (
+            RelayBroadcaster(private_urls, sessions=self._http)
+            if private_urls
+            else None
+        )
         self._tenderly_account = getattr(settings, "tenderly_account_slug", None)
         self._tenderly_project = getattr(settings, "tenderly_project_slug", None)
         self._tenderly_token = getattr(settings, "tenderly_access_token", None)
@@ -82,6 +139,12 @@ class TransactionManager:
             settings, "tenderly_base_url", "https://api.tenderly.co/api/v1"
         )
         self._bundle_relay_url = getattr(settings, "bundle_relay_url", None)
+        bundle_urls = merge_urls(
+            self._bundle_relay_url, getattr(settings, "bundle_relay_urls", None)
+        )
+        self._bundle_relays: Optional[RelayBroadcaster] = (
+            RelayBroadcaster(bundle_urls, sessions=self._http) if bundle_urls else None
+        )
         self._bundle_relay_auth = getattr(settings, "bundle_relay_auth_token", None)
         self._bundle_target_block_offset = getattr(
             settings, "bundle_target_block_offset", 1
@@ -90,6 +153,17 @@ class TransactionManager:
         self._bundle_signer_key = getattr(settings, "bundle_signer_key", None)
         self._bundle_signer_key_path = getattr(settings, "bundle_signer_key_path", None)
         self._bundle_signer_account: Optional[LocalAccount] = None
+        # Keeps each signed bundle submitted over a window of future blocks
+        self._bundle_scheduler: Optional[BundleScheduler] = (
+            BundleScheduler(
+                web3,
+                chain_id,
+                self._send_bundle,
+                window=getattr(settings, "bundle_target_blocks", 3),
+            )
+            if self._bundle_relays
+            else None
+        )
 
         # Performance tracking
         self._execution_stats = {
@@ -99,6 +173,25 @@ class TransactionManager:
             "total_gas_spent_eth": 0.0,
         }
         self._last_bundle_hash: Optional[str] = None
+        # Contract objects keyed by (address, abi name) and by DEX name
+        self._contract_cache: Dict[Tuple[str, str], Any] = {}
+        self._dex_contracts: Dict[str, Any] = {}
+        # Coalesces concurrent quote/balance/allowance reads into one eth_call
+        self._multicall: Optional[MulticallBatcher] = get_multicall(web3)
+        # Shared with the chain's TxPoolScanner once wired by the ChainWorker
+        self._mempool_state: Optional[MempoolState] = None
+        # Shared per-chain receipt tracker; wait_for_receipt polls without one
+        self._receipt_tracker: Optional[ReceiptTracker] = None
+        # Log-driven reserve cache; V2 quotes fall back to getAmountsOut without it
+        self._pool_cache: Optional[PoolStateCache] = None
+        # Swap pre-flight latency per stage (quote, balance, allowance, ...)
+        self._preflight_latency: Dict[str, LatencyTracker] = {}
+        # Sandwich bundles: time to build/sign and build-to-accepted gap
+        self._sandwich_latency: Dict[str, LatencyTracker] = {
+            "build": LatencyTracker(),
+            "build_to_submit": LatencyTracker(),
+        }
+        self._sandwich_stats = {"built": 0, "submitted": 0, "included": 0}
 
         logger.debug(
             "ON1Builder TransactionManager initialized for chain ID %s.", chain_id
@@ -134,23 +227,48 @@ class TransactionManager:
     ) -> TxParams:
         """transaction building with dynamic gas optimization."""
 
-        nonce = (
-            nonce if nonce is not None else await self._nonce_manager.get_next_nonce()
-        )
-
         tx_params: TxParams = {
             "from": self._address,
             "to": self._web3.to_checksum_address(to),
             "value": value,
             "data": data,
-            "nonce": nonce,
             "chainId": self._chain_id,
         }
 
-        # Dynamic gas pricing
-        if gas_price:
-            tx_params["gasPrice"] = gas_price
-        elif settings.dynamic_gas_pricing:
+        tx_params["gasPrice"] = gas_price or await self._resolve_gas_price(value)
+        tx_params["gas"] = gas_limit or await self._estimate_gas_limit(tx_params)
+        # Reserved last so a rejected build does not hold a nonce
+        tx_params["nonce"] = (
+            nonce if nonce is not None else await self._nonce_manager.get_next_nonce()
+        )
+
+        return tx_params
+
+    @property
+    def bundle_scheduler(self) -> Optional[BundleScheduler]:
+        """Multi-block bundle scheduler; None without bundle relays."""
+        return self._bundle_scheduler
+
+    def _running_bundle_scheduler(self) -> Optional[BundleScheduler]:
+        scheduler = self.bundle_scheduler
+        return scheduler if scheduler is not None and scheduler.running else None
+
+    async def close(self) -> None:
+        """Stop bundle scheduling and close pooled HTTP connections."""
+        if self.bundle_scheduler is not None:
+            await self.bundle_scheduler.stop()
+        for relays in (self._private_relays, self._bundle_relays):
+            if relays is not None:
+                await relays.close()
+        await self._http.close()
+
+    def _http_session(self, url: str) -> aiohttp.ClientSession:
+        """Pooled keep-alive session for ``url``'s host."""
+        return self._http.session(url)
+
+    async def _resolve_gas_price(self, value: Wei = Wei(0)) -> Wei:
+        """Dynamic gas price for a transaction, capped at max_gas_price_gwei."""
+        if settings.dynamic_gas_pricing:
             # Use balance manager for optimal gas price
             expected_profit = value / 10**18 * 0.01  # Rough estimate
             optimal_gas_gwei, should_proceed = (
@@ -159,40 +277,48 @@ class TransactionManager:
                 )
             )
             if should_proceed:
-                tx_params["gasPrice"] = self._web3.to_wei(optimal_gas_gwei, "gwei")
+                gas_price = self._web3.to_wei(optimal_gas_gwei, "gwei")
+            elif getattr(settings, "allow_insufficient_funds_tests", False):
+                gas_price = await self._web3.eth.gas_price
             else:
-                if getattr(settings, "allow_insufficient_funds_tests", False):
-                    tx_params["gasPrice"] = await self._web3.eth.gas_price
-                else:
-                    raise InsufficientFundsError(
-                        "Gas price too high relative to expected profit"
-                    )
+                raise InsufficientFundsError(
+                    "Gas price too high relative to expected profit"
+                )
         else:
-            tx_params["gasPrice"] = await self._web3.eth.gas_price
+            gas_price = await self._web3.eth.gas_price
 
         # Enforce max gas price ceiling to avoid runaway costs
         max_allowed = self._web3.to_wei(settings.max_gas_price_gwei, "gwei")
-        if tx_params["gasPrice"] > max_allowed:
+        if gas_price > max_allowed:
             raise TransactionError(
-                f"Gas price {tx_params['gasPrice']} exceeds max_gas_price_gwei "
+                f"Gas price {gas_price} exceeds max_gas_price_gwei "
                 f"({settings.max_gas_price_gwei} gwei)"
             )
+        return gas_price
 
-        # Gas limit estimation with fallback
-        if gas_limit:
-            tx_params["gas"] = gas_limit
-        else:
-            try:
-                estimated_gas = await self._web3.eth.estimate_gas(tx_params)
-                # Add 20% buffer for safety
-                tx_params["gas"] = min(int(estimated_gas * 1.2), MAX_GAS_LIMIT)
-            except Exception as e:
-                logger.warning(f"Gas estimation failed: {e}. Using default limit.")
-                tx_params["gas"] = settings.default_gas_limit
-
-        return tx_params
+    async def _estimate_gas_limit(self, tx_params: TxParams) -> int:
+        """Gas estimate plus a 20% buffer, or the default limit on failure."""
+        try:
+            estimated_gas = await self._web3.eth.estimate_gas(tx_params)
+            return min(int(estimated_gas * 1.2), MAX_GAS_LIMIT)
+        except Exception as e:
+            logger.warning(f"Gas estimation failed: {e}. Using default limit.")
+            return settings.default_gas_limit
 
     async def _sign_and_send(self, tx_params: TxParams) -> str:
+        """
+        Sign and broadcast, then settle the nonce reservation: committed once
+        broadcast, released for reuse if the transaction never went out.
+        """
+        try:
+            tx_hash = await self._sign_and_broadcast(tx_params)
+        except Exception:
+            self._nonce_manager.release(tx_params["nonce"])
+            raise
+        self._nonce_manager.commit(tx_params["nonce"], tx_hash)
+        return tx_hash
+
+    async def _sign_and_broadcast(self, tx_params: TxParams) -> str:
         """transaction signing with comprehensive safety checks."""
 
         # Safety check with balance awareness
@@ -201,17 +327,10 @@ class TransactionManager:
             raise StrategyExecutionError(f"Safety check failed: {reason}")
 
         # Additional balance check
-        if not getattr(settings, "allow_insufficient_funds_tests", False):
-            max_cost = tx_params.get("value", 0) + (
-                tx_params.get("gas", 0) * tx_params.get("gasPrice", 0)
-            )
-            current_balance = await self._balance_manager.update_balance()
-            balance_wei = self._web3.to_wei(current_balance, "ether")
-
-            if max_cost > balance_wei:
-                raise InsufficientFundsError(
-                    f"Insufficient balance for transaction. Required: {max_cost}, Available: {balance_wei}"
-                )
+        await self._check_native_balance(
+            tx_params.get("value", 0)
+            + (tx_params.get("gas", 0) * tx_params.get("gasPrice", 0))
+        )
 
         logger.debug(f"Signing transaction for nonce {tx_params['nonce']}.")
         signed_tx: SignedTransaction = self._account.sign_transaction(tx_params)
@@ -224,20 +343,30 @@ class TransactionManager:
                     logger.info(f"Transaction sent: {tx_hash.hex()}")
                     return tx_hash.hex()
                 elif settings.submission_mode == "private":
-                    if not self._private_rpc_url:
+                    if not self._private_relays:
                         raise StrategyExecutionError(
-                            "submission_mode is private but no private_rpc_url configured"
+                            "submission_mode is private but no private_rpc_url(s) configured"
                         )
                     tx_hash_hex = await self._send_private_transaction(raw_tx)
                     logger.info(f"Private transaction sent: {tx_hash_hex}")
                     return tx_hash_hex
                 elif settings.submission_mode == "bundle":
-                    if not self._bundle_relay_url:
+                    if not self._bundle_relays:
                         raise StrategyExecutionError(
-                            "submission_mode is bundle but no bundle_relay_url configured"
+                            "submission_mode is bundle but no bundle_relay_url(s) configured"
                         )
                     tx_hash_hex = signed_tx.hash.hex()
-                    bundle_hash = await self._send_bundle([raw_tx])
+                    scheduler = self._running_bundle_scheduler()
+                    if scheduler is not None:
+                        bundle = await scheduler.schedule(
+                            [raw_tx],
+                            [(self._address, tx_params["nonce"])],
+                            first_block=(await self._web3.eth.block_number)
+                            + self._bundle_target_block_offset,
+                        )
+                        bundle_hash = bundle.bundle_hash
+                    else:
+                        bundle_hash = await self._send_bundle([raw_tx])
                     self._last_bundle_hash = bundle_hash
                     logger.info(
                         "Bundle submitted: %s (tx: %s)", bundle_hash, tx_hash_hex
@@ -284,20 +413,67 @@ class TransactionManager:
 
         raise TransactionError("Failed to send transaction after multiple retries.")
 
+    async def _fill_nonce_gap(self, nonce: int) -> str:
+        """Close a nonce gap with a zero-value self-transfer, sent publicly."""
+        gas_price = min(
+            await self._web3.eth.gas_price,
+            self._web3.to_wei(settings.max_gas_price_gwei, "gwei"),
+        )
+        signed_tx = self._account.sign_transaction(
+            {
+                "from": self._address,
+                "to": self._address,
+                "value": 0,
+                "gas": 21000,
+                "gasPrice": gas_price,
+                "nonce": nonce,
+                "chainId": self._chain_id,
+            }
+        )
+        tx_hash = await self._web3.eth.send_raw_transaction(
+            self._get_raw_transaction_bytes(signed_tx)
+        )
+        return f"0x{bytes(tx_hash).hex()}"
+
+    async def _check_native_balance(self, max_cost: int) -> None:
+        """Raise unless the wallet can pay ``max_cost`` wei of value plus gas."""
+        if getattr(settings, "allow_insufficient_funds_tests", False):
+            return
+        current_balance = await self._balance_manager.update_balance()
+        balance_wei = self._web3.to_wei(current_balance, "ether")
+
+        if max_cost > balance_wei:
+            raise InsufficientFundsError(
+                f"Insufficient balance for transaction. Required: {max_cost}, Available: {balance_wei}"
+            )
+
     async def wait_for_receipt(
         self, tx_hash: str, timeout: int = 120
     ) -> Dict[str, Any]:
-        """Wait for transaction receipt with timeout and dropped-tx detection."""
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            try:
-                receipt = await self._web3.eth.get_transaction_receipt(tx_hash)
-                if receipt:
-                    return receipt
-            except TransactionNotFound:
-                # Keep polling; tx may still be pending or replaced
-                pass
-            await asyncio.sleep(2)
+        """
+        Wait for transaction receipt with timeout and dropped-tx detection.
+
+        With a running receipt tracker the receipt resolves on the head that
+        includes the transaction; otherwise the receipt is polled every 2s.
+        """
+        tracker = self._receipt_tracker
+        if tracker is not None and tracker.running:
+            receipt = await tracker.wait(tx_hash, timeout)
+            if receipt:
+                self._attribute_inclusion(tx_hash)
+                return receipt
+        else:
+            deadline = time.time() + timeout
+            while time.time() < deadline:
+                try:
+                    receipt = await self._web3.eth.get_transaction_receipt(tx_hash)
+                    if receipt:
+                        self._attribute_inclusion(tx_hash)
+                        return receipt
+                except TransactionNotFound:
+                    # Keep polling; tx may still be pending or replaced
+                    pass
+                await asyncio.sleep(2)
 
         # Timeout: check if tx still exists in mempool; if not, treat as dropped
         try:
@@ -315,59 +491,110 @@ class TransactionManager:
             f"Transaction {tx_hash} not confirmed within {timeout}s."
         )
 
+    def _attribute_inclusion(self, tx_hash: str) -> None:
+        """Credit the relays that accepted a now-included transaction."""
+        for relays in (self._private_relays, self._bundle_relays):
+            if relays is not None:
+                relays.record_inclusion(tx_hash)
+
+    def set_mempool_state(self, mempool_state: Optional[MempoolState]) -> None:
+        """Use the scanner's mempool model to track victim transactions."""
+        self._mempool_state = mempool_state
+
+    def set_receipt_tracker(self, receipt_tracker: Optional[ReceiptTracker]) -> None:
+        """Resolve receipts through the chain's shared head-driven tracker."""
+        self._receipt_tracker = receipt_tracker
+
+    def set_pool_cache(self, pool_cache: Optional[PoolStateCache]) -> None:
+        """Quote V2 swaps from the chain's cached reserves."""
+        self._pool_cache = pool_cache
+
+    async def _wait_for_target(self, target_hash: Any, timeout: int) -> str:
+        """
+        Wait for a victim transaction to leave the mempool.
+
+        Transactions known to the mempool state resolve on the block that
+        includes them, or as soon as a replacement is seen. Otherwise this
+        falls back to polling for a receipt.
+
+        Returns:
+            ``included``, ``replaced``, ``dropped`` or ``pending`` (timeout).
+        """
+        state = self._mempool_state
+        if state is not None and state.status(target_hash) != UNKNOWN:
+            return await state.wait_for_resolution(target_hash, timeout)
+        try:
+            await self.wait_for_receipt(target_hash, timeout=timeout)
+            return INCLUDED
+        except TransactionError:
+            return PENDING
+
     async def _send_private_transaction(self, raw_tx: bytes) -> str:
         """
-        Send a private transaction via a configured private RPC (e.g., Flashbots Protect).
-        Tries eth_sendPrivateTransaction first, then falls back to eth_sendRawTransaction.
+        Send a private transaction to every configured private RPC (e.g.,
+        Flashbots Protect) at once; returns the first endpoint's accept.
+        Each endpoint is tried with eth_sendPrivateTransaction first, then
+        eth_sendRawTransaction.
         """
-        if not self._private_rpc_url:
+        relays = self._private_relays
+        if relays is None:
             raise StrategyExecutionError("Private RPC URL not configured.")
 
-        async def _post(method: str) -> Optional[str]:
+        async def _post(
+            session: aiohttp.ClientSession, url: str, method: str
+        ) -> Optional[str]:
             payload = {
                 "jsonrpc": "2.0",
                 "id": 1,
                 "method": method,
                 "params": [self._format_raw_tx(raw_tx)],
             }
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self._private_rpc_url, json=payload, timeout=15
-                ) as resp:
-                    data = await resp.json()
-                    if "error" in data:
-                        raise StrategyExecutionError(
-                            f"Private submission ({method}) failed: {data['error'].get('message', data['error'])}"
-                        )
-                    return data.get("result")
+            async with session.post(url, json=payload) as resp:
+                data = await resp.json()
+                if "error" in data:
+                    raise StrategyExecutionError(
+                        f"Private submission ({method}) failed: {data['error'].get('message', data['error'])}"
+                    )
+                return data.get("result")
 
-        # Try eth_sendPrivateTransaction if relay supports it
-        try:
-            result = await _post("eth_sendPrivateTransaction")
-            if result:
-                return result
-        except Exception as e:
-            logger.debug(f"eth_sendPrivateTransaction failed, falling back: {e}")
+        async def _send(session: aiohttp.ClientSession, url: str) -> str:
+            # Try eth_sendPrivateTransaction if relay supports it
+            try:
+                result = await _post(session, url, "eth_sendPrivateTransaction")
+                if result:
+                    return result
+            except Exception as e:
+                logger.debug(f"eth_sendPrivateTransaction failed, falling back: {e}")
+
+            result = await _post(session, url, "eth_sendRawTransaction")
+            if not result:
+                raise StrategyExecutionError("Private submission returned no result")
+            return result
 
-        result = await _post("eth_sendRawTransaction")
-        if not result:
-            raise StrategyExecutionError("Private submission returned no result")
+        result, _url = await relays.broadcast(_send, key=keccak(raw_tx))
         return result
 
-    async def _send_bundle(self, raw_txs: List[bytes]) -> str:
+    async def _send_bundle(
+        self, raw_txs: List[bytes], target_block: Optional[int] = None
+    ) -> str:
         """
-        Send a bundle to a MEV-Boost/Flashbots relay via eth_sendBundle.
+        Send a bundle to every configured MEV-Boost/Flashbots relay via
+        eth_sendBundle; returns the bundle hash from the first relay to
+        accept.
+
+        Targets ``target_block`` when given, else the configured offset from
+        the current head.
         """
-        if not self._bundle_relay_url:
+        relays = self._bundle_relays
+        if relays is None:
             raise StrategyExecutionError("Bundle relay URL not configured.")
 
         # Target a future block
-        target_block = (
-            await self._web3.eth.block_number
-        ) + self._bundle_target_block_offset
-        import time as _time
-
-        now = int(_time.time())
+        if target_block is None:
+            target_block = (
+                await self._web3.eth.block_number
+            ) + self._bundle_target_block_offset
+        now = int(time.time())
 
         payload: Dict[str, Any] = {
             "jsonrpc": "2.0",
@@ -384,8 +611,6 @@ class TransactionManager:
         }
 
         headers = {"Content-Type": "application/json"}
-        if self._bundle_relay_auth:
-            headers["Authorization"] = f"Bearer {self._bundle_relay_auth}"
         try:
             body = json.dumps(payload, separators=(",", ":"), sort_keys=True)
             signer = self._get_bundle_signer_account()
@@ -394,10 +619,15 @@ class TransactionManager:
         except Exception as e:
             raise StrategyExecutionError(f"Failed to sign bundle payload: {e}") from e
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self._bundle_relay_url, data=body, headers=headers, timeout=15
-            ) as resp:
+        async def _send(session: aiohttp.ClientSession, url: str) -> str:
+            relay_headers = headers
+            # The auth token belongs to the primary relay only
+            if self._bundle_relay_auth and url == self._bundle_relay_url:
+                relay_headers = {
+                    **headers,
+                    "Authorization": f"Bearer {self._bundle_relay_auth}",
+                }
+            async with session.post(url, data=body, headers=relay_headers) as resp:
                 data = await resp.json()
                 if "error" in data:
                     raise StrategyExecutionError(
@@ -412,6 +642,10 @@ class TransactionManager:
                     return result
                 raise StrategyExecutionError("Bundle submission returned no result")
 
+        # Keyed by the first transaction so its receipt attributes inclusion
+        bundle_hash, _url = await relays.broadcast(_send, key=keccak(raw_txs[0]))
+        return bundle_hash
+
     def _get_bundle_signer_account(self) -> LocalAccount:
         if self._bundle_signer_account:
             return self._bundle_signer_account
@@ -477,6 +711,52 @@ class TransactionManager:
             )
         return raw_tx
 
+    @staticmethod
+    def _encode_signed_transaction(tx: Mapping) -> bytes:
+        """
+        Re-serialize a signed transaction from the body a node returns
+        (``eth_getTransactionByHash``), signature included.
+        """
+
+        def _int(value: Any) -> int:
+            if isinstance(value, (bytes, bytearray)):
+                return int.from_bytes(value, "big")
+            if isinstance(value, str):
+                return int(value, 16)
+            return int(value)
+
+        tx_type = _int(tx.get("type") or 0)
+        v, r, s = _int(tx["v"]), _int(tx["r"]), _int(tx["s"])
+        fields: Dict[str, Any] = {
+            "nonce": _int(tx["nonce"]),
+            "gas": _int(tx["gas"]),
+            "to": tx["to"],
+            "value": _int(tx["value"]),
+            "data": tx["input"],
+        }
+        if tx_type == 0:
+            fields["gasPrice"] = _int(tx["gasPrice"])
+            if v >= 35:  # EIP-155
+                fields["chainId"] = (v - 35) // 2
+            unsigned = serializable_unsigned_transaction_from_dict(fields)
+            return encode_transaction(unsigned, (v, r, s))
+        if tx_type not in (1, 2):
+            raise StrategyExecutionError(
+                f"Cannot re-encode transaction type {tx_type}."
+            )
+        fields["type"] = tx_type
+        fields["chainId"] = _int(tx["chainId"])
+        fields["accessList"] = [
+            {"address": entry["address"], "storageKeys": list(entry["storageKeys"])}
+            for entry in tx.get("accessList") or []
+        ]
+        if tx_type == 1:
+            fields["gasPrice"] = _int(tx["gasPrice"])
+        else:
+            fields["maxFeePerGas"] = _int(tx["maxFeePerGas"])
+            fields["maxPriorityFeePerGas"] = _int(tx["maxPriorityFeePerGas"])
+        return TypedTransaction.from_dict({**fields, "v": v, "r": r, "s": s}).encode()
+
     async def execute_and_confirm(
         self,
         tx_params: TxParams,
@@ -654,14 +934,26 @@ class TransactionManager:
                 "strategy": strategy_name,
             }
 
+    def _get_contract(self, address: str, abi_name: str):
+        """Contract object for ``(address, abi_name)``, built once and reused."""
+        key = (address.lower(), abi_name)
+        contract = self._contract_cache.get(key)
+        if contract is None:
+            abi = self._abi_registry.get_abi(abi_name)
+            if not abi:
+                raise StrategyExecutionError(
+                    f"{abi_name} not found. Available ABIs: {list(self._abi_registry._abis.keys())}"
+                )
+            contract = self._contract_cache[key] = self._web3.eth.contract(
+                address=address, abi=abi
+            )
+        return contract
+
     async def _get_dex_contract(self, dex_name: str):
         """Get DEX contract with ON1Builder error handling."""
-        abi_name = f"{dex_name.lower()}_abi"
-        abi = self._abi_registry.get_abi(abi_name)
-        if not abi:
-            raise StrategyExecutionError(
-                f"{dex_name} ABI not found. Available ABIs: {list(self._abi_registry._abis.keys())}"
-            )
+        contract = self._dex_contracts.get(dex_name)
+        if contract is not None:
+            return contract
 
         # Try different address mapping formats
         address_maps = [
@@ -682,7 +974,9 @@ class TransactionManager:
                 f"{dex_name} router address not configured for chain {self._chain_id}."
             )
 
-        return self._web3.eth.contract(address=address, abi=abi)
+        contract = self._get_contract(address, f"{dex_name.lower()}_abi")
+        self._dex_contracts[dex_name] = contract
+        return contract
 
     def _get_wrapped_native_address(self) -> str:
         """
@@ -722,19 +1016,19 @@ class TransactionManager:
                 )
             tx_for_call = dict(tx_params)
             tx_for_call.pop("nonce", None)
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "eth_call",
-                    "params": [tx_for_call, "latest"],
-                }
-                async with session.post(fork_rpc, json=payload, timeout=15) as resp:
-                    data = await resp.json()
-                    if "error" in data:
-                        raise StrategyExecutionError(
-                            f"Anvil simulation failed: {data['error'].get('message', data['error'])}"
-                        )
+            payload = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "eth_call",
+                "params": [tx_for_call, "latest"],
+            }
+            session = self._http_session(fork_rpc)
+            async with session.post(fork_rpc, json=payload, timeout=15) as resp:
+                data = await resp.json()
+                if "error" in data:
+                    raise StrategyExecutionError(
+                        f"Anvil simulation failed: {data['error'].get('message', data['error'])}"
+                    )
         elif backend == "tenderly":
             await self._simulate_with_tenderly(tx_params)
         else:
@@ -771,27 +1065,32 @@ class TransactionManager:
             "Authorization": f"Bearer {self._tenderly_token}",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url, json=payload, headers=headers, timeout=15
-            ) as resp:
-                data = await resp.json()
-                if resp.status >= 400 or "error" in data:
-                    message = (
-                        data.get("error", {}).get("message")
-                        if isinstance(data.get("error"), dict)
-                        else data.get("error")
-                    )
-                    raise StrategyExecutionError(
-                        f"Tenderly simulation failed: {message or data}"
-                    )
-                # success: no return value needed
+        session = self._http_session(url)
+        async with session.post(url, json=payload, headers=headers, timeout=15) as resp:
+            data = await resp.json()
+            if resp.status >= 400 or "error" in data:
+                message = (
+                    data.get("error", {}).get("message")
+                    if isinstance(data.get("error"), dict)
+                    else data.get("error")
+                )
+                raise StrategyExecutionError(
+                    f"Tenderly simulation failed: {message or data}"
+                )
+            # success: no return value needed
+
+    async def _read_call(self, encoder: CallEncoder, to: str, *args: Any) -> Any:
+        """``eth_call`` a precomputed encoder and decode its return value."""
+        if self._multicall is not None:
+            return await self._multicall.call(encoder, to, *args)
+        result = await self._web3.eth.call(
+            {"to": to, "data": encoder.encode_hex(*args)}
+        )
+        return encoder.decode_output(result)
 
     async def _get_token_allowance(self, token_address: str, spender: str) -> int:
         """Check ERC20 allowance for the spender."""
-        erc20_abi = self._abi_registry.get_abi("erc20_abi")
-        token_contract = self._web3.eth.contract(address=token_address, abi=erc20_abi)
-        return await token_contract.functions.allowance(self._address, spender).call()
+        return await self._read_call(ALLOWANCE, token_address, self._address, spender)
 
     async def _get_swap_path(self, opportunity: Dict[str, Any]) -> List[str]:
         """path resolution with validation."""
@@ -835,23 +1134,24 @@ class TransactionManager:
         encoded += bytes.fromhex(tokens[-1][2:])
         return encoded
 
+    @staticmethod
+    def _to_wei_amount(amount: Any) -> int:
+        """Amounts given as floats are in whole tokens; convert to Wei."""
+        if isinstance(amount, float):
+            return int(amount * 10**18)
+        return amount
+
     async def _calculate_amounts_with_slippage(
         self, opportunity: Dict[str, Any], expected_amount_out: Optional[int] = None
     ) -> Tuple[int, int]:
         """Calculate swap amounts with slippage protection."""
-        amount_in = opportunity.get("amount_in", 0)
-        expected_out = (
+        amount_in = self._to_wei_amount(opportunity.get("amount_in", 0))
+        expected_out = self._to_wei_amount(
             expected_amount_out
             if expected_amount_out is not None
             else opportunity.get("expected_amount_out", 0)
         )
 
-        # Convert to Wei if necessary
-        if isinstance(amount_in, float):
-            amount_in = int(amount_in * 10**18)
-        if isinstance(expected_out, float):
-            expected_out = int(expected_out * 10**18)
-
         if expected_out <= 0:
             raise StrategyExecutionError(
                 "Missing expected_amount_out; cannot protect slippage."
@@ -864,11 +1164,34 @@ class TransactionManager:
         return amount_in, amount_out_min
 
     async def _quote_expected_output(
-        self, dex_contract, amount_in: int, path: List[str]
+        self,
+        dex_contract,
+        amount_in: int,
+        path: List[str],
+        fee_bps: int = V2_FEE_BPS,
     ) -> int:
-        """Quote expected output using getAmountsOut on the DEX contract."""
+        """
+        Quote expected output for a V2 path.
+
+        Computed locally from cached reserves when every pair is cached and in
+        sync; otherwise ``getAmountsOut`` on the DEX contract (and the pairs
+        are queued for caching).
+        """
+        pool_cache = self._pool_cache
+        if pool_cache is not None:
+            hops = pool_cache.v2_hops(dex_contract.address, path)
+            if hops is not None:
+                try:
+                    return get_amounts_out(amount_in, hops, fee_bps)[-1]
+                except ValueError as e:
+                    raise StrategyExecutionError(
+                        f"Failed to quote expected output: {e}"
+                    )
+            pool_cache.track_v2_path(dex_contract.address, path)
         try:
-            amounts = await dex_contract.functions.getAmountsOut(amount_in, path).call()
+            amounts = await self._read_call(
+                GET_AMOUNTS_OUT, dex_contract.address, amount_in, path
+            )
             if not amounts or len(amounts) < 2:
                 raise StrategyExecutionError("DEX quote returned no amounts.")
             return int(amounts[-1])
@@ -911,90 +1234,48 @@ class TransactionManager:
         raw_path = await self._get_swap_path(opportunity)
         path = [self._web3.to_checksum_address(addr) for addr in raw_path]
 
-        # Determine expected output; if not provided, quote via DEX
-        expected_out = opportunity.get("expected_amount_out", 0)
-        if not expected_out or expected_out <= 0:
-            expected_out = await self._quote_expected_output(
-                dex_contract, amount_in=opportunity.get("amount_in", 0), path=path
-            )
-            opportunity["expected_amount_out"] = expected_out
-
-        amount_in, amount_out_min = await self._calculate_amounts_with_slippage(
-            opportunity, expected_amount_out=expected_out
-        )
-
+        wrapped_native = self._get_wrapped_native_address()
+        amount_in = self._to_wei_amount(opportunity.get("amount_in", 0))
         deadline = int(time.time()) + 300  # 5 minute deadline
 
-        # Check if we have enough balance for this swap
-        wrapped_native = self._get_wrapped_native_address()
-        first_hop = path[0].lower()
-        if first_hop != wrapped_native:  # Token in
-            token_contract = self._web3.eth.contract(
-                address=path[0], abi=self._abi_registry.get_abi("erc20_abi")
-            )
-            balance = await token_contract.functions.balanceOf(self._address).call()
-            if balance < amount_in:
-                raise InsufficientFundsError(
-                    f"Insufficient token balance. Required: {amount_in}, Available: {balance}"
-                )
-            # Ensure allowance is non-zero by default to avoid on-chain failures.
-            allowance = await self._get_token_allowance(path[0], dex_contract.address)
-            if allowance < amount_in:
-                raise StrategyExecutionError(
-                    f"Token allowance too low for spender {dex_contract.address}: {allowance} < {amount_in}"
+        async def _amounts() -> Tuple[int, int]:
+            # Determine expected output; if not provided, quote via DEX
+            expected_out = opportunity.get("expected_amount_out", 0)
+            if not expected_out or expected_out <= 0:
+                expected_out = await self._quote_expected_output(
+                    dex_contract,
+                    amount_in=amount_in,
+                    path=path,
+                    fee_bps=V2_DEX_FEE_BPS.get(dex_name.lower(), V2_FEE_BPS),
                 )
-
-        # Build transaction based on swap type
-        if path[0].lower() == wrapped_native:  # ETH to token
-            function_call = dex_contract.functions.swapExactETHForTokens(
-                amount_out_min, path, self._address, deadline
-            )
-            value = Wei(amount_in)
-        elif path[-1].lower() == wrapped_native:  # Token to ETH
-            function_call = dex_contract.functions.swapExactTokensForETH(
-                amount_in, amount_out_min, path, self._address, deadline
+                opportunity["expected_amount_out"] = expected_out
+            return await self._calculate_amounts_with_slippage(
+                opportunity, expected_amount_out=expected_out
             )
-            value = Wei(0)
-        else:  # Token to token
-            function_call = dex_contract.functions.swapExactTokensForTokens(
-                amount_in, amount_out_min, path, self._address, deadline
-            )
-            value = Wei(0)
-
-        # Build and send transaction
-        tx_data = function_call.build_transaction(
-            {
-                "from": self._address,
-                "value": value,
-                "gas": settings.default_gas_limit,
-            }
-        )["data"]
-
-        tx_params = await self._build_transaction(
-            to=dex_contract.address, data=tx_data, value=value
-        )
-
-        # Preflight simulate unless caller already simulated/bypassed
-        if not opportunity.get("simulated", False):
-            await self._simulate_transaction(tx_params)
-            opportunity["simulated"] = True
 
-        if simulate_only:
-            return {"success": True, "simulated": True}
-
-        # Override gas price if specified
-        if opportunity.get("gas_price_wei"):
-            tx_params["gasPrice"] = Wei(opportunity["gas_price_wei"])
-        elif opportunity.get("optimal_gas_price"):
-            tx_params["gasPrice"] = self._web3.to_wei(
-                opportunity["optimal_gas_price"], "gwei"
+        def _encode(amount_in: int, amount_out_min: int) -> Tuple[bytes, int]:
+            # ETH->token, token->ETH or token->token depending on the path ends
+            return encode_v2_swap(
+                path,
+                amount_in,
+                amount_out_min,
+                self._address,
+                deadline,
+                wrapped_native,
             )
 
-        expected_profit = opportunity.get("expected_profit_eth", 0)
-        return await self.execute_and_confirm(
-            tx_params,
-            strategy_name,
-            Decimal(str(expected_profit)) if expected_profit else None,
+        tx_params = await self._swap_preflight(
+            opportunity,
+            router=dex_contract.address,
+            token_in=None if path[0].lower() == wrapped_native else path[0],
+            amount_in=amount_in,
+            value=Wei(amount_in if path[0].lower() == wrapped_native else 0),
+            amounts=_amounts,
+            encode=_encode,
+            check_balance=True,
+        )
+        return await self._send_swap(
+            tx_params, opportunity, strategy_name, simulate_only
         )
 
     async def _execute_swap_v3(
@@ -1014,23 +1295,12 @@ class TransactionManager:
                 "Uniswap V3 requires expected_amount_out/amount_out_min for slippage protection."
             )
 
-        amount_in, amount_out_min = await self._calculate_amounts_with_slippage(
-            opportunity, expected_amount_out=expected_out
-        )
-
         deadline = int(time.time()) + 300
         sqrt_price_limit = int(opportunity.get("sqrt_price_limit_x96", 0))
 
         wrapped_native = self._get_wrapped_native_address()
-        token_in = path[0].lower()
-        value = Wei(amount_in) if token_in == wrapped_native else Wei(0)
-
-        if token_in != wrapped_native:
-            allowance = await self._get_token_allowance(path[0], dex_contract.address)
-            if allowance < amount_in:
-                raise StrategyExecutionError(
-                    f"Token allowance too low for spender {dex_contract.address}: {allowance} < {amount_in}"
-                )
+        amount_in = self._to_wei_amount(opportunity.get("amount_in", 0))
+        native_in = path[0].lower() == wrapped_native
 
         if len(path) == 2:
             fee = opportunity.get("fee") or opportunity.get("pool_fee")
@@ -1038,17 +1308,6 @@ class TransactionManager:
                 raise StrategyExecutionError(
                     "Uniswap V3 single-hop swaps require fee or pool_fee."
                 )
-            params = (
-                path[0],
-                path[1],
-                int(fee),
-                self._address,
-                deadline,
-                amount_in,
-                amount_out_min,
-                sqrt_price_limit,
-            )
-            function_call = dex_contract.functions.exactInputSingle(params)
         else:
             fees = opportunity.get("fees")
             if not fees:
@@ -1056,41 +1315,146 @@ class TransactionManager:
                     "Uniswap V3 multi-hop swaps require fees list."
                 )
             path_bytes = self._encode_uniswap_v3_path(path, [int(f) for f in fees])
-            params = (
-                path_bytes,
-                self._address,
-                deadline,
-                amount_in,
-                amount_out_min,
+
+        async def _amounts() -> Tuple[int, int]:
+            return await self._calculate_amounts_with_slippage(
+                opportunity, expected_amount_out=expected_out
             )
-            function_call = dex_contract.functions.exactInput(params)
 
-        tx_data = function_call.build_transaction(
-            {
+        def _encode(amount_in: int, amount_out_min: int) -> Tuple[bytes, int]:
+            value = amount_in if native_in else 0
+            if len(path) == 2:
+                params = (
+                    path[0],
+                    path[1],
+                    int(fee),
+                    self._address,
+                    deadline,
+                    amount_in,
+                    amount_out_min,
+                    sqrt_price_limit,
+                )
+                return EXACT_INPUT_SINGLE.encode(params), value
+            params = (path_bytes, self._address, deadline, amount_in, amount_out_min)
+            return EXACT_INPUT.encode(params), value
+
+        tx_params = await self._swap_preflight(
+            opportunity,
+            router=dex_contract.address,
+            token_in=None if native_in else path[0],
+            amount_in=amount_in,
+            value=Wei(amount_in if native_in else 0),
+            amounts=_amounts,
+            encode=_encode,
+            check_balance=False,
+        )
+        return await self._send_swap(
+            tx_params, opportunity, strategy_name, simulate_only
+        )
+
+    async def _check_token_balance(self, token: str, amount_in: int) -> int:
+        balance = await self._read_call(BALANCE_OF, token, self._address)
+        if balance < amount_in:
+            raise InsufficientFundsError(
+                f"Insufficient token balance. Required: {amount_in}, Available: {balance}"
+            )
+        return balance
+
+    async def _check_token_allowance(
+        self, token: str, spender: str, amount_in: int
+    ) -> int:
+        # Ensure allowance is non-zero by default to avoid on-chain failures.
+        allowance = await self._get_token_allowance(token, spender)
+        if allowance < amount_in:
+            raise StrategyExecutionError(
+                f"Token allowance too low for spender {spender}: {allowance} < {amount_in}"
+            )
+        return allowance
+
+    async def _swap_gas_price(self, opportunity: Dict[str, Any], value: Wei) -> Wei:
+        """Gas price requested by the opportunity, else the dynamic price."""
+        if opportunity.get("gas_price_wei"):
+            return Wei(opportunity["gas_price_wei"])
+        if opportunity.get("optimal_gas_price"):
+            return self._web3.to_wei(opportunity["optimal_gas_price"], "gwei")
+        return await self._resolve_gas_price(value)
+
+    async def _swap_preflight(
+        self,
+        opportunity: Dict[str, Any],
+        router: str,
+        token_in: Optional[str],
+        amount_in: int,
+        value: Wei,
+        amounts: Callable[[], Awaitable[Tuple[int, int]]],
+        encode: Callable[[int, int], Tuple[bytes, int]],
+        check_balance: bool,
+    ) -> TxParams:
+        """
+        Run a swap's pre-trade reads as a dependency graph.
+
+        Quote, balance, allowance and gas price are independent and run
+        concurrently; gas estimation and simulation start once calldata and
+        gas price are known. The first failing check cancels the rest. The
+        nonce is only taken afterwards, so a rejected swap does not consume
+        one.
+        """
+        graph = PreflightGraph(self._preflight_latency)
+        graph.add("quote", lambda _r: amounts())
+        if token_in is not None:
+            if check_balance:
+                graph.add(
+                    "balance", lambda _r: self._check_token_balance(token_in, amount_in)
+                )
+            graph.add(
+                "allowance",
+                lambda _r: self._check_token_allowance(token_in, router, amount_in),
+            )
+        graph.add("gas_price", lambda _r: self._swap_gas_price(opportunity, value))
+
+        def _call_params(results: Dict[str, Any]) -> TxParams:
+            calldata, call_value = encode(*results["quote"])
+            return {
                 "from": self._address,
-                "value": value,
-                "gas": settings.default_gas_limit,
+                "to": self._web3.to_checksum_address(router),
+                "value": Wei(call_value),
+                "data": "0x" + calldata.hex(),
+                "chainId": self._chain_id,
+                "gasPrice": results["gas_price"],
             }
-        )["data"]
 
-        tx_params = await self._build_transaction(
-            to=dex_contract.address, data=tx_data, value=value
+        graph.add(
+            "estimate_gas",
+            lambda r: self._estimate_gas_limit(_call_params(r)),
+            after=("quote", "gas_price"),
         )
+        # Preflight simulate unless caller already simulated/bypassed
+        simulate = not opportunity.get("simulated", False)
+        if simulate:
+            graph.add(
+                "simulate",
+                lambda r: self._simulate_transaction(_call_params(r)),
+                after=("quote", "gas_price"),
+            )
 
-        if not opportunity.get("simulated", False):
-            await self._simulate_transaction(tx_params)
+        results = await graph.run()
+        if simulate:
             opportunity["simulated"] = True
+        tx_params = _call_params(results)
+        tx_params["gas"] = results["estimate_gas"]
+        return tx_params
 
+    async def _send_swap(
+        self,
+        tx_params: TxParams,
+        opportunity: Dict[str, Any],
+        strategy_name: str,
+        simulate_only: bool,
+    ) -> Dict[str, Any]:
         if simulate_only:
             return {"success": True, "simulated": True}
 
-        if opportunity.get("gas_price_wei"):
-            tx_params["gasPrice"] = Wei(opportunity["gas_price_wei"])
-        elif opportunity.get("optimal_gas_price"):
-            tx_params["gasPrice"] = self._web3.to_wei(
-                opportunity["optimal_gas_price"], "gwei"
-            )
-
+        tx_params["nonce"] = await self._nonce_manager.get_next_nonce()
         expected_profit = opportunity.get("expected_profit_eth", 0)
         return await self.execute_and_confirm(
             tx_params,
@@ -1161,14 +1525,18 @@ class TransactionManager:
         # Wait for target transaction to be mined
         target_hash = target_tx.get("hash")
         if target_hash:
-            try:
-                await self.wait_for_receipt(target_hash, timeout=60)
-                logger.info("Target transaction confirmed, executing back-run")
-            except TransactionError:
+            target_status = await self._wait_for_target(target_hash, timeout=60)
+            if target_status in (REPLACED, DROPPED):
+                return {
+                    "success": False,
+                    "reason": f"Target transaction {target_status}",
+                }
+            if target_status != INCLUDED:
                 return {
                     "success": False,
                     "reason": "Target transaction not confirmed in time",
                 }
+            logger.info("Target transaction confirmed, executing back-run")
 
         # Use slightly lower gas price for back-running
         target_gas_price = target_tx.get("gasPrice", 0)
@@ -1180,7 +1548,13 @@ class TransactionManager:
         return await self.execute_swap(opportunity, "back_run")
 
     async def execute_sandwich(self, opportunity: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute sandwich attack with comprehensive coordination."""
+        """
+        Execute sandwich attack with comprehensive coordination.
+
+        With a bundle relay configured the sandwich is submitted as one atomic
+        bundle; otherwise the front-run and back-run are sent as separate
+        transactions around the target's inclusion.
+        """
         logger.info("Executing sandwich attack strategy")
 
         target_tx = opportunity.get("target_tx", {})
@@ -1189,6 +1563,8 @@ class TransactionManager:
                 "success": False,
                 "reason": "No target transaction for sandwich attack",
             }
+        if self._bundle_relays:
+            return await self._execute_sandwich_bundle(opportunity, target_tx)
 
         # Prepare front-run and back-run opportunities
         front_run_opp = opportunity.copy()
@@ -1213,16 +1589,15 @@ class TransactionManager:
         logger.info("Front-run successful, waiting for target transaction")
 
         # Wait for target transaction
-        try:
-            target_hash = target_tx.get("hash")
-            if target_hash:
-                await self.wait_for_receipt(target_hash, timeout=120)
-            else:
-                # Wait a bit for target to be mined
-                await asyncio.sleep(15)
-        except TransactionError as e:
-            logger.warning(f"Target transaction monitoring failed: {e}")
-            # Continue with back-run anyway
+        target_hash = target_tx.get("hash")
+        if target_hash:
+            target_status = await self._wait_for_target(target_hash, timeout=120)
+            if target_status != INCLUDED:
+                # Continue with back-run anyway to unwind the front-run position
+                logger.warning(f"Sandwich target transaction {target_status}")
+        else:
+            # Wait a bit for target to be mined
+            await asyncio.sleep(15)
 
         logger.info("Executing sandwich back-run")
 
@@ -1285,6 +1660,276 @@ class TransactionManager:
             "total_gas_cost_eth": front_run_cost + back_run_cost,
         }
 
+    async def _pending_target(self, target_tx: Mapping) -> Mapping:
+        """The node's body of a still-pending target transaction."""
+        try:
+            tx = await self._web3.eth.get_transaction(target_tx["hash"])
+        except TransactionNotFound:
+            tx = None
+        if tx is None:
+            raise StrategyExecutionError("Sandwich target is no longer pending.")
+        if tx.get("blockNumber") is not None:
+            raise StrategyExecutionError("Sandwich target is already included.")
+        return tx
+
+    async def _execute_sandwich_bundle(
+        self, opportunity: Dict[str, Any], target_tx: Mapping
+    ) -> Dict[str, Any]:
+        """
+        Sandwich a pending V2 swap as one [front, victim, back] bundle.
+
+        Both legs are sized and signed before anything is sent, from the
+        cached reserves as they will be around the victim: the front-run is
+        the largest size up to ``amount_in`` that still meets the victim's
+        ``amount_out_min``, and the back-run sells exactly the front-run's
+        output with a minimum that covers the front-run input (plus gas when
+        trading from the native token). The bundle lands whole and
+        profitable or not at all.
+        """
+        build_started = time.monotonic()
+        intent = target_tx.get("swap_intent") or {}
+        raw_path = intent.get("path") or []
+        victim_in = int(intent.get("amount_in") or 0)
+        victim_min_out = int(intent.get("amount_out_min") or 0)
+        if intent.get("exact_output"):
+            # amount_in is only a cap there, so the victim's impact is unknown
+            return {
+                "success": False,
+                "reason": "Exact-output sandwich targets are not supported",
+            }
+        if (
+            not is_v2_exact_input(intent)
+            or len(raw_path) < 2
+            or victim_in <= 0
+            or not target_tx.get("to")
+        ):
+            return {"success": False, "reason": "Sandwich target is not a V2 swap"}
+        upper = self._to_wei_amount(opportunity.get("amount_in", 0))
+        if upper <= 0:
+            return {"success": False, "reason": "Sandwich opportunity has no amount_in"}
+        pool_cache = self._pool_cache
+        if pool_cache is None:
+            return {
+                "success": False,
+                "reason": "Sandwich bundles require the pool state cache",
+            }
+
+        router = self._web3.to_checksum_address(target_tx["to"])
+        path = [self._web3.to_checksum_address(addr) for addr in raw_path]
+        hops = pool_cache.v2_hops(router, path)
+        if hops is None:
+            pool_cache.track_v2_path(router, path)
+            return {"success": False, "reason": "Sandwich pair reserves not cached"}
+
+        fee_bps = V2_DEX_FEE_BPS.get(
+            (target_tx.get("target_dex") or "").lower(), V2_FEE_BPS
+        )
+        try:
+            front_in = max_sandwich_front_in(
+                upper, victim_in, victim_min_out, hops, fee_bps
+            )
+            projection = (
+                project_sandwich(front_in, victim_in, victim_min_out, hops, fee_bps)
+                if front_in > 0
+                else None
+            )
+        except ValueError as e:
+            return {"success": False, "reason": f"Sandwich projection failed: {e}"}
+        if projection is None:
+            return {
+                "success": False,
+                "reason": "Target slippage leaves no room to front-run",
+            }
+        front_out, back_out = projection
+
+        wrapped_native = self._get_wrapped_native_address()
+        token_in, token_out = path[0], path[1]
+        native_in = token_in.lower() == wrapped_native
+        deadline = int(time.time()) + 300
+
+        def _leg_params(calldata: bytes, value: int, gas_price: Wei) -> TxParams:
+            return {
+                "from": self._address,
+                "to": router,
+                "value": Wei(value),
+                "data": "0x" + calldata.hex(),
+                "chainId": self._chain_id,
+                "gasPrice": gas_price,
+            }
+
+        front_data, front_value = encode_v2_swap(
+            [token_in, token_out],
+            front_in,
+            front_out,
+            self._address,
+            deadline,
+            wrapped_native,
+        )
+
+        # Victim bytes, head, allowances and gas are independent reads
+        latency = self._sandwich_latency
+        graph = PreflightGraph(latency)
+        graph.add("victim", lambda _r: self._pending_target(target_tx))
+        graph.add("head", lambda _r: self._web3.eth.block_number)
+        if token_out.lower() != wrapped_native:
+            # A back-run selling the wrapped native token goes in as ETH
+            graph.add(
+                "allowance",
+                lambda _r: self._check_token_allowance(token_out, router, front_out),
+            )
+        if not native_in:
+            graph.add(
+                "balance", lambda _r: self._check_token_balance(token_in, front_in)
+            )
+            graph.add(
+                "allowance_in",
+                lambda _r: self._check_token_allowance(token_in, router, front_in),
+            )
+        graph.add(
+            "gas_price",
+            lambda _r: self._swap_gas_price(opportunity, Wei(front_value)),
+        )
+        # The back-run cannot be estimated before the front-run has executed,
+        # so both legs get the front-run's limit
+        graph.add(
+            "estimate_gas",
+            lambda r: self._estimate_gas_limit(
+                _leg_params(front_data, front_value, r["gas_price"])
+            ),
+            after=("gas_price",),
+        )
+        results = await graph.run()
+
+        gas_price, gas = results["gas_price"], results["estimate_gas"]
+        gas_cost = 2 * gas * gas_price
+        back_min = front_in + (gas_cost if native_in else 0)
+        if back_out < back_min:
+            return {
+                "success": False,
+                "reason": "Sandwich unprofitable at projected reserves",
+                "front_in": front_in,
+                "back_out": back_out,
+            }
+        back_data, back_value = encode_v2_swap(
+            [token_out, token_in],
+            front_out,
+            back_min,
+            self._address,
+            deadline,
+            wrapped_native,
+        )
+        legs = [
+            _leg_params(front_data, front_value, gas_price),
+            _leg_params(back_data, back_value, gas_price),
+        ]
+        for checked in await asyncio.gather(
+            *(self._safety_guard.check_transaction(leg) for leg in legs)
+        ):
+            is_safe, reason = checked
+            if not is_safe:
+                raise StrategyExecutionError(f"Safety check failed: {reason}")
+        await self._check_native_balance(front_value + gas_cost)
+
+        nonces = await self._nonce_manager.get_next_nonces(len(legs))
+        signed = []
+        for leg, nonce in zip(legs, nonces):
+            leg["gas"] = gas
+            leg["nonce"] = nonce
+            signed.append(self._account.sign_transaction(leg))
+        front_hash, back_hash = (f"0x{bytes(tx.hash).hex()}" for tx in signed)
+        raw_front, raw_back = (self._get_raw_transaction_bytes(tx) for tx in signed)
+        victim = results["victim"]
+        bundle_txs = [raw_front, self._encode_signed_transaction(victim), raw_back]
+        target_block = results["head"] + self._bundle_target_block_offset
+        scheduler = self._running_bundle_scheduler()
+
+        built_at = time.monotonic()
+        build_ms = (built_at - build_started) * 1000.0
+        stats = self._sandwich_stats
+        stats["built"] += 1
+        latency["build"].record(build_ms)
+
+        try:
+            if scheduler is not None:
+                scheduled = await scheduler.schedule(
+                    bundle_txs,
+                    [
+                        (self._address, nonces[0]),
+                        (victim["from"], int(victim["nonce"])),
+                        (self._address, nonces[1]),
+                    ],
+                    first_block=target_block,
+                )
+                bundle_hash = scheduled.bundle_hash
+            else:
+                bundle_hash = await self._send_bundle(bundle_txs, target_block)
+        except Exception as e:
+            # Nothing was broadcast, so the reserved nonces were never used
+            for nonce in nonces:
+                self._nonce_manager.release(nonce)
+            return {"success": False, "reason": f"Bundle submission failed: {e}"}
+        for nonce, tx_hash in zip(nonces, (front_hash, back_hash)):
+            self._nonce_manager.commit(nonce, tx_hash)
+        submit_ms = (time.monotonic() - built_at) * 1000.0
+        latency["build_to_submit"].record(submit_ms)
+        stats["submitted"] += 1
+        self._last_bundle_hash = bundle_hash
+        logger.info(
+            "Sandwich bundle %s submitted for block %s (build %.1fms, submit %.1fms)",
+            bundle_hash,
+            target_block,
+            build_ms,
+            submit_ms,
+        )
+
+        distance = None
+        if scheduler is not None:
+            outcome = await scheduled.wait()
+            included = outcome["status"] == BUNDLE_INCLUDED
+            included_block = outcome["included_block"]
+            distance = outcome["inclusion_distance"]
+            if included:
+                self._attribute_inclusion(front_hash)
+            else:
+                logger.info(f"Sandwich bundle {bundle_hash} {outcome['status']}")
+                for nonce in nonces:
+                    self._nonce_manager.release(nonce)
+        else:
+            try:
+                receipt = await self.wait_for_receipt(
+                    front_hash, timeout=self._bundle_timeout_seconds
+                )
+            except TransactionError as e:
+                logger.info(f"Sandwich bundle {bundle_hash} not included: {e}")
+                receipt = None
+                for nonce in nonces:
+                    self._nonce_manager.release(nonce)
+            included = bool(receipt) and receipt.get("status") == 1
+            included_block = receipt.get("blockNumber") if included else None
+        if included:
+            stats["included"] += 1
+
+        return {
+            "success": included,
+            "included": included,
+            "bundle_hash": bundle_hash,
+            "front_run_tx": front_hash,
+            "back_run_tx": back_hash,
+            "target_block": target_block,
+            "included_block": included_block,
+            "inclusion_distance": distance,
+            "build_ms": build_ms,
+            "build_to_submit_ms": submit_ms,
+            "front_in": front_in,
+            "front_out": front_out,
+            "back_out": back_out,
+            "profit_eth": (
+                float(self._web3.from_wei(back_out - front_in - gas_cost, "ether"))
+                if native_in
+                else None
+            ),
+        }
+
     async def execute_flashloan_arbitrage(
         self, opportunity: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -1399,13 +2044,7 @@ class TransactionManager:
                 f"Flashloan contract not configured for chain {self._chain_id}."
             )
 
-        flashloan_abi = self._abi_registry.get_abi("aave_flashloan_abi")
-        if not flashloan_abi:
-            raise StrategyExecutionError("Flashloan ABI not found.")
-
-        contract = self._web3.eth.contract(
-            address=flashloan_contract_address, abi=flashloan_abi
-        )
+        contract = self._get_contract(flashloan_contract_address, "aave_flashloan_abi")
 
         # Check if we have enough ETH for flashloan fees
         balance_summary = await self._balance_manager.get_balance_summary()
@@ -1416,18 +2055,12 @@ class TransactionManager:
 
         # Build flashloan transaction
         try:
-            encoded_function = contract.functions.requestFlashLoan(
-                assets, amounts, user_data
-            ).build_transaction(
-                {
-                    "chainId": self._chain_id,
-                    "from": self._address,
-                    "value": 0,
-                }
+            encoded_function = contract.encode_abi(
+                "requestFlashLoan", args=[assets, amounts, user_data]
             )
 
             tx_params = await self._build_transaction(
-                to=flashloan_contract_address, data=encoded_function["data"]
+                to=flashloan_contract_address, data=encoded_function
             )
 
             # Add buffer for flashloan gas requirements
@@ -1541,4 +2174,29 @@ class TransactionManager:
                 self._execution_stats["total_gas_spent_eth"]
                 / max(1, self._execution_stats["total_transactions"])
             ),
+            "multicall": (self._multicall.get_stats() if self._multicall else {}),
+            "preflight_latency": {
+                stage: tracker.snapshot()
+                for stage, tracker in self._preflight_latency.items()
+            },
+            "relays": {
+                name: relays.get_stats()
+                for name, relays in (
+                    ("private", self._private_relays),
+                    ("bundle", self._bundle_relays),
+                )
+                if relays is not None
+            },
+            "bundle_scheduler": (
+                self.bundle_scheduler.get_stats() if self.bundle_scheduler else {}
+            ),
+            "nonces": self._nonce_manager.get_stats(),
+            "http_sessions": self._http.get_stats(),
+            "sandwich_bundles": {
+                **self._sandwich_stats,
+                "latency": {
+                    stage: tracker.snapshot()
+                    for stage, tracker in self._sandwich_latency.items()
+                },
+            },
         }
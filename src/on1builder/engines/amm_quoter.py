@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Off-chain re-implementation of the Uniswap V2 library and V3 core swap math.
+# Everything is integer arithmetic with the contracts' rounding, so results
+# are bit-exact with getAmountsOut / the V3 Quoter for the same pool state.
+
+MAX_UINT256 = (1 << 256) - 1
+MAX_UINT160 = (1 << 160) - 1
+Q96 = 1 << 96
+
+MIN_TICK = -887272
+MAX_TICK = 887272
+MIN_SQRT_RATIO = 4295128739
+MAX_SQRT_RATIO = 1461446703485210103287273052203988822378723970342
+
+V2_FEE_BPS = 30
+
+
+# --------------------------------------------------------------------------
+# Uniswap V2
+# --------------------------------------------------------------------------
+
+
+def get_amount_out(
+    amount_in: int, reserve_in: int, reserve_out: int, fee_bps: int = V2_FEE_BPS
+) -> int:
+    """UniswapV2Library.getAmountOut (0.3% fee by default)."""
+    if amount_in <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_INPUT_AMOUNT")
+    if reserve_in <= 0 or reserve_out <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_LIQUIDITY")
+    amount_in_with_fee = amount_in * (10000 - fee_bps)
+    return (amount_in_with_fee * reserve_out) // (
+        reserve_in * 10000 + amount_in_with_fee
+    )
+
+
+def get_amount_in(
+    amount_out: int, reserve_in: int, reserve_out: int, fee_bps: int = V2_FEE_BPS
+) -> int:
+    """UniswapV2Library.getAmountIn (0.3% fee by default)."""
+    if amount_out <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_OUTPUT_AMOUNT")
+    if reserve_in <= 0 or reserve_out <= amount_out:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_LIQUIDITY")
+    numerator = reserve_in * amount_out * 10000
+    denominator = (reserve_out - amount_out) * (10000 - fee_bps)
+    return numerator // denominator + 1
+
+
+def get_amounts_out(
+    amount_in: int, hops: Sequence[Tuple[int, int]], fee_bps: int = V2_FEE_BPS
+) -> List[int]:
+    """UniswapV2Library.getAmountsOut over ``(reserve_in, reserve_out)`` hops."""
+    amounts = [amount_in]
+    for reserve_in, reserve_out in hops:
+        amounts.append(get_amount_out(amounts[-1], reserve_in, reserve_out, fee_bps))
+    return amounts
+
+
+def amounts_out_many(
+    amounts_in: Sequence[int],
+    hops: Sequence[Tuple[int, int]],
+    fee_bps: int = V2_FEE_BPS,
+) -> List[int]:
+    """
+    Final output of a V2 path for many candidate input sizes.
+
+    The per-hop constants are hoisted out of the loop, so sizing a trade
+    over a grid of inputs costs a few big-int operations per candidate.
+    """
+    fee_factor = 10000 - fee_bps
+    outputs = list(amounts_in)
+    for reserve_in, reserve_out in hops:
+        if reserve_in <= 0 or reserve_out <= 0:
+            raise ValueError("UniswapV2Library: INSUFFICIENT_LIQUIDITY")
+        scaled_reserve_in = reserve_in * 10000
+        for i, amount in enumerate(outputs):
+            if amount <= 0:
+                outputs[i] = 0
+                continue
+            with_fee = amount * fee_factor
+            outputs[i] = (with_fee * reserve_out) // (scaled_reserve_in + with_fee)
+    return outputs
+
+
+def project_sandwich(
+    front_in: int,
+    victim_in: int,
+    victim_min_out: int,
+    hops: Sequence[Tuple[int, int]],
+    fee_bps: int = V2_FEE_BPS,
+) -> Optional[Tuple[int, int]]:
+    """
+    Front-run, victim and back-run on the first pair of a V2 path.
+
+    The front-run buys with ``front_in`` on the first hop, the victim swaps
+    the whole path, and the back-run sells the front-run's output back on
+    the first hop. Returns ``(front_out, back_out)``, or None when the
+    victim's ``amount_out_min`` would no longer be met (it would revert).
+    """
+    reserve_in, reserve_out = hops[0]
+    front_out = get_amount_out(front_in, reserve_in, reserve_out, fee_bps)
+    reserve_in, reserve_out = reserve_in + front_in, reserve_out - front_out
+    victim = get_amounts_out(victim_in, [(reserve_in, reserve_out), *hops[1:]], fee_bps)
+    if victim[-1] < victim_min_out:
+        return None
+    reserve_in, reserve_out = reserve_in + victim_in, reserve_out - victim[1]
+    back_out = get_amount_out(front_out, reserve_out, reserve_in, fee_bps)
+    return front_out, back_out
+
+
+def max_sandwich_front_in(
+    upper: int,
+    victim_in: int,
+    victim_min_out: int,
+    hops: Sequence[Tuple[int, int]],
+    fee_bps: int = V2_FEE_BPS,
+) -> int:
+    """Largest front-run input up to ``upper`` that leaves the victim valid."""
+    if project_sandwich(upper, victim_in, victim_min_out, hops, fee_bps):
+        return upper
+    low, high = 0, upper
+    while high - low > max(1, upper >> 20):
+        mid = (low + high) // 2
+        if mid and project_sandwich(mid, victim_in, victim_min_out, hops, fee_bps):
+            low = mid
+        else:
+            high = mid
+    return low
+
+
+# --------------------------------------------------------------------------
+# Uniswap V3: FullMath / TickMath / SqrtPriceMath / SwapMath
+# --------------------------------------------------------------------------
+
+
+def _mul_div(a: int, b: int, denominator: int) -> int:
+    result = a * b // denominator
+    if result > MAX_UINT256:
+        raise ValueError("FullMath: overflow")
+    return result
+
+
+def _mul_div_rounding_up(a: int, b: int, denominator: int) -> int:
+    result = -(-a * b // denominator)
+    if result > MAX_UINT256:
+        raise ValueError("FullMath: overflow")
+    return result
+
+
+def _div_rounding_up(x: int, y: int) -> int:
+    return -(-x // y)
+
+
+_TICK_FACTORS = (
+    (0x2, 0xFFF97272373D413259A46990580E213A),
+    (0x4, 0xFFF2E50F5F656932EF12357CF3C7FDCC),
+    (0x8, 0xFFE5CACA7E10E4E61C3624EAA0941CD0),
+    (0x10, 0xFFCB9843D60F6159C9DB58835C926644),
+    (0x20, 0xFF973B41FA98C081472E6896DFB254C0),
+    (0x40, 0xFF2EA16466C96A3843EC78B326B52861),
+    (0x80, 0xFE5DEE046A99A2A811C461F1969C3053),
+    (0x100, 0xFCBE86C7900A88AEDCFFC83B479AA3A4),
+    (0x200, 0xF987A7253AC413176F2B074CF7815E54),
+    (0x400, 0xF3392B0822B70005940C7A398E4B70F3),
+    (0x800, 0xE7159475A2C29B7443B29C7FA6E889D9),
+    (0x1000, 0xD097F3BDFD2022B8845AD8F792AA5825),
+    (0x2000, 0xA9F746462D870FDF8A65DC1F90E061E5),
+    (0x4000, 0x70D869A156D2A1B890BB3DF62BAF32F7),
+    (0x8000, 0x31BE135F97D08FD981231505542FCFA6),
+    (0x10000, 0x9AA508B5B7A84E1C677DE54F3E99BC9),
+    (0x20000, 0x5D6AF8DEDB81196699C329225EE604),
+    (0x40000, 0x2216E584F5FA1EA926041BEDFE98),
+    (0x80000, 0x48A170391F7DC42444E8FA2),
+)
+
+
+@lru_cache(maxsize=65536)
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """TickMath.getSqrtRatioAtTick: sqrt(1.0001^tick) as a Q64.96."""
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise ValueError("TickMath: T")
+    ratio = (
+        0xFFFCB933BD6FAD37AA2D162D1A594001
+        if abs_tick & 0x1
+        else 0x100000000000000000000000000000000
+    )
+    for bit, factor in _TICK_FACTORS:
+        if abs_tick & bit:
+            ratio = (ratio * factor) >> 128
+    if tick > 0:
+        ratio = MAX_UINT256 // ratio
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+
+def get_tick_at_sqrt_ratio(sqrt_price_x96: int) -> int:
+    """TickMath.getTickAtSqrtRatio: greatest tick whose ratio is <= input."""
+    if not MIN_SQRT_RATIO <= sqrt_price_x96 < MAX_SQRT_RATIO:
+        raise ValueError("TickMath: R")
+    low, high = MIN_TICK, MAX_TICK
+    while low < high:
+        mid = (low + high + 1) // 2
+        if get_sqrt_ratio_at_tick(mid) <= sqrt_price_x96:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _next_sqrt_price_from_amount0_rounding_up(
+    sqrt_price_x96: int, liquidity: int, amount: int, add: bool
+) -> int:
+    if amount == 0:
+        return sqrt_price_x96
+    numerator1 = liquidity << 96
+    product = amount * sqrt_price_x96
+    if add:
+        if product <= MAX_UINT256 and numerator1 + product <= MAX_UINT256:
+            return _mul_div_rounding_up(
+                numerator1, sqrt_price_x96, numerator1 + product
+            )
+        return _div_rounding_up(numerator1, numerator1 // sqrt_price_x96 + amount)
+    if product > MAX_UINT256 or numerator1 <= product:
+        raise ValueError("SqrtPriceMath: amount0 exceeds liquidity")
+    result = _mul_div_rounding_up(numerator1, sqrt_price_x96, numerator1 - product)
+    if result > MAX_UINT160:
+        raise ValueError("SqrtPriceMath: uint160 overflow")
+    return result
+
+
+def _next_sqrt_price_from_amount1_rounding_down(
+    sqrt_price_x96: int, liquidity: int, amount: int, add: bool
+) -> int:
+    if add:
+        result = sqrt_price_x96 + (amount << 96) // liquidity
+        if result > MAX_UINT160:
+            raise ValueError("SqrtPriceMath: uint160 overflow")
+        return result
+    quotient = _div_rounding_up(amount << 96, liquidity)
+    if sqrt_price_x96 <= quotient:
+        raise ValueError("SqrtPriceMath: amount1 exceeds liquidity")
+    return sqrt_price_x96 - quotient
+
+
+def get_next_sqrt_price_from_input(
+    sqrt_price_x96: int, liquidity: int, amount_in: int, zero_for_one: bool
+) -> int:
+    if sqrt_price_x96 <= 0 or liquidity <= 0:
+        raise ValueError("SqrtPriceMath: zero price or liquidity")
+    if zero_for_one:
+        return _next_sqrt_price_from_amount0_rounding_up(
+            sqrt_price_x96, liquidity, amount_in, True
+        )
+    return _next_sqrt_price_from_amount1_rounding_down(
+        sqrt_price_x96, liquidity, amount_in, True
+    )
+
+
+def get_next_sqrt_price_from_output(
+    sqrt_price_x96: int, liquidity: int, amount_out: int, zero_for_one: bool
+) -> int:
+    if sqrt_price_x96 <= 0 or liquidity <= 0:
+        raise ValueError("SqrtPriceMath: zero price or liquidity")
+    if zero_for_one:
+        return _next_sqrt_price_from_amount1_rounding_down(
+            sqrt_price_x96, liquidity, amount_out, False
+        )
+    return _next_sqrt_price_from_amount0_rounding_up(
+        sqrt_price_x96, liquidity, amount_out, False
+    )
+
+
+def get_amount0_delta(
+    sqrt_a_x96: int, sqrt_b_x96: int, liquidity: int, round_up: bool
+) -> int:
+    if sqrt_a_x96 > sqrt_b_x96:
+        sqrt_a_x96, sqrt_b_x96 = sqrt_b_x96, sqrt_a_x96
+    if sqrt_a_x96 <= 0:
+        raise ValueError("SqrtPriceMath: zero price")
+    numerator1 = liquidity << 96
+    numerator2 = sqrt_b_x96 - sqrt_a_x96
+    if round_up:
+        return _div_rounding_up(
+            _mul_div_rounding_up(numerator1, numerator2, sqrt_b_x96), sqrt_a_x96
+        )
+    return _mul_div(numerator1, numerator2, sqrt_b_x96) // sqrt_a_x96
+
+
+def get_amount1_delta(
+    sqrt_a_x96: int, sqrt_b_x96: int, liquidity: int, round_up: bool
+) -> int:
+    if sqrt_a_x96 > sqrt_b_x96:
+        sqrt_a_x96, sqrt_b_x96 = sqrt_b_x96, sqrt_a_x96
+    if round_up:
+        return _mul_div_rounding_up(liquidity, sqrt_b_x96 - sqrt_a_x96, Q96)
+    return _mul_div(liquidity, sqrt_b_x96 - sqrt_a_x96, Q96)
+
+
+def compute_swap_step(
+    sqrt_price_current_x96: int,
+    sqrt_price_target_x96: int,
+    liquidity: int,
+    amount_remaining: int,
+    fee_pips: int,
+) -> Tuple[int, int, int, int]:
+    """
+    SwapMath.computeSwapStep.
+
+    ``amount_remaining`` is signed like the contract: positive for exact
+    input, negative for exact output. Returns
+    ``(sqrt_price_next_x96, amount_in, amount_out, fee_amount)``.
+    """
+    zero_for_one = sqrt_price_current_x96 >= sqrt_price_target_x96
+    exact_in = amount_remaining >= 0
+
+    if exact_in:
+        remaining_less_fee = _mul_div(amount_remaining, 1_000_000 - fee_pips, 1_000_000)
+        amount_in = (
+            get_amount0_delta(
+                sqrt_price_target_x96, sqrt_price_current_x96, liquidity, True
+            )
+            if zero_for_one
+            else get_amount1_delta(
+                sqrt_price_current_x96, sqrt_price_target_x96, liquidity, True
+            )
+        )
+        if remaining_less_fee >= amount_in:
+            sqrt_price_next = sqrt_price_target_x96
+        else:
+            sqrt_price_next = get_next_sqrt_price_from_input(
+                sqrt_price_current_x96, liquidity, remaining_less_fee, zero_for_one
+            )
+    else:
+        amount_out = (
+            get_amount1_delta(
+                sqrt_price_target_x96, sqrt_price_current_x96, liquidity, False
+            )
+            if zero_for_one
+            else get_amount0_delta(
+                sqrt_price_current_x96, sqrt_price_target_x96, liquidity, False
+            )
+        )
+        if -amount_remaining >= amount_out:
+            sqrt_price_next = sqrt_price_target_x96
+        else:
+            sqrt_price_next = get_next_sqrt_price_from_output(
+                sqrt_price_current_x96, liquidity, -amount_remaining, zero_for_one
+            )
+
+    reached_target = sqrt_price_target_x96 == sqrt_price_next
+    if zero_for_one:
+        if not (reached_target and exact_in):
+            amount_in = get_amount0_delta(
+                sqrt_price_next, sqrt_price_current_x96, liquidity, True
+            )
+        if not (reached_target and not exact_in):
+            amount_out = get_amount1_delta(
+                sqrt_price_next, sqrt_price_current_x96, liquidity, False
+            )
+    else:
+        if not (reached_target and exact_in):
+            amount_in = get_amount1_delta(
+                sqrt_price_current_x96, sqrt_price_next, liquidity, True
+            )
+        if not (reached_target and not exact_in):
+            amount_out = get_amount0_delta(
+                sqrt_price_current_x96, sqrt_price_next, liquidity, False
+            )
+
+    if not exact_in and amount_out > -amount_remaining:
+        amount_out = -amount_remaining
+
+    if exact_in and sqrt_price_next != sqrt_price_target_x96:
+        fee_amount = amount_remaining - amount_in
+    else:
+        fee_amount = _mul_div_rounding_up(amount_in, fee_pips, 1_000_000 - fee_pips)
+    return sqrt_price_next, amount_in, amount_out, fee_amount
+
+
+# --------------------------------------------------------------------------
+# Uniswap V3 pool swap
+# --------------------------------------------------------------------------
+
+
+@dataclass
+class V3PoolState:
+    """
+    Cached V3 pool state: ``slot0`` price/tick, active liquidity, fee (pips),
+    tick spacing and ``liquidityNet`` of every initialized tick.
+    """
+
+    sqrt_price_x96: int
+    tick: int
+    liquidity: int
+    fee: int
+    tick_spacing: int
+    ticks: Dict[int, int] = field(default_factory=dict)
+    _sorted_ticks: List[int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._sorted_ticks = sorted(self.ticks)
+
+    def update_tick(self, tick: int, liquidity_net: int, initialized: bool) -> None:
+        """Set a tick's ``liquidityNet``; uninitialized ticks are removed."""
+        known = tick in self.ticks
+        if initialized:
+            self.ticks[tick] = liquidity_net
+            if not known:
+                insort(self._sorted_ticks, tick)
+        elif known:
+            del self.ticks[tick]
+            self._sorted_ticks.remove(tick)
+
+    def next_initialized_tick_within_one_word(
+        self, tick: int, lte: bool
+    ) -> Tuple[int, bool]:
+        """TickBitmap.nextInitializedTickWithinOneWord over the cached ticks."""
+        spacing = self.tick_spacing
+        compressed = tick // spacing
+        ticks = self._sorted_ticks
+        if lte:
+            word_start = (compressed >> 8) << 8
+            index = bisect_right(ticks, compressed * spacing) - 1
+            if index >= 0 and ticks[index] >= word_start * spacing:
+                return ticks[index], True
+            return word_start * spacing, False
+        compressed += 1
+        word_end = ((compressed >> 8) << 8) + 255
+        index = bisect_left(ticks, compressed * spacing)
+        if index < len(ticks) and ticks[index] <= word_end * spacing:
+            return ticks[index], True
+        return word_end * spacing, False
+
+
+def swap(
+    pool: V3PoolState,
+    zero_for_one: bool,
+    amount_specified: int,
+    sqrt_price_limit_x96: Optional[int] = None,
+) -> Tuple[int, int, int, int, int]:
+    """
+    UniswapV3Pool.swap without transfers or state writes.
+
+    ``amount_specified`` > 0 is an exact input, < 0 an exact output.
+    Returns ``(amount0, amount1, sqrt_price_x96, tick, liquidity)`` with the
+    pool's sign convention (positive = paid into the pool).
+    """
+    if amount_specified == 0:
+        raise ValueError("UniswapV3Pool: AS")
+    if sqrt_price_limit_x96 is None:
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+    if zero_for_one:
+        if not MIN_SQRT_RATIO < sqrt_price_limit_x96 < pool.sqrt_price_x96:
+            raise ValueError("UniswapV3Pool: SPL")
+    elif not pool.sqrt_price_x96 < sqrt_price_limit_x96 < MAX_SQRT_RATIO:
+        raise ValueError("UniswapV3Pool: SPL")
+
+    exact_input = amount_specified > 0
+    remaining = amount_specified
+    calculated = 0
+    sqrt_price = pool.sqrt_price_x96
+    tick = pool.tick
+    liquidity = pool.liquidity
+
+    while remaining != 0 and sqrt_price != sqrt_price_limit_x96:
+        sqrt_price_start = sqrt_price
+        tick_next, initialized = pool.next_initialized_tick_within_one_word(
+            tick, zero_for_one
+        )
+        tick_next = min(max(tick_next, MIN_TICK), MAX_TICK)
+        sqrt_price_next = get_sqrt_ratio_at_tick(tick_next)
+        if (
+            sqrt_price_next < sqrt_price_limit_x96
+            if zero_for_one
+            else sqrt_price_next > sqrt_price_limit_x96
+        ):
+            target = sqrt_price_limit_x96
+        else:
+            target = sqrt_price_next
+
+        sqrt_price, step_in, step_out, fee_amount = compute_swap_step(
+            sqrt_price, target, liquidity, remaining, pool.fee
+        )
+        if exact_input:
+            remaining -= step_in + fee_amount
+            calculated -= step_out
+        else:
+            remaining += step_out
+            calculated += step_in + fee_amount
+
+        if sqrt_price == sqrt_price_next:
+            if initialized:
+                liquidity_net = pool.ticks[tick_next]
+                if zero_for_one:
+                    liquidity_net = -liquidity_net
+                liquidity += liquidity_net
+                if liquidity < 0:
+                    raise ValueError("LiquidityMath: LS")
+            tick = tick_next - 1 if zero_for_one else tick_next
+        elif sqrt_price != sqrt_price_start:
+            tick = get_tick_at_sqrt_ratio(sqrt_price)
+
+    if zero_for_one == exact_input:
+        amount0, amount1 = amount_specified - remaining, calculated
+    else:
+        amount0, amount1 = calculated, amount_specified - remaining
+    return amount0, amount1, sqrt_price, tick, liquidity
+
+
+def quote_exact_input_single(
+    pool: V3PoolState,
+    zero_for_one: bool,
+    amount_in: int,
+    sqrt_price_limit_x96: Optional[int] = None,
+) -> int:
+    """QuoterV2.quoteExactInputSingle against a cached pool state."""
+    amount0, amount1, *_ = swap(pool, zero_for_one, amount_in, sqrt_price_limit_x96)
+    return -(amount1 if zero_for_one else amount0)
+
+
+def quote_exact_input(hops: Sequence[Tuple[V3PoolState, bool]], amount_in: int) -> int:
+    """Multi-hop exact input over ``(pool, zero_for_one)`` hops."""
+    amount = amount_in
+    for pool, zero_for_one in hops:
+        amount = quote_exact_input_single(pool, zero_for_one, amount)
+    return amount
+
+
+def quote_exact_input_many(
+    pool: V3PoolState, zero_for_one: bool, amounts_in: Sequence[int]
+) -> List[int]:
+    """Exact-input quotes for many candidate sizes against one pool state."""
+    return [
+        quote_exact_input_single(pool, zero_for_one, amount) if amount > 0 else 0
+        for amount in amounts_in
+    ]
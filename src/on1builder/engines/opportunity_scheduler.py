@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from on1builder.utils.latency_tracker import LatencyTracker
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Heap entry: (-score, sequence, enqueued_at, opportunity, target)
+_Entry = Tuple[float, int, float, Dict[str, Any], Any]
+
+
+def _deadline(opportunity: Mapping) -> Optional[datetime]:
+    deadline = opportunity.get("execution_deadline")
+    return deadline if isinstance(deadline, datetime) else None
+
+
+def _priority(opportunity: Mapping) -> float:
+    priority = opportunity.get("priority_score")
+    if priority is None:
+        target = opportunity.get("target_tx")
+        if isinstance(target, Mapping):
+            priority = target.get("priority_score")
+    return float(priority or 0.0)
+
+
+class OpportunityScheduler:
+    """
+    Deadline-aware priority queue in front of opportunity execution.
+
+    Opportunities are ranked by expected profit weighted by ``priority_score``
+    and divided by the seconds left until ``execution_deadline``, so a
+    short-lived front-run outranks an arbitrage of equal value that can wait.
+    A fixed number of workers executes the best entry first; entries whose
+    deadline passed, or that ``is_stale`` rejects (e.g. the target was
+    mined), are dropped when they reach the head of the queue. When the
+    queue is full the lowest-ranked entry is shed.
+    """
+
+    # Ranking horizon for opportunities without an execution deadline
+    DEFAULT_HORIZON_SECONDS = 120.0
+    MIN_HORIZON_SECONDS = 1.0
+
+    def __init__(
+        self,
+        execute: Callable[[Dict[str, Any]], Awaitable[Any]],
+        max_concurrency: int = 2,
+        max_queued: int = 1000,
+        is_stale: Optional[Callable[[Any], bool]] = None,
+    ):
+        if max_concurrency <= 0 or max_queued <= 0:
+            raise ValueError("OpportunityScheduler bounds must be > 0")
+        self._execute = execute
+        self._max_concurrency = max_concurrency
+        self._max_queued = max_queued
+        self._is_stale = is_stale
+
+        self._heap: List[_Entry] = []
+        self._sequence = 0
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._workers: List[asyncio.Task] = []
+        self._running = 0
+
+        self._counters: Dict[str, int] = {
+            "submitted": 0,
+            "executed": 0,
+            "failed": 0,
+            "expired": 0,
+            "stale": 0,
+            "shed": 0,
+        }
+        self._queue_wait = LatencyTracker()
+        self._execution_latency = LatencyTracker()
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers)
+
+    def score(self, opportunity: Mapping, now: Optional[datetime] = None) -> float:
+        """Expected profit per second of remaining deadline, priority-weighted."""
+        profit = float(
+            opportunity.get("expected_profit_eth")
+            or opportunity.get("estimated_profit_eth")
+            or 0.0
+        )
+        deadline = _deadline(opportunity)
+        if deadline is None:
+            horizon = self.DEFAULT_HORIZON_SECONDS
+        else:
+            horizon = (deadline - (now or datetime.now())).total_seconds()
+        return (
+            profit
+            * (1.0 + _priority(opportunity))
+            / max(horizon, self.MIN_HORIZON_SECONDS)
+        )
+
+    def submit(self, opportunity: Dict[str, Any], target: Any = None) -> bool:
+        """
+        Queue an opportunity; ``target`` is passed to ``is_stale`` later.
+
+        Returns:
+            False if it was rejected (already expired, or ranked below
+            everything in a full queue).
+        """
+        self._counters["submitted"] += 1
+        now = datetime.now()
+        deadline = _deadline(opportunity)
+        if deadline is not None and deadline <= now:
+            self._counters["expired"] += 1
+            return False
+
+        entry: _Entry = (
+            -self.score(opportunity, now),
+            self._sequence,
+            time.monotonic(),
+            opportunity,
+            target,
+        )
+        self._sequence += 1
+        if len(self._heap) >= self._max_queued:
+            self._counters["shed"] += 1
+            worst = max(range(len(self._heap)), key=self._heap.__getitem__)
+            if entry >= self._heap[worst]:
+                return False
+            self._heap[worst] = self._heap[-1]
+            self._heap.pop()
+            heapq.heapify(self._heap)
+        heapq.heappush(self._heap, entry)
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self._max_concurrency)
+        ]
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._running = 0
+        if not self._heap:
+            self._idle.set()
+
+    async def join(self) -> None:
+        """Wait until the queue is empty and no execution is in flight."""
+        await self._idle.wait()
+
+    async def _worker(self) -> None:
+        while True:
+            while not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            _, _, enqueued_at, opportunity, target = heapq.heappop(self._heap)
+            self._running += 1
+            try:
+                await self._run(opportunity, target, enqueued_at)
+            finally:
+                self._running -= 1
+                if not self._heap and not self._running:
+                    self._idle.set()
+
+    async def _run(
+        self, opportunity: Dict[str, Any], target: Any, enqueued_at: float
+    ) -> None:
+        self._queue_wait.record_since(enqueued_at)
+        deadline = _deadline(opportunity)
+        if deadline is not None and deadline <= datetime.now():
+            self._counters["expired"] += 1
+            return
+        if self._is_stale is not None and target is not None and self._is_stale(target):
+            self._counters["stale"] += 1
+            return
+
+        started = time.monotonic()
+        try:
+            await self._execute(opportunity)
+            self._counters["executed"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._counters["failed"] += 1
+            logger.debug("Scheduled opportunity failed: %s", e)
+        finally:
+            self._execution_latency.record_since(started)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queued": len(self._heap),
+            "running": self._running,
+            "max_concurrency": self._max_concurrency,
+            **self._counters,
+            "queue_wait": self._queue_wait.snapshot(),
+            "execution_latency": self._execution_latency.snapshot(),
+        }
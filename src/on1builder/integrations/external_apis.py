@@ -15,6 +15,14 @@ import aiohttp
 from cachetools import TTLCache
 
 from on1builder.config.loaders import settings
+from on1builder.core.call_encoders import (
+    DECIMALS,
+    GET_RESERVES,
+    LATEST_ROUND_DATA,
+    TOKEN0,
+    TOKEN1,
+)
+from on1builder.core.multicall import get_multicall
 from on1builder.utils.web3_factory import Web3ConnectionFactory
 from on1builder.utils.custom_exceptions import APICallError
 from on1builder.utils.logging_config import get_logger
@@ -891,47 +899,11 @@ class ExternalAPIManager(metaclass=SingletonMeta):
                     self._primary_chain_id
                 )
 
-            aggregator_abi = [
-                {
-                    "inputs": [],
-                    "name": "decimals",
-                    "outputs": [{"internalType": "uint8", "name": "", "type": "uint8"}],
-                    "stateMutability": "view",
-                    "type": "function",
-                },
-                {
-                    "inputs": [],
-                    "name": "latestRoundData",
-                    "outputs": [
-                        {"internalType": "uint80", "name": "roundId", "type": "uint80"},
-                        {"internalType": "int256", "name": "answer", "type": "int256"},
-                        {
-                            "internalType": "uint256",
-                            "name": "startedAt",
-                            "type": "uint256",
-                        },
-                        {
-                            "internalType": "uint256",
-                            "name": "updatedAt",
-                            "type": "uint256",
-                        },
-                        {
-                            "internalType": "uint80",
-                            "name": "answeredInRound",
-                            "type": "uint80",
-                        },
-                    ],
-                    "stateMutability": "view",
-                    "type": "function",
-                },
-            ]
-            contract = self._onchain_web3.eth.contract(
-                address=self._onchain_web3.to_checksum_address(feed_address),
-                abi=aggregator_abi,
-            )
-            decimals = await contract.functions.decimals().call()
-            _, answer, _, updated_at, _ = (
-                await contract.functions.latestRoundData().call()
+            multicall = get_multicall(self._onchain_web3)
+            feed = self._onchain_web3.to_checksum_address(feed_address)
+            decimals, (_, answer, _, updated_at, _) = await asyncio.gather(
+                multicall.call(DECIMALS, feed),
+                multicall.call(LATEST_ROUND_DATA, feed),
             )
             if answer is None or int(answer) <= 0:
                 return None
@@ -1253,14 +1225,16 @@ class ExternalAPIManager(metaclass=SingletonMeta):
             if not pair_address:
                 return None
 
-            reserves = await self._get_pair_reserves(web3, pair_address)
+            # Reserves and token order coalesce into one multicall
+            reserves, token0, token1 = await asyncio.gather(
+                self._get_pair_reserves(web3, pair_address),
+                self._get_pair_token(web3, pair_address, 0),
+                self._get_pair_token(web3, pair_address, 1),
+            )
             if not reserves:
                 return None
 
             reserve0, reserve1 = reserves
-            # Determine token position
-            token0 = await self._get_pair_token(web3, pair_address, 0)
-            token1 = await self._get_pair_token(web3, pair_address, 1)
             if not token0 or not token1:
                 return None
 
@@ -1372,36 +1346,10 @@ class ExternalAPIManager(metaclass=SingletonMeta):
     async def _get_pair_reserves(self, web3, pair_address: str) -> Optional[tuple]:
         """Get reserves from a Uniswap V2 pair."""
         try:
-            pair_abi = [
-                {
-                    "inputs": [],
-                    "name": "getReserves",
-                    "outputs": [
-                        {
-                            "internalType": "uint112",
-                            "name": "_reserve0",
-                            "type": "uint112",
-                        },
-                        {
-                            "internalType": "uint112",
-                            "name": "_reserve1",
-                            "type": "uint112",
-                        },
-                        {
-                            "internalType": "uint32",
-                            "name": "_blockTimestampLast",
-                            "type": "uint32",
-                        },
-                    ],
-                    "stateMutability": "view",
-                    "type": "function",
-                }
-            ]
-            contract = web3.eth.contract(
-                address=web3.to_checksum_address(pair_address), abi=pair_abi
+            reserve0, reserve1, _ = await get_multicall(web3).call(
+                GET_RESERVES, web3.to_checksum_address(pair_address)
             )
-            reserves = await contract.functions.getReserves().call()
-            return reserves[0], reserves[1]
+            return reserve0, reserve1
         except Exception:
             return None
 
@@ -1410,23 +1358,10 @@ class ExternalAPIManager(metaclass=SingletonMeta):
     ) -> Optional[str]:
         """Get token0 or token1 address from a Uniswap V2 pair."""
         try:
-            fn = "token0" if index == 0 else "token1"
-            abi = [
-                {
-                    "inputs": [],
-                    "name": fn,
-                    "outputs": [
-                        {"internalType": "address", "name": "", "type": "address"}
-                    ],
-                    "stateMutability": "view",
-                    "type": "function",
-                }
-            ]
-            contract = web3.eth.contract(
-                address=web3.to_checksum_address(pair_address), abi=abi
+            return await get_multicall(web3).call(
+                TOKEN0 if index == 0 else TOKEN1,
+                web3.to_checksum_address(pair_address),
             )
-            addr = await getattr(contract.functions, fn)().call()
-            return addr
         except Exception:
             return None
 
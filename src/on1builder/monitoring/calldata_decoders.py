@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+import eth_abi
+from eth_utils import abi_to_signature
+
+from on1builder.monitoring.selector_index import (
+    SelectorIndex,
+    build_abi_swap_decoder,
+    decode_v3_path,
+    make_swap_intent,
+)
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def _struct_abi(name: str, components: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """Build a single-struct-argument function ABI for the generic decoder."""
+    return {
+        "type": "function",
+        "name": name,
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "params",
+                "type": "tuple",
+                "components": [
+                    {"name": arg_name, "type": arg_type}
+                    for arg_type, arg_name in components
+                ],
+            }
+        ],
+    }
+
+
+def _args_abi(name: str, args: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """Build a positional-argument function ABI for the generic decoder."""
+    return {
+        "type": "function",
+        "name": name,
+        "stateMutability": "payable",
+        "inputs": [{"name": arg_name, "type": arg_type} for arg_type, arg_name in args],
+    }
+
+
+class CalldataDecoderPlugin(ABC):
+    """
+    Base class for calldata decoder plugins.
+
+    A plugin registers one or more function signatures with the selector index
+    together with a decoder that returns a normalized swap intent (see
+    :func:`make_swap_intent`).
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def register(self, index: SelectorIndex) -> None:
+        """Add this plugin's signatures and decoders to ``index``."""
+
+
+class SwapRouterPlugin(CalldataDecoderPlugin):
+    """
+    Uniswap V3 SwapRouter / SwapRouter02 functions and their ``multicall``
+    wrappers.
+
+    Multicall payloads are unpacked and each inner call is dispatched through
+    the selector index, so any router function the index understands is
+    decoded once, at the outer level.
+    """
+
+    name = "uniswap_swap_router"
+
+    ROUTER_FUNCTIONS = (
+        # SwapRouter exact-output functions (not in the bundled V3 ABI)
+        (
+            _struct_abi(
+                "exactOutputSingle",
+                [
+                    ("address", "tokenIn"),
+                    ("address", "tokenOut"),
+                    ("uint24", "fee"),
+                    ("address", "recipient"),
+                    ("uint256", "deadline"),
+                    ("uint256", "amountOut"),
+                    ("uint256", "amountInMaximum"),
+                    ("uint160", "sqrtPriceLimitX96"),
+                ],
+            ),
+            "uniswap_v3",
+        ),
+        (
+            _struct_abi(
+                "exactOutput",
+                [
+                    ("bytes", "path"),
+                    ("address", "recipient"),
+                    ("uint256", "deadline"),
+                    ("uint256", "amountOut"),
+                    ("uint256", "amountInMaximum"),
+                ],
+            ),
+            "uniswap_v3",
+        ),
+        # SwapRouter02 drops the per-call deadline and adds V2 routes
+        (
+            _struct_abi(
+                "exactInputSingle",
+                [
+                    ("address", "tokenIn"),
+                    ("address", "tokenOut"),
+                    ("uint24", "fee"),
+                    ("address", "recipient"),
+                    ("uint256", "amountIn"),
+                    ("uint256", "amountOutMinimum"),
+                    ("uint160", "sqrtPriceLimitX96"),
+                ],
+            ),
+            "uniswap_v3",
+        ),
+        (
+            _struct_abi(
+                "exactInput",
+                [
+                    ("bytes", "path"),
+                    ("address", "recipient"),
+                    ("uint256", "amountIn"),
+                    ("uint256", "amountOutMinimum"),
+                ],
+            ),
+            "uniswap_v3",
+        ),
+        (
+            _struct_abi(
+                "exactOutputSingle",
+                [
+                    ("address", "tokenIn"),
+                    ("address", "tokenOut"),
+                    ("uint24", "fee"),
+                    ("address", "recipient"),
+                    ("uint256", "amountOut"),
+                    ("uint256", "amountInMaximum"),
+                    ("uint160", "sqrtPriceLimitX96"),
+                ],
+            ),
+            "uniswap_v3",
+        ),
+        (
+            _struct_abi(
+                "exactOutput",
+                [
+                    ("bytes", "path"),
+                    ("address", "recipient"),
+                    ("uint256", "amountOut"),
+                    ("uint256", "amountInMaximum"),
+                ],
+            ),
+            "uniswap_v3",
+        ),
+        (
+            _args_abi(
+                "swapExactTokensForTokens",
+                [
+                    ("uint256", "amountIn"),
+                    ("uint256", "amountOutMin"),
+                    ("address[]", "path"),
+                    ("address", "to"),
+                ],
+            ),
+            "uniswap_v2",
+        ),
+        (
+            _args_abi(
+                "swapTokensForExactTokens",
+                [
+                    ("uint256", "amountOut"),
+                    ("uint256", "amountInMax"),
+                    ("address[]", "path"),
+                    ("address", "to"),
+                ],
+            ),
+            "uniswap_v2",
+        ),
+    )
+
+    MULTICALLS = (
+        ("multicall(bytes[])", ["bytes[]"], None),
+        ("multicall(uint256,bytes[])", ["uint256", "bytes[]"], 0),
+        ("multicall(bytes32,bytes[])", ["bytes32", "bytes[]"], None),
+    )
+
+    def __init__(self):
+        self._index: Optional[SelectorIndex] = None
+
+    def register(self, index: SelectorIndex) -> None:
+        self._index = index
+        for fn_abi, family in self.ROUTER_FUNCTIONS:
+            index.register_signature(
+                abi_to_signature(fn_abi),
+                family,
+                decoder=build_abi_swap_decoder(fn_abi, dex=family),
+                source=self.name,
+            )
+        for signature, types, deadline_pos in self.MULTICALLS:
+            index.register_signature(
+                signature,
+                "uniswap_v3",
+                mev_type="arbitrage",
+                decoder=self._multicall_decoder(types, deadline_pos),
+                source=self.name,
+            )
+
+    def _multicall_decoder(self, types: List[str], deadline_pos: Optional[int]):
+        def decode(args: bytes, value_wei: int) -> Optional[Dict[str, Any]]:
+            decoded = eth_abi.decode(types, args)
+            deadline = decoded[deadline_pos] if deadline_pos is not None else None
+            return self.decode_calls(decoded[-1], value_wei, deadline)
+
+        return decode
+
+    def decode_calls(
+        self,
+        calls: List[bytes],
+        value_wei: int,
+        deadline: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the first swap intent found in a list of encoded calls."""
+        if self._index is None:
+            return None
+        intent = None
+        legs = 0
+        for call in calls:
+            entry = self._index.lookup(call)
+            if not entry or not entry.decoder:
+                continue
+            try:
+                inner = entry.decoder(call[4:], value_wei)
+            except Exception:
+                continue
+            if not inner:
+                continue
+            legs += inner.get("legs", 1)
+            if intent is None:
+                intent = inner
+        if intent is None:
+            return None
+        intent["legs"] = legs
+        intent["mev_type"] = "sandwich_attack"
+        if intent.get("deadline") is None and deadline is not None:
+            intent["deadline"] = int(deadline)
+        return intent
+
+
+class UniversalRouterPlugin(CalldataDecoderPlugin):
+    """Uniswap Universal Router ``execute`` command streams (V2/V3 swap commands)."""
+
+    name = "uniswap_universal_router"
+
+    COMMAND_TYPE_MASK = 0x3F
+    V3_SWAP_EXACT_IN = 0x00
+    V3_SWAP_EXACT_OUT = 0x01
+    V2_SWAP_EXACT_IN = 0x08
+    V2_SWAP_EXACT_OUT = 0x09
+
+    V3_SWAP_TYPES = ["address", "uint256", "uint256", "bytes", "bool"]
+    V2_SWAP_TYPES = ["address", "uint256", "uint256", "address[]", "bool"]
+
+    # Sentinels the router resolves at execution time
+    CONTRACT_BALANCE = 1 << 255
+    MSG_SENDER = "0x" + "00" * 19 + "01"
+
+    def register(self, index: SelectorIndex) -> None:
+        index.register_signature(
+            "execute(bytes,bytes[],uint256)",
+            "uniswap_universal",
+            mev_type="sandwich_attack",
+            decoder=self._decode_with_deadline,
+            source=self.name,
+        )
+        index.register_signature(
+            "execute(bytes,bytes[])",
+            "uniswap_universal",
+            mev_type="sandwich_attack",
+            decoder=self._decode_without_deadline,
+            source=self.name,
+        )
+
+    def _decode_with_deadline(self, args: bytes, value_wei: int):
+        commands, inputs, deadline = eth_abi.decode(
+            ["bytes", "bytes[]", "uint256"], args
+        )
+        return self.decode_commands(commands, inputs, value_wei, deadline)
+
+    def _decode_without_deadline(self, args: bytes, value_wei: int):
+        commands, inputs = eth_abi.decode(["bytes", "bytes[]"], args)
+        return self.decode_commands(commands, inputs, value_wei, None)
+
+    def decode_commands(
+        self,
+        commands: bytes,
+        inputs: List[bytes],
+        value_wei: int,
+        deadline: Optional[int],
+    ) -> Optional[Dict[str, Any]]:
+        """Return the intent of the first swap command, counting all swap legs."""
+        intent = None
+        legs = 0
+        for command, payload in zip(commands, inputs):
+            command_type = command & self.COMMAND_TYPE_MASK
+            if command_type in (self.V3_SWAP_EXACT_IN, self.V3_SWAP_EXACT_OUT):
+                leg = self._decode_v3(command_type, payload, value_wei)
+            elif command_type in (self.V2_SWAP_EXACT_IN, self.V2_SWAP_EXACT_OUT):
+                leg = self._decode_v2(command_type, payload, value_wei)
+            else:
+                continue
+            if leg is None:
+                continue
+            legs += 1
+            if intent is None:
+                intent = leg
+        if intent is None:
+            return None
+        intent["legs"] = legs
+        if deadline is not None:
+            intent["deadline"] = int(deadline)
+        return intent
+
+    def _amount_in(self, amount: int, value_wei: int) -> int:
+        return value_wei if amount == self.CONTRACT_BALANCE else amount
+
+    def _decode_v3(self, command_type: int, payload: bytes, value_wei: int):
+        recipient, amount_a, amount_b, path, _ = eth_abi.decode(
+            self.V3_SWAP_TYPES, payload
+        )
+        tokens, fees = decode_v3_path(path)
+        if not tokens or not fees:
+            return None
+        if command_type == self.V3_SWAP_EXACT_IN:
+            amount_in, amount_out_min = amount_a, amount_b
+        else:
+            amount_out_min, amount_in = amount_a, amount_b
+            tokens.reverse()
+            fees.reverse()
+        return make_swap_intent(
+            tokens,
+            self._amount_in(amount_in, value_wei),
+            amount_out_min,
+            fees=fees,
+            recipient=recipient,
+            dex="uniswap_v3",
+            exact_output=command_type == self.V3_SWAP_EXACT_OUT,
+        )
+
+    def _decode_v2(self, command_type: int, payload: bytes, value_wei: int):
+        recipient, amount_a, amount_b, path, _ = eth_abi.decode(
+            self.V2_SWAP_TYPES, payload
+        )
+        if len(path) < 2:
+            return None
+        if command_type == self.V2_SWAP_EXACT_IN:
+            amount_in, amount_out_min = amount_a, amount_b
+        else:
+            amount_out_min, amount_in = amount_a, amount_b
+        return make_swap_intent(
+            list(path),
+            self._amount_in(amount_in, value_wei),
+            amount_out_min,
+            recipient=recipient,
+            dex="uniswap_v2",
+            exact_output=command_type == self.V2_SWAP_EXACT_OUT,
+        )
+
+
+class AggregatorPlugin(CalldataDecoderPlugin):
+    """
+    Aggregator entry points (1inch v5/v6 ``swap``, 0x ``transformERC20``).
+
+    Aggregator routes are opaque, so intents carry the input/output tokens and
+    amounts but no pool family.
+    """
+
+    name = "aggregators"
+
+    ONEINCH_DESC = "(address,address,address,address,uint256,uint256,uint256)"
+
+    def register(self, index: SelectorIndex) -> None:
+        index.register_signature(
+            f"swap(address,{self.ONEINCH_DESC},bytes,bytes)",
+            "1inch",
+            mev_type="arbitrage",
+            decoder=self._decode_oneinch_v5,
+            source=self.name,
+        )
+        index.register_signature(
+            f"swap(address,{self.ONEINCH_DESC},bytes)",
+            "1inch",
+            mev_type="arbitrage",
+            decoder=self._decode_oneinch_v6,
+            source=self.name,
+        )
+        index.register_signature(
+            "transformERC20(address,address,uint256,uint256,(uint32,bytes)[])",
+            "0x",
+            mev_type="arbitrage",
+            decoder=self._decode_zeroex,
+            source=self.name,
+        )
+
+    @staticmethod
+    def _oneinch_intent(desc: Tuple[Any, ...]) -> Dict[str, Any]:
+        src_token, dst_token, _src_receiver, dst_receiver, amount, min_return, _ = desc
+        return make_swap_intent(
+            [src_token, dst_token], amount, min_return, recipient=dst_receiver
+        )
+
+    def _decode_oneinch_v5(self, args: bytes, value_wei: int):
+        _, desc, _, _ = eth_abi.decode(
+            ["address", self.ONEINCH_DESC, "bytes", "bytes"], args
+        )
+        return self._oneinch_intent(desc)
+
+    def _decode_oneinch_v6(self, args: bytes, value_wei: int):
+        _, desc, _ = eth_abi.decode(["address", self.ONEINCH_DESC, "bytes"], args)
+        return self._oneinch_intent(desc)
+
+    @staticmethod
+    def _decode_zeroex(args: bytes, value_wei: int):
+        input_token, output_token, amount_in, min_out, _ = eth_abi.decode(
+            ["address", "address", "uint256", "uint256", "(uint32,bytes)[]"], args
+        )
+        return make_swap_intent([input_token, output_token], amount_in, min_out)
+
+
+# Registered with the global selector index, in order (later plugins win on
+# selector collisions).
+DEFAULT_PLUGINS = (SwapRouterPlugin, UniversalRouterPlugin, AggregatorPlugin)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from on1builder.monitoring.selector_index import SelectorIndex, get_selector_index
+from on1builder.utils.latency_tracker import LatencyTracker
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# (mev_type, swap_intent) - the compact result shipped back to the event loop
+DecodeResult = Tuple[Optional[str], Optional[Dict[str, Any]]]
+
+
+def decode_calldata(
+    calldata: bytes, value_wei: int, index: Optional[SelectorIndex] = None
+) -> DecodeResult:
+    """
+    Classify calldata by selector and decode its swap intent.
+
+    Pure apart from the (read-only) selector index, so it can run in the
+    event loop or in a worker process.
+    """
+    entry = (index or get_selector_index()).lookup(calldata)
+    if entry is None:
+        return None, None
+    intent: Optional[Dict[str, Any]] = None
+    if entry.decoder and len(calldata) > 4:
+        try:
+            intent = entry.decoder(calldata[4:], int(value_wei or 0)) or None
+        except Exception:
+            intent = None
+    mev_type = (intent.get("mev_type") if intent else None) or entry.mev_type
+    return mev_type, intent
+
+
+def decode_batch(items: List[Tuple[bytes, int]]) -> List[DecodeResult]:
+    """Worker entry point: decode a shard batch in one IPC round-trip."""
+    return [decode_calldata(calldata, value_wei) for calldata, value_wei in items]
+
+
+def _init_worker() -> None:
+    # Build the selector index once per process instead of on the first batch
+    get_selector_index()
+
+
+class DecodePool:
+    """
+    Off-loop calldata decoding sharded across worker processes.
+
+    Each shard is a single-process executor and a transaction always lands on
+    the shard picked by its hash. Requests are micro-batched per shard (up to
+    ``max_batch_size`` or ``linger_ms``) because pickling one transaction at a
+    time costs more than decoding it; :meth:`decode_many` hands a caller's
+    whole batch to the shards at once.
+    """
+
+    def __init__(
+        self, processes: int, max_batch_size: int = 64, linger_ms: float = 2.0
+    ):
+        if processes <= 0:
+            raise ValueError("DecodePool needs at least one process")
+        context = multiprocessing.get_context("spawn")
+        self._shards = [
+            ProcessPoolExecutor(
+                max_workers=1, mp_context=context, initializer=_init_worker
+            )
+            for _ in range(processes)
+        ]
+        self._max_batch_size = max(1, max_batch_size)
+        self._linger_s = max(0.0, linger_ms) / 1000.0
+        self._pending: List[List[Tuple[bytes, int, asyncio.Future]]] = [
+            [] for _ in self._shards
+        ]
+        self._flush_handles: List[Optional[asyncio.TimerHandle]] = [
+            None for _ in self._shards
+        ]
+        self._inflight: set = set()
+        self._closed = False
+
+        self._shard_items = [0 for _ in self._shards]
+        self._batches = 0
+        self._items = 0
+        self._fallbacks = 0
+        self._round_trip = LatencyTracker()
+
+    @property
+    def processes(self) -> int:
+        return len(self._shards)
+
+    def shard_for(self, tx_hash: bytes) -> int:
+        return int.from_bytes(tx_hash[-4:], "big") % len(self._shards)
+
+    async def decode(
+        self, tx_hash: bytes, calldata: bytes, value_wei: int
+    ) -> DecodeResult:
+        """Decode on the transaction's shard; falls back in-process when closed."""
+        return await self._submit(tx_hash, calldata, value_wei)
+
+    async def decode_many(
+        self, items: Sequence[Tuple[bytes, bytes, int]]
+    ) -> List[DecodeResult]:
+        """
+        Decode ``(tx_hash, calldata, value_wei)`` items in order.
+
+        Each shard's share is sent as soon as it is queued instead of waiting
+        out the linger for more work.
+        """
+        futures = [self._submit(*item) for item in items]
+        for shard, pending in enumerate(self._pending):
+            if pending:
+                self._flush(shard)
+        return list(await asyncio.gather(*futures))
+
+    def _submit(
+        self, tx_hash: bytes, calldata: bytes, value_wei: int
+    ) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if self._closed or len(calldata) < 4:
+            future.set_result(decode_calldata(calldata, value_wei))
+            return future
+        shard = self.shard_for(tx_hash)
+        pending = self._pending[shard]
+        pending.append((calldata, value_wei, future))
+        if len(pending) >= self._max_batch_size:
+            self._flush(shard)
+        elif self._flush_handles[shard] is None:
+            self._flush_handles[shard] = loop.call_later(
+                self._linger_s, self._flush, shard
+            )
+        return future
+
+    def _flush(self, shard: int) -> None:
+        handle = self._flush_handles[shard]
+        if handle is not None:
+            handle.cancel()
+            self._flush_handles[shard] = None
+        batch, self._pending[shard] = self._pending[shard], []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run_batch(shard, batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _run_batch(
+        self, shard: int, batch: List[Tuple[bytes, int, asyncio.Future]]
+    ) -> None:
+        items = [(calldata, value_wei) for calldata, value_wei, _ in batch]
+        started = time.monotonic()
+        self._batches += 1
+        self._items += len(batch)
+        self._shard_items[shard] += len(batch)
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._shards[shard], decode_batch, items
+            )
+            self._round_trip.record_since(started)
+        except Exception as e:
+            # A crashed or shut-down worker must not stall the scanner
+            self._fallbacks += len(batch)
+            logger.warning("Decode shard %s failed (%s); decoding in-process", shard, e)
+            results = decode_batch(items)
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Drain queued work and shut the worker processes down."""
+        if self._closed:
+            return
+        for shard in range(len(self._shards)):
+            self._flush(shard)
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        self._closed = True
+        for executor in self._shards:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "processes": len(self._shards),
+            "batches": self._batches,
+            "items": self._items,
+            "avg_batch_size": self._items / self._batches if self._batches else 0.0,
+            "shard_items": list(self._shard_items),
+            "fallbacks": self._fallbacks,
+            "round_trip": self._round_trip.snapshot(),
+        }
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List, Tuple
+
+
+class IngestQueue:
+    """
+    Bounded hand-off between a subscription callback and a pool of consumers.
+
+    The producer side never blocks: when the queue is full it sheds load
+    according to ``shed_policy``. ``drop_oldest`` evicts the stalest entry to
+    admit the new one (fresh mempool data is worth more than stale data),
+    ``drop_newest`` rejects the incoming entry instead.
+    """
+
+    SHED_POLICIES = ("drop_oldest", "drop_newest")
+
+    def __init__(self, maxsize: int, shed_policy: str = "drop_oldest"):
+        if maxsize <= 0:
+            raise ValueError("IngestQueue maxsize must be > 0")
+        if shed_policy not in self.SHED_POLICIES:
+            raise ValueError(
+                f"Unknown shed policy '{shed_policy}'; expected one of {self.SHED_POLICIES}"
+            )
+        self._queue: asyncio.Queue[Tuple[Any, float]] = asyncio.Queue(maxsize=maxsize)
+        self._maxsize = maxsize
+        self._shed_policy = shed_policy
+
+        self._enqueued = 0
+        self._dequeued = 0
+        self._dropped = 0
+        self._high_watermark = 0
+        self._waiting = 0
+
+    def put_nowait(self, item: Any) -> bool:
+        """
+        Enqueue an item stamped with its arrival time.
+
+        Returns:
+            True if the item was admitted, False if it was shed.
+        """
+        if self._queue.full():
+            self._dropped += 1
+            if self._shed_policy == "drop_newest":
+                return False
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+            except asyncio.QueueEmpty:
+                pass
+
+        self._queue.put_nowait((item, time.monotonic()))
+        self._enqueued += 1
+        depth = self._queue.qsize()
+        if depth > self._high_watermark:
+            self._high_watermark = depth
+        return True
+
+    async def get(self) -> Tuple[Any, float]:
+        """Wait for the next ``(item, enqueued_at)`` pair."""
+        entry = await self._queue.get()
+        self._dequeued += 1
+        return entry
+
+    async def get_batch(self, max_items: int) -> List[Tuple[Any, float]]:
+        """
+        Wait for one entry, then take up to ``max_items`` without waiting.
+
+        The backlog is split evenly between the consumers waiting on the
+        queue, so a short queue is spread over idle consumers instead of
+        landing on the first one. Every returned entry needs its own
+        :meth:`task_done`.
+        """
+        self._waiting += 1
+        try:
+            batch = [await self.get()]
+            # Consumers woken by the same burst have not taken their share yet
+            share = self._waiting
+        finally:
+            self._waiting -= 1
+        extra = min(max_items, -(-(self._queue.qsize() + 1) // share)) - 1
+        for _ in range(extra):
+            batch.append(self._queue.get_nowait())
+        self._dequeued += len(batch) - 1
+        return batch
+
+    def task_done(self) -> None:
+        """Mark an item returned by :meth:`get` as fully processed."""
+        self._queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every admitted item has been processed or shed."""
+        await self._queue.join()
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def fill_ratio(self) -> float:
+        return self._queue.qsize() / self._maxsize
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and shedding counters for metrics."""
+        return {
+            "depth": self._queue.qsize(),
+            "capacity": self._maxsize,
+            "high_watermark": self._high_watermark,
+            "enqueued": self._enqueued,
+            "dequeued": self._dequeued,
+            "dropped": self._dropped,
+            "shed_policy": self._shed_policy,
+        }
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Optional
+
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+NORMAL = "normal"
+DEGRADED = "degraded"
+
+
+class LoadShedder:
+    """
+    Capacity model that switches the scanner into a degraded mode.
+
+    Keeps EWMAs of the pending inter-arrival time and of the per-transaction
+    analysis cost; their ratio is the utilization of the analysis stage.
+    Above ``enter_utilization`` (or with the ingest queue half full) the
+    scanner only fully analyses transactions worth it and discards the rest
+    cheaply. It returns to normal below ``exit_utilization`` with a drained
+    queue, after at least ``min_dwell_s`` in degraded mode, so it does not
+    flap at the boundary.
+    """
+
+    ENTER_QUEUE_FILL = 0.5
+    EXIT_QUEUE_FILL = 0.1
+    # Samples of each kind needed before utilization is trusted
+    WARMUP_SAMPLES = 32
+
+    def __init__(
+        self,
+        enter_utilization: float = 0.9,
+        exit_utilization: float = 0.6,
+        alpha: float = 0.05,
+        min_dwell_s: float = 5.0,
+        name: str = "scanner",
+    ):
+        if not 0 < exit_utilization < enter_utilization:
+            raise ValueError("exit_utilization must be > 0 and < enter_utilization")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self._enter = enter_utilization
+        self._exit = exit_utilization
+        self._alpha = alpha
+        self._min_dwell_s = min_dwell_s
+        self._name = name
+
+        self._interval_ewma: Optional[float] = None
+        self._cost_ewma: Optional[float] = None
+        self._last_arrival: Optional[float] = None
+        self._arrivals = 0
+        self._processed = 0
+
+        self._mode = NORMAL
+        self._mode_since = time.monotonic()
+        self._degraded_total_s = 0.0
+        self._transitions = 0
+        self._shed = 0
+        self._shed_this_episode = 0
+        self._admitted_degraded = 0
+
+    @property
+    def degraded(self) -> bool:
+        return self._mode == DEGRADED
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    def on_arrival(self, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        self._arrivals += 1
+        if self._last_arrival is not None:
+            self._interval_ewma = self._ewma(
+                self._interval_ewma, max(now - self._last_arrival, 0.0)
+            )
+        self._last_arrival = now
+
+    def on_processed(self, cost_s: float) -> None:
+        self._processed += 1
+        self._cost_ewma = self._ewma(self._cost_ewma, cost_s)
+
+    def _ewma(self, current: Optional[float], sample: float) -> float:
+        if current is None:
+            return sample
+        return current + self._alpha * (sample - current)
+
+    def utilization(self, now: Optional[float] = None) -> float:
+        """Arrival rate times per-tx cost (1.0 = analysis saturated)."""
+        if (
+            not self._interval_ewma
+            or self._cost_ewma is None
+            or min(self._arrivals, self._processed) < self.WARMUP_SAMPLES
+        ):
+            return 0.0
+        interval = self._interval_ewma
+        if self._last_arrival is not None:
+            # A quiet feed must lower the estimate even without new arrivals
+            now = time.monotonic() if now is None else now
+            interval = max(interval, now - self._last_arrival)
+        return self._cost_ewma / interval if interval > 0 else 0.0
+
+    def update(self, queue_fill: float = 0.0, now: Optional[float] = None) -> bool:
+        """Re-evaluate the mode; returns True while degraded."""
+        now = time.monotonic() if now is None else now
+        utilization = self.utilization(now)
+        if self._mode == NORMAL:
+            if utilization > self._enter or queue_fill >= self.ENTER_QUEUE_FILL:
+                self._switch(DEGRADED, now, utilization, queue_fill)
+        elif (
+            utilization < self._exit
+            and queue_fill < self.EXIT_QUEUE_FILL
+            and now - self._mode_since >= self._min_dwell_s
+        ):
+            self._switch(NORMAL, now, utilization, queue_fill)
+        return self._mode == DEGRADED
+
+    def _switch(self, mode: str, now: float, utilization: float, fill: float) -> None:
+        if self._mode == DEGRADED:
+            self._degraded_total_s += now - self._mode_since
+            logger.info(
+                "[%s] Load shedding off after %.1fs (utilization %.2f, "
+                "%s transactions shed, %s analysed)",
+                self._name,
+                now - self._mode_since,
+                utilization,
+                self._shed_this_episode,
+                self._admitted_degraded,
+            )
+        else:
+            logger.warning(
+                "[%s] Overloaded (utilization %.2f, queue %.0f%% full); "
+                "only analysing DEX router and high-value transactions",
+                self._name,
+                utilization,
+                fill * 100,
+            )
+            self._shed_this_episode = 0
+            self._admitted_degraded = 0
+        self._mode = mode
+        self._mode_since = now
+        self._transitions += 1
+
+    def record_shed(self) -> None:
+        self._shed += 1
+        self._shed_this_episode += 1
+
+    def record_admitted(self) -> None:
+        if self._mode == DEGRADED:
+            self._admitted_degraded += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        degraded_s = self._degraded_total_s
+        if self._mode == DEGRADED:
+            degraded_s += now - self._mode_since
+        interval = self._interval_ewma
+        return {
+            "mode": self._mode,
+            "utilization": self.utilization(now),
+            "arrival_rate_per_s": 1.0 / interval if interval else 0.0,
+            "cost_ewma_ms": (self._cost_ewma or 0.0) * 1000.0,
+            "capacity_per_s": 1.0 / self._cost_ewma if self._cost_ewma else 0.0,
+            "transitions": self._transitions,
+            "shed": self._shed,
+            "degraded_seconds": degraded_s,
+        }
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from on1builder.utils.bounded_cache import BoundedCache
+from on1builder.utils.latency_tracker import LatencyTracker
+
+
+def source_label(url: str, taken: Optional[List[str]] = None) -> str:
+    """
+    Short, key-free label for an endpoint URL.
+
+    Provider URLs often embed API keys in the path, so only the host is kept;
+    a ``#n`` suffix disambiguates several endpoints on the same host.
+    """
+    host = urlparse(url).hostname or url
+    label, n = host, 2
+    while taken and label in taken:
+        label = f"{host}#{n}"
+        n += 1
+    return label
+
+
+class _SourceStats:
+    __slots__ = ("seen", "first", "lead", "lag")
+
+    def __init__(self):
+        self.seen = 0
+        self.first = 0
+        self.lead = LatencyTracker()
+        self.lag = LatencyTracker()
+
+
+class _Sighting:
+    __slots__ = ("source", "first_seen", "sources")
+
+    def __init__(self, source: str, first_seen: float):
+        self.source = source
+        self.first_seen = first_seen
+        self.sources = {source}
+
+
+class MempoolFanIn:
+    """
+    First-seen dedup across several pending transaction feeds.
+
+    Every sighting is reported through :meth:`observe`; only the first one for
+    a hash is forwarded. Later sightings from other sources record how far
+    that source lagged the winner (and how far the winner led it), giving a
+    per-endpoint view of who delivers the mempool earliest. Memory is bounded
+    by an LRU/TTL cache of recent hashes.
+    """
+
+    def __init__(self, max_entries: int = 50000, window_s: float = 30.0):
+        self._seen: BoundedCache[str, _Sighting] = BoundedCache(
+            max_entries, ttl=window_s
+        )
+        self._sources: Dict[str, _SourceStats] = {}
+        self._forwarded = 0
+        self._duplicates = 0
+
+    def add_source(self, source: str) -> None:
+        self._sources.setdefault(source, _SourceStats())
+
+    def observe(self, source: str, tx_hash: str, now: Optional[float] = None) -> bool:
+        """
+        Record a sighting of ``tx_hash`` from ``source``.
+
+        Returns:
+            True if this is the first sighting and the payload should be
+            processed, False for a duplicate.
+        """
+        now = time.monotonic() if now is None else now
+        stats = self._sources.get(source)
+        if stats is None:
+            stats = self._sources[source] = _SourceStats()
+        stats.seen += 1
+
+        sighting = self._seen.get(tx_hash)
+        if sighting is None:
+            self._seen.put(tx_hash, _Sighting(source, now))
+            stats.first += 1
+            self._forwarded += 1
+            return True
+
+        self._duplicates += 1
+        if source not in sighting.sources:
+            sighting.sources.add(source)
+            gap_ms = (now - sighting.first_seen) * 1000.0
+            stats.lag.record(gap_ms)
+            winner = self._sources.get(sighting.source)
+            if winner is not None:
+                winner.lead.record(gap_ms)
+        return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Forwarded/duplicate totals plus first-seen share and lead/lag per source."""
+        return {
+            "forwarded": self._forwarded,
+            "duplicates": self._duplicates,
+            "tracked_hashes": len(self._seen),
+            "sources": {
+                name: {
+                    "seen": stats.seen,
+                    "first": stats.first,
+                    "first_ratio": (
+                        stats.first / self._forwarded if self._forwarded else 0.0
+                    ),
+                    "lead": stats.lead.snapshot(),
+                    "lag": stats.lag.snapshot(),
+                }
+                for name, stats in self._sources.items()
+            },
+        }
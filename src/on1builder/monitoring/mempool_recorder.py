@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import os
+import struct
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Union
+
+from eth_utils import to_checksum_address
+from hexbytes import HexBytes
+
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"ON1MP\x01"
+
+# arrival_ts, chain_id, hash, from, to, flags, value, nonce, gas, gasPrice,
+# maxFeePerGas, maxPriorityFeePerGas, input length; calldata follows.
+_RECORD = struct.Struct("<dQ32s20s20sB32sQQQQQI")
+
+_FLAG_HAS_TO = 0x01
+_FLAG_HAS_GAS_PRICE = 0x02
+_FLAG_DYNAMIC_FEE = 0x04
+
+_UINT64_MAX = 2**64 - 1
+
+
+class RecordedTx(NamedTuple):
+    """A pending transaction as it was seen by the scanner."""
+
+    arrival_ts: float
+    chain_id: int
+    tx: Dict[str, Any]
+
+
+def _to_bytes(value: Any, size: Optional[int] = None) -> bytes:
+    if value is None:
+        raw = b""
+    elif isinstance(value, (bytes, bytearray)):
+        raw = bytes(value)
+    else:
+        raw = bytes.fromhex(str(value).removeprefix("0x"))
+    if size is not None and len(raw) != size:
+        raise ValueError(f"expected {size} bytes, got {len(raw)}")
+    return raw
+
+
+def _u64(value: Any) -> int:
+    return min(int(value or 0), _UINT64_MAX)
+
+
+def encode_record(tx: Mapping, chain_id: int, arrival_ts: float) -> bytes:
+    """Serialize one pending transaction into the recording format."""
+    flags = 0
+    to = tx.get("to")
+    if to:
+        flags |= _FLAG_HAS_TO
+    if tx.get("gasPrice") is not None:
+        flags |= _FLAG_HAS_GAS_PRICE
+    if tx.get("maxFeePerGas") is not None:
+        flags |= _FLAG_DYNAMIC_FEE
+    calldata = _to_bytes(tx.get("input"))
+    header = _RECORD.pack(
+        arrival_ts,
+        chain_id,
+        _to_bytes(tx["hash"], 32),
+        _to_bytes(tx["from"], 20),
+        _to_bytes(to, 20) if to else b"\x00" * 20,
+        flags,
+        int(tx.get("value", 0) or 0).to_bytes(32, "big"),
+        _u64(tx.get("nonce")),
+        _u64(tx.get("gas")),
+        _u64(tx.get("gasPrice")),
+        _u64(tx.get("maxFeePerGas")),
+        _u64(tx.get("maxPriorityFeePerGas")),
+        len(calldata),
+    )
+    return header + calldata
+
+
+def _decode_tx(fields: tuple, calldata: bytes) -> Dict[str, Any]:
+    _, _, tx_hash, sender, to, flags, value, nonce, gas, gas_price, max_fee, tip, _ = (
+        fields
+    )
+    tx: Dict[str, Any] = {
+        "hash": HexBytes(tx_hash),
+        "from": to_checksum_address(sender),
+        "to": to_checksum_address(to) if flags & _FLAG_HAS_TO else None,
+        "value": int.from_bytes(value, "big"),
+        "nonce": nonce,
+        "gas": gas,
+        "input": HexBytes(calldata),
+    }
+    if flags & _FLAG_HAS_GAS_PRICE:
+        tx["gasPrice"] = gas_price
+    if flags & _FLAG_DYNAMIC_FEE:
+        tx["maxFeePerGas"] = max_fee
+        tx["maxPriorityFeePerGas"] = tip
+    return tx
+
+
+def iter_records(path: Union[str, Path]) -> Iterator[RecordedTx]:
+    """
+    Stream records from a recording file.
+
+    A truncated trailing record (recorder killed mid-write) ends the stream
+    instead of raising.
+    """
+    with open(path, "rb") as fh:
+        if fh.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a mempool recording")
+        while True:
+            header = fh.read(_RECORD.size)
+            if len(header) < _RECORD.size:
+                return
+            fields = _RECORD.unpack(header)
+            calldata = fh.read(fields[-1])
+            if len(calldata) < fields[-1]:
+                logger.warning("Truncated record at end of %s", path)
+                return
+            yield RecordedTx(fields[0], fields[1], _decode_tx(fields, calldata))
+
+
+def load_records(path: Union[str, Path]) -> List[RecordedTx]:
+    return list(iter_records(path))
+
+
+class MempoolRecorder:
+    """
+    Append-only writer for the pending transaction stream.
+
+    Each record holds the transaction fields the scanner consumes, its
+    wall-clock arrival time and the chain id. Writes go through a large
+    buffer so recording stays cheap on the ingest path.
+    """
+
+    def __init__(self, path: Union[str, Path], chain_id: int):
+        self._path = Path(path)
+        self._chain_id = chain_id
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self._path, "ab", buffering=1 << 16)
+        if self._fh.tell() == 0:
+            self._fh.write(MAGIC)
+
+        self._records = 0
+        self._bytes_written = 0
+        self._skipped = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def record(self, tx: Mapping, arrival_ts: Optional[float] = None) -> bool:
+        """Append one transaction; returns False if it could not be encoded."""
+        if self._fh.closed:
+            return False
+        try:
+            payload = encode_record(
+                tx, self._chain_id, arrival_ts if arrival_ts else time.time()
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            self._skipped += 1
+            logger.debug("Skipping unrecordable transaction: %s", e)
+            return False
+        self._fh.write(payload)
+        self._records += 1
+        self._bytes_written += len(payload)
+        return True
+
+    def flush(self) -> None:
+        if not self._fh.closed:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self.flush()
+            self._fh.close()
+            logger.info(
+                "Mempool recording closed: %s records written to %s",
+                self._records,
+                self._path,
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "path": str(self._path),
+            "records": self._records,
+            "bytes_written": self._bytes_written,
+            "skipped": self._skipped,
+        }
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence
+
+from web3.exceptions import TransactionNotFound
+
+from on1builder.monitoring.mempool_recorder import RecordedTx
+from on1builder.monitoring.txpool_scanner import TxPoolScanner
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def _rpc_quantity(value: Optional[int]) -> Optional[str]:
+    return hex(value) if value is not None else None
+
+
+def _to_rpc(tx: Dict[str, Any]) -> Dict[str, Any]:
+    """Render a recorded transaction the way ``eth_getTransactionByHash`` returns it."""
+    rpc = {
+        "hash": tx["hash"].to_0x_hex(),
+        "from": tx["from"],
+        "to": tx["to"],
+        "value": _rpc_quantity(tx["value"]),
+        "nonce": _rpc_quantity(tx["nonce"]),
+        "gas": _rpc_quantity(tx["gas"]),
+        "input": tx["input"].to_0x_hex(),
+    }
+    for key in ("gasPrice", "maxFeePerGas", "maxPriorityFeePerGas"):
+        if key in tx:
+            rpc[key] = _rpc_quantity(tx[key])
+    return rpc
+
+
+class ReplayProvider:
+    """Stand-in JSON-RPC provider answering transaction lookups from a recording."""
+
+    def __init__(self, records: Sequence[RecordedTx]):
+        self._by_hash = {record.tx["hash"].to_0x_hex(): record.tx for record in records}
+        self.batch_requests = 0
+
+    def lookup(self, tx_hash: Any) -> Optional[Dict[str, Any]]:
+        key = tx_hash if isinstance(tx_hash, str) else f"0x{bytes(tx_hash).hex()}"
+        return self._by_hash.get(key.lower())
+
+    async def make_batch_request(self, requests: List[tuple]) -> List[Dict[str, Any]]:
+        self.batch_requests += 1
+        responses = []
+        for request_id, (_method, params) in enumerate(requests):
+            tx = self.lookup(params[0])
+            responses.append(
+                {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "result": _to_rpc(tx) if tx else None,
+                }
+            )
+        return responses
+
+
+class ReplayWeb3:
+    """Minimal ``AsyncWeb3`` stand-in backed by a :class:`ReplayProvider`."""
+
+    def __init__(self, records: Sequence[RecordedTx], chain_id: int):
+        self.provider = ReplayProvider(records)
+        self.eth = SimpleNamespace(
+            get_transaction=self._get_transaction, chain_id=chain_id
+        )
+
+    async def _get_transaction(self, tx_hash: Any) -> Dict[str, Any]:
+        tx = self.provider.lookup(tx_hash)
+        if tx is None:
+            raise TransactionNotFound(f"Transaction {tx_hash} not found")
+        return tx
+
+
+class OpportunitySink:
+    """Strategy executor stand-in that counts opportunities instead of trading."""
+
+    def __init__(self):
+        self.emitted: Counter = Counter()
+
+    async def simulate_opportunities_batch(
+        self, opportunities: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        return opportunities
+
+    async def execute_opportunity(self, opportunity: Dict[str, Any]) -> None:
+        self.emitted[opportunity.get("strategy_type", "unknown")] += 1
+
+
+class MempoolReplayer:
+    """
+    Feed a recorded pending stream through a :class:`TxPoolScanner` offline.
+
+    ``speed`` scales the recorded inter-arrival gaps (1.0 = real time,
+    10.0 = ten times faster); ``None`` submits as fast as the queue admits.
+    ``mode`` chooses between pushing full bodies or hashes that the scanner
+    resolves through the stand-in provider.
+    """
+
+    MODES = ("full", "hashes")
+
+    def __init__(
+        self,
+        records: Sequence[RecordedTx],
+        speed: Optional[float] = None,
+        mode: str = "full",
+        chain_id: Optional[int] = None,
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown replay mode '{mode}'; expected {self.MODES}")
+        if speed is not None and speed <= 0:
+            raise ValueError("Replay speed must be > 0, or None for max speed")
+        self._chain_id = chain_id
+        self._records = [
+            record
+            for record in records
+            if chain_id is None or record.chain_id == chain_id
+        ]
+        self._speed = speed
+        self._mode = mode
+
+    def build_scanner(self) -> TxPoolScanner:
+        chain_id = self._chain_id
+        if chain_id is None:
+            chain_id = self._records[0].chain_id if self._records else 1
+        return TxPoolScanner(
+            ReplayWeb3(self._records, chain_id), OpportunitySink(), chain_id
+        )
+
+    async def run(self, scanner: Optional[TxPoolScanner] = None) -> Dict[str, Any]:
+        """Replay every record and return a throughput report."""
+        scanner = scanner or self.build_scanner()
+        await scanner.start(subscribe=False)
+        started = time.monotonic()
+        try:
+            first_arrival = self._records[0].arrival_ts if self._records else 0.0
+            for record in self._records:
+                if self._speed is not None:
+                    due = started + (record.arrival_ts - first_arrival) / self._speed
+                    delay = due - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                payload = record.tx if self._mode == "full" else record.tx["hash"]
+                scanner.submit_pending(payload)
+                if self._speed is None:
+                    # Let the workers run between submissions at max speed
+                    await asyncio.sleep(0)
+            await scanner.wait_idle()
+            elapsed = time.monotonic() - started
+        finally:
+            await scanner.stop()
+
+        metrics = scanner.get_performance_metrics()
+        sink = scanner._strategy_executor
+        emitted = dict(getattr(sink, "emitted", {}))
+        return {
+            "records": len(self._records),
+            "mode": self._mode,
+            "speed": self._speed,
+            "elapsed_s": elapsed,
+            "tx_per_s": metrics["processed_transactions"] / elapsed if elapsed else 0.0,
+            "processed": metrics["processed_transactions"],
+            "shed": metrics["ingest"]["dropped"],
+            "load_shedding": metrics["load_shedding"],
+            "analysis_latency": metrics["analysis_latency"],
+            "decision_latency": metrics["decision_latency"],
+            "opportunities": sum(emitted.values()),
+            "opportunities_by_strategy": emitted,
+        }
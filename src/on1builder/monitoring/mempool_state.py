@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from on1builder.utils.bounded_cache import BoundedCache
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Transaction lifecycle states reported by MempoolState.status()
+PENDING = "pending"
+REPLACED = "replaced"
+INCLUDED = "included"
+DROPPED = "dropped"
+UNKNOWN = "unknown"
+
+# Outcomes of MempoolState.observe()
+NEW = "new"
+REPLACEMENT = "replacement"
+DUPLICATE = "duplicate"
+UNDERPRICED = "underpriced"
+REJECTED = "rejected"
+
+
+def normalize_hash(tx_hash: Any) -> str:
+    """Lower-case 0x-prefixed hex for bytes, HexBytes or str hashes."""
+    if isinstance(tx_hash, (bytes, bytearray)):
+        return f"0x{bytes(tx_hash).hex()}"
+    value = str(tx_hash).lower()
+    return value if value.startswith("0x") else f"0x{value}"
+
+
+def _fee_key(tx: Mapping) -> Tuple[int, int]:
+    """(fee cap, tip) for legacy and EIP-1559 transactions alike."""
+    gas_price = tx.get("gasPrice")
+    fee_cap = tx.get("maxFeePerGas", gas_price) or 0
+    tip = tx.get("maxPriorityFeePerGas", gas_price) or 0
+    return int(fee_cap), int(tip)
+
+
+class PendingTx:
+    """A pending transaction occupying a (sender, nonce) slot."""
+
+    __slots__ = (
+        "tx_hash",
+        "sender",
+        "nonce",
+        "fee_cap",
+        "tip",
+        "first_seen",
+        "replaces",
+    )
+
+    def __init__(
+        self,
+        tx_hash: str,
+        sender: str,
+        nonce: int,
+        fee_cap: int,
+        tip: int,
+        replaces: Optional[str] = None,
+    ):
+        self.tx_hash = tx_hash
+        self.sender = sender
+        self.nonce = nonce
+        self.fee_cap = fee_cap
+        self.tip = tip
+        self.first_seen = time.monotonic()
+        self.replaces = replaces
+
+
+class _ResolutionWaiter:
+    """One event shared by every caller waiting on the same hash."""
+
+    __slots__ = ("event", "count")
+
+    def __init__(self):
+        self.event = asyncio.Event()
+        self.count = 0
+
+
+class MempoolState:
+    """
+    Pending-state model of the mempool keyed by ``(sender, nonce)``.
+
+    A transaction for an occupied slot with a strictly higher fee cap and tip
+    replaces the previous one, which is then reported as ``replaced``.
+    Transactions seen in a block are ``included``; other pending nonces of
+    the same sender at or below the included nonce can never land and are
+    resolved too. All lookups are O(1) dict hits, and memory is bounded both
+    globally (oldest slot evicted) and per sender (highest nonce evicted).
+    """
+
+    def __init__(self, max_entries: int = 50000, max_per_sender: int = 16):
+        if max_entries <= 0 or max_per_sender <= 0:
+            raise ValueError("MempoolState bounds must be > 0")
+        self._max_entries = max_entries
+        self._max_per_sender = max_per_sender
+
+        self._slots: "OrderedDict[Tuple[str, int], PendingTx]" = OrderedDict()
+        self._by_hash: Dict[str, Tuple[str, int]] = {}
+        self._by_sender: Dict[str, Dict[int, PendingTx]] = {}
+        # Final state of hashes that left the pending set: (status, detail)
+        self._resolved: BoundedCache[str, Tuple[str, Any]] = BoundedCache(
+            max_entries * 2, ttl=900.0
+        )
+        self._waiters: Dict[str, _ResolutionWaiter] = {}
+
+        self._counters: Dict[str, int] = {
+            NEW: 0,
+            REPLACEMENT: 0,
+            DUPLICATE: 0,
+            UNDERPRICED: 0,
+            REJECTED: 0,
+            "included": 0,
+            "nonce_superseded": 0,
+            "evicted": 0,
+            "blocks": 0,
+        }
+        self._last_block: Optional[int] = None
+
+    # -- pending stream ---------------------------------------------------
+
+    def observe(self, tx: Mapping) -> str:
+        """Record a pending transaction; returns the observe outcome."""
+        try:
+            tx_hash = normalize_hash(tx["hash"])
+            sender = str(tx["from"]).lower()
+            nonce = int(tx["nonce"])
+        except (KeyError, TypeError, ValueError):
+            self._counters[REJECTED] += 1
+            return REJECTED
+
+        if tx_hash in self._by_hash:
+            self._counters[DUPLICATE] += 1
+            return DUPLICATE
+        resolved = self._resolved.get(tx_hash)
+        if resolved is not None and resolved[0] != DROPPED:
+            # Late copy of something already mined or replaced
+            self._counters[DUPLICATE] += 1
+            return DUPLICATE
+
+        fee_cap, tip = _fee_key(tx)
+        key = (sender, nonce)
+        current = self._slots.get(key)
+        if current is not None:
+            if fee_cap <= current.fee_cap or tip <= current.tip:
+                self._counters[UNDERPRICED] += 1
+                return UNDERPRICED
+            self._remove(current)
+            self._resolve(current.tx_hash, REPLACED, tx_hash)
+            self._insert(
+                PendingTx(tx_hash, sender, nonce, fee_cap, tip, current.tx_hash)
+            )
+            self._counters[REPLACEMENT] += 1
+            return REPLACEMENT
+
+        sender_slots = self._by_sender.get(sender)
+        if sender_slots and len(sender_slots) >= self._max_per_sender:
+            highest = max(sender_slots)
+            if nonce > highest:
+                self._counters[REJECTED] += 1
+                return REJECTED
+            self._evict(sender_slots[highest])
+
+        self._insert(PendingTx(tx_hash, sender, nonce, fee_cap, tip))
+        while len(self._slots) > self._max_entries:
+            _, oldest = next(iter(self._slots.items()))
+            self._evict(oldest)
+        self._counters[NEW] += 1
+        return NEW
+
+    # -- blocks -------------------------------------------------------------
+
+    def on_block(self, block_number: int, transactions: Iterable[Any]) -> int:
+        """
+        Resolve everything a new block makes final.
+
+        ``transactions`` may be hashes or transaction mappings; with mappings
+        the sender/nonce of transactions never seen pending is known as well.
+
+        Returns:
+            Number of pending entries removed.
+        """
+        self._counters["blocks"] += 1
+        self._last_block = block_number
+        removed = 0
+        nonce_floor: Dict[str, int] = {}
+        for item in transactions:
+            if isinstance(item, Mapping):
+                tx_hash = normalize_hash(item.get("hash"))
+                sender = item.get("from")
+                nonce = item.get("nonce")
+            else:
+                tx_hash, sender, nonce = normalize_hash(item), None, None
+            key = self._by_hash.get(tx_hash)
+            if key is not None:
+                sender, nonce = key
+                self._remove(self._slots[key])
+                self._counters["included"] += 1
+                removed += 1
+            self._resolve(tx_hash, INCLUDED, block_number)
+            if sender is not None and nonce is not None:
+                sender = str(sender).lower()
+                nonce_floor[sender] = max(nonce_floor.get(sender, -1), int(nonce))
+
+        # Same-sender entries at or below an included nonce can never land
+        for sender, floor in nonce_floor.items():
+            for entry in list(self._by_sender.get(sender, {}).values()):
+                if entry.nonce <= floor:
+                    self._remove(entry)
+                    self._resolve(entry.tx_hash, DROPPED, block_number)
+                    self._counters["nonce_superseded"] += 1
+                    removed += 1
+        return removed
+
+    # -- queries --------------------------------------------------------------
+
+    def status(self, tx_hash: Any) -> str:
+        tx_hash = normalize_hash(tx_hash)
+        if tx_hash in self._by_hash:
+            return PENDING
+        resolved = self._resolved.get(tx_hash)
+        return resolved[0] if resolved else UNKNOWN
+
+    def is_pending(self, tx_hash: Any) -> bool:
+        return normalize_hash(tx_hash) in self._by_hash
+
+    def replacement_of(self, tx_hash: Any) -> Optional[str]:
+        """Hash of the transaction that replaced ``tx_hash``, if any."""
+        resolved = self._resolved.get(normalize_hash(tx_hash))
+        return resolved[1] if resolved and resolved[0] == REPLACED else None
+
+    def get(self, sender: str, nonce: int) -> Optional[PendingTx]:
+        return self._slots.get((sender.lower(), nonce))
+
+    def pending_for(self, sender: str) -> List[PendingTx]:
+        slots = self._by_sender.get(sender.lower(), {})
+        return [slots[nonce] for nonce in sorted(slots)]
+
+    async def wait_for_resolution(self, tx_hash: Any, timeout: float) -> str:
+        """
+        Wait until ``tx_hash`` is included, replaced or dropped.
+
+        Returns immediately if it already is; returns the current status
+        (``pending`` or ``unknown``) when ``timeout`` expires.
+        """
+        tx_hash = normalize_hash(tx_hash)
+        current = self.status(tx_hash)
+        if current in (INCLUDED, REPLACED, DROPPED):
+            return current
+        waiter = self._waiters.get(tx_hash)
+        if waiter is None:
+            waiter = self._waiters[tx_hash] = _ResolutionWaiter()
+        waiter.count += 1
+        try:
+            await asyncio.wait_for(waiter.event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            waiter.count -= 1
+            # The last waiter to give up forgets the hash; others keep waiting
+            if waiter.count == 0 and self._waiters.get(tx_hash) is waiter:
+                del self._waiters[tx_hash]
+        return self.status(tx_hash)
+
+    # -- internals --------------------------------------------------------------
+
+    def _insert(self, entry: PendingTx) -> None:
+        key = (entry.sender, entry.nonce)
+        self._slots[key] = entry
+        self._by_hash[entry.tx_hash] = key
+        self._by_sender.setdefault(entry.sender, {})[entry.nonce] = entry
+
+    def _remove(self, entry: PendingTx) -> None:
+        self._slots.pop((entry.sender, entry.nonce), None)
+        self._by_hash.pop(entry.tx_hash, None)
+        sender_slots = self._by_sender.get(entry.sender)
+        if sender_slots is not None:
+            sender_slots.pop(entry.nonce, None)
+            if not sender_slots:
+                del self._by_sender[entry.sender]
+
+    def _evict(self, entry: PendingTx) -> None:
+        # Capacity eviction says nothing about the tx itself, so no status
+        self._remove(entry)
+        self._counters["evicted"] += 1
+
+    def _resolve(self, tx_hash: str, status: str, detail: Any) -> None:
+        self._resolved.put(tx_hash, (status, detail))
+        waiter = self._waiters.pop(tx_hash, None)
+        if waiter is not None:
+            waiter.event.set()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._slots),
+            "senders": len(self._by_sender),
+            "resolved_tracked": len(self._resolved),
+            "waiters": len(self._waiters),
+            "last_block": self._last_block,
+            **self._counters,
+        }
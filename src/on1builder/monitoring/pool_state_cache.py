@@ -0,0 +1,775 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import eth_abi
+from web3 import AsyncWeb3
+
+from on1builder.core.call_encoders import (
+    FACTORY,
+    GET_PAIR,
+    GET_RESERVES,
+    LIQUIDITY,
+    POOL_FEE,
+    SLOT0,
+    TICK_BITMAP,
+    TICK_SPACING,
+    TICKS,
+    TOKEN0,
+    TOKEN1,
+)
+from on1builder.core.multicall import get_multicall
+from on1builder.engines.amm_quoter import V3PoolState
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SYNC_TOPIC = "0x1c411e9a96e071241c2f21f7726b17ae89e3cab4c78be50e062b03a9fffbbad1"
+V3_SWAP_TOPIC = "0xc42079f94a6350d7e6235f29174924f928cc2ac818eb64fed8004e115fbcca67"
+V3_MINT_TOPIC = "0x7a53080ba414158be7ec69b987b5fb7d07dee101fe85488f0853ae16239d0bde"
+V3_BURN_TOPIC = "0x0c396cd989a39f4459b5fa1aed6a9a8dcdbc45908acfd67e028cd568da98982c"
+POOL_TOPICS = [SYNC_TOPIC, V3_SWAP_TOPIC, V3_MINT_TOPIC, V3_BURN_TOPIC]
+
+V2 = "v2"
+V3 = "v3"
+
+# Position of a cold-loaded pool: every log of the load block is reflected
+_LOADED_AT_END_OF_BLOCK = 1 << 62
+
+
+def _hex(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex()
+    return str(value).lower()
+
+
+def _int(value: Any) -> int:
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def _data(value: Any) -> bytes:
+    if isinstance(value, str):
+        return bytes.fromhex(value.removeprefix("0x"))
+    return bytes(value)
+
+
+def _topic_int24(topic: Any) -> int:
+    """Indexed int24 topic (sign-extended to 32 bytes)."""
+    return int.from_bytes(_data(topic), "big", signed=True)
+
+
+def _pair_key(factory: str, token_a: str, token_b: str) -> Tuple[str, str, str]:
+    token_a, token_b = token_a.lower(), token_b.lower()
+    return (factory, *sorted((token_a, token_b)))
+
+
+class _Pool:
+    __slots__ = (
+        "address",
+        "kind",
+        "token0",
+        "token1",
+        "reserve0",
+        "reserve1",
+        "v3",
+        "tick_gross",
+        "position",
+        "loaded",
+        "backlog",
+    )
+
+    def __init__(self, address: str, kind: str):
+        self.address = address
+        self.kind = kind
+        self.token0: Optional[str] = None
+        self.token1: Optional[str] = None
+        self.reserve0 = 0
+        self.reserve1 = 0
+        self.v3: Optional[V3PoolState] = None
+        # liquidityGross per tick: a tick stays initialized while it is > 0
+        self.tick_gross: Dict[int, int] = {}
+        # (block, logIndex) of the last state change applied
+        self.position: Tuple[int, int] = (-1, -1)
+        self.loaded = False
+        # Logs that arrived while the pool was (re)loading
+        self.backlog: List[Mapping] = []
+
+
+class PoolStateCache:
+    """
+    Per-chain pool state kept current from logs instead of per-read RPCs.
+
+    Watched V2 pairs follow their ``Sync`` events and V3 pools their
+    ``Swap``/``Mint``/``Burn`` events, so ``get_reserves``/``get_v3_state``
+    answer from memory together with the block the state reflects. Newly
+    watched pools are bulk-loaded through Multicall3. Logs come from a
+    websocket ``logs`` subscription and, while no subscription is live, from
+    ``eth_getLogs`` on each head; both filter on the watched addresses, and
+    the subscription is replaced when pools are added (they load once it is
+    live). Block hashes seen in logs are checked against the canonical
+    chain; on a reorg the pools touched by orphaned blocks are reloaded.
+    """
+
+    POLL_INTERVAL_SECONDS = 1.0
+    # Beyond this many missed blocks, reloading beats replaying logs
+    MAX_LOG_RANGE = 32
+    REORG_HISTORY = 64
+    # Tick bitmap words loaded either side of a V3 pool's current word
+    V3_WORD_RADIUS = 2
+    # Nodes cap the addresses of one log filter (geth: 1000)
+    MAX_FILTER_ADDRESSES = 1000
+    # Pools watched within this window share one resubscribe
+    RESUBSCRIBE_DELAY_SECONDS = 0.25
+    # Failed or empty factory()/getPair lookups are retried after this long
+    NEGATIVE_TTL_SECONDS = 300.0
+
+    def __init__(
+        self,
+        web3: AsyncWeb3,
+        chain_id: int,
+        ws_url: Optional[str] = None,
+        max_pools: int = 5000,
+    ):
+        self._web3 = web3
+        self._chain_id = chain_id
+        self._ws_url = ws_url
+        self._max_pools = max_pools
+        self._multicall = get_multicall(web3)
+
+        self._pools: Dict[str, _Pool] = {}
+        self._factories: Dict[str, str] = {}
+        self._pairs: Dict[Tuple[str, str, str], str] = {}
+        # Router or pair key -> monotonic time its failed lookup expires
+        self._failed: Dict[Any, float] = {}
+        # (router, *path) of track_v2_path lookups in flight
+        self._tracking: Set[Tuple[str, ...]] = set()
+        self._block_hashes: "OrderedDict[int, str]" = OrderedDict()
+        self._head: Optional[int] = None
+        self._synced_block: Optional[int] = None
+        self._subscribed = False
+        self._head_event = asyncio.Event()
+        self._pools_changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._background: Set[asyncio.Task] = set()
+
+        self._counters: Dict[str, int] = {
+            "logs_applied": 0,
+            "logs_ignored": 0,
+            "loads": 0,
+            "pools_loaded": 0,
+            "load_failures": 0,
+            "pairs_resolved": 0,
+            "lookup_failures": 0,
+            "lookups_skipped": 0,
+            "resubscribes": 0,
+            "reorgs": 0,
+            "hits": 0,
+            "misses": 0,
+        }
+
+    # -- lifecycle ---------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def in_sync(self) -> bool:
+        """True while logs are applied up to (at most one block behind) the head."""
+        if not self.running or self._synced_block is None:
+            return False
+        return self._head is None or self._synced_block >= self._head - 1
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        tasks = list(self._background)
+        if self._task:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._background.clear()
+
+    def notify_head(self, block_number: int) -> None:
+        """Block feed hook: record a new head and wake the poller."""
+        if self._head is None or block_number > self._head:
+            self._head = block_number
+            if self._subscribed and self._synced_block is not None:
+                # A live subscription delivers the head's logs as it arrives
+                self._synced_block = max(self._synced_block, block_number)
+            self._head_event.set()
+
+    # -- watching and loading ---------------------------------------------
+
+    def watch_v2(self, pool: str) -> bool:
+        """Track a V2 pair; returns False if it is already tracked or full."""
+        return self._watch(pool, V2)
+
+    def watch_v3(self, pool: str) -> bool:
+        """Track a V3 pool; returns False if it is already tracked or full."""
+        return self._watch(pool, V3)
+
+    def _watch(self, pool: str, kind: str) -> bool:
+        key = pool.lower()
+        if key in self._pools or len(self._pools) >= self._max_pools:
+            return False
+        self._pools[key] = _Pool(key, kind)
+        if self._task is not None:
+            self._pools_changed.set()
+            if not self._subscribed:
+                self._spawn(self.load([key]))
+        return True
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def load(self, pools: Optional[Iterable[str]] = None) -> int:
+        """
+        Bulk-load pool state through Multicall3; returns the pools loaded.
+
+        Loads every pool that is not loaded yet unless ``pools`` is given.
+        """
+        if pools is None:
+            targets = [p for p in self._pools.values() if not p.loaded]
+        else:
+            targets = [
+                self._pools[p.lower()] for p in pools if p.lower() in self._pools
+            ]
+        if not targets:
+            return 0
+        self._counters["loads"] += 1
+        head = await self._web3.eth.block_number
+        results = await asyncio.gather(
+            *(self._read_pool(pool) for pool in targets), return_exceptions=True
+        )
+        loaded = 0
+        for pool, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                self._counters["load_failures"] += 1
+                logger.debug("Pool %s load failed: %s", pool.address, result)
+                continue
+            self._install(pool, result, head)
+            loaded += 1
+        self._counters["pools_loaded"] += loaded
+        if self._head is None or head > self._head:
+            self._head = head
+        if self._synced_block is None:
+            self._synced_block = head
+        return loaded
+
+    def _install(self, pool: _Pool, state: Dict[str, Any], head: int) -> None:
+        """Apply freshly read state, then any logs that arrived after it."""
+        pool.token0 = state["token0"].lower()
+        pool.token1 = state["token1"].lower()
+        if pool.kind == V2:
+            pool.reserve0, pool.reserve1 = state["reserves"]
+        else:
+            pool.v3 = state["v3"]
+            pool.tick_gross = state["tick_gross"]
+        # The reads were served at ``head`` or later: logs up to it are in
+        pool.position = (head, _LOADED_AT_END_OF_BLOCK)
+        pool.loaded = True
+        backlog, pool.backlog = pool.backlog, []
+        for log in backlog:
+            self._apply(pool, log)
+
+    async def _read_pool(self, pool: _Pool) -> Dict[str, Any]:
+        call = self._multicall.call
+        address = self._web3.to_checksum_address(pool.address)
+        if pool.kind == V2:
+            reserves, token0, token1 = await asyncio.gather(
+                call(GET_RESERVES, address),
+                call(TOKEN0, address),
+                call(TOKEN1, address),
+            )
+            return {
+                "reserves": (reserves[0], reserves[1]),
+                "token0": token0,
+                "token1": token1,
+            }
+
+        slot0, liquidity, fee, spacing, token0, token1 = await asyncio.gather(
+            call(SLOT0, address),
+            call(LIQUIDITY, address),
+            call(POOL_FEE, address),
+            call(TICK_SPACING, address),
+            call(TOKEN0, address),
+            call(TOKEN1, address),
+        )
+        sqrt_price_x96, tick = slot0[0], slot0[1]
+        word = (tick // spacing) >> 8
+        words = range(word - self.V3_WORD_RADIUS, word + self.V3_WORD_RADIUS + 1)
+        bitmaps = await asyncio.gather(*(call(TICK_BITMAP, address, w) for w in words))
+        initialized = [
+            ((w << 8) + bit) * spacing
+            for w, bitmap in zip(words, bitmaps)
+            for bit in range(256)
+            if bitmap >> bit & 1
+        ]
+        infos = await asyncio.gather(*(call(TICKS, address, t) for t in initialized))
+        return {
+            "token0": token0,
+            "token1": token1,
+            "v3": V3PoolState(
+                sqrt_price_x96=sqrt_price_x96,
+                tick=tick,
+                liquidity=liquidity,
+                fee=fee,
+                tick_spacing=spacing,
+                ticks={t: info[1] for t, info in zip(initialized, infos)},
+            ),
+            "tick_gross": {t: info[0] for t, info in zip(initialized, infos)},
+        }
+
+    # -- V2 pair resolution -----------------------------------------------
+
+    def find_v2_pair(self, router: str, token_a: str, token_b: str) -> Optional[str]:
+        """Pair of a router's factory if it was resolved before (no RPC)."""
+        factory = self._factories.get(router.lower())
+        if factory is None:
+            return None
+        return self._pairs.get(_pair_key(factory, token_a, token_b))
+
+    def _recently_failed(self, key: Any) -> bool:
+        expiry = self._failed.get(key)
+        if expiry is None:
+            return False
+        if expiry > time.monotonic():
+            return True
+        del self._failed[key]
+        return False
+
+    def _remember_failure(self, key: Any) -> None:
+        now = time.monotonic()
+        if len(self._failed) >= self._max_pools:
+            self._failed = {k: t for k, t in self._failed.items() if t > now}
+        self._failed[key] = now + self.NEGATIVE_TTL_SECONDS
+        self._counters["lookup_failures"] += 1
+
+    def _needs_lookup(self, router: str, token_a: str, token_b: str) -> bool:
+        """False if the pair is resolved or its last lookup failed recently."""
+        factory = self._factories.get(router.lower())
+        if factory is None:
+            return not self._recently_failed(router.lower())
+        key = _pair_key(factory, token_a, token_b)
+        return key not in self._pairs and not self._recently_failed(key)
+
+    async def resolve_v2_pair(
+        self, router: str, token_a: str, token_b: str
+    ) -> Optional[str]:
+        """
+        Pair address from the router's factory; resolved once, then watched.
+
+        A router without ``factory()``, a failed ``getPair`` and a pair that
+        does not exist are remembered for ``NEGATIVE_TTL_SECONDS`` and answer
+        None without an RPC until then.
+        """
+        router_key = router.lower()
+        factory = self._factories.get(router_key)
+        if factory is None:
+            if self._recently_failed(router_key):
+                return None
+            try:
+                factory = await self._multicall.call(
+                    FACTORY, self._web3.to_checksum_address(router)
+                )
+            except Exception:
+                self._remember_failure(router_key)
+                raise
+            factory = self._factories[router_key] = factory.lower()
+        key = _pair_key(factory, token_a, token_b)
+        if key not in self._pairs:
+            if self._recently_failed(key):
+                return None
+            try:
+                pair = await self._multicall.call(
+                    GET_PAIR,
+                    self._web3.to_checksum_address(factory),
+                    self._web3.to_checksum_address(token_a),
+                    self._web3.to_checksum_address(token_b),
+                )
+            except Exception:
+                self._remember_failure(key)
+                raise
+            self._counters["pairs_resolved"] += 1
+            if int(pair, 16) == 0:
+                self._remember_failure(key)
+                return None
+            self._pairs[key] = pair.lower()
+        pair = self._pairs[key]
+        self.watch_v2(pair)
+        return pair
+
+    def track_v2_path(self, router: str, path: Sequence[str]) -> None:
+        """
+        Resolve and watch the pairs of ``path`` in the background.
+
+        Nothing is spawned while the same lookup is in flight or when every
+        hop is resolved or recently failed.
+        """
+        key = (router.lower(), *(token.lower() for token in path))
+        hops = list(zip(path, path[1:]))
+        if key in self._tracking or not any(
+            self._needs_lookup(router, token_in, token_out)
+            for token_in, token_out in hops
+        ):
+            self._counters["lookups_skipped"] += 1
+            return
+
+        async def _track():
+            try:
+                await asyncio.gather(
+                    *(
+                        self.resolve_v2_pair(router, token_in, token_out)
+                        for token_in, token_out in hops
+                    )
+                )
+            except Exception as e:
+                logger.debug("Could not resolve pairs for %s: %s", router, e)
+            finally:
+                self._tracking.discard(key)
+
+        self._tracking.add(key)
+        self._spawn(_track())
+
+    # -- reads ---------------------------------------------------------------
+
+    def _reflected_block(self, pool: _Pool) -> int:
+        return max(pool.position[0], self._synced_block or -1)
+
+    def get_reserves(self, pool: str) -> Optional[Tuple[int, int, int]]:
+        """``(reserve0, reserve1, block_number)`` of a loaded V2 pair, or None."""
+        entry = self._pools.get(pool.lower())
+        if entry is None or not entry.loaded or entry.kind != V2:
+            self._counters["misses"] += 1
+            return None
+        self._counters["hits"] += 1
+        return entry.reserve0, entry.reserve1, self._reflected_block(entry)
+
+    def get_v3_state(self, pool: str) -> Optional[Tuple[V3PoolState, int]]:
+        """``(state, block_number)`` of a loaded V3 pool, or None."""
+        entry = self._pools.get(pool.lower())
+        if entry is None or not entry.loaded or entry.kind != V3:
+            self._counters["misses"] += 1
+            return None
+        self._counters["hits"] += 1
+        return entry.v3, self._reflected_block(entry)
+
+    def v2_hops(
+        self, router: str, path: Sequence[str]
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Cached ``(reserve_in, reserve_out)`` for each hop of ``path``.
+
+        None unless every pair is resolved and loaded and the cache is in
+        sync with the head, so callers can fall back to an RPC quote.
+        """
+        if not self.in_sync:
+            self._counters["misses"] += 1
+            return None
+        hops = []
+        for token_in, token_out in zip(path, path[1:]):
+            pair = self.find_v2_pair(router, token_in, token_out)
+            entry = self._pools.get(pair) if pair else None
+            if entry is None or not entry.loaded or entry.kind != V2:
+                self._counters["misses"] += 1
+                return None
+            if entry.token0 == token_in.lower():
+                hops.append((entry.reserve0, entry.reserve1))
+            else:
+                hops.append((entry.reserve1, entry.reserve0))
+        self._counters["hits"] += 1
+        return hops
+
+    # -- logs ----------------------------------------------------------------
+
+    def handle_log(self, log: Mapping[str, Any]) -> None:
+        """Apply one pool log from the subscription or ``eth_getLogs``."""
+        pool = self._pools.get(_hex(log.get("address")))
+        if pool is None:
+            return
+        block = _int(log["blockNumber"])
+        if log.get("removed"):
+            self._on_reorg(block)
+            return
+        block_hash = _hex(log.get("blockHash"))
+        if block_hash:
+            known = self._block_hashes.get(block)
+            if known is not None and known != block_hash:
+                self._on_reorg(block)
+            self._remember_hash(block, block_hash)
+        if not pool.loaded:
+            pool.backlog.append(log)
+            return
+        self._apply(pool, log)
+
+    def _apply(self, pool: _Pool, log: Mapping[str, Any]) -> None:
+        position = (_int(log["blockNumber"]), _int(log.get("logIndex", 0)))
+        topics = log.get("topics") or []
+        if position <= pool.position or not topics:
+            self._counters["logs_ignored"] += 1
+            return
+        topic = _hex(topics[0])
+        data = _data(log.get("data") or b"")
+        if pool.kind == V2 and topic == SYNC_TOPIC:
+            pool.reserve0, pool.reserve1 = eth_abi.decode(["uint112", "uint112"], data)
+        elif pool.kind == V3 and topic == V3_SWAP_TOPIC:
+            _, _, sqrt_price_x96, liquidity, tick = eth_abi.decode(
+                ["int256", "int256", "uint160", "uint128", "int24"], data
+            )
+            pool.v3.sqrt_price_x96 = sqrt_price_x96
+            pool.v3.liquidity = liquidity
+            pool.v3.tick = tick
+        elif pool.kind == V3 and topic in (V3_MINT_TOPIC, V3_BURN_TOPIC):
+            if topic == V3_MINT_TOPIC:
+                amount = eth_abi.decode(
+                    ["address", "uint128", "uint256", "uint256"], data
+                )[1]
+            else:
+                amount = -eth_abi.decode(["uint128", "uint256", "uint256"], data)[0]
+            self._apply_position(
+                pool, _topic_int24(topics[2]), _topic_int24(topics[3]), amount
+            )
+        else:
+            self._counters["logs_ignored"] += 1
+            return
+        pool.position = position
+        self._counters["logs_applied"] += 1
+
+    @staticmethod
+    def _apply_position(
+        pool: _Pool, tick_lower: int, tick_upper: int, liquidity_delta: int
+    ) -> None:
+        """Mint (+) or Burn (-) of a position, as UniswapV3Pool applies it."""
+        state = pool.v3
+        for tick, net_delta in (
+            (tick_lower, liquidity_delta),
+            (tick_upper, -liquidity_delta),
+        ):
+            gross = pool.tick_gross.get(tick, 0) + liquidity_delta
+            if gross > 0:
+                pool.tick_gross[tick] = gross
+            else:
+                pool.tick_gross.pop(tick, None)
+            state.update_tick(tick, state.ticks.get(tick, 0) + net_delta, gross > 0)
+        if tick_lower <= state.tick < tick_upper:
+            state.liquidity += liquidity_delta
+
+    def _remember_hash(self, block: int, block_hash: str) -> None:
+        self._block_hashes[block] = block_hash
+        while len(self._block_hashes) > self.REORG_HISTORY:
+            self._block_hashes.pop(min(self._block_hashes))
+
+    def _on_reorg(self, block: int) -> None:
+        """Drop everything derived from ``block`` onwards and reload it."""
+        self._counters["reorgs"] += 1
+        for number in [n for n in self._block_hashes if n >= block]:
+            del self._block_hashes[number]
+        stale = [
+            pool
+            for pool in self._pools.values()
+            if pool.loaded and pool.position[0] >= block
+        ]
+        for pool in stale:
+            pool.loaded = False
+            pool.position = (-1, -1)
+        if self._synced_block is not None and self._synced_block >= block:
+            self._synced_block = block - 1
+        logger.info(
+            "Reorg at block %s on chain %s; reloading %s pools.",
+            block,
+            self._chain_id,
+            len(stale),
+        )
+        if stale and self._task is not None:
+            self._spawn(self.load([pool.address for pool in stale]))
+
+    async def _check_reorg(self) -> bool:
+        """Compare recorded block hashes with the canonical chain."""
+        fork_block = None
+        for number in sorted(self._block_hashes, reverse=True):
+            try:
+                block = await self._web3.eth.get_block(number)
+            except Exception:
+                # Not served by this node (yet); nothing to compare against
+                break
+            if _hex(block.get("hash")) == self._block_hashes[number]:
+                break
+            fork_block = number
+        if fork_block is None:
+            return False
+        self._on_reorg(fork_block)
+        return True
+
+    # -- log sources -------------------------------------------------------
+
+    async def _run(self) -> None:
+        try:
+            await self.load()
+        except Exception as e:
+            logger.debug("Pool cold load failed on chain %s: %s", self._chain_id, e)
+        while True:
+            if self._ws_url:
+                try:
+                    await self._follow_logs(self._ws_url)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.debug(
+                        "Pool log subscription failed on chain %s (%s); polling.",
+                        self._chain_id,
+                        e,
+                    )
+                # Pools watched while subscribed were left for the resubscribe
+                self._spawn(self.load())
+            try:
+                await self._poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug("Pool log poll failed on chain %s: %s", self._chain_id, e)
+            try:
+                await asyncio.wait_for(
+                    self._head_event.wait(), self.POLL_INTERVAL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._head_event.clear()
+
+    async def _poll(self) -> None:
+        """Catch up from the last synced block with ``eth_getLogs``."""
+        head = await self._web3.eth.block_number
+        if self._head is None or head > self._head:
+            self._head = head
+        if await self._check_reorg():
+            return
+        if not self._pools or self._synced_block is None:
+            self._synced_block = head
+            return
+        start = self._synced_block + 1
+        if start > head:
+            return
+        if head - start + 1 > self.MAX_LOG_RANGE:
+            for pool in self._pools.values():
+                pool.loaded = False
+            await self.load()
+            self._synced_block = head
+            return
+        batches = await asyncio.gather(
+            *(
+                self._web3.eth.get_logs(
+                    {
+                        "fromBlock": start,
+                        "toBlock": head,
+                        "address": addresses,
+                        "topics": [POOL_TOPICS],
+                    }
+                )
+                for addresses in self._address_chunks()
+            )
+        )
+        for logs in batches:
+            for log in logs:
+                self.handle_log(log)
+        self._synced_block = head
+
+    def _address_chunks(self) -> List[List[str]]:
+        """Watched pool addresses, split to fit one log filter each."""
+        addresses = [self._web3.to_checksum_address(pool) for pool in self._pools]
+        size = self.MAX_FILTER_ADDRESSES
+        return [addresses[i : i + size] for i in range(0, len(addresses), size)]
+
+    async def _follow_logs(self, ws_url: str) -> None:
+        """Apply logs from a websocket ``logs`` subscription until it drops."""
+        from web3.providers import WebSocketProvider
+
+        ws_provider = WebSocketProvider(ws_url)
+        ws_web3 = AsyncWeb3(ws_provider)
+        subscriptions: List[str] = []
+        listener: Optional[asyncio.Task] = None
+        changed: Optional[asyncio.Task] = None
+
+        async def _handle_log(context):
+            self.handle_log(context.result or {})
+
+        async def _subscribe() -> None:
+            """Subscribe to the watched addresses, then drop the old filters."""
+            nonlocal subscriptions
+            self._pools_changed.clear()
+            fresh = []
+            for addresses in self._address_chunks():
+                fresh.append(
+                    await ws_web3.eth.subscribe(
+                        "logs",
+                        {"address": addresses, "topics": [POOL_TOPICS]},
+                        handler=_handle_log,
+                    )
+                )
+            previous, subscriptions = subscriptions, fresh
+            for subscription_id in previous:
+                await ws_web3.eth.unsubscribe(subscription_id)
+
+        try:
+            await ws_provider.connect()
+            await _subscribe()
+            # Close the gap to the last poll; duplicates are skipped by position
+            await self._poll()
+            self._subscribed = True
+            listener = asyncio.create_task(
+                ws_web3.subscription_manager.handle_subscriptions(run_forever=True)
+            )
+            while True:
+                changed = asyncio.create_task(self._pools_changed.wait())
+                await asyncio.wait(
+                    {listener, changed}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if listener.done():
+                    listener.result()
+                    return
+                await asyncio.sleep(self.RESUBSCRIBE_DELAY_SECONDS)
+                await _subscribe()
+                self._counters["resubscribes"] += 1
+                # Loaded only now, so every log after the load is delivered
+                await self.load()
+        finally:
+            self._subscribed = False
+            for task in (listener, changed):
+                if task is not None:
+                    task.cancel()
+            for subscription_id in subscriptions:
+                try:
+                    await ws_web3.eth.unsubscribe(subscription_id)
+                except Exception:
+                    pass
+            try:
+                await ws_provider.disconnect()
+            except Exception:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        pools = list(self._pools.values())
+        return {
+            **self._counters,
+            "pools": len(pools),
+            "loaded": sum(1 for pool in pools if pool.loaded),
+            "synced_block": self._synced_block,
+            "head": self._head,
+            "in_sync": self.in_sync,
+            "source": "logs" if self._subscribed else "polling",
+        }
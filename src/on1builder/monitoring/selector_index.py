@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import eth_abi
+from eth_utils import (
+    abi_to_signature,
+    function_signature_to_4byte_selector,
+    get_abi_input_types,
+)
+
+from on1builder.integrations.abi_registry import ABIRegistry
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# (args_without_selector, value_wei) -> normalized swap intent, or None
+SwapDecoder = Callable[[bytes, int], Optional[Dict[str, Any]]]
+
+# ABI resource name -> DEX/protocol family. Routers sharing an interface share
+# a family (SushiSwap is a Uniswap V2 fork with identical selectors).
+ABI_FAMILIES: Dict[str, str] = {
+    "uniswap": "uniswap_v2",
+    "sushiswap": "uniswap_v2",
+    "uniswap_v3": "uniswap_v3",
+    "aave_pool": "aave_v3",
+}
+
+# Well-known entry points that are not covered by the bundled ABIs
+# (the Aave pool ABI in resources is only the proxy interface):
+# (signature, family, mev_type override)
+KNOWN_SIGNATURES: Tuple[Tuple[str, str, Optional[str]], ...] = (
+    ("liquidationCall(address,address,address,uint256,bool)", "aave_v3", None),
+    (
+        "flashLoan(address,address[],uint256[],uint256[],address,bytes,uint16)",
+        "aave_v3",
+        None,
+    ),
+    ("flashLoanSimple(address,address,uint256,bytes,uint16)", "aave_v3", None),
+    ("liquidateBorrow(address,uint256,address)", "compound", None),
+    ("multicall(bytes[])", "uniswap_v3", None),
+    ("multicall(uint256,bytes[])", "uniswap_v3", None),
+    (
+        "batchSwap(uint8,(bytes32,uint256,uint256,uint256,bytes)[],address[],"
+        "(address,bool,address,bool),int256[],uint256)",
+        "balancer",
+        None,
+    ),
+    # Uniswap V2 pair swap with callback data is a flash swap
+    ("swap(uint256,uint256,address,bytes)", "uniswap_v2_pair", "flash_loan"),
+)
+
+# Classification rules evaluated once per function name at index build time,
+# never against calldata.
+MEV_NAME_RULES: Tuple[Tuple[str, re.Pattern], ...] = (
+    ("flash_loan", re.compile(r"^flash(Loan|Swap)", re.IGNORECASE)),
+    ("liquidation", re.compile(r"liquidat|seize", re.IGNORECASE)),
+    ("arbitrage", re.compile(r"^(multicall|batchSwap)$", re.IGNORECASE)),
+    ("sandwich_attack", re.compile(r"^(swap\w+For\w+|exact(Input|Output))")),
+)
+
+
+@dataclass(frozen=True)
+class SelectorEntry:
+    """Dispatch information for one 4-byte function selector."""
+
+    selector: bytes
+    signature: str
+    name: str
+    mev_type: Optional[str]
+    dex_family: Optional[str]
+    decoder: Optional[SwapDecoder] = None
+    source: str = "abi"
+
+
+def classify_function_name(name: str) -> Optional[str]:
+    """Map a contract function name to an MEV category."""
+    for mev_type, pattern in MEV_NAME_RULES:
+        if pattern.search(name):
+            return mev_type
+    return None
+
+
+def decode_v3_path(path_bytes: bytes) -> Tuple[List[str], List[int]]:
+    """Decode Uniswap V3 path bytes into token addresses and fee tiers."""
+    if not path_bytes or len(path_bytes) < 43:
+        return [], []
+
+    tokens: List[str] = []
+    fees: List[int] = []
+    offset = 0
+    tokens.append("0x" + path_bytes[offset : offset + 20].hex())
+    offset += 20
+
+    while offset < len(path_bytes):
+        if offset + 3 > len(path_bytes):
+            return [], []
+        fee = int.from_bytes(path_bytes[offset : offset + 3], "big")
+        fees.append(fee)
+        offset += 3
+        if offset + 20 > len(path_bytes):
+            return [], []
+        tokens.append("0x" + path_bytes[offset : offset + 20].hex())
+        offset += 20
+
+    return tokens, fees
+
+
+def make_swap_intent(
+    path: List[str],
+    amount_in: int,
+    amount_out_min: int,
+    *,
+    fees: Optional[List[int]] = None,
+    pool_fee: Optional[int] = None,
+    recipient: Optional[str] = None,
+    deadline: Optional[int] = None,
+    dex: Optional[str] = None,
+    legs: int = 1,
+    mev_type: Optional[str] = None,
+    exact_output: bool = False,
+) -> Dict[str, Any]:
+    """
+    Build the normalized swap intent every decoder returns.
+
+    ``path`` is always ordered input token first. ``dex`` names the pool family
+    the first swap leg routes through when the calldata reveals it, and
+    ``mev_type`` lets wrapper calls (multicall, Universal Router) refine the
+    selector's static classification. For ``exact_output`` swaps
+    ``amount_in`` is the maximum input and ``amount_out_min`` the exact output.
+    """
+    return {
+        "path": path,
+        "fees": fees,
+        "pool_fee": pool_fee,
+        "amount_in": int(amount_in),
+        "amount_out_min": int(amount_out_min),
+        "recipient": recipient,
+        "deadline": int(deadline) if deadline is not None else None,
+        "dex": dex,
+        "legs": legs,
+        "mev_type": mev_type,
+        "exact_output": exact_output,
+    }
+
+
+def is_v2_exact_input(intent: Optional[Dict[str, Any]]) -> bool:
+    """True for a constant-product (Uniswap V2 family) exact-input swap."""
+    return bool(
+        intent
+        and intent.get("dex") == "uniswap_v2"
+        and intent.get("pool_fee") is None
+        and not intent.get("fees")
+        and not intent.get("exact_output")
+    )
+
+
+def _first(named: Dict[str, Any], *keys: str) -> Any:
+    for key in keys:
+        if named.get(key) is not None:
+            return named[key]
+    return None
+
+
+def build_abi_swap_decoder(
+    fn_abi: Dict[str, Any], dex: Optional[str] = None
+) -> Optional[SwapDecoder]:
+    """
+    Build a swap decoder for a router function from its ABI definition.
+
+    Arguments are mapped by name (``amountIn``, ``path``, ``tokenIn`` ...), so
+    V2-style positional arguments and V3-style ``params`` structs share a
+    single implementation. Returns None for read-only functions and functions
+    without a swap path.
+    """
+    if fn_abi.get("stateMutability") in ("view", "pure"):
+        return None
+    inputs = fn_abi.get("inputs", [])
+    if len(inputs) == 1 and inputs[0].get("type") == "tuple":
+        names = [component.get("name") for component in inputs[0]["components"]]
+        unwrap = True
+    else:
+        names = [item.get("name") for item in inputs]
+        unwrap = False
+    if "path" not in names and "tokenIn" not in names:
+        return None
+    types = get_abi_input_types(fn_abi)
+    # V3 exact-output paths are encoded output token first
+    reversed_path = fn_abi.get("name", "").startswith("exactOutput")
+    # Exact-output functions fix amountOut and cap the input
+    exact_output = "amountOut" in names
+
+    def decode(args: bytes, value_wei: int) -> Optional[Dict[str, Any]]:
+        decoded = eth_abi.decode(types, args)
+        named = dict(zip(names, decoded[0] if unwrap else decoded))
+
+        fees = None
+        pool_fee = None
+        path = named.get("path")
+        if isinstance(path, (bytes, bytearray)):
+            tokens, fees = decode_v3_path(path)
+            if not tokens or not fees:
+                return None
+            if reversed_path:
+                tokens.reverse()
+                fees.reverse()
+        elif path is not None:
+            tokens = list(path)
+        else:
+            tokens = [named["tokenIn"], named["tokenOut"]]
+            pool_fee = int(named["fee"])
+
+        amount_in = _first(named, "amountIn", "amountInMax", "amountInMaximum")
+        amount_out = _first(named, "amountOutMin", "amountOutMinimum", "amountOut")
+        return make_swap_intent(
+            tokens,
+            amount_in if amount_in is not None else value_wei,
+            amount_out if amount_out is not None else 0,
+            fees=fees,
+            pool_fee=pool_fee,
+            recipient=_first(named, "to", "recipient"),
+            deadline=named.get("deadline"),
+            dex=dex,
+            exact_output=exact_output,
+        )
+
+    return decode
+
+
+class SelectorIndex:
+    """
+    Selector-indexed dispatch table built once from ``resources/abi``.
+
+    Classifying a transaction is a single dict lookup on the first four bytes
+    of its calldata.
+    """
+
+    def __init__(self, registry: Optional[ABIRegistry] = None):
+        self._entries: Dict[bytes, SelectorEntry] = {}
+        registry = registry or ABIRegistry()
+        for abi_name, family in ABI_FAMILIES.items():
+            abi = registry.get_abi(abi_name) or []
+            self._register_abi(abi, family)
+        for signature, family, mev_type in KNOWN_SIGNATURES:
+            self.register_signature(signature, family, mev_type=mev_type)
+        logger.debug("SelectorIndex built with %s selectors.", len(self._entries))
+
+    def _register_abi(self, abi: Iterable[Dict[str, Any]], family: str) -> None:
+        for fn_abi in abi:
+            if fn_abi.get("type") != "function":
+                continue
+            signature = abi_to_signature(fn_abi)
+            selector = function_signature_to_4byte_selector(signature)
+            if selector in self._entries:
+                continue
+            self._entries[selector] = SelectorEntry(
+                selector=selector,
+                signature=signature,
+                name=fn_abi["name"],
+                mev_type=classify_function_name(fn_abi["name"]),
+                dex_family=family,
+                decoder=build_abi_swap_decoder(fn_abi, dex=family),
+            )
+
+    def register_signature(
+        self,
+        signature: str,
+        dex_family: Optional[str] = None,
+        mev_type: Optional[str] = None,
+        decoder: Optional[SwapDecoder] = None,
+        source: str = "abi",
+    ) -> SelectorEntry:
+        """Register (or replace) the entry for a text function signature."""
+        selector = function_signature_to_4byte_selector(signature)
+        name = signature.split("(", 1)[0]
+        entry = SelectorEntry(
+            selector=selector,
+            signature=signature,
+            name=name,
+            mev_type=mev_type or classify_function_name(name),
+            dex_family=dex_family,
+            decoder=decoder,
+            source=source,
+        )
+        self._entries[selector] = entry
+        return entry
+
+    def register_plugin(self, plugin: Any) -> None:
+        """Let a calldata decoder plugin register its selectors."""
+        plugin.register(self)
+        logger.debug("Registered calldata decoder plugin '%s'.", plugin.name)
+
+    def entries(self, source: Optional[str] = None) -> List[SelectorEntry]:
+        """All entries, optionally only those registered by ``source``."""
+        return [
+            entry
+            for entry in self._entries.values()
+            if source is None or entry.source == source
+        ]
+
+    def lookup(self, calldata: bytes) -> Optional[SelectorEntry]:
+        """Return the entry for the selector at the start of ``calldata``."""
+        return self._entries.get(calldata[:4])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, selector: bytes) -> bool:
+        return selector in self._entries
+
+
+# Global selector index, built on first use
+_selector_index: Optional[SelectorIndex] = None
+
+
+def get_selector_index() -> SelectorIndex:
+    """Get the global selector index instance."""
+    global _selector_index
+    if _selector_index is None:
+        from on1builder.monitoring.calldata_decoders import DEFAULT_PLUGINS
+
+        index = SelectorIndex()
+        for plugin_cls in DEFAULT_PLUGINS:
+            index.register_plugin(plugin_cls())
+        _selector_index = index
+    return _selector_index
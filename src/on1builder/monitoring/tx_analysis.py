@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+WEI_PER_ETH = 10**18
+
+
+@dataclass(slots=True)
+class TxAnalysis(Mapping):
+    """
+    Compact per-transaction analysis record kept in the scanner cache.
+
+    Stores raw bytes and integer wei values only; the legacy dict keys
+    (``hash``, ``gasPrice``, ``value_eth``, ``input_data`` ...) are derived on
+    access so strategy code can keep treating the record as a read-only
+    mapping.
+    """
+
+    tx_hash: bytes
+    sender: str
+    to: Optional[str]
+    value_wei: int
+    gas_price: int
+    gas_limit: int
+    calldata: bytes
+    observed_at: float
+    mev_type: Optional[str] = None
+    target_dex: Optional[str] = None
+    swap_intent: Optional[Dict[str, Any]] = None
+    priority_score: float = 0.0
+    estimated_profit_potential: float = 0.0
+    risk_score: float = 0.0
+
+    @classmethod
+    def from_tx(cls, tx: Mapping, calldata: bytes) -> "TxAnalysis":
+        """Build a record from a web3 transaction body and its decoded calldata."""
+        raw_hash = tx["hash"]
+        if isinstance(raw_hash, str):
+            raw_hash = bytes.fromhex(raw_hash.removeprefix("0x"))
+        return cls(
+            tx_hash=bytes(raw_hash),
+            sender=tx["from"],
+            to=tx.get("to"),
+            value_wei=int(tx.get("value", 0) or 0),
+            gas_price=int(tx.get("gasPrice", 0) or 0),
+            gas_limit=int(tx.get("gas", 0) or 0),
+            calldata=calldata,
+            observed_at=time.monotonic(),
+        )
+
+    @property
+    def value_eth(self) -> float:
+        return self.value_wei / WEI_PER_ETH
+
+    @property
+    def input_data(self) -> str:
+        return f"0x{self.calldata.hex()}"
+
+    @property
+    def swap_path(self) -> Optional[List[str]]:
+        return self.swap_intent.get("path") if self.swap_intent else None
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time the transaction was observed."""
+        return datetime.now() - timedelta(seconds=time.monotonic() - self.observed_at)
+
+    def _intent_field(self, name: str) -> Any:
+        return self.swap_intent.get(name) if self.swap_intent else None
+
+    # Mapping adapter -----------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        getter = _KEY_GETTERS.get(key)
+        if getter is None:
+            raise KeyError(key)
+        return getter(self)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEY_GETTERS)
+
+    def __len__(self) -> int:
+        return len(_KEY_GETTERS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the legacy dict view (for logging or serialization)."""
+        return {key: getter(self) for key, getter in _KEY_GETTERS.items()}
+
+
+# Legacy analysis dict keys -> accessor. ``hash``/``tx_hash`` keep the
+# historical un-prefixed hex form produced by ``HexBytes.hex()``.
+_KEY_GETTERS: Dict[str, Callable[[TxAnalysis], Any]] = {
+    "tx_hash": lambda a: a.tx_hash.hex(),
+    "hash": lambda a: a.tx_hash.hex(),
+    "from": lambda a: a.sender,
+    "to": lambda a: a.to,
+    "value_eth": lambda a: a.value_eth,
+    "value_wei": lambda a: a.value_wei,
+    "gas_price": lambda a: a.gas_price,
+    "gasPrice": lambda a: a.gas_price,
+    "gas_limit": lambda a: a.gas_limit,
+    "timestamp": lambda a: a.timestamp,
+    "input_data": lambda a: a.input_data,
+    "mev_type": lambda a: a.mev_type,
+    "target_dex": lambda a: a.target_dex,
+    "estimated_profit_potential": lambda a: a.estimated_profit_potential,
+    "risk_score": lambda a: a.risk_score,
+    "priority_score": lambda a: a.priority_score,
+    "swap_path": lambda a: a.swap_path,
+    "amount_in": lambda a: a._intent_field("amount_in"),
+    "amount_out_min": lambda a: a._intent_field("amount_out_min"),
+    "pool_fee": lambda a: a._intent_field("pool_fee"),
+    "fees": lambda a: a._intent_field("fees"),
+    "exact_output": lambda a: a._intent_field("exact_output"),
+    "swap_intent": lambda a: a.swap_intent,
+}
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from web3 import AsyncWeb3
+from web3._utils.method_formatters import transaction_result_formatter
+from web3.exceptions import TransactionNotFound
+from web3.types import TxData
+
+from on1builder.utils.latency_tracker import LatencyTracker
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class TxBatchFetcher:
+    """
+    Micro-batching ``eth_getTransactionByHash`` fetcher.
+
+    Callers await :meth:`fetch` for a single hash; hashes are collected for up
+    to ``linger_ms`` or until ``max_batch_size`` are pending and then resolved
+    with one JSON-RPC batch request; :meth:`fetch_many` sends a caller's
+    whole set of hashes straight away. Providers that do not implement batching
+    are detected on first use and served with individual ``get_transaction``
+    calls instead.
+    """
+
+    def __init__(
+        self, web3: AsyncWeb3, max_batch_size: int = 50, linger_ms: float = 5.0
+    ):
+        if max_batch_size <= 0:
+            raise ValueError("TxBatchFetcher max_batch_size must be > 0")
+        self._web3 = web3
+        self._max_batch_size = max_batch_size
+        self._linger = max(linger_ms, 0.0) / 1000.0
+
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._linger_task: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+        self._batch_supported: Optional[bool] = None
+
+        self._batches = 0
+        self._items = 0
+        self._deduplicated = 0
+        self._errors = 0
+        self._fetch_latency = LatencyTracker()
+
+    async def fetch(self, tx_hash: str) -> TxData:
+        """
+        Fetch a pending transaction by hash.
+
+        Raises:
+            TransactionNotFound: If the node no longer knows the transaction.
+        """
+        if self._batch_supported is False:
+            started = time.monotonic()
+            try:
+                return await self._web3.eth.get_transaction(tx_hash)
+            finally:
+                self._fetch_latency.record_since(started)
+
+        return await asyncio.shield(self._request(tx_hash))
+
+    async def fetch_many(self, tx_hashes: Sequence[str]) -> List[Any]:
+        """
+        Fetch several hashes at once, sent without waiting out the linger.
+
+        Returns each transaction or the exception its fetch raised, in
+        ``tx_hashes`` order; more than ``max_batch_size`` hashes are split
+        over several batch requests.
+        """
+        if self._batch_supported is False:
+            return await asyncio.gather(
+                *(self.fetch(tx_hash) for tx_hash in tx_hashes),
+                return_exceptions=True,
+            )
+        futures = [self._request(tx_hash) for tx_hash in tx_hashes]
+        self._flush()
+        return await asyncio.gather(
+            *(asyncio.shield(future) for future in futures), return_exceptions=True
+        )
+
+    def _request(self, tx_hash: str) -> asyncio.Future:
+        """Add a hash to the pending batch; returns the future it resolves."""
+        future = self._pending.get(tx_hash)
+        if future is not None:
+            self._deduplicated += 1
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[tx_hash] = future
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._linger_task is None:
+            self._linger_task = asyncio.create_task(self._flush_after_linger())
+        return future
+
+    async def _flush_after_linger(self) -> None:
+        try:
+            await asyncio.sleep(self._linger)
+        except asyncio.CancelledError:
+            return
+        self._linger_task = None
+        self._flush()
+
+    def _flush(self) -> None:
+        """Detach the pending batch and resolve it in the background."""
+        if self._linger_task is not None:
+            self._linger_task.cancel()
+            self._linger_task = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        task = asyncio.create_task(self._execute_batch(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _execute_batch(self, batch: Dict[str, asyncio.Future]) -> None:
+        hashes = list(batch)
+        started = time.monotonic()
+        self._batches += 1
+        self._items += len(hashes)
+        try:
+            if self._batch_supported is False:
+                await self._fetch_individually(batch)
+                return
+            try:
+                responses = await self._web3.provider.make_batch_request(
+                    [("eth_getTransactionByHash", [tx_hash]) for tx_hash in hashes]
+                )
+            except (NotImplementedError, AttributeError):
+                logger.info(
+                    "Provider does not support JSON-RPC batching; "
+                    "fetching pending transactions individually."
+                )
+                self._batch_supported = False
+                await self._fetch_individually(batch)
+                return
+
+            self._batch_supported = True
+            if not isinstance(responses, list):
+                # Batch rejected as a whole: a single error object is returned
+                raise ValueError(f"Batch request failed: {responses.get('error')}")
+            for tx_hash, response in zip(hashes, responses):
+                self._resolve(batch[tx_hash], tx_hash, response)
+        except Exception as e:
+            self._errors += 1
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._fetch_latency.record_since(started)
+
+    async def _fetch_individually(self, batch: Dict[str, asyncio.Future]) -> None:
+        results = await asyncio.gather(
+            *(self._web3.eth.get_transaction(tx_hash) for tx_hash in batch),
+            return_exceptions=True,
+        )
+        for future, result in zip(batch.values(), results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _resolve(
+        self, future: asyncio.Future, tx_hash: str, response: Dict[str, Any]
+    ) -> None:
+        if future.done():
+            return
+        if response.get("error"):
+            self._errors += 1
+            future.set_exception(ValueError(str(response["error"])))
+        elif response.get("result") is None:
+            future.set_exception(
+                TransactionNotFound(f"Transaction {tx_hash} not found")
+            )
+        else:
+            future.set_result(transaction_result_formatter(response["result"]))
+
+    async def close(self) -> None:
+        """Flush outstanding requests and wait for in-flight batches."""
+        self._flush()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batch fill ratio, fetch latency and error counters."""
+        return {
+            "batching": self._batch_supported,
+            "batches": self._batches,
+            "items": self._items,
+            "max_batch_size": self._max_batch_size,
+            "linger_ms": self._linger * 1000.0,
+            "avg_batch_size": self._items / self._batches if self._batches else 0.0,
+            "fill_ratio": (
+                self._items / (self._batches * self._max_batch_size)
+                if self._batches
+                else 0.0
+            ),
+            "deduplicated": self._deduplicated,
+            "errors": self._errors,
+            "fetch_latency": self._fetch_latency.snapshot(),
+        }
@@ -5,19 +5,43 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional, Set, Tuple
+import time
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
-import re
 
 from web3 import AsyncWeb3
 from web3.exceptions import TransactionNotFound
 from web3.types import TxData
 
 from on1builder.config.loaders import settings
+from on1builder.engines.amm_quoter import V2_FEE_BPS, get_amount_out
+from on1builder.engines.opportunity_scheduler import OpportunityScheduler
 from on1builder.engines.strategy_executor import StrategyExecutor
 from on1builder.integrations.abi_registry import ABIRegistry
+from on1builder.monitoring.decode_pool import DecodePool, DecodeResult, decode_calldata
+from on1builder.monitoring.ingest_queue import IngestQueue
+from on1builder.monitoring.load_shedder import LoadShedder
+from on1builder.monitoring.mempool_fanin import MempoolFanIn, source_label
+from on1builder.monitoring.mempool_recorder import MempoolRecorder
+from on1builder.monitoring.mempool_state import (
+    DROPPED,
+    INCLUDED,
+    REPLACED,
+    REPLACEMENT,
+    MempoolState,
+)
+from on1builder.monitoring.pool_state_cache import PoolStateCache
+from on1builder.monitoring.selector_index import (
+    get_selector_index,
+    is_v2_exact_input,
+)
+from on1builder.monitoring.tx_analysis import TxAnalysis
+from on1builder.monitoring.tx_batch_fetcher import TxBatchFetcher
+from on1builder.utils.bounded_cache import BoundedCache
+from on1builder.utils.latency_tracker import LatencyTracker
 from on1builder.utils.logging_config import get_logger
-from on1builder.utils.constants import DEX_ROUTER_IDENTIFIERS
+from on1builder.utils.constants import DEX_ROUTER_IDENTIFIERS, V2_DEX_FEE_BPS
 
 logger = get_logger(__name__)
 
@@ -25,20 +49,14 @@ logger = get_logger(__name__)
 class TxPoolScanner:
     """transaction pool scanner with sophisticated MEV opportunity detection."""
 
-    # MEV pattern detection
-    MEV_PATTERNS = {
-        "sandwich_attack": re.compile(
-            r"swapExactTokensForTokens|swapTokensForExactTokens", re.IGNORECASE
-        ),
-        "arbitrage": re.compile(r"multicall|batchSwap", re.IGNORECASE),
-        "liquidation": re.compile(r"liquidate|seize", re.IGNORECASE),
-        "flash_loan": re.compile(r"flashLoan|flashSwap", re.IGNORECASE),
-    }
-
     # Cache management constants
     MAX_TX_CACHE_SIZE = 1000
     MAX_OPPORTUNITY_CACHE_SIZE = 500
+    TX_CACHE_TTL_SECONDS = 600.0
+    OPPORTUNITY_CACHE_TTL_SECONDS = 120.0
     CACHE_CLEANUP_THRESHOLD = 0.8
+    BLOCK_POLL_INTERVAL_SECONDS = 1.0
+    MAX_BLOCK_CATCHUP = 8
     MEV_LOG_EVERY = 50
     NOT_FOUND_LOG_EVERY = 50
     SUPPORTED_SWAP_DEXES = {"uniswap_v2", "uniswap_v3", "sushiswap", "pancakeswap"}
@@ -50,8 +68,11 @@ class TxPoolScanner:
         self._strategy_executor = strategy_executor
         self._chain_id = chain_id
         self._abi_registry = ABIRegistry()
+        # 4-byte selector -> (mev_type, decoder, dex family)
+        self._selector_index = get_selector_index()
         self._is_running = False
         self._scan_task: Optional[asyncio.Task] = None
+        self._block_task: Optional[asyncio.Task] = None
 
         # Build chain-specific DEX router mapping
         self._dex_routers = self._build_dex_router_mapping()
@@ -66,16 +87,161 @@ class TxPoolScanner:
         self._mev_log_counter = 0
         self._not_found_counter = 0
 
-        # - caching with size management
-        self._tx_analysis_cache: Dict[str, Dict] = {}
-        self._opportunity_cache: Dict[str, Dict] = {}
-        self._cache_access_times: Dict[str, datetime] = {}
+        # LRU caches keyed by normalized tx hash; pending txs are short-lived
+        # so entries also expire after a TTL.
+        self._tx_analysis_cache: BoundedCache[str, TxAnalysis] = BoundedCache(
+            self.MAX_TX_CACHE_SIZE, ttl=self.TX_CACHE_TTL_SECONDS
+        )
+        self._opportunity_cache: BoundedCache[str, List[Dict[str, Any]]] = BoundedCache(
+            self.MAX_OPPORTUNITY_CACHE_SIZE,
+            ttl=self.OPPORTUNITY_CACHE_TTL_SECONDS,
+        )
+
+        # Bounded ingest: the subscription callback only enqueues, a fixed
+        # worker pool drains the queue so bursts cannot spawn unbounded tasks.
+        self._ingest_queue = IngestQueue(
+            maxsize=int(self._scanner_setting("txpool_ingest_queue_size", 10000)),
+            shed_policy=self._scanner_setting("txpool_shed_policy", "drop_oldest"),
+        )
+        self._ingest_worker_count = max(
+            1, int(self._scanner_setting("txpool_ingest_workers", 8))
+        )
+        self._ingest_workers: List[asyncio.Task] = []
+        self._decision_latency = LatencyTracker()
+        self._analysis_latency = LatencyTracker()
+
+        # Degraded mode under overload: only DEX router, monitored or
+        # high-value/high-gas transactions get the full analysis.
+        self._load_shedder: Optional[LoadShedder] = None
+        if self._scanner_setting("txpool_load_shedding", True):
+            self._load_shedder = LoadShedder(
+                enter_utilization=float(
+                    self._scanner_setting("txpool_shed_enter_utilization", 0.9)
+                ),
+                exit_utilization=float(
+                    self._scanner_setting("txpool_shed_exit_utilization", 0.6)
+                ),
+                name=f"Chain {chain_id} TxPoolScanner",
+            )
+        self._shed_min_value_wei = int(
+            float(self._scanner_setting("txpool_shed_min_value_eth", 1.0)) * 10**18
+        )
+
+        # Pending feed mode: full tx bodies when the endpoint supports them,
+        # otherwise hashes that need a get_transaction round-trip.
+        self._subscription_mode: Optional[str] = None
+        self._full_tx_support: Dict[str, bool] = {}
+        self._source_modes: Dict[str, str] = {}
+        self._full_payload_count = 0
+        self._hash_payload_count = 0
+        self._rpc_calls_avoided = 0
+
+        # Hash mode: coalesce get_transaction calls into JSON-RPC batches.
+        # Workers take up to a batch of queued payloads at a time, so the
+        # batches fill from the backlog rather than from one hash per worker.
+        fetch_batch_size = int(self._scanner_setting("txpool_fetch_batch_size", 50))
+        self._ingest_batch_size = max(1, fetch_batch_size)
+        self._tx_fetcher: Optional[TxBatchFetcher] = None
+        if fetch_batch_size > 1:
+            self._tx_fetcher = TxBatchFetcher(
+                web3,
+                max_batch_size=fetch_batch_size,
+                linger_ms=float(self._scanner_setting("txpool_fetch_linger_ms", 5.0)),
+            )
+
+        # Optional off-loop decode stage for chains where decoding saturates
+        # the event loop's core
+        decode_processes = int(self._scanner_setting("txpool_decode_processes", 0))
+        self._decode_pool: Optional[DecodePool] = None
+        if decode_processes > 0:
+            decode_batch_size = int(
+                self._scanner_setting("txpool_decode_batch_size", 64)
+            )
+            self._decode_pool = DecodePool(
+                decode_processes,
+                max_batch_size=decode_batch_size,
+                linger_ms=float(self._scanner_setting("txpool_decode_linger_ms", 2.0)),
+            )
+            # An ingest batch can fill every shard's decode batch
+            self._ingest_batch_size = max(
+                self._ingest_batch_size, decode_batch_size * decode_processes
+            )
+
+        # (sender, nonce) view of the mempool: replacements and inclusions
+        self._mempool_state = MempoolState(
+            max_entries=int(self._scanner_setting("txpool_state_max_entries", 50000)),
+            max_per_sender=int(
+                self._scanner_setting("txpool_state_max_per_sender", 16)
+            ),
+        )
+        self._last_block_number: Optional[int] = None
+        self._block_source = "polling"
+        # Called with each new block number (e.g. the chain's ReceiptTracker)
+        self._block_listeners: List[Callable[[int], None]] = []
+        # Cached reserves for exact price-impact estimates (set by the worker)
+        self._pool_cache: Optional[PoolStateCache] = None
+        # Work skipped because its target already landed (or expired)
+        self._wasted_work: Dict[str, int] = {
+            "blocks": 0,
+            "analyses_evicted": 0,
+            "opportunities_evicted": 0,
+            "analyses_skipped": 0,
+            "dropped_before_simulation": 0,
+            "dropped_before_execution": 0,
+            "opportunities_expired": 0,
+        }
+
+        # Opportunities are ranked and executed off the ingest path once the
+        # scanner is started; until then they execute inline.
+        self._scheduler = OpportunityScheduler(
+            self._execute_opportunity,
+            max_concurrency=int(
+                self._scanner_setting("txpool_max_concurrent_executions", 2)
+            ),
+            max_queued=int(
+                self._scanner_setting("txpool_opportunity_queue_size", 1000)
+            ),
+            is_stale=self._target_resolved,
+        )
+
+        # Set when several websocket endpoints feed this scanner
+        self._fanin: Optional[MempoolFanIn] = None
+
+        # Optional capture of the pending stream for offline replay
+        self._recorder: Optional[MempoolRecorder] = None
+        record_path = self._scanner_setting("txpool_record_path", None)
+        if record_path:
+            self._recorder = MempoolRecorder(
+                str(record_path).format(chain_id=chain_id), chain_id
+            )
 
         logger.debug(
             "ON1Builder TxPoolScanner initialized. Monitoring %s addresses.",
             len(self._monitored_addresses),
         )
 
+    @property
+    def mempool_state(self) -> MempoolState:
+        return self._mempool_state
+
+    def add_block_listener(self, listener: Callable[[int], None]) -> None:
+        """Share this scanner's block feed with another component."""
+        self._block_listeners.append(listener)
+
+    def set_pool_cache(self, pool_cache: Optional[PoolStateCache]) -> None:
+        """Estimate victim price impact from the chain's cached reserves."""
+        self._pool_cache = pool_cache
+
+    def _scanner_setting(self, name: str, default: Any) -> Any:
+        """Resolve a scanner setting, honouring per-chain overrides."""
+        overrides = getattr(settings, "txpool_chain_overrides", None) or {}
+        chain_overrides = overrides.get(self._chain_id) or overrides.get(
+            str(self._chain_id)
+        )
+        if chain_overrides and name in chain_overrides:
+            return chain_overrides[name]
+        return getattr(settings, name, default)
+
     def _build_dex_router_mapping(self) -> Dict[str, str]:
         """Build chain-specific DEX router address mapping."""
         dex_routers = {}
@@ -117,34 +283,26 @@ class TxPoolScanner:
         return addresses
 
     def _manage_cache_size(self) -> None:
-        """Efficiently manage cache sizes to prevent memory bloat."""
-        current_time = datetime.now()
+        """
+        Purge expired entries and trim caches under memory pressure.
 
-        # Clean tx analysis cache
-        if len(self._tx_analysis_cache) > int(
-            self.MAX_TX_CACHE_SIZE * self.CACHE_CLEANUP_THRESHOLD
-        ):
-            # Remove oldest 20% of entries
-            removal_count = len(self._tx_analysis_cache) // 5
-            oldest_keys = sorted(
-                self._cache_access_times.keys(),
-                key=lambda k: self._cache_access_times.get(k, current_time),
-            )[:removal_count]
-
-            for key in oldest_keys:
-                self._tx_analysis_cache.pop(key, None)
-                self._cache_access_times.pop(key, None)
-
-        # Clean opportunity cache
-        if len(self._opportunity_cache) > int(
-            self.MAX_OPPORTUNITY_CACHE_SIZE * self.CACHE_CLEANUP_THRESHOLD
-        ):
-            removal_count = len(self._opportunity_cache) // 5
-            oldest_opportunities = list(self._opportunity_cache.keys())[:removal_count]
-            for key in oldest_opportunities:
-                self._opportunity_cache.pop(key, None)
+        Capacity is enforced on every insert, so this is only needed to
+        release memory early (e.g. from the memory optimizer callbacks).
+        """
+        for cache in (self._tx_analysis_cache, self._opportunity_cache):
+            cache.purge_expired()
+            limit = int(cache.maxsize * self.CACHE_CLEANUP_THRESHOLD)
+            if len(cache) > limit:
+                cache.shrink_to(limit)
 
-    async def start(self):
+    async def start(self, subscribe: bool = True):
+        """
+        Start the ingest workers and the pending transaction subscription.
+
+        Args:
+            subscribe: Set to False to only run the workers, e.g. when a
+                replayer feeds transactions through :meth:`submit_pending`.
+        """
         if self._is_running:
             logger.warning("TxPoolScanner is already running.")
             return
@@ -154,43 +312,282 @@ class TxPoolScanner:
             "Scanning transaction pool for MEV opportunities on chain %s...",
             self._chain_id,
         )
-        self._scan_task = asyncio.create_task(self._subscribe_to_pending_transactions())
+        self._ingest_workers = [
+            asyncio.create_task(self._ingest_worker())
+            for _ in range(self._ingest_worker_count)
+        ]
+        await self._scheduler.start()
+        if subscribe:
+            self._scan_task = asyncio.create_task(
+                self._subscribe_to_pending_transactions()
+            )
+            self._block_task = asyncio.create_task(self._track_blocks())
 
     async def stop(self):
         if not self._is_running:
             return
 
         self._is_running = False
-        if self._scan_task:
-            self._scan_task.cancel()
-            try:
-                await self._scan_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._scan_task, self._block_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        for worker in self._ingest_workers:
+            worker.cancel()
+        if self._ingest_workers:
+            await asyncio.gather(*self._ingest_workers, return_exceptions=True)
+        self._ingest_workers = []
+        await self._scheduler.stop()
+        if self._tx_fetcher:
+            await self._tx_fetcher.close()
+        if self._decode_pool:
+            await self._decode_pool.close()
+        if self._recorder:
+            self._recorder.close()
         logger.info("TxPoolScanner stopped.")
 
+    async def _ingest_worker(self):
+        """
+        Drain the ingest queue a batch at a time.
+
+        The batch's hashes are fetched together and its calldata decoded
+        together, then every transaction is processed in arrival order. A
+        failed batch stage or transaction never costs the rest of the batch.
+        """
+        while True:
+            batch = await self._ingest_queue.get_batch(self._ingest_batch_size)
+            try:
+                fetched = await self._batch_stage(self._prefetch, batch)
+                decoded = await self._batch_stage(self._predecode, batch, fetched)
+                for payload, enqueued_at in batch:
+                    try:
+                        await self._process_payload(
+                            payload, enqueued_at, fetched, decoded
+                        )
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        logger.debug("Ingest worker failed: %s", e)
+            finally:
+                for _ in batch:
+                    self._ingest_queue.task_done()
+
+    async def _batch_stage(self, stage, *args) -> Dict[str, Any]:
+        """Run a batch-wide pre-stage; on failure each tx falls back to its own."""
+        try:
+            return await stage(*args)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug("Ingest batch %s failed: %s", stage.__name__, e)
+            return {}
+
+    async def _process_payload(
+        self,
+        payload: Any,
+        enqueued_at: float,
+        fetched: Dict[str, Any],
+        decoded: Dict[str, DecodeResult],
+    ) -> None:
+        if isinstance(payload, Mapping):
+            await self._process_pending_transaction(
+                payload,
+                enqueued_at=enqueued_at,
+                decoded=decoded.get(self._normalize_tx_hash(payload.get("hash"))),
+            )
+        else:
+            normalized_hash = self._normalize_tx_hash(payload)
+            await self._process_tx_hash(
+                payload,
+                enqueued_at=enqueued_at,
+                fetched=fetched.get(normalized_hash),
+                decoded=decoded.get(normalized_hash),
+            )
+
+    async def _prefetch(self, batch: List[Tuple[Any, float]]) -> Dict[str, Any]:
+        """
+        Fetch the hashes of an ingest batch in one go.
+
+        Returns normalized hash -> transaction (or the exception raised for
+        it); hashes that are resolved or already analysed are not fetched.
+        """
+        if not self._tx_fetcher:
+            return {}
+        hashes = []
+        for payload, _ in batch:
+            if isinstance(payload, Mapping):
+                continue
+            normalized_hash = self._normalize_tx_hash(payload)
+            if not (
+                self._target_resolved(normalized_hash)
+                or normalized_hash in self._tx_analysis_cache
+            ):
+                hashes.append(normalized_hash)
+        if not hashes:
+            return {}
+        results = await self._tx_fetcher.fetch_many(hashes)
+        return dict(zip(hashes, results))
+
+    async def _predecode(
+        self, batch: List[Tuple[Any, float]], fetched: Dict[str, Any]
+    ) -> Dict[str, DecodeResult]:
+        """
+        Decode an ingest batch through the decode pool in one hand-off.
+
+        Returns normalized hash -> decode result for the transactions the
+        batch will analyse, so every shard receives its share at once.
+        Malformed entries are left out for the per-transaction path.
+        """
+        if not self._decode_pool:
+            return {}
+        shedder = self._load_shedder
+        items: Dict[str, Tuple[bytes, bytes, int]] = {}
+        for payload, _ in batch:
+            try:
+                if isinstance(payload, Mapping):
+                    tx = payload
+                    normalized_hash = self._normalize_tx_hash(tx.get("hash"))
+                else:
+                    normalized_hash = self._normalize_tx_hash(payload)
+                    tx = fetched.get(normalized_hash)
+                    if not tx or isinstance(tx, BaseException):
+                        continue
+                if (
+                    normalized_hash in items
+                    or self._target_resolved(normalized_hash)
+                    or normalized_hash in self._tx_analysis_cache
+                    or (shedder and shedder.degraded and not self._shed_exempt(tx))
+                ):
+                    continue
+                items[normalized_hash] = (
+                    bytes.fromhex(normalized_hash.removeprefix("0x")),
+                    self._calldata_bytes(tx),
+                    tx.get("value", 0),
+                )
+            except Exception as e:
+                logger.debug("Skipping predecode of a malformed payload: %s", e)
+        if not items:
+            return {}
+        results = await self._decode_pool.decode_many(list(items.values()))
+        return dict(zip(items, results))
+
+    def submit_pending(self, payload: Any) -> bool:
+        """
+        Hand a pending transaction (full body or hash) to the ingest workers.
+
+        Returns:
+            False if the ingest queue shed the payload.
+        """
+        self._pending_tx_count += 1
+        if isinstance(payload, Mapping):
+            self._full_payload_count += 1
+        else:
+            self._hash_payload_count += 1
+        if self._load_shedder:
+            self._load_shedder.on_arrival()
+            self._load_shedder.update(self._ingest_queue.fill_ratio())
+        return self._ingest_queue.put_nowait(payload)
+
+    async def wait_idle(self) -> None:
+        """Wait until every queued transaction and opportunity has been processed."""
+        await self._ingest_queue.join()
+        await self._scheduler.join()
+
+    async def _subscribe_pending(
+        self, ws_web3: AsyncWeb3, handler, source: str = "primary"
+    ) -> str:
+        """
+        Subscribe to pending transactions, preferring full transaction bodies.
+
+        In ``auto`` mode a rejected full-body subscription is remembered per
+        source so reconnects go straight to hash mode. Endpoints that accept
+        the flag but still push hashes are handled per payload by the ingest
+        workers.
+        """
+        mode = self._scanner_setting("txpool_subscription_mode", "auto")
+        if mode != "hashes" and self._full_tx_support.get(source) is not False:
+            try:
+                subscription_id = await ws_web3.eth.subscribe(
+                    "newPendingTransactions", True, handler=handler
+                )
+                self._full_tx_support[source] = True
+                self._subscription_mode = self._source_modes[source] = "full"
+                return subscription_id
+            except Exception as e:
+                if mode == "full":
+                    raise
+                self._full_tx_support[source] = False
+                logger.info(
+                    "[Chain %s] Full pending transaction subscription not supported "
+                    "by %s (%s); falling back to hash mode.",
+                    self._chain_id,
+                    source,
+                    e,
+                )
+
+        subscription_id = await ws_web3.eth.subscribe(
+            "newPendingTransactions", handler=handler
+        )
+        self._subscription_mode = self._source_modes[source] = "hashes"
+        return subscription_id
+
+    def _pending_ws_urls(self, chain_id: int) -> List[str]:
+        """Primary websocket URL followed by any extra mempool endpoints."""
+        ws_urls = getattr(settings, "websocket_urls", {})
+        # settings may store URLs keyed by either int or string chain ids; try both
+        primary = ws_urls.get(chain_id) or ws_urls.get(str(chain_id))
+        extra_by_chain = self._scanner_setting("txpool_websocket_urls", None) or {}
+        extras = extra_by_chain.get(chain_id) or extra_by_chain.get(str(chain_id)) or []
+
+        urls: List[str] = [primary] if primary else []
+        for url in extras:
+            if url in urls:
+                continue
+            if "public" in url.lower():
+                logger.debug(
+                    "[Chain %s] Skipping public mempool endpoint %s",
+                    chain_id,
+                    source_label(url),
+                )
+                continue
+            urls.append(url)
+        return urls
+
+    def _on_pending_payload(self, source: str, payload: Any) -> None:
+        """Forward a subscription payload, dropping fan-in duplicates."""
+        if self._fanin is not None:
+            tx_hash = payload.get("hash") if isinstance(payload, Mapping) else payload
+            if not self._fanin.observe(source, self._normalize_tx_hash(tx_hash)):
+                return
+        self.submit_pending(payload)
+
     async def _subscribe_to_pending_transactions(self):
         """
-        Establishes a WebSocket subscription to new pending transactions and
+        Establishes WebSocket subscriptions to new pending transactions and
         processes them in a continuous loop with ON1Builder analysis.
+
+        With several endpoints configured, each gets its own subscription and
+        the feeds are merged through a first-seen dedup fan-in.
         """
         if not self._is_running:
             self._is_running = True
 
         chain_id = await self._web3.eth.chain_id
-        ws_urls = getattr(settings, "websocket_urls", {})
         rpc_urls = getattr(settings, "rpc_urls", {})
-        # settings may store URLs keyed by either int or string chain ids; try both
-        ws_url = ws_urls.get(chain_id) or ws_urls.get(str(chain_id))
         rpc_url = rpc_urls.get(chain_id) or rpc_urls.get(str(chain_id))
+        urls = self._pending_ws_urls(chain_id)
 
-        if not ws_url:
+        if not urls:
             logger.error(
                 f"No WebSocket URL configured for chain {chain_id}. TxPoolScanner cannot run."
             )
             self._is_running = False
             return
 
+        ws_url = urls[0]
         # Public endpoints often do not support pending tx subscriptions reliably; disable to avoid noise
         if "public" in ws_url.lower() or (rpc_url and "public" in rpc_url.lower()):
             logger.debug(
@@ -200,6 +597,30 @@ class TxPoolScanner:
             self._is_running = False
             return
 
+        if len(urls) == 1:
+            await self._run_pending_feed(ws_url, "primary")
+            return
+
+        self._fanin = MempoolFanIn(
+            max_entries=int(self._scanner_setting("txpool_fanin_dedup_size", 50000)),
+            window_s=float(self._scanner_setting("txpool_fanin_window_s", 30.0)),
+        )
+        sources: List[str] = []
+        for url in urls:
+            sources.append(source_label(url, sources))
+            self._fanin.add_source(sources[-1])
+        logger.info(
+            "[Chain %s] Merging pending transactions from %s endpoints: %s",
+            chain_id,
+            len(urls),
+            ", ".join(sources),
+        )
+        await asyncio.gather(
+            *(self._run_pending_feed(url, source) for url, source in zip(urls, sources))
+        )
+
+    async def _run_pending_feed(self, ws_url: str, source: str):
+        """Keep one websocket subscription alive, reconnecting with backoff."""
         backoff_delay = settings.connection_retry_delay
         while self._is_running:
             ws_provider = None
@@ -215,17 +636,18 @@ class TxPoolScanner:
                 await ws_provider.connect()
 
                 async def _handle_pending(context):
-                    tx_hash = context.result
-                    if tx_hash:
-                        self._pending_tx_count += 1
-                        asyncio.create_task(self._process_tx_hash(tx_hash))
+                    if context.result:
+                        self._on_pending_payload(source, context.result)
 
-                subscription_id = await ws_web3.eth.subscribe(
-                    "newPendingTransactions", handler=_handle_pending
+                subscription_id = await self._subscribe_pending(
+                    ws_web3, _handle_pending, source
                 )
                 logger.info(
-                    "Successfully subscribed to pending transactions (subscription: %s)",
+                    "Successfully subscribed to pending transactions "
+                    "(source: %s, subscription: %s, mode: %s)",
+                    source,
                     subscription_id,
+                    self._source_modes.get(source),
                 )
 
                 # Run the subscription handler loop until cancelled
@@ -237,7 +659,8 @@ class TxPoolScanner:
                 break
             except Exception as e:
                 logger.error(
-                    f"TxPoolScanner subscription error: {e}. Reconnecting in {backoff_delay}s.",
+                    f"TxPoolScanner subscription error ({source}): {e}. "
+                    f"Reconnecting in {backoff_delay}s.",
                     exc_info=True,
                 )
                 await asyncio.sleep(backoff_delay)
@@ -254,54 +677,167 @@ class TxPoolScanner:
                     except Exception:
                         pass
 
-    async def _process_tx_hash(self, tx_hash: str):
-        """transaction processing with comprehensive MEV analysis."""
-        normalized_hash = self._normalize_tx_hash(tx_hash)
+    async def _track_blocks(self):
+        """
+        Follow new heads and resolve the transactions each block includes.
+
+        Uses a ``newHeads`` subscription on the primary websocket endpoint and
+        polls the HTTP provider while no subscription is available.
+        """
+        ws_urls = self._pending_ws_urls(self._chain_id)
+        while self._is_running:
+            if ws_urls:
+                try:
+                    await self._follow_new_heads(ws_urls[0])
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.debug(
+                        "newHeads subscription failed on chain %s (%s); polling.",
+                        self._chain_id,
+                        e,
+                    )
+            try:
+                await self._sync_to_block(await self._web3.eth.block_number)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug("Block tracking failed on chain %s: %s", self._chain_id, e)
+            await asyncio.sleep(self.BLOCK_POLL_INTERVAL_SECONDS)
+
+    async def _follow_new_heads(self, ws_url: str):
+        """Process heads from a ``newHeads`` subscription until it drops."""
+        from web3.providers import WebSocketProvider
+
+        ws_provider = WebSocketProvider(ws_url)
+        ws_web3 = AsyncWeb3(ws_provider)
+        subscription_id = None
         try:
-            # Check cache first
-            if normalized_hash in self._tx_analysis_cache:
-                self._cache_access_times[normalized_hash] = datetime.now()
-                tx_analysis = self._tx_analysis_cache[normalized_hash]
-                tx = None  # Don't need full tx data if cached
-            else:
-                tx = await self._web3.eth.get_transaction(normalized_hash)
-                if not tx:
-                    return
+            await ws_provider.connect()
 
-                # Perform analysis
-                tx_analysis = self._analyze_transaction_comprehensive(tx)
+            async def _handle_head(context):
+                number = (context.result or {}).get("number")
+                if number is not None:
+                    await self._sync_to_block(
+                        int(number, 16) if isinstance(number, str) else int(number)
+                    )
 
-                # Cache with access time tracking
-                self._tx_analysis_cache[normalized_hash] = tx_analysis
-                self._cache_access_times[normalized_hash] = datetime.now()
+            subscription_id = await ws_web3.eth.subscribe(
+                "newHeads", handler=_handle_head
+            )
+            self._block_source = "newHeads"
+            await ws_web3.subscription_manager.handle_subscriptions(run_forever=True)
+        finally:
+            self._block_source = "polling"
+            if subscription_id:
+                try:
+                    await ws_web3.eth.unsubscribe(subscription_id)
+                except Exception:
+                    pass
+            try:
+                await ws_provider.disconnect()
+            except Exception:
+                pass
 
-                # Manage cache size efficiently
-                if len(self._tx_analysis_cache) > self.MAX_TX_CACHE_SIZE:
-                    self._manage_cache_size()
+    async def _sync_to_block(self, head: int):
+        """Fetch the tx hash lists of every unseen block up to ``head``."""
+        last = self._last_block_number
+        first = head if last is None else last + 1
+        for number in range(max(first, head - self.MAX_BLOCK_CATCHUP + 1), head + 1):
+            block = await self._web3.eth.get_block(number)
+            self.on_new_block(number, block.get("transactions") or [])
 
-            self._processed_tx_count += 1
+    def on_new_block(self, block_number: int, transactions: List[Any]) -> None:
+        """
+        Resolve a new block's transactions and drop work derived from them.
 
-            if self._is_relevant_for_mev(tx_analysis):
-                self._mev_log_counter += 1
-                if self._mev_log_counter % self.MEV_LOG_EVERY == 1:
-                    logger.info(
-                        "MEV-relevant transactions: %s (latest: %s)",
-                        self._mev_log_counter,
-                        normalized_hash,
-                    )
-                opportunities = await self._analyze_for_opportunities(tx_analysis)
+        Included transactions leave the mempool state and both scanner caches,
+        so nothing downstream simulates a trade against a mined target.
+        """
+        if (
+            self._last_block_number is not None
+            and block_number <= self._last_block_number
+        ):
+            return
+        self._last_block_number = block_number
+        self._mempool_state.on_block(block_number, transactions)
+        self._wasted_work["blocks"] += 1
+        for item in transactions:
+            tx_hash = self._normalize_tx_hash(
+                item.get("hash") if isinstance(item, Mapping) else item
+            )
+            if self._tx_analysis_cache.pop(tx_hash) is not None:
+                self._wasted_work["analyses_evicted"] += 1
+            if self._opportunity_cache.pop(tx_hash) is not None:
+                self._wasted_work["opportunities_evicted"] += 1
+        for listener in self._block_listeners:
+            try:
+                listener(block_number)
+            except Exception as e:
+                logger.debug("Block listener failed: %s", e)
 
-                # Pre-execution simulation stage
-                if opportunities and not settings.allow_unsimulated_trades:
-                    opportunities = (
-                        await self._strategy_executor.simulate_opportunities_batch(
-                            opportunities
-                        )
-                    )
+    def _target_resolved(self, tx_hash: Any) -> bool:
+        """True once a tx is mined, replaced or dropped and cannot be targeted."""
+        return self._mempool_state.status(tx_hash) in (INCLUDED, REPLACED, DROPPED)
 
-                for opportunity in opportunities:
-                    self._opportunity_count += 1
-                    await self._strategy_executor.execute_opportunity(opportunity)
+    def _drop_stale_opportunities(
+        self, opportunities: List[Dict[str, Any]], tx_hash: str, counter: str
+    ) -> List[Dict[str, Any]]:
+        """Filter out opportunities whose target resolved or deadline passed."""
+        if self._target_resolved(tx_hash):
+            self._wasted_work[counter] += len(opportunities)
+            return []
+        now = datetime.now()
+        fresh = []
+        for opportunity in opportunities:
+            deadline = opportunity.get("execution_deadline")
+            if isinstance(deadline, datetime) and deadline < now:
+                self._wasted_work["opportunities_expired"] += 1
+            else:
+                fresh.append(opportunity)
+        return fresh
+
+    async def _process_tx_hash(
+        self,
+        tx_hash: str,
+        enqueued_at: Optional[float] = None,
+        fetched: Any = None,
+        decoded: Optional[DecodeResult] = None,
+    ):
+        """
+        transaction processing with comprehensive MEV analysis.
+
+        Args:
+            tx_hash: Pending transaction hash.
+            enqueued_at: ``time.monotonic()`` stamp from the ingest queue, used
+                to measure tick-to-decision latency.
+            fetched: The transaction (or its fetch error) if it was already
+                fetched with the rest of its ingest batch.
+            decoded: Its calldata decode result if the batch was predecoded.
+        """
+        normalized_hash = self._normalize_tx_hash(tx_hash)
+        if self._target_resolved(normalized_hash):
+            self._wasted_work["analyses_skipped"] += 1
+            return
+        try:
+            # Check cache first
+            tx_analysis = self._tx_analysis_cache.get(normalized_hash)
+            if tx_analysis is None:
+                if isinstance(fetched, BaseException):
+                    raise fetched
+                if fetched is not None:
+                    tx = fetched
+                elif self._tx_fetcher:
+                    tx = await self._tx_fetcher.fetch(normalized_hash)
+                else:
+                    tx = await self._web3.eth.get_transaction(normalized_hash)
+                if not tx or self._should_shed(tx):
+                    return
+                tx_analysis = await self._analyze_and_cache(
+                    normalized_hash, tx, enqueued_at, decoded
+                )
+
+            await self._handle_analysis(tx_analysis, normalized_hash, enqueued_at)
 
         except TransactionNotFound:
             self._not_found_counter += 1
@@ -314,6 +850,141 @@ class TxPoolScanner:
         except Exception as e:
             logger.debug("Could not process transaction %s: %s", tx_hash, e)
 
+    async def _process_pending_transaction(
+        self,
+        tx: TxData,
+        enqueued_at: Optional[float] = None,
+        decoded: Optional[DecodeResult] = None,
+    ):
+        """Process a full transaction body pushed by the subscription."""
+        normalized_hash = self._normalize_tx_hash(tx.get("hash"))
+        if self._target_resolved(normalized_hash):
+            self._wasted_work["analyses_skipped"] += 1
+            return
+        try:
+            tx_analysis = self._tx_analysis_cache.get(normalized_hash)
+            if tx_analysis is None:
+                self._rpc_calls_avoided += 1
+                if self._should_shed(tx):
+                    return
+                tx_analysis = await self._analyze_and_cache(
+                    normalized_hash, tx, enqueued_at, decoded
+                )
+
+            await self._handle_analysis(tx_analysis, normalized_hash, enqueued_at)
+        except Exception as e:
+            logger.debug("Could not process transaction %s: %s", normalized_hash, e)
+
+    async def _analyze_and_cache(
+        self,
+        normalized_hash: str,
+        tx: TxData,
+        enqueued_at: Optional[float] = None,
+        decoded: Optional[DecodeResult] = None,
+    ) -> TxAnalysis:
+        """Analyze a transaction and store the result in the analysis cache."""
+        if self._recorder:
+            arrival_ts = None
+            if enqueued_at is not None:
+                arrival_ts = time.time() - (time.monotonic() - enqueued_at)
+            self._recorder.record(tx, arrival_ts)
+
+        if self._mempool_state.observe(tx) == REPLACEMENT:
+            # The replaced tx can no longer land; forget what was derived from it
+            entry = self._mempool_state.get(str(tx.get("from")), int(tx["nonce"]))
+            if entry is not None and entry.replaces:
+                self._tx_analysis_cache.pop(entry.replaces)
+                self._opportunity_cache.pop(entry.replaces)
+
+        started = time.monotonic()
+        if self._decode_pool:
+            calldata = self._calldata_bytes(tx)
+            if decoded is None:
+                decoded = await self._decode_pool.decode(
+                    bytes.fromhex(normalized_hash.removeprefix("0x")),
+                    calldata,
+                    tx.get("value", 0),
+                )
+            tx_analysis = self._analyze_transaction_comprehensive(tx, decoded, calldata)
+        else:
+            tx_analysis = self._analyze_transaction_comprehensive(tx)
+        elapsed = time.monotonic() - started
+        self._analysis_latency.record(elapsed * 1000.0)
+        if self._load_shedder:
+            self._load_shedder.on_processed(elapsed)
+        self._tx_analysis_cache.put(normalized_hash, tx_analysis)
+        return tx_analysis
+
+    def _should_shed(self, tx: TxData) -> bool:
+        """Cheap degraded-mode filter; True if the tx is discarded unanalysed."""
+        shedder = self._load_shedder
+        if shedder is None or not shedder.degraded:
+            return False
+        if self._shed_exempt(tx):
+            shedder.record_admitted()
+            return False
+        shedder.record_shed()
+        return True
+
+    def _shed_exempt(self, tx: TxData) -> bool:
+        """True for DEX router, monitored, high-gas or high-value transactions."""
+        to = str(tx.get("to") or "").lower()
+        gas_price = tx.get("maxFeePerGas") or tx.get("gasPrice") or 0
+        return (
+            to in self._dex_routers
+            or to in self._monitored_addresses
+            or int(gas_price) >= self._get_high_gas_threshold()
+            or int(tx.get("value") or 0) >= self._shed_min_value_wei
+        )
+
+    async def _handle_analysis(
+        self,
+        tx_analysis: TxAnalysis,
+        normalized_hash: str,
+        enqueued_at: Optional[float],
+    ):
+        """Decide on an analyzed transaction and dispatch any opportunities."""
+        self._processed_tx_count += 1
+
+        if not self._is_relevant_for_mev(tx_analysis):
+            self._decision_latency.record_since(enqueued_at)
+            return
+
+        self._mev_log_counter += 1
+        if self._mev_log_counter % self.MEV_LOG_EVERY == 1:
+            logger.info(
+                "MEV-relevant transactions: %s (latest: %s)",
+                self._mev_log_counter,
+                normalized_hash,
+            )
+        opportunities = await self._analyze_for_opportunities(tx_analysis)
+        opportunities = self._drop_stale_opportunities(
+            opportunities, normalized_hash, "dropped_before_simulation"
+        )
+
+        # Pre-execution simulation stage
+        if opportunities and not settings.allow_unsimulated_trades:
+            opportunities = await self._strategy_executor.simulate_opportunities_batch(
+                opportunities
+            )
+            # A block may have landed the target while we were simulating
+            opportunities = self._drop_stale_opportunities(
+                opportunities, normalized_hash, "dropped_before_execution"
+            )
+
+        self._decision_latency.record_since(enqueued_at)
+        if opportunities:
+            self._opportunity_cache.put(normalized_hash, opportunities)
+        for opportunity in opportunities:
+            self._opportunity_count += 1
+            if self._scheduler.is_running:
+                self._scheduler.submit(opportunity, normalized_hash)
+            else:
+                await self._execute_opportunity(opportunity)
+
+    async def _execute_opportunity(self, opportunity: Dict[str, Any]) -> Any:
+        return await self._strategy_executor.execute_opportunity(opportunity)
+
     @staticmethod
     def _normalize_tx_hash(tx_hash: Any) -> str:
         """Normalize tx hashes to 0x-prefixed hex strings for cache/logging."""
@@ -326,70 +997,65 @@ class TxPoolScanner:
             return tx_hash if tx_hash.startswith("0x") else f"0x{tx_hash}"
         return str(tx_hash)
 
-    def _analyze_transaction_comprehensive(self, tx: TxData) -> Dict[str, Any]:
-        """Performs comprehensive analysis of a transaction for MEV opportunities."""
+    @staticmethod
+    def _calldata_bytes(tx: TxData) -> bytes:
+        """Raw calldata from either a bytes or a hex string ``input`` field."""
         raw_input = tx.get("input", "")
         if isinstance(raw_input, (bytes, bytearray)):
-            input_hex = raw_input.hex()
-        elif isinstance(raw_input, str):
-            input_hex = raw_input
-        else:
-            input_hex = str(raw_input)
-        if input_hex and not input_hex.startswith("0x"):
-            input_hex = f"0x{input_hex}"
-
-        analysis = {
-            "tx_hash": tx["hash"].hex(),
-            "hash": tx["hash"].hex(),
-            "from": tx["from"],
-            "to": tx.get("to"),
-            "value_eth": float(self._web3.from_wei(tx.get("value", 0), "ether")),
-            "value_wei": tx.get("value", 0),
-            "gas_price": tx.get("gasPrice", 0),
-            "gasPrice": tx.get("gasPrice", 0),
-            "gas_limit": tx.get("gas", 0),
-            "timestamp": datetime.now(),
-            "input_data": input_hex,
-            "mev_type": None,
-            "target_dex": None,
-            "estimated_profit_potential": 0.0,
-            "risk_score": 0.0,
-            "swap_path": None,
-            "amount_in": None,
-            "amount_out_min": None,
-            "pool_fee": None,
-            "fees": None,
-        }
+            return bytes(raw_input)
+        input_hex = raw_input if isinstance(raw_input, str) else str(raw_input)
+        try:
+            return bytes.fromhex(input_hex.removeprefix("0x"))
+        except ValueError:
+            return b""
+
+    def _analyze_transaction_comprehensive(
+        self,
+        tx: TxData,
+        decoded: Optional[DecodeResult] = None,
+        calldata: Optional[bytes] = None,
+    ) -> TxAnalysis:
+        """
+        Performs comprehensive analysis of a transaction for MEV opportunities.
+
+        Args:
+            tx: Pending transaction body.
+            decoded: ``(mev_type, swap_intent)`` already produced by the decode
+                pool; decoded in-process when omitted.
+            calldata: Raw calldata if the caller already extracted it.
+        """
+        if calldata is None:
+            calldata = self._calldata_bytes(tx)
+        analysis = TxAnalysis.from_tx(tx, calldata)
 
         # Analyze target address efficiently
-        to_address = tx.get("to", "").lower() if tx.get("to") else ""
+        to_address = analysis.to.lower() if analysis.to else ""
         if to_address in self._dex_routers:
-            analysis["target_dex"] = self._dex_routers[to_address]
+            analysis.target_dex = self._dex_routers[to_address]
 
-        # Detect MEV patterns in input data
-        input_data = analysis["input_data"]
-        for mev_type, pattern in self.MEV_PATTERNS.items():
-            if pattern.search(input_data):
-                analysis["mev_type"] = mev_type
-                break
+        # Classify by function selector (single dict lookup on raw bytes) and
+        # decode the swap intent once; later stages read it from the analysis.
+        if decoded is None:
+            decoded = decode_calldata(
+                calldata, analysis.value_wei, self._selector_index
+            )
+        analysis.mev_type, swap_intent = decoded
+        if swap_intent:
+            analysis.swap_intent = swap_intent
+            # Wrapper routers (Universal Router, SwapRouter02) route through
+            # the pool family of their first swap leg.
+            target_dex = analysis.target_dex
+            if (
+                target_dex
+                and target_dex not in self.SUPPORTED_SWAP_DEXES
+                and swap_intent.get("dex") in self.SUPPORTED_SWAP_DEXES
+            ):
+                analysis.target_dex = swap_intent["dex"]
 
         # Calculate priority and profit potential
-        analysis["priority_score"] = self._calculate_priority_score(analysis)
-        analysis["estimated_profit_potential"] = self._estimate_profit_potential(
-            analysis
-        )
-        analysis["risk_score"] = self._calculate_risk_score(analysis)
-        swap_params = self._extract_swap_params(analysis)
-        if swap_params:
-            analysis.update(
-                {
-                    "swap_path": swap_params.get("path"),
-                    "amount_in": swap_params.get("amount_in"),
-                    "amount_out_min": swap_params.get("amount_out_min"),
-                    "pool_fee": swap_params.get("pool_fee"),
-                    "fees": swap_params.get("fees"),
-                }
-            )
+        analysis.priority_score = self._calculate_priority_score(analysis)
+        analysis.estimated_profit_potential = self._estimate_profit_potential(analysis)
+        analysis.risk_score = self._calculate_risk_score(analysis)
 
         return analysis
 
@@ -419,127 +1085,6 @@ class TxPoolScanner:
 
         return False
 
-    def _extract_swap_params(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract swap parameters from common Uniswap V2-style calls."""
-        input_data = analysis.get("input_data", "")
-        if not input_data or len(input_data) < 10:
-            return {}
-
-        func_selector = input_data[:10]
-        data_hex = input_data[10:]
-        if not data_hex:
-            return {}
-
-        swap_selectors = {
-            "0x38ed1739": (
-                "exact_in",
-                ["uint256", "uint256", "address[]", "address", "uint256"],
-            ),
-            "0x8803dbee": (
-                "exact_out",
-                ["uint256", "uint256", "address[]", "address", "uint256"],
-            ),
-            "0x7ff36ab5": (
-                "eth_exact_in",
-                ["uint256", "address[]", "address", "uint256"],
-            ),
-            "0x18cbafe5": (
-                "exact_in",
-                ["uint256", "uint256", "address[]", "address", "uint256"],
-            ),
-            "0x414bf389": (
-                "v3_exact_input_single",
-                ["(address,address,uint24,address,uint256,uint256,uint256,uint160)"],
-            ),
-            "0xc04b8d59": (
-                "v3_exact_input",
-                ["(bytes,address,uint256,uint256,uint256)"],
-            ),
-        }
-
-        if func_selector not in swap_selectors:
-            return {}
-
-        try:
-            import eth_abi
-        except Exception:
-            return {}
-
-        try:
-            kind, types = swap_selectors[func_selector]
-            decoded = eth_abi.decode(types, bytes.fromhex(data_hex))
-            if kind == "v3_exact_input_single":
-                params = decoded[0]
-                token_in = params[0]
-                token_out = params[1]
-                fee = int(params[2])
-                amount_in = int(params[5])
-                amount_out_min = int(params[6])
-                return {
-                    "path": [token_in, token_out],
-                    "amount_in": amount_in,
-                    "amount_out_min": amount_out_min,
-                    "pool_fee": fee,
-                }
-            if kind == "v3_exact_input":
-                params = decoded[0]
-                path_bytes = params[0]
-                amount_in = int(params[3])
-                amount_out_min = int(params[4])
-                tokens, fees = self._decode_uniswap_v3_path(path_bytes)
-                if not tokens or not fees:
-                    return {}
-                return {
-                    "path": tokens,
-                    "fees": fees,
-                    "amount_in": amount_in,
-                    "amount_out_min": amount_out_min,
-                }
-            if kind == "eth_exact_in":
-                amount_out_min = int(decoded[0])
-                path = list(decoded[1])
-                amount_in = int(analysis.get("value_wei", 0))
-            elif kind == "exact_out":
-                amount_out_min = int(decoded[0])
-                amount_in = int(decoded[1])
-                path = list(decoded[2])
-            else:
-                amount_in = int(decoded[0])
-                amount_out_min = int(decoded[1])
-                path = list(decoded[2])
-            return {
-                "path": path,
-                "amount_in": amount_in,
-                "amount_out_min": amount_out_min,
-            }
-        except Exception:
-            return {}
-
-    @staticmethod
-    def _decode_uniswap_v3_path(path_bytes: bytes) -> Tuple[List[str], List[int]]:
-        """Decode Uniswap V3 path bytes into token addresses and fee tiers."""
-        if not path_bytes or len(path_bytes) < 43:
-            return [], []
-
-        tokens: List[str] = []
-        fees: List[int] = []
-        offset = 0
-        tokens.append("0x" + path_bytes[offset : offset + 20].hex())
-        offset += 20
-
-        while offset < len(path_bytes):
-            if offset + 3 > len(path_bytes):
-                return [], []
-            fee = int.from_bytes(path_bytes[offset : offset + 3], "big")
-            fees.append(fee)
-            offset += 3
-            if offset + 20 > len(path_bytes):
-                return [], []
-            tokens.append("0x" + path_bytes[offset : offset + 20].hex())
-            offset += 20
-
-        return tokens, fees
-
     async def _analyze_for_opportunities(
         self, analysis: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
@@ -678,64 +1223,22 @@ class TxPoolScanner:
         if not analysis["target_dex"] or analysis["value_eth"] < 1.0:
             return None
 
-        # Advanced arbitrage detection by decoding swap parameters
-        try:
-            # Decode transaction input data to get swap parameters
-            tx_input = analysis.get("input_data", "0x")
-            if len(tx_input) < 10:  # Must have function selector + data
-                return None
-
-            # Common DEX function selectors
-            swap_selectors = {
-                "0x38ed1739": "swapExactTokensForTokens",  # Uniswap V2
-                "0x8803dbee": "swapTokensForExactTokens",  # Uniswap V2
-                "0x7ff36ab5": "swapExactETHForTokens",  # Uniswap V2
-                "0x18cbafe5": "swapExactTokensForETH",  # Uniswap V2
-                "0x414bf389": "exactInputSingle",  # Uniswap V3
-                "0xc04b8d59": "exactInput",  # Uniswap V3
-            }
-
-            func_selector = tx_input[:10]
-            if func_selector not in swap_selectors:
-                estimated_price_impact = (
-                    analysis["value_eth"] * 0.002
-                )  # Fallback estimate
-            else:
-                # Parse swap parameters for better analysis
-                try:
-                    import eth_abi
-
-                    # Decode based on function type
-                    if func_selector == "0x38ed1739":  # swapExactTokensForTokens
-                        # (uint amountIn, uint amountOutMin, address[] path, address to, uint deadline)
-                        decoded = eth_abi.decode(
-                            ["uint256", "uint256", "address[]", "address", "uint256"],
-                            bytes.fromhex(tx_input[10:]),
-                        )
-                        amount_in = decoded[0]
-                        amount_out_min = decoded[1]
-                        token_path = decoded[2]
-
-                        # Calculate price impact based on amounts
-                        if amount_in > 0:
-                            # Estimate price impact using liquidity-based model
-                            impact_factor = min(
-                                amount_in / 10**18 / 100, 0.05
-                            )  # Max 5% impact
-                            estimated_price_impact = impact_factor
-                        else:
-                            estimated_price_impact = 0.001
-                    else:
-                        # For other functions, use heuristic
-                        estimated_price_impact = analysis["value_eth"] * 0.001
-
-                except Exception as decode_error:
-                    logger.debug(f"Failed to decode swap parameters: {decode_error}")
-                    estimated_price_impact = analysis["value_eth"] * 0.002
+        # Must have function selector + data
+        if len(analysis.get("input_data") or "0x") < 10:
+            return None
 
-        except Exception as e:
-            logger.warning(f"Error in arbitrage detection: {e}")
+        # Reuse the swap intent decoded during analysis
+        swap_intent = analysis.get("swap_intent")
+        cached_impact = self._cached_price_impact(analysis)
+        if cached_impact is not None:
+            estimated_price_impact = cached_impact
+        elif not swap_intent:
             estimated_price_impact = analysis["value_eth"] * 0.002  # Fallback estimate
+        elif swap_intent.get("amount_in", 0) > 0:
+            # Estimate price impact using liquidity-based model, max 5% impact
+            estimated_price_impact = min(swap_intent["amount_in"] / 10**18 / 100, 0.05)
+        else:
+            estimated_price_impact = 0.001
 
         if estimated_price_impact < 0.01:
             return None
@@ -750,6 +1253,38 @@ class TxPoolScanner:
             "requires_flash_loan": analysis["value_eth"] > 10.0,
         }
 
+    def _cached_price_impact(self, analysis: Dict[str, Any]) -> Optional[float]:
+        """
+        Exact mid-price move a V2 swap leaves on its first pair.
+
+        Computed from cached reserves; None (and the pair is queued for
+        caching) until they are available.
+        """
+        pool_cache = self._pool_cache
+        swap_intent = analysis.get("swap_intent")
+        router = analysis.get("to")
+        if pool_cache is None or not swap_intent or not router:
+            return None
+        if not is_v2_exact_input(swap_intent):
+            return None  # V3 pools and exact-output amounts don't fit this model
+        path = swap_intent.get("path") or []
+        amount_in = swap_intent.get("amount_in", 0)
+        if len(path) < 2 or amount_in <= 0:
+            return None
+        hops = pool_cache.v2_hops(router, path[:2])
+        if hops is None:
+            pool_cache.track_v2_path(router, path[:2])
+            return None
+        reserve_in, reserve_out = hops[0]
+        fee_bps = V2_DEX_FEE_BPS.get(analysis["target_dex"] or "", V2_FEE_BPS)
+        try:
+            amount_out = get_amount_out(amount_in, reserve_in, reserve_out, fee_bps)
+        except ValueError:
+            return None
+        return 1 - ((reserve_out - amount_out) * reserve_in) / (
+            (reserve_in + amount_in) * reserve_out
+        )
+
     async def _analyze_liquidation_opportunity(
         self, analysis: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -840,7 +1375,7 @@ class TxPoolScanner:
         """Returns the count of processed pending transactions."""
         return self._pending_tx_count
 
-    def get_cache_stats(self) -> Dict[str, int]:
+    def get_cache_stats(self) -> Dict[str, Any]:
         """Returns cache statistics for monitoring."""
         return {
             "tx_analysis_cache_size": len(self._tx_analysis_cache),
@@ -849,9 +1384,14 @@ class TxPoolScanner:
             "dex_addresses": len(self._dex_routers),
             "processed_transactions": self._processed_tx_count,
             "detected_opportunities": self._opportunity_count,
-            "cache_access_entries": len(self._cache_access_times),
+            "tx_analysis_cache": self._tx_analysis_cache.get_stats(),
+            "opportunity_cache": self._opportunity_cache.get_stats(),
         }
 
+    def get_load_shedding_stats(self) -> Optional[Dict[str, Any]]:
+        """Degraded-mode state and shed counts, or None when disabled."""
+        return self._load_shedder.get_stats() if self._load_shedder else None
+
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get comprehensive performance metrics."""
         total_pending = max(self._pending_tx_count, 1)
@@ -862,11 +1402,35 @@ class TxPoolScanner:
             "detected_opportunities": self._opportunity_count,
             "processing_rate": self._processed_tx_count / total_pending,
             "opportunity_detection_rate": self._opportunity_count / total_pending,
-            "cache_hit_efficiency": len(self._cache_access_times)
-            / max(len(self._tx_analysis_cache), 1),
+            "cache_hit_efficiency": self._tx_analysis_cache.get_stats()["hit_rate"],
             "memory_usage": {
                 "tx_cache_size": len(self._tx_analysis_cache),
                 "opportunity_cache_size": len(self._opportunity_cache),
                 "monitored_addresses": len(self._monitored_addresses),
             },
+            "ingest": {
+                **self._ingest_queue.get_stats(),
+                "workers": self._ingest_worker_count,
+            },
+            "decision_latency": self._decision_latency.snapshot(),
+            "analysis_latency": self._analysis_latency.snapshot(),
+            "subscription": {
+                "mode": self._subscription_mode,
+                "full_payloads": self._full_payload_count,
+                "hash_payloads": self._hash_payload_count,
+                "rpc_calls_avoided": self._rpc_calls_avoided,
+                "sources": dict(self._source_modes),
+            },
+            "fanin": self._fanin.get_stats() if self._fanin else None,
+            "decode_pool": self._decode_pool.get_stats() if self._decode_pool else None,
+            "fetcher": self._tx_fetcher.get_stats() if self._tx_fetcher else None,
+            "recorder": self._recorder.get_stats() if self._recorder else None,
+            "mempool_state": self._mempool_state.get_stats(),
+            "blocks": {
+                "source": self._block_source,
+                "last_block": self._last_block_number,
+            },
+            "wasted_work_avoided": dict(self._wasted_work),
+            "scheduler": self._scheduler.get_stats(),
+            "load_shedding": self.get_load_shedding_stats(),
         }
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Iterator, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class BoundedCache(Generic[K, V]):
+    """
+    Size-bounded LRU cache with optional per-entry TTL.
+
+    Backed by an ``OrderedDict`` kept in recency order, so ``get``, ``put`` and
+    eviction are all O(1). Entries expire ``ttl`` seconds after they were
+    stored; expired entries are dropped lazily on access or in bulk via
+    :meth:`purge_expired`.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        if maxsize <= 0:
+            raise ValueError("BoundedCache maxsize must be > 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("BoundedCache ttl must be > 0 when set")
+        self._data: "OrderedDict[K, Tuple[V, float]]" = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self._ttl is not None and now - stored_at >= self._ttl
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """Return the cached value and mark it most recently used."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self._misses += 1
+            return default
+        value, stored_at = entry
+        if self._expired(stored_at, time.monotonic()):
+            del self._data[key]
+            self._expirations += 1
+            self._misses += 1
+            return default
+        self._data.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        if key in self._data:
+            self._data.move_to_end(key)
+        self._data[key] = (value, time.monotonic())
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+    def pop(self, key: K, default: Any = None) -> Any:
+        """Remove an entry without counting it as an eviction."""
+        entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[0]
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry; returns how many were removed."""
+        if self._ttl is None:
+            return 0
+        now = time.monotonic()
+        expired = [
+            key
+            for key, (_, stored_at) in self._data.items()
+            if self._expired(stored_at, now)
+        ]
+        for key in expired:
+            del self._data[key]
+        self._expirations += len(expired)
+        return len(expired)
+
+    def shrink_to(self, size: int) -> int:
+        """Evict least recently used entries until at most ``size`` remain."""
+        removed = 0
+        while len(self._data) > max(size, 0):
+            self._data.popitem(last=False)
+            removed += 1
+        self._evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._data.get(key, _MISSING)  # type: ignore[arg-type]
+        return entry is not _MISSING and not self._expired(entry[1], time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._data))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size, capacity and hit/miss/eviction counters."""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._data),
+            "maxsize": self._maxsize,
+            "ttl": self._ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
@@ -151,8 +151,13 @@ DEX_ROUTER_IDENTIFIERS = {
     "sushiswap": "0xd9e1ce17f2641f24ae83637ab66a2cca9c378b9f",
     "1inch": "0x1111111254fb6c44bac0bed2854e76f90643097d",
     "pancakeswap": "0x10ed43c718714eb63d5aa57b78b54704e256024e",
+    "uniswap_universal": "0x3fc91a3afd70395cd496c647d5a6cc9d4b2b7fad",
+    "uniswap_swaprouter02": "0x68b3465833fb72a70ecdf485e0e4c7bd8665fc45",
 }
 
+# V2-style pairs whose swap fee differs from Uniswap's 30 bps
+V2_DEX_FEE_BPS = {"pancakeswap": 25}
+
 # Flash loan providers
 FLASHLOAN_PROVIDERS = {
     "aave_v3": "aave_flashloan",
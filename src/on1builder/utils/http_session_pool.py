@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+from typing import Any, Dict
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from on1builder.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class HttpSessionPool:
+    """
+    Long-lived aiohttp sessions, one per endpoint origin.
+
+    Every ``scheme://host:port`` gets its own session and connector, so
+    keep-alive connections, the per-host connection limit and the resolved
+    DNS entries are reused across calls instead of paying TCP (and TLS)
+    setup on every request. Sessions are created lazily on first use and
+    all closed by ``close``.
+    """
+
+    def __init__(
+        self,
+        limit_per_host: int = 16,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        timeout: float = 15.0,
+    ):
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._created = 0
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    def session(self, url: str) -> aiohttp.ClientSession:
+        """The pooled session for ``url``'s origin (created on first use)."""
+        origin = self._origin(url)
+        session = self._sessions.get(origin)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                use_dns_cache=self._dns_cache_ttl > 0,
+                ttl_dns_cache=self._dns_cache_ttl or None,
+            )
+            session = aiohttp.ClientSession(connector=connector, timeout=self._timeout)
+            self._sessions[origin] = session
+            self._created += 1
+            logger.debug(f"Opened pooled HTTP session for {origin}")
+        return session
+
+    async def close(self) -> None:
+        """Close every session and its pooled connections."""
+        sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"open_sessions": len(self._sessions), "sessions_created": self._created}
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# MIT License
+# Copyright (c) 2026 John Hauger Mitander
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional
+
+
+def percentile(samples: Iterable[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (0.0 when empty)."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+class LatencyTracker:
+    """
+    Rolling window of latency samples in milliseconds.
+
+    Samples are kept in a bounded deque so recording is O(1); percentiles are
+    only computed when a snapshot is requested (metrics/heartbeat paths).
+    """
+
+    def __init__(self, window: int = 4096):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        """Record a single latency sample."""
+        self._samples.append(latency_ms)
+        self._count += 1
+        self._total_ms += latency_ms
+        if latency_ms > self._max_ms:
+            self._max_ms = latency_ms
+
+    def record_since(self, started_at: Optional[float]) -> None:
+        """Record the time elapsed since a ``time.monotonic()`` timestamp."""
+        if started_at is None:
+            return
+        self.record((time.monotonic() - started_at) * 1000.0)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return count, mean and p50/p90/p99/max over the rolling window."""
+        window = list(self._samples)
+        return {
+            "count": self._count,
+            "mean_ms": self._total_ms / self._count if self._count else 0.0,
+            "p50_ms": percentile(window, 50),
+            "p90_ms": percentile(window, 90),
+            "p99_ms": percentile(window, 99),
+            "max_ms": self._max_ms,
+        }
@@ -0,0 +1,246 @@
+"""Tests for the off-chain V2/V3 quoting math."""
+
+import random
+from decimal import Decimal, localcontext
+from math import isqrt
+
+import pytest
+
+from on1builder.engines.amm_quoter import (
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    Q96,
+    V3PoolState,
+    amounts_out_many,
+    compute_swap_step,
+    get_amount_in,
+    get_amount_out,
+    get_amounts_out,
+    get_sqrt_ratio_at_tick,
+    get_tick_at_sqrt_ratio,
+    quote_exact_input,
+    quote_exact_input_many,
+    quote_exact_input_single,
+    swap,
+)
+
+RNG_SEED = 1234
+
+
+def encode_price_sqrt(reserve1, reserve0):
+    """The v3-core test helper: floor(sqrt(reserve1 / reserve0) * 2**96)."""
+    return isqrt((reserve1 << 192) // reserve0)
+
+
+# -- Uniswap V2 -------------------------------------------------------------
+
+
+def _k_check_passes(amount_in, amount_out, reserve_in, reserve_out):
+    """UniswapV2Pair.swap's invariant check for the trade."""
+    balance_in = reserve_in + amount_in
+    balance_out = reserve_out - amount_out
+    adjusted_in = balance_in * 1000 - amount_in * 3
+    adjusted_out = balance_out * 1000
+    return adjusted_in * adjusted_out >= reserve_in * reserve_out * 1000**2
+
+
+def test_v2_reference_value():
+    # 1 ETH into a 100 ETH / 200k USDC pool
+    assert get_amount_out(10**18, 100 * 10**18, 200_000 * 10**6) == 1974316068
+    assert get_amounts_out(10**18, [(100 * 10**18, 200_000 * 10**6)]) == [
+        10**18,
+        1974316068,
+    ]
+
+
+def test_v2_output_is_the_largest_amount_the_pair_accepts():
+    rng = random.Random(RNG_SEED)
+    for _ in range(500):
+        reserve_in = rng.randrange(10**3, 10**30)
+        reserve_out = rng.randrange(10**3, 10**30)
+        amount_in = rng.randrange(1, reserve_in * 2)
+        out = get_amount_out(amount_in, reserve_in, reserve_out)
+        assert _k_check_passes(amount_in, out, reserve_in, reserve_out)
+        if out + 1 < reserve_out:
+            assert not _k_check_passes(amount_in, out + 1, reserve_in, reserve_out)
+
+
+def test_v2_amount_in_round_trips():
+    rng = random.Random(RNG_SEED)
+    for _ in range(200):
+        reserve_in = rng.randrange(10**6, 10**27)
+        reserve_out = rng.randrange(10**6, 10**27)
+        amount_out = rng.randrange(1, reserve_out // 2)
+        amount_in = get_amount_in(amount_out, reserve_in, reserve_out)
+        assert get_amount_out(amount_in, reserve_in, reserve_out) >= amount_out
+        assert _k_check_passes(amount_in, amount_out, reserve_in, reserve_out)
+
+
+def test_v2_batch_matches_scalar_path():
+    hops = [(5 * 10**21, 9 * 10**24), (3 * 10**12, 4 * 10**21)]
+    sizes = [0, 1, 10**15, 10**18, 7 * 10**19]
+    expected = [0] + [get_amounts_out(a, hops)[-1] for a in sizes[1:]]
+    assert amounts_out_many(sizes, hops) == expected
+
+
+def test_v2_rejects_empty_pool():
+    with pytest.raises(ValueError, match="INSUFFICIENT_LIQUIDITY"):
+        get_amount_out(1, 0, 10)
+
+
+# -- TickMath ---------------------------------------------------------------
+
+
+def test_tick_math_reference_values():
+    assert get_sqrt_ratio_at_tick(MIN_TICK) == MIN_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(MAX_TICK) == MAX_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(0) == Q96
+    assert get_tick_at_sqrt_ratio(MIN_SQRT_RATIO) == MIN_TICK
+    assert get_tick_at_sqrt_ratio(MAX_SQRT_RATIO - 1) == MAX_TICK - 1
+    with pytest.raises(ValueError):
+        get_sqrt_ratio_at_tick(MAX_TICK + 1)
+
+
+def test_tick_math_tracks_exact_price_and_inverts():
+    rng = random.Random(RNG_SEED)
+    for tick in [rng.randrange(MIN_TICK, MAX_TICK) for _ in range(200)]:
+        ratio = get_sqrt_ratio_at_tick(tick)
+        with localcontext() as ctx:
+            ctx.prec = 80
+            exact = (Decimal("1.0001") ** tick).sqrt() * Q96
+        # Rounded up to an integer Q64.96, within 1e-18 relative otherwise
+        assert abs(Decimal(ratio) - exact) <= 1 + exact * Decimal("1e-18")
+        assert get_tick_at_sqrt_ratio(ratio) == tick
+        assert get_tick_at_sqrt_ratio(ratio + 1) == tick
+
+
+# -- SwapMath (values from the v3-core SwapMath spec) ----------------------
+
+
+def test_swap_step_exact_in_capped_at_price_target():
+    target = encode_price_sqrt(101, 100)
+    assert compute_swap_step(
+        encode_price_sqrt(1, 1), target, 2 * 10**18, 10**18, 600
+    ) == (target, 9975124224178055, 9925619580021728, 5988667735148)
+
+
+def test_swap_step_exact_in_fully_spent():
+    target = encode_price_sqrt(1000, 100)
+    price, amount_in, amount_out, fee = compute_swap_step(
+        encode_price_sqrt(1, 1), target, 2 * 10**18, 10**18, 600
+    )
+    assert (amount_in, amount_out, fee) == (
+        999400000000000000,
+        666399946655997866,
+        600000000000000,
+    )
+    assert price < target
+
+
+def test_swap_step_exact_out_capped_at_price_target():
+    target = encode_price_sqrt(101, 100)
+    assert compute_swap_step(
+        encode_price_sqrt(1, 1), target, 2 * 10**18, -(10**18), 600
+    ) == (target, 9975124224178055, 9925619580021728, 5988667735148)
+
+
+def test_swap_step_amount_out_capped_at_desired_amount():
+    assert compute_swap_step(
+        417332158212080721273783715441582,
+        1452870262520218020823638996,
+        159344665391607089467575320103,
+        -1,
+        1,
+    ) == (417332158212080721273783715441581, 1, 1, 1)
+
+
+def test_swap_step_intermediate_insufficient_liquidity():
+    price = 20282409603651670423947251286016
+    target = price * 11 // 10
+    assert compute_swap_step(price, target, 1024, -4, 3000) == (target, 26215, 0, 79)
+    target = price * 9 // 10
+    assert compute_swap_step(price, target, 1024, -263000, 3000) == (
+        target,
+        1,
+        26214,
+        1,
+    )
+
+
+# -- Pool swaps -------------------------------------------------------------
+
+
+def _pool(ticks=None, liquidity=10**21, tick_spacing=60, fee=3000):
+    return V3PoolState(
+        sqrt_price_x96=Q96,
+        tick=0,
+        liquidity=liquidity,
+        fee=fee,
+        tick_spacing=tick_spacing,
+        ticks=ticks or {},
+    )
+
+
+def test_single_tick_quote_matches_one_swap_step():
+    pool = _pool(ticks={-887220: 10**21, 887220: -(10**21)})
+    amount_in = 10**18
+    step = compute_swap_step(
+        Q96, get_sqrt_ratio_at_tick(-60), pool.liquidity, amount_in, pool.fee
+    )
+    assert step[1] + step[3] == amount_in  # stays inside the first step
+    assert quote_exact_input_single(pool, True, amount_in) == step[2]
+
+
+def test_crossing_an_initialized_tick_updates_liquidity():
+    # Liquidity halves below tick -60
+    pool = _pool(ticks={-60: 5 * 10**20})
+    boundary = get_sqrt_ratio_at_tick(-60)
+    to_boundary = compute_swap_step(Q96, boundary, 10**21, 10**30, pool.fee)
+    spent = to_boundary[1] + to_boundary[3]
+    extra = 10**18
+    next_word = get_sqrt_ratio_at_tick(-256 * 60)
+    after = compute_swap_step(boundary, next_word, 5 * 10**20, extra, pool.fee)
+
+    amount0, amount1, price, tick, liquidity = swap(pool, True, spent + extra)
+
+    assert amount0 == spent + extra
+    assert -amount1 == to_boundary[2] + after[2]
+    assert liquidity == 5 * 10**20
+    assert price == after[0]
+    assert tick == get_tick_at_sqrt_ratio(price)
+
+
+def test_exact_output_round_trip_never_pays_more_than_quoted_input():
+    rng = random.Random(RNG_SEED)
+    pool = _pool(ticks={-600: 10**20, 600: -(10**20), -6000: 10**19})
+    for _ in range(50):
+        zero_for_one = rng.random() < 0.5
+        amount_in = rng.randrange(10**12, 10**20)
+        out = quote_exact_input_single(pool, zero_for_one, amount_in)
+        amount0, amount1, *_ = swap(pool, zero_for_one, -out)
+        paid = amount0 if zero_for_one else amount1
+        assert paid <= amount_in
+
+
+def test_quotes_are_monotonic_in_size_and_batch_matches_scalar():
+    pool = _pool(ticks={-1200: 10**20, 1200: -(10**20)})
+    sizes = [10**k for k in range(10, 22)]
+    quotes = quote_exact_input_many(pool, False, sizes)
+    assert quotes == sorted(quotes)
+    assert quotes == [quote_exact_input_single(pool, False, s) for s in sizes]
+
+
+def test_multi_hop_chains_single_quotes():
+    first = _pool()
+    second = _pool(fee=500, tick_spacing=10)
+    mid = quote_exact_input_single(first, True, 10**18)
+    assert quote_exact_input([(first, True), (second, False)], 10**18) == (
+        quote_exact_input_single(second, False, mid)
+    )
+
+
+def test_swap_validates_price_limit():
+    with pytest.raises(ValueError, match="SPL"):
+        swap(_pool(), True, 10**18, sqrt_price_limit_x96=2 * Q96)
@@ -0,0 +1,141 @@
+"""Tests for the bounded LRU/TTL cache and its use in the txpool scanner."""
+
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from on1builder.monitoring.txpool_scanner import TxPoolScanner
+from on1builder.utils import bounded_cache
+from on1builder.utils.bounded_cache import BoundedCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(bounded_cache, "time", fake)
+    return fake
+
+
+def test_lru_eviction_respects_recency():
+    cache = BoundedCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["size"] == 2
+
+
+def test_hit_miss_counters_and_falsy_values():
+    cache = BoundedCache(maxsize=4)
+    cache.put("zero", 0)
+    assert cache.get("zero", "default") == 0
+    assert cache.get("missing", "default") == "default"
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == pytest.approx(0.5)
+
+
+def test_ttl_expires_lazily_and_in_bulk(clock):
+    cache = BoundedCache(maxsize=10, ttl=5.0)
+    cache.put("a", 1)
+    clock.now += 3
+    cache.put("b", 2)
+    clock.now += 3
+
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    clock.now += 10
+    assert cache.purge_expired() == 1
+    assert len(cache) == 0
+    stats = cache.get_stats()
+    assert stats["expirations"] == 2
+    assert stats["misses"] == 1
+
+
+def test_put_refreshes_ttl_and_shrink_to_evicts_oldest(clock):
+    cache = BoundedCache(maxsize=10, ttl=5.0)
+    for key in ("a", "b", "c"):
+        cache.put(key, key)
+    clock.now += 4
+    cache.put("a", "a2")
+    clock.now += 2
+    assert cache.get("a") == "a2"
+
+    assert cache.shrink_to(1) == 2
+    assert list(cache) == ["a"]
+
+
+def test_invalid_configuration_rejected():
+    with pytest.raises(ValueError):
+        BoundedCache(maxsize=0)
+    with pytest.raises(ValueError):
+        BoundedCache(maxsize=1, ttl=0)
+
+
+class DummyWeb3:
+    def __init__(self):
+        self.eth = SimpleNamespace(get_transaction=AsyncMock(), chain_id=1)
+
+    def from_wei(self, value, unit):
+        return Decimal(value) / Decimal(10**18)
+
+
+@pytest.mark.asyncio
+async def test_scanner_reuses_cached_analysis_and_reports_counters(monkeypatch):
+    stub_settings = SimpleNamespace(
+        contracts=SimpleNamespace(), chains=[1], allow_unsimulated_trades=True
+    )
+    monkeypatch.setattr("on1builder.monitoring.txpool_scanner.settings", stub_settings)
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.ABIRegistry",
+        lambda: SimpleNamespace(get_monitored_tokens=lambda _chain_id: {}),
+    )
+    web3 = DummyWeb3()
+    web3.eth.get_transaction.return_value = {
+        "hash": bytes.fromhex("11" * 32),
+        "from": "0xdead",
+        "to": "0xbeef",
+        "value": 0,
+        "gasPrice": 1,
+        "gas": 21000,
+        "input": "0x",
+    }
+    scanner = TxPoolScanner(web3, SimpleNamespace(), chain_id=1)
+    scanner._tx_fetcher = None
+
+    await scanner._process_tx_hash("0x" + "11" * 32)
+    await scanner._process_tx_hash("0x" + "11" * 32)
+
+    assert web3.eth.get_transaction.await_count == 1
+    stats = scanner.get_cache_stats()
+    assert stats["tx_analysis_cache_size"] == 1
+    assert stats["tx_analysis_cache"]["hits"] == 1
+    assert stats["tx_analysis_cache"]["misses"] == 1
+    assert scanner.get_performance_metrics()["cache_hit_efficiency"] == 0.5
+
+    for i in range(scanner.MAX_TX_CACHE_SIZE):
+        scanner._tx_analysis_cache.put(f"0x{i:064x}", {})
+    scanner._manage_cache_size()
+    assert len(scanner._tx_analysis_cache) == int(
+        scanner.MAX_TX_CACHE_SIZE * scanner.CACHE_CLEANUP_THRESHOLD
+    )
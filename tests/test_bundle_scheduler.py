@@ -0,0 +1,132 @@
+"""Tests for multi-block bundle re-submission."""
+
+import asyncio
+
+import pytest
+from eth_utils import keccak
+from web3.exceptions import TransactionNotFound
+
+from on1builder.core.bundle_scheduler import (
+    EXPIRED,
+    INCLUDED,
+    INVALIDATED,
+    BundleScheduler,
+)
+from on1builder.monitoring.mempool_state import normalize_hash
+
+ME = "0x" + "aa" * 20
+VICTIM = "0x" + "bb" * 20
+TXS = [b"front", b"victim", b"back"]
+NONCES = [(ME, 7), (VICTIM, 41), (ME, 8)]
+
+
+class FakeEth:
+    def __init__(self):
+        self.block_number_value = 100
+        self.nonces = {ME: 7, VICTIM: 41}
+        self.receipts = {}
+
+    @property
+    def block_number(self):
+        async def _head():
+            return self.block_number_value
+
+        return _head()
+
+    async def get_transaction_count(self, sender, block):
+        return self.nonces[sender]
+
+    async def get_transaction_receipt(self, tx_hash):
+        if tx_hash not in self.receipts:
+            raise TransactionNotFound(tx_hash)
+        return self.receipts[tx_hash]
+
+
+class FakeWeb3:
+    def __init__(self):
+        self.eth = FakeEth()
+
+
+def _scheduler(window=3, fail=False):
+    web3 = FakeWeb3()
+    submitted = []
+
+    async def submit(raw_txs, block):
+        if fail:
+            raise RuntimeError("all relays rejected")
+        submitted.append((tuple(raw_txs), block))
+        return "0xbundle"
+
+    return BundleScheduler(web3, 1, submit, window=window), web3, submitted
+
+
+@pytest.mark.asyncio
+async def test_bundle_is_resubmitted_each_block_until_the_window_ends():
+    scheduler, _, submitted = _scheduler(window=3)
+    bundle = await scheduler.schedule(TXS, NONCES, first_block=101)
+
+    for head in (101, 102, 103):
+        await scheduler.process_head(head)
+
+    assert [block for _, block in submitted] == [101, 102, 103]
+    assert all(txs == tuple(TXS) for txs, _ in submitted)
+    outcome = await bundle.wait()
+    assert outcome["status"] == EXPIRED
+    assert outcome["targets"] == [101, 102, 103]
+    assert scheduler.get_stats()["live"] == 0
+
+
+@pytest.mark.asyncio
+async def test_inclusion_stops_resubmission_and_reports_distance():
+    scheduler, web3, submitted = _scheduler(window=5)
+    bundle = await scheduler.schedule(TXS, NONCES)  # next block after head 100
+    await scheduler.process_head(101)
+
+    # Lands in block 102: both our nonces and the victim's are consumed
+    web3.eth.nonces = {ME: 9, VICTIM: 42}
+    web3.eth.receipts[normalize_hash(keccak(b"front"))] = {"blockNumber": 102}
+    await scheduler.process_head(102)
+    await scheduler.process_head(103)
+
+    assert [block for _, block in submitted] == [101, 102]
+    outcome = await bundle.wait()
+    assert outcome["status"] == INCLUDED
+    assert (outcome["included_block"], outcome["inclusion_distance"]) == (102, 1)
+    stats = scheduler.get_stats()
+    assert stats[INCLUDED] == 1 and stats["inclusion_distance"]["max"] == 1
+
+
+@pytest.mark.asyncio
+async def test_victim_mined_alone_invalidates_remaining_targets():
+    scheduler, web3, submitted = _scheduler(window=5)
+    bundle = await scheduler.schedule(TXS, NONCES, first_block=101)
+
+    web3.eth.nonces[VICTIM] = 42
+    await scheduler.process_head(101)
+
+    assert (await bundle.wait())["status"] == INVALIDATED
+    assert [block for _, block in submitted] == [101]
+
+
+@pytest.mark.asyncio
+async def test_rejected_first_submission_is_not_scheduled():
+    scheduler, _, _ = _scheduler(fail=True)
+    with pytest.raises(RuntimeError):
+        await scheduler.schedule(TXS, NONCES, first_block=101)
+    assert scheduler.get_stats()["scheduled"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pushed_heads_drive_the_running_scheduler():
+    scheduler, _, submitted = _scheduler(window=2)
+    scheduler.start()
+    try:
+        bundle = await scheduler.schedule(TXS, NONCES, first_block=101)
+        scheduler.notify_head(101)
+        await asyncio.sleep(0.05)
+        scheduler.notify_head(102)
+        outcome = await asyncio.wait_for(bundle.wait(), 1)
+    finally:
+        await scheduler.stop()
+    assert outcome["status"] == EXPIRED
+    assert [block for _, block in submitted] == [101, 102]
@@ -0,0 +1,119 @@
+"""Tests for precomputed call encoders and TransactionManager contract caching."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import eth_abi
+import pytest
+from web3 import Web3
+
+from on1builder.core.call_encoders import (
+    ALLOWANCE,
+    BALANCE_OF,
+    EXACT_INPUT,
+    EXACT_INPUT_SINGLE,
+    GET_AMOUNTS_OUT,
+    SWAP_EXACT_ETH_FOR_TOKENS,
+    SWAP_EXACT_TOKENS_FOR_ETH,
+    SWAP_EXACT_TOKENS_FOR_TOKENS,
+    encode_v2_swap,
+)
+from on1builder.core.transaction_manager import TransactionManager
+
+ABI_DIR = (
+    Path(__file__).resolve().parents[1] / "src" / "on1builder" / "resources" / "abi"
+)
+ROUTER = Web3.to_checksum_address("0x7a250d5630b4cf539739df2c5dacb4c659f2488d")
+WETH = Web3.to_checksum_address("0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2")
+USDC = Web3.to_checksum_address("0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48")
+DAI = Web3.to_checksum_address("0x6b175474e89094c44da98b954eedeac495271d0f")
+ME = Web3.to_checksum_address("0x" + "ab" * 20)
+
+
+def _contract(abi_name):
+    abi = json.loads((ABI_DIR / f"{abi_name}.json").read_text())
+    return Web3().eth.contract(address=ROUTER, abi=abi)
+
+
+@pytest.mark.parametrize(
+    "encoder, args",
+    [
+        (GET_AMOUNTS_OUT, [10**18, [WETH, USDC]]),
+        (SWAP_EXACT_ETH_FOR_TOKENS, [5, [WETH, USDC], ME, 1_700_000_000]),
+        (SWAP_EXACT_TOKENS_FOR_ETH, [7, 5, [USDC, WETH], ME, 1_700_000_000]),
+        (SWAP_EXACT_TOKENS_FOR_TOKENS, [7, 5, [USDC, WETH, DAI], ME, 1]),
+    ],
+)
+def test_v2_encoders_match_router_abi(encoder, args):
+    expected = _contract("uniswap_abi").encode_abi(encoder.name, args=args)
+    assert encoder.encode_hex(*args) == expected
+
+
+def test_v3_and_erc20_encoders_match_abi():
+    v3 = _contract("uniswap_v3_abi")
+    single = (WETH, USDC, 500, ME, 1, 10**18, 9, 0)
+    multi = (b"\x01" * 43, ME, 1, 10**18, 9)
+    assert EXACT_INPUT_SINGLE.encode_hex(single) == v3.encode_abi(
+        "exactInputSingle", args=[single]
+    )
+    assert EXACT_INPUT.encode_hex(multi) == v3.encode_abi("exactInput", args=[multi])
+
+    erc20 = _contract("erc20_abi")
+    assert BALANCE_OF.encode_hex(ME) == erc20.encode_abi("balanceOf", args=[ME])
+    assert ALLOWANCE.encode_hex(ME, ROUTER) == erc20.encode_abi(
+        "allowance", args=[ME, ROUTER]
+    )
+
+
+def test_decode_output_unwraps_single_values():
+    assert BALANCE_OF.decode_output(eth_abi.encode(["uint256"], [42])) == 42
+    amounts = eth_abi.encode(["uint256[]"], [[1, 2, 3]])
+    assert list(GET_AMOUNTS_OUT.decode_output(amounts)) == [1, 2, 3]
+
+
+def test_encode_v2_swap_picks_function_and_value():
+    weth = WETH.lower()
+    data, value = encode_v2_swap([WETH, USDC], 10, 9, ME, 1, weth)
+    assert data[:4] == SWAP_EXACT_ETH_FOR_TOKENS.selector and value == 10
+    data, value = encode_v2_swap([USDC, WETH], 10, 9, ME, 1, weth)
+    assert data[:4] == SWAP_EXACT_TOKENS_FOR_ETH.selector and value == 0
+    data, value = encode_v2_swap([USDC, DAI], 10, 9, ME, 1, weth)
+    assert data[:4] == SWAP_EXACT_TOKENS_FOR_TOKENS.selector and value == 0
+
+
+@pytest.mark.asyncio
+async def test_dex_contract_is_built_once(monkeypatch):
+    monkeypatch.setattr(
+        "on1builder.core.transaction_manager.settings",
+        SimpleNamespace(contracts=SimpleNamespace(uniswap_router={"1": ROUTER})),
+    )
+    tm = TransactionManager.__new__(TransactionManager)
+    tm._chain_id = 1
+    tm._abi_registry = SimpleNamespace(get_abi=lambda _name: [{"type": "function"}])
+    tm._web3 = SimpleNamespace(eth=SimpleNamespace(contract=MagicMock()))
+    tm._contract_cache = {}
+    tm._dex_contracts = {}
+
+    first = await tm._get_dex_contract("uniswap")
+    second = await tm._get_dex_contract("uniswap")
+
+    assert first is second
+    tm._web3.eth.contract.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_token_reads_use_raw_eth_call():
+    tm = TransactionManager.__new__(TransactionManager)
+    tm._address = ME
+    tm._web3 = SimpleNamespace(
+        eth=SimpleNamespace(
+            call=AsyncMock(return_value=eth_abi.encode(["uint256"], [77]))
+        )
+    )
+    tm._multicall = None
+
+    assert await tm._get_token_allowance(USDC, ROUTER) == 77
+    tx = tm._web3.eth.call.await_args.args[0]
+    assert tx == {"to": USDC, "data": ALLOWANCE.encode_hex(ME, ROUTER)}
@@ -0,0 +1,181 @@
+"""Tests for calldata decoder plugins (Universal Router, multicall, aggregators)."""
+
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import eth_abi
+import pytest
+
+from on1builder.monitoring.calldata_decoders import CalldataDecoderPlugin
+from on1builder.monitoring.selector_index import get_selector_index
+from on1builder.monitoring.txpool_scanner import TxPoolScanner
+
+TOKEN_A = "0x" + "aa" * 20
+TOKEN_B = "0x" + "bb" * 20
+TOKEN_C = "0x" + "cc" * 20
+RECIPIENT = "0x" + "dd" * 20
+UNIVERSAL_ROUTER = "0x3fc91a3afd70395cd496c647d5a6cc9d4b2b7fad"
+
+
+def _v3_path(*hops):
+    """hops: token, fee, token, fee, token ..."""
+    encoded = b""
+    for hop in hops:
+        if isinstance(hop, int):
+            encoded += hop.to_bytes(3, "big")
+        else:
+            encoded += bytes.fromhex(hop[2:])
+    return encoded
+
+
+def _universal_router_calldata(deadline=1_700_000_000):
+    v3_exact_in = eth_abi.encode(
+        ["address", "uint256", "uint256", "bytes", "bool"],
+        [RECIPIENT, 5 * 10**18, 4 * 10**18, _v3_path(TOKEN_A, 500, TOKEN_B), True],
+    )
+    v2_exact_out = eth_abi.encode(
+        ["address", "uint256", "uint256", "address[]", "bool"],
+        [RECIPIENT, 10, 20, [TOKEN_B, TOKEN_C], True],
+    )
+    # WRAP_ETH (0x0b) is skipped, V3_SWAP_EXACT_IN (0x00), V2_SWAP_EXACT_OUT (0x09)
+    commands = bytes([0x0B, 0x00, 0x09])
+    wrap = eth_abi.encode(["address", "uint256"], [RECIPIENT, 0])
+    args = eth_abi.encode(
+        ["bytes", "bytes[]", "uint256"],
+        [commands, [wrap, v3_exact_in, v2_exact_out], deadline],
+    )
+    return bytes.fromhex("3593564c") + args
+
+
+def _decode(calldata, value_wei=0):
+    entry = get_selector_index().lookup(calldata)
+    assert entry is not None and entry.decoder is not None
+    return entry, entry.decoder(calldata[4:], value_wei)
+
+
+def test_universal_router_decodes_first_swap_and_counts_legs():
+    entry, intent = _decode(_universal_router_calldata())
+    assert entry.source == "uniswap_universal_router"
+    assert intent["path"] == [TOKEN_A, TOKEN_B]
+    assert intent["fees"] == [500]
+    assert intent["amount_in"] == 5 * 10**18
+    assert intent["amount_out_min"] == 4 * 10**18
+    assert intent["recipient"] == RECIPIENT
+    assert intent["deadline"] == 1_700_000_000
+    assert intent["dex"] == "uniswap_v3"
+    assert intent["legs"] == 2
+
+
+def test_universal_router_exact_out_reverses_v3_path():
+    payload = eth_abi.encode(
+        ["address", "uint256", "uint256", "bytes", "bool"],
+        # Exact-output paths are encoded output token first
+        [RECIPIENT, 7, 9, _v3_path(TOKEN_B, 3000, TOKEN_A), True],
+    )
+    calldata = bytes.fromhex("24856bc3") + eth_abi.encode(
+        ["bytes", "bytes[]"], [bytes([0x01]), [payload]]
+    )
+    _, intent = _decode(calldata)
+    assert intent["path"] == [TOKEN_A, TOKEN_B]
+    assert intent["amount_in"] == 9
+    assert intent["amount_out_min"] == 7
+    assert intent["deadline"] is None
+
+
+def test_swaprouter02_multicall_unpacks_inner_swap():
+    inner = bytes.fromhex("04e45aaf") + eth_abi.encode(
+        ["(address,address,uint24,address,uint256,uint256,uint160)"],
+        [(TOKEN_A, TOKEN_C, 3000, RECIPIENT, 123, 100, 0)],
+    )
+    refund = bytes.fromhex("12210e8a")  # refundETH(), not a swap
+    calldata = bytes.fromhex("5ae401dc") + eth_abi.encode(
+        ["uint256", "bytes[]"], [999, [inner, refund]]
+    )
+    entry, intent = _decode(calldata)
+    assert entry.mev_type == "arbitrage"
+    assert intent["mev_type"] == "sandwich_attack"
+    assert intent["path"] == [TOKEN_A, TOKEN_C]
+    assert intent["pool_fee"] == 3000
+    assert intent["amount_in"] == 123
+    assert intent["deadline"] == 999
+    assert intent["legs"] == 1
+
+
+def test_multicall_without_swaps_yields_no_intent():
+    approve = bytes.fromhex("095ea7b3") + eth_abi.encode(
+        ["address", "uint256"], [RECIPIENT, 1]
+    )
+    calldata = bytes.fromhex("ac9650d8") + eth_abi.encode(["bytes[]"], [[approve]])
+    _, intent = _decode(calldata)
+    assert intent is None
+
+
+def test_oneinch_swap_intent():
+    desc = (TOKEN_A, TOKEN_B, RECIPIENT, RECIPIENT, 50, 45, 0)
+    calldata = bytes.fromhex("12aa3caf") + eth_abi.encode(
+        [
+            "address",
+            "(address,address,address,address,uint256,uint256,uint256)",
+            "bytes",
+            "bytes",
+        ],
+        [RECIPIENT, desc, b"", b"\x01"],
+    )
+    entry, intent = _decode(calldata)
+    assert entry.dex_family == "1inch"
+    assert intent["path"] == [TOKEN_A, TOKEN_B]
+    assert intent["amount_in"] == 50
+    assert intent["amount_out_min"] == 45
+    assert intent["dex"] is None
+
+
+def test_plugin_without_register_cannot_be_instantiated():
+    class Incomplete(CalldataDecoderPlugin):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+class DummyWeb3:
+    def __init__(self):
+        self.eth = SimpleNamespace(get_transaction=AsyncMock(), chain_id=1)
+
+    def from_wei(self, value, unit):
+        return Decimal(value) / Decimal(10**18)
+
+
+@pytest.mark.asyncio
+async def test_scanner_caches_intent_and_routes_universal_router(monkeypatch):
+    stub_settings = SimpleNamespace(
+        contracts=SimpleNamespace(), chains=[1], allow_unsimulated_trades=True
+    )
+    monkeypatch.setattr("on1builder.monitoring.txpool_scanner.settings", stub_settings)
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.ABIRegistry",
+        lambda: SimpleNamespace(get_monitored_tokens=lambda _chain_id: {}),
+    )
+    scanner = TxPoolScanner(DummyWeb3(), SimpleNamespace(), chain_id=1)
+    tx = {
+        "hash": bytes.fromhex("55" * 32),
+        "from": "0xdead",
+        "to": UNIVERSAL_ROUTER,
+        "value": 0,
+        "gasPrice": 10**9,
+        "gas": 300_000,
+        "input": _universal_router_calldata(),
+    }
+
+    analysis = scanner._analyze_transaction_comprehensive(tx)
+
+    assert analysis["target_dex"] == "uniswap_v3"
+    assert analysis["mev_type"] == "sandwich_attack"
+    assert analysis["swap_intent"]["legs"] == 2
+    assert analysis["swap_path"] == [TOKEN_A, TOKEN_B]
+    assert analysis["fees"] == [500]
+
+    # The arbitrage stage reads the cached intent instead of decoding again
+    analysis.value_wei = 5 * 10**18
+    opportunity = await scanner._analyze_arbitrage_opportunity(analysis)
+    assert opportunity["estimated_profit_eth"] == pytest.approx(0.05 * 0.8)
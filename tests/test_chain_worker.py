@@ -22,6 +22,7 @@ async def test_status_running_reports_components(monkeypatch):
     worker.is_running = True
     worker._performance_stats = {"uptime_seconds": 5}
     worker.tx_scanner = type("TS", (), {"get_pending_tx_count": lambda self: 2})()
+    worker.receipt_tracker = worker.pool_cache = None
 
     async def bm_summary():
         return {"balance": 1.0, "balance_tier": "medium"}
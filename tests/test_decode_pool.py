@@ -0,0 +1,238 @@
+"""Tests for the process-pool sharded calldata decode stage."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import eth_abi
+import pytest
+
+from on1builder.monitoring.decode_pool import DecodePool, decode_batch, decode_calldata
+from on1builder.monitoring.txpool_scanner import TxPoolScanner
+
+TOKEN_A = "0x" + "aa" * 20
+TOKEN_B = "0x" + "bb" * 20
+V2_ROUTER = "0x7a250d5630b4cf539739df2c5dacb4c659f2488d"
+
+
+def _v2_swap(amount_in=5 * 10**18):
+    return bytes.fromhex("38ed1739") + eth_abi.encode(
+        ["uint256", "uint256", "address[]", "address", "uint256"],
+        [amount_in, 1, [TOKEN_A, TOKEN_B], TOKEN_A, 2**32],
+    )
+
+
+def test_decode_calldata_classifies_and_decodes():
+    mev_type, intent = decode_calldata(_v2_swap(), 0)
+    assert mev_type == "sandwich_attack"
+    assert intent["path"] == [TOKEN_A, TOKEN_B]
+    assert intent["amount_in"] == 5 * 10**18
+
+    assert decode_calldata(b"\xde\xad\xbe\xef", 0) == (None, None)
+    assert decode_calldata(b"", 0) == (None, None)
+
+
+def test_shard_assignment_is_stable_by_hash():
+    pool = DecodePool(3)
+    try:
+        tx_hash = bytes.fromhex("00" * 28 + "00000005")
+        assert pool.shard_for(tx_hash) == 5 % 3
+        assert pool.shard_for(tx_hash) == pool.shard_for(bytes(tx_hash))
+    finally:
+        for executor in pool._shards:
+            executor.shutdown(wait=False)
+
+
+@pytest.mark.asyncio
+async def test_pool_batches_per_shard():
+    pool = DecodePool(2, max_batch_size=4, linger_ms=1.0)
+    for executor in pool._shards:
+        executor.shutdown(wait=False)
+    # Threads stand in for worker processes; batching and sharding are the same
+    pool._shards = [ThreadPoolExecutor(max_workers=1) for _ in range(2)]
+
+    hashes = [i.to_bytes(32, "big") for i in range(10)]
+    results = await asyncio.gather(
+        *(pool.decode(h, _v2_swap(i + 1), 0) for i, h in enumerate(hashes))
+    )
+    await pool.close()
+
+    assert [intent["amount_in"] for _, intent in results] == list(range(1, 11))
+    stats = pool.get_stats()
+    assert stats["items"] == 10
+    assert stats["shard_items"] == [5, 5]
+    assert stats["batches"] == 4  # 4+1 per shard
+    assert stats["fallbacks"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_shard_falls_back_in_process():
+    pool = DecodePool(1, linger_ms=0.0)
+    pool._shards[0].shutdown(wait=False)
+
+    mev_type, intent = await pool.decode(b"\x01" * 32, _v2_swap(), 0)
+    await pool.close()
+
+    assert mev_type == "sandwich_attack"
+    assert intent["amount_in"] == 5 * 10**18
+    assert pool.get_stats()["fallbacks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_processes_return_compact_results():
+    pool = DecodePool(2, linger_ms=0.0)
+    try:
+        calldata = _v2_swap()
+        result = await pool.decode(b"\x02" * 32, calldata, 0)
+    finally:
+        await pool.close()
+    assert result == decode_batch([(calldata, 0)])[0]
+
+
+class DummyABIRegistry:
+    def get_monitored_tokens(self, _chain_id):
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_scanner_routes_decoding_through_pool(monkeypatch):
+    stub_settings = SimpleNamespace(
+        contracts=SimpleNamespace(),
+        chains=[1],
+        allow_unsimulated_trades=True,
+        txpool_decode_processes=1,
+    )
+    monkeypatch.setattr("on1builder.monitoring.txpool_scanner.settings", stub_settings)
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
+    )
+    scanner = TxPoolScanner(SimpleNamespace(), SimpleNamespace(), chain_id=1)
+    assert isinstance(scanner._decode_pool, DecodePool)
+    for executor in scanner._decode_pool._shards:
+        executor.shutdown(wait=False)
+
+    calls = []
+
+    class RecordingPool:
+        async def decode(self, tx_hash, calldata, value_wei):
+            calls.append(tx_hash)
+            return decode_calldata(calldata, value_wei)
+
+    scanner._decode_pool = RecordingPool()
+    tx = {
+        "hash": bytes.fromhex("11" * 32),
+        "from": "0xdead",
+        "to": V2_ROUTER,
+        "value": 0,
+        "gasPrice": 1,
+        "gas": 21000,
+        "input": _v2_swap(),
+    }
+    analysis = await scanner._analyze_and_cache("0x" + "11" * 32, tx)
+
+    assert calls == [bytes.fromhex("11" * 32)]
+    assert analysis.mev_type == "sandwich_attack"
+    assert analysis["swap_path"] == [TOKEN_A, TOKEN_B]
+    assert analysis["target_dex"] == "uniswap_v2"
+
+
+def _threaded_pool(processes, **kwargs):
+    pool = DecodePool(processes, **kwargs)
+    for executor in pool._shards:
+        executor.shutdown(wait=False)
+    pool._shards = [ThreadPoolExecutor(max_workers=1) for _ in range(processes)]
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_decode_many_sends_each_shard_its_share_without_lingering():
+    pool = _threaded_pool(2, max_batch_size=64, linger_ms=10_000)
+    items = [(i.to_bytes(32, "big"), _v2_swap(i + 1), 0) for i in range(10)]
+    items.append((b"\x00" * 32, b"", 0))
+
+    results = await asyncio.wait_for(pool.decode_many(items), timeout=1)
+    await pool.close()
+
+    assert [intent["amount_in"] for _, intent in results[:10]] == list(range(1, 11))
+    assert results[10] == (None, None)
+    assert pool.get_stats()["batches"] == 2
+
+
+def _pooled_scanner(monkeypatch, linger_ms=10_000):
+    """Scanner with a two-shard decode pool running on threads."""
+    stub_settings = SimpleNamespace(
+        contracts=SimpleNamespace(),
+        chains=[1],
+        allow_unsimulated_trades=True,
+        txpool_decode_processes=2,
+        txpool_decode_batch_size=64,
+        txpool_load_shedding=False,
+    )
+    monkeypatch.setattr("on1builder.monitoring.txpool_scanner.settings", stub_settings)
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
+    )
+    scanner = TxPoolScanner(SimpleNamespace(), SimpleNamespace(), chain_id=1)
+    for executor in scanner._decode_pool._shards:
+        executor.shutdown(wait=False)
+    scanner._decode_pool = _threaded_pool(2, max_batch_size=64, linger_ms=linger_ms)
+    return scanner
+
+
+def _body(n):
+    return {
+        "hash": n.to_bytes(32, "big"),
+        "from": "0x" + f"{n:040x}",
+        "nonce": 0,
+        "to": "0x" + "cc" * 20,
+        "value": 0,
+        "gasPrice": 1,
+        "gas": 21000,
+        "input": "0x" + bytes.fromhex("deadbeef").hex(),
+    }
+
+
+@pytest.mark.asyncio
+async def test_scanner_decodes_ingest_batches_in_full_shard_batches(monkeypatch):
+    scanner = _pooled_scanner(monkeypatch)
+    pool = scanner._decode_pool
+    sizes = []
+    run_batch = pool._run_batch
+
+    async def _recording_run_batch(shard, batch):
+        sizes.append(len(batch))
+        await run_batch(shard, batch)
+
+    pool._run_batch = _recording_run_batch
+    await scanner.start(subscribe=False)
+
+    for n in range(1024):
+        scanner.submit_pending(_body(n))
+    await asyncio.wait_for(scanner.wait_idle(), timeout=10)
+    await scanner.stop()
+
+    assert scanner._processed_tx_count == 1024
+    # Each worker's 128-tx ingest batch fills one batch on both shards
+    assert sizes == [64] * 16
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pool_fails", [False, True])
+async def test_malformed_payload_does_not_cost_the_rest_of_its_batch(
+    monkeypatch, pool_fails
+):
+    # Per-transaction decodes must not wait out a long linger
+    scanner = _pooled_scanner(monkeypatch, linger_ms=1)
+    if pool_fails:
+        scanner._decode_pool.decode_many = AsyncMock(side_effect=RuntimeError("ipc"))
+    await scanner.start(subscribe=False)
+
+    bodies = [_body(n) for n in range(20)]
+    del bodies[7]["hash"]
+    for body in bodies:
+        scanner.submit_pending(body)
+    await asyncio.wait_for(scanner.wait_idle(), timeout=10)
+    await scanner.stop()
+
+    assert scanner._processed_tx_count == 19
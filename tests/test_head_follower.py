@@ -0,0 +1,78 @@
+"""Tests for the shared pushed-or-polled head loop."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from on1builder.core.head_follower import HeadFollower
+
+
+class CountingEth:
+    def __init__(self, head):
+        self.head = head
+        self.polls = 0
+
+    @property
+    def block_number(self):
+        async def _head():
+            self.polls += 1
+            return self.head
+
+        return _head()
+
+
+class Recorder(HeadFollower):
+    POLL_INTERVAL_SECONDS = 0.01
+
+    def __init__(self, web3):
+        super().__init__(web3)
+        self.work = True
+        self.heads = []
+        self.seen = asyncio.Event()
+
+    def _has_work(self):
+        return self.work
+
+    async def _on_head(self):
+        self.heads.append(self._head)
+        self.seen.set()
+
+
+def test_follower_without_head_handler_cannot_be_built():
+    class Incomplete(HeadFollower):
+        def _has_work(self):
+            return True
+
+    with pytest.raises(TypeError):
+        Incomplete(SimpleNamespace())
+
+
+@pytest.mark.asyncio
+async def test_polls_for_heads_while_nobody_pushes():
+    eth = CountingEth(100)
+    follower = Recorder(SimpleNamespace(eth=eth))
+    follower.start()
+    try:
+        await asyncio.wait_for(follower.seen.wait(), 1)
+    finally:
+        await follower.stop()
+    assert follower.heads[0] == 100 and eth.polls >= 1
+
+
+@pytest.mark.asyncio
+async def test_pushed_heads_skip_polling_and_idle_followers_do_nothing():
+    eth = CountingEth(100)
+    follower = Recorder(SimpleNamespace(eth=eth))
+    follower.POLL_INTERVAL_SECONDS = 5.0
+    follower.start()
+    try:
+        follower.notify_head(7)
+        await asyncio.wait_for(follower.seen.wait(), 1)
+        follower.work = False
+        follower.notify_head(8)
+        await asyncio.sleep(0.01)
+    finally:
+        await follower.stop()
+    assert follower.heads == [7] and eth.polls == 0
+    assert not follower.running
@@ -0,0 +1,112 @@
+"""Tests for pooled keep-alive HTTP sessions against a local server."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from on1builder.core.relay_broadcaster import RelayBroadcaster
+from on1builder.core.transaction_manager import TransactionManager
+from on1builder.utils.custom_exceptions import StrategyExecutionError
+from on1builder.utils.http_session_pool import HttpSessionPool
+
+
+@pytest_asyncio.fixture
+async def rpc_server():
+    """JSON-RPC endpoint that records the client port of every request."""
+    peers = []
+    bodies = []
+
+    async def handle(request):
+        peers.append(request.transport.get_extra_info("peername")[1])
+        bodies.append(json.loads(await request.read()))
+        if request.match_info["name"] == "revert":
+            return web.json_response({"error": {"message": "execution reverted"}})
+        return web.json_response({"result": "0x"})
+
+    app = web.Application()
+    app.router.add_post("/{name}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield SimpleNamespace(
+        url=lambda name="ok": f"http://127.0.0.1:{port}/{name}",
+        peers=peers,
+        bodies=bodies,
+    )
+    await runner.cleanup()
+
+
+async def _post(session, url):
+    async with session.post(url, json={"method": "eth_call"}) as resp:
+        return await resp.json()
+
+
+@pytest.mark.asyncio
+async def test_calls_to_one_host_reuse_a_connection(rpc_server):
+    pool = HttpSessionPool()
+    try:
+        session = pool.session(rpc_server.url("a"))
+        assert pool.session(rpc_server.url("b")) is session
+        for name in ("a", "b", "a"):
+            await _post(pool.session(rpc_server.url(name)), rpc_server.url(name))
+        assert len(set(rpc_server.peers)) == 1
+        assert pool.get_stats() == {"open_sessions": 1, "sessions_created": 1}
+    finally:
+        await pool.close()
+    assert session.closed
+    assert pool.get_stats()["open_sessions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_each_origin_gets_its_own_session():
+    pool = HttpSessionPool()
+    try:
+        a = pool.session("https://relay-a.example/rpc?key=1")
+        b = pool.session("https://relay-b.example/")
+        assert a is not b
+        assert pool.session("https://RELAY-A.example/other") is a
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_uses_shared_pool_and_leaves_it_open(rpc_server):
+    pool = HttpSessionPool()
+    relays = RelayBroadcaster([rpc_server.url("a"), rpc_server.url("b")], sessions=pool)
+    try:
+        await relays.broadcast(_post)
+        await relays.close()
+        assert not pool.session(rpc_server.url()).closed
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_anvil_simulation_reuses_pool_until_close(rpc_server, monkeypatch):
+    from on1builder.core import transaction_manager as tm_module
+
+    monkeypatch.setattr(tm_module.settings, "simulation_backend", "anvil")
+    tm = TransactionManager.__new__(TransactionManager)
+    tm._private_rpc_url = rpc_server.url()
+    tm._http = HttpSessionPool()
+    tm._private_relays = tm._bundle_relays = None
+    tm._bundle_scheduler = None
+    tx = {"to": "0x" + "11" * 20, "data": "0x", "nonce": 5}
+
+    await tm._simulate_transaction(tx)
+    await tm._simulate_transaction(tx)
+    assert len(rpc_server.bodies) == 2 and len(set(rpc_server.peers)) == 1
+    assert "nonce" not in rpc_server.bodies[0]["params"][0]
+
+    tm._private_rpc_url = rpc_server.url("revert")
+    with pytest.raises(StrategyExecutionError, match="execution reverted"):
+        await tm._simulate_transaction(tx)
+
+    session = tm._http.session(rpc_server.url())
+    await tm.close()
+    assert session.closed
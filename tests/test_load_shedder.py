@@ -0,0 +1,86 @@
+"""Tests for adaptive load shedding in the scanner."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from on1builder.monitoring.load_shedder import LoadShedder
+from on1builder.monitoring.txpool_scanner import TxPoolScanner
+
+ROUTER = "0x" + "12" * 20
+
+
+def _drive(shedder, start, count, interval_s, cost_s, fill=0.0):
+    now = start
+    for _ in range(count):
+        now += interval_s
+        shedder.on_arrival(now)
+        shedder.on_processed(cost_s)
+        shedder.update(fill, now)
+    return now
+
+
+def test_enters_and_leaves_degraded_mode_with_hysteresis():
+    shedder = LoadShedder(min_dwell_s=1.0)
+    # 1ms per tx against 1000 tx/s would saturate analysis
+    now = _drive(shedder, 0.0, 100, interval_s=0.0008, cost_s=0.001)
+    assert shedder.degraded
+    assert shedder.utilization(now) > 0.9
+
+    # Load drops, but the dwell time holds the mode briefly
+    now = _drive(shedder, now, 100, interval_s=0.002, cost_s=0.0005)
+    assert shedder.degraded
+    _drive(shedder, now, 300, interval_s=0.005, cost_s=0.0005)
+    assert not shedder.degraded
+
+    stats = shedder.get_stats()
+    assert stats["transitions"] == 2
+    assert stats["degraded_seconds"] > 1.0
+
+
+def test_queue_backlog_forces_degraded_mode_before_warmup():
+    shedder = LoadShedder()
+    shedder.on_arrival(0.0)
+    assert shedder.update(queue_fill=0.6, now=0.0)
+    assert shedder.utilization(0.0) == 0.0
+
+
+def test_quiet_feed_lowers_utilization():
+    shedder = LoadShedder()
+    now = _drive(shedder, 0.0, 100, interval_s=0.001, cost_s=0.001)
+    assert shedder.utilization(now) == pytest.approx(1.0)
+    assert shedder.utilization(now + 1.0) < 0.01
+
+
+def test_rejects_inverted_thresholds():
+    with pytest.raises(ValueError):
+        LoadShedder(enter_utilization=0.5, exit_utilization=0.6)
+
+
+class DummyABIRegistry:
+    def get_monitored_tokens(self, _chain_id):
+        return {}
+
+
+def test_degraded_scanner_only_analyses_valuable_transactions(monkeypatch):
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.settings",
+        SimpleNamespace(contracts=SimpleNamespace(), chains=[1]),
+    )
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
+    )
+    scanner = TxPoolScanner(SimpleNamespace(eth=SimpleNamespace()), None, 1)
+    scanner._dex_routers = {ROUTER: "uniswap_v2"}
+    transfer = {"to": "0x" + "34" * 20, "value": 10**17, "gasPrice": 10**9}
+
+    assert scanner._should_shed(transfer) is False
+    scanner._load_shedder.update(queue_fill=0.9)
+
+    assert scanner._should_shed(transfer) is True
+    assert scanner._should_shed({**transfer, "to": ROUTER.upper()}) is False
+    assert scanner._should_shed({**transfer, "value": 2 * 10**18}) is False
+    assert scanner._should_shed({**transfer, "maxFeePerGas": 100 * 10**9}) is False
+    stats = scanner.get_performance_metrics()["load_shedding"]
+    assert stats["mode"] == "degraded"
+    assert stats["shed"] == 1
@@ -311,8 +311,10 @@ async def test_txpool_scanner_identifies_mev_relevance_and_opportunities(monkeyp
     analysis = scanner._analyze_transaction_comprehensive(tx)
     assert analysis["target_dex"] == "uniswap_v2"
     assert scanner._is_relevant_for_mev(analysis) is True
-    # Priority should include value, gas, and dex bonuses
-    assert analysis["priority_score"] == pytest.approx(0.65, rel=0.05)
+    # swapExactTokensForTokens is classified by selector as a sandwich target
+    assert analysis["mev_type"] == "sandwich_attack"
+    # Priority should include value, gas, MEV type and dex bonuses
+    assert analysis["priority_score"] == pytest.approx(0.95, rel=0.05)
 
     opportunities = await scanner._analyze_for_opportunities(analysis)
     # With a sizable trade into a DEX, we should surface at least front/back run opportunities
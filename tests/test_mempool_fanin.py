@@ -0,0 +1,152 @@
+"""Tests for multi-endpoint mempool fan-in and first-seen dedup."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from on1builder.monitoring.mempool_fanin import MempoolFanIn, source_label
+from on1builder.monitoring.txpool_scanner import TxPoolScanner
+
+
+class DummyABIRegistry:
+    def get_monitored_tokens(self, _chain_id):
+        return {}
+
+
+class DummyWeb3:
+    def __init__(self):
+        async def _chain_id():
+            return 1
+
+        self.eth = SimpleNamespace(chain_id=None)
+        self._chain_id = _chain_id
+
+
+def _patch_scanner(monkeypatch, **overrides):
+    stub_settings = SimpleNamespace(
+        contracts=SimpleNamespace(),
+        chains=[1],
+        allow_unsimulated_trades=True,
+        connection_retry_delay=0.1,
+        websocket_urls={1: "wss://primary.example/ws/secret-key"},
+        rpc_urls={1: "https://primary.example/rpc"},
+        **overrides,
+    )
+    monkeypatch.setattr("on1builder.monitoring.txpool_scanner.settings", stub_settings)
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
+    )
+    return stub_settings
+
+
+def test_source_label_hides_path_and_disambiguates_hosts():
+    assert source_label("wss://node.example/v3/APIKEY") == "node.example"
+    assert source_label("wss://node.example/other", ["node.example"]) == (
+        "node.example#2"
+    )
+
+
+def test_first_seen_wins_and_lead_lag_are_recorded():
+    fanin = MempoolFanIn()
+    fanin.add_source("slow")
+
+    assert fanin.observe("fast", "0x1", now=10.0) is True
+    assert fanin.observe("slow", "0x1", now=10.05) is False
+    # Repeats from a source that already reported the hash add no samples
+    assert fanin.observe("slow", "0x1", now=10.2) is False
+    assert fanin.observe("slow", "0x2", now=11.0) is True
+
+    stats = fanin.get_stats()
+    assert stats["forwarded"] == 2
+    assert stats["duplicates"] == 2
+    fast, slow = stats["sources"]["fast"], stats["sources"]["slow"]
+    assert fast["first"] == 1 and fast["seen"] == 1
+    assert slow["first"] == 1 and slow["seen"] == 3
+    assert fast["first_ratio"] == pytest.approx(0.5)
+    assert fast["lead"]["count"] == 1
+    assert fast["lead"]["max_ms"] == pytest.approx(50.0)
+    assert slow["lag"]["p50_ms"] == pytest.approx(50.0)
+    assert slow["lead"]["count"] == 0
+
+
+def test_dedup_memory_is_bounded():
+    fanin = MempoolFanIn(max_entries=2)
+    for i in range(5):
+        fanin.observe("a", f"0x{i}", now=float(i))
+    assert fanin.get_stats()["tracked_hashes"] == 2
+    # The oldest hash was evicted, so a late copy is forwarded again
+    assert fanin.observe("b", "0x0", now=6.0) is True
+
+
+def test_scanner_merges_extra_endpoints_and_skips_public(monkeypatch):
+    _patch_scanner(
+        monkeypatch,
+        txpool_websocket_urls={
+            "1": [
+                "wss://primary.example/ws/secret-key",
+                "wss://mempool-b.example/ws",
+                "wss://public-node.example/ws",
+            ]
+        },
+    )
+    scanner = TxPoolScanner(DummyWeb3(), SimpleNamespace(), chain_id=1)
+    assert scanner._pending_ws_urls(1) == [
+        "wss://primary.example/ws/secret-key",
+        "wss://mempool-b.example/ws",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_scanner_fans_in_feeds_and_drops_duplicates(monkeypatch):
+    _patch_scanner(
+        monkeypatch, txpool_websocket_urls={1: ["wss://mempool-b.example/ws"]}
+    )
+    scanner = TxPoolScanner(DummyWeb3(), SimpleNamespace(), chain_id=1)
+
+    async def chain_id():
+        return 1
+
+    scanner._web3.eth = SimpleNamespace(chain_id=chain_id())
+    started = []
+
+    async def fake_feed(url, source):
+        started.append(source)
+        if source == "primary.example":
+            scanner._on_pending_payload(source, {"hash": bytes.fromhex("aa" * 32)})
+        else:
+            await asyncio.sleep(0.01)
+            scanner._on_pending_payload(source, "0x" + "aa" * 32)
+
+    scanner._run_pending_feed = fake_feed
+    scanner._is_running = True
+    await scanner._subscribe_to_pending_transactions()
+
+    assert started == ["primary.example", "mempool-b.example"]
+    assert scanner._ingest_queue.qsize() == 1
+    stats = scanner.get_performance_metrics()["fanin"]
+    assert stats["forwarded"] == 1
+    assert stats["sources"]["primary.example"]["first"] == 1
+    assert stats["sources"]["mempool-b.example"]["lag"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_single_endpoint_skips_fanin(monkeypatch):
+    _patch_scanner(monkeypatch)
+    scanner = TxPoolScanner(DummyWeb3(), SimpleNamespace(), chain_id=1)
+
+    async def chain_id():
+        return 1
+
+    scanner._web3.eth = SimpleNamespace(chain_id=chain_id())
+    feeds = []
+
+    async def fake_feed(url, source):
+        feeds.append((url, source))
+
+    scanner._run_pending_feed = fake_feed
+    scanner._is_running = True
+    await scanner._subscribe_to_pending_transactions()
+
+    assert feeds == [("wss://primary.example/ws/secret-key", "primary")]
+    assert scanner._fanin is None
@@ -0,0 +1,173 @@
+"""Tests for mempool recording and offline replay through TxPoolScanner."""
+
+from types import SimpleNamespace
+
+import eth_abi
+import pytest
+
+from on1builder.monitoring.mempool_recorder import (
+    MAGIC,
+    MempoolRecorder,
+    iter_records,
+    load_records,
+)
+from on1builder.monitoring.mempool_replay import MempoolReplayer
+
+V2_ROUTER = "0x7a250d5630b4cf539739df2c5dacb4c659f2488d"
+SENDER = "0x" + "ab" * 20
+
+
+class DummyABIRegistry:
+    def get_monitored_tokens(self, _chain_id):
+        return {}
+
+
+def _patch_scanner(monkeypatch, **overrides):
+    stub_settings = SimpleNamespace(
+        contracts=SimpleNamespace(),
+        chains=[1],
+        allow_unsimulated_trades=True,
+        connection_retry_delay=0.1,
+        txpool_fetch_linger_ms=0.0,
+        **overrides,
+    )
+    monkeypatch.setattr("on1builder.monitoring.txpool_scanner.settings", stub_settings)
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
+    )
+    return stub_settings
+
+
+def _swap_tx(index, value=6 * 10**18):
+    calldata = bytes.fromhex("38ed1739") + eth_abi.encode(
+        ["uint256", "uint256", "address[]", "address", "uint256"],
+        [value, 1, ["0x" + "11" * 20, "0x" + "22" * 20], SENDER, 2**32],
+    )
+    return {
+        "hash": index.to_bytes(32, "big"),
+        "from": SENDER,
+        "to": V2_ROUTER,
+        "value": value,
+        "nonce": index,
+        "gas": 250_000,
+        "gasPrice": 60 * 10**9,
+        "input": calldata,
+    }
+
+
+def _transfer_tx(index):
+    return {
+        "hash": (10_000 + index).to_bytes(32, "big"),
+        "from": SENDER,
+        "to": None,
+        "value": 0,
+        "nonce": index,
+        "gas": 21_000,
+        "maxFeePerGas": 30 * 10**9,
+        "maxPriorityFeePerGas": 10**9,
+        "input": "0x",
+    }
+
+
+def _write(path, txs, chain_id=1):
+    recorder = MempoolRecorder(path, chain_id)
+    for offset, tx in enumerate(txs):
+        assert recorder.record(tx, 1_700_000_000.0 + offset * 0.001)
+    recorder.close()
+    return recorder
+
+
+def test_record_round_trip_preserves_fields(tmp_path):
+    path = tmp_path / "stream.bin"
+    swap, transfer = _swap_tx(1), _transfer_tx(2)
+    recorder = _write(path, [swap, transfer], chain_id=8453)
+    assert recorder.get_stats()["records"] == 2
+
+    first, second = load_records(path)
+    assert first.chain_id == 8453
+    assert first.arrival_ts == pytest.approx(1_700_000_000.0)
+    assert bytes(first.tx["hash"]) == swap["hash"]
+    assert first.tx["from"].lower() == SENDER
+    assert first.tx["to"].lower() == V2_ROUTER
+    assert first.tx["value"] == swap["value"]
+    assert first.tx["gasPrice"] == swap["gasPrice"]
+    assert bytes(first.tx["input"]) == swap["input"]
+    assert "maxFeePerGas" not in first.tx
+
+    assert second.tx["to"] is None
+    assert second.tx["maxPriorityFeePerGas"] == 10**9
+    assert "gasPrice" not in second.tx
+    assert bytes(second.tx["input"]) == b""
+
+
+def test_recording_appends_and_tolerates_truncated_tail(tmp_path):
+    path = tmp_path / "stream.bin"
+    _write(path, [_swap_tx(1)])
+    _write(path, [_swap_tx(2)])
+    assert path.read_bytes().count(MAGIC) == 1
+
+    with open(path, "ab") as fh:
+        fh.write(b"\x00" * 10)
+    assert [bytes(r.tx["hash"])[-1] for r in iter_records(path)] == [1, 2]
+
+
+def test_recorder_skips_unencodable_transactions(tmp_path):
+    recorder = MempoolRecorder(tmp_path / "stream.bin", 1)
+    assert not recorder.record({"hash": b"\x01", "from": SENDER})
+    recorder.close()
+    assert recorder.get_stats()["skipped"] == 1
+
+
+def test_non_recording_is_rejected(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a recording")
+    with pytest.raises(ValueError):
+        load_records(path)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["full", "hashes"])
+async def test_replay_reports_throughput_and_opportunities(monkeypatch, tmp_path, mode):
+    _patch_scanner(monkeypatch)
+    path = tmp_path / "stream.bin"
+    _write(path, [_swap_tx(i) for i in range(5)] + [_transfer_tx(i) for i in range(5)])
+
+    report = await MempoolReplayer(load_records(path), mode=mode).run()
+
+    assert report["records"] == 10
+    assert report["processed"] == 10
+    assert report["shed"] == 0
+    assert report["tx_per_s"] > 0
+    assert report["analysis_latency"]["count"] == 10
+    assert report["opportunities_by_strategy"]["front_run"] == 5
+    assert report["opportunities"] == sum(report["opportunities_by_strategy"].values())
+
+
+@pytest.mark.asyncio
+async def test_replay_paces_at_recorded_speed(monkeypatch, tmp_path):
+    _patch_scanner(monkeypatch)
+    path = tmp_path / "stream.bin"
+    recorder = MempoolRecorder(path, 1)
+    recorder.record(_transfer_tx(1), 100.0)
+    recorder.record(_transfer_tx(2), 100.2)
+    recorder.close()
+
+    report = await MempoolReplayer(load_records(path), speed=2.0).run()
+    assert report["elapsed_s"] >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_scanner_records_stream_when_configured(monkeypatch, tmp_path):
+    _patch_scanner(
+        monkeypatch, txpool_record_path=str(tmp_path / "mempool_{chain_id}.bin")
+    )
+    source = tmp_path / "source.bin"
+    _write(source, [_swap_tx(i) for i in range(3)])
+
+    replayer = MempoolReplayer(load_records(source))
+    scanner = replayer.build_scanner()
+    await replayer.run(scanner)
+
+    recorded = load_records(tmp_path / "mempool_1.bin")
+    assert sorted(bytes(r.tx["hash"])[-1] for r in recorded) == [0, 1, 2]
+    assert scanner.get_performance_metrics()["recorder"]["records"] == 3
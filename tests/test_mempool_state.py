@@ -0,0 +1,197 @@
+"""Tests for the (sender, nonce) mempool state and victim tx tracking."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from on1builder.core.transaction_manager import TransactionManager
+from on1builder.monitoring.mempool_state import (
+    DROPPED,
+    DUPLICATE,
+    INCLUDED,
+    NEW,
+    PENDING,
+    REJECTED,
+    REPLACED,
+    REPLACEMENT,
+    UNDERPRICED,
+    UNKNOWN,
+    MempoolState,
+)
+from on1builder.monitoring.txpool_scanner import TxPoolScanner
+from on1builder.utils.custom_exceptions import TransactionError
+
+SENDER = "0x" + "aa" * 20
+
+
+def _tx(n, nonce=0, sender=SENDER, fee=10, tip=2):
+    return {
+        "hash": "0x" + f"{n:064x}",
+        "from": sender,
+        "nonce": nonce,
+        "maxFeePerGas": fee,
+        "maxPriorityFeePerGas": tip,
+    }
+
+
+def _hash(n):
+    return "0x" + f"{n:064x}"
+
+
+def test_replacement_requires_higher_fee_and_tip():
+    state = MempoolState()
+    assert state.observe(_tx(1)) == NEW
+    assert state.observe(_tx(1)) == DUPLICATE
+    assert state.observe(_tx(2, fee=20, tip=2)) == UNDERPRICED
+    assert state.observe(_tx(3, fee=20, tip=3)) == REPLACEMENT
+
+    assert state.status(_hash(1)) == REPLACED
+    assert state.replacement_of(_hash(1)) == _hash(3)
+    assert state.get(SENDER.upper().replace("0X", "0x"), 0).tx_hash == _hash(3)
+    assert state.is_pending(_hash(3))
+    assert len(state) == 1
+
+
+def test_legacy_gas_price_and_hash_formats():
+    state = MempoolState()
+    tx = {"hash": bytes.fromhex("11" * 32), "from": SENDER, "nonce": 1, "gasPrice": 5}
+    assert state.observe(tx) == NEW
+    assert state.status("11" * 32) == PENDING
+    assert state.observe({"hash": "0x" + "22" * 32, "from": SENDER}) == REJECTED
+    assert state.status("0x" + "33" * 32) == UNKNOWN
+
+
+def test_block_includes_and_supersedes_lower_nonces():
+    state = MempoolState()
+    for nonce in range(3):
+        state.observe(_tx(10 + nonce, nonce=nonce))
+    # A different tx for nonce 1 was mined: nonces 0 and 1 can no longer land
+    removed = state.on_block(100, [{"hash": _hash(99), "from": SENDER, "nonce": 1}])
+
+    assert removed == 2
+    assert state.status(_hash(99)) == INCLUDED
+    assert state.status(_hash(10)) == DROPPED
+    assert state.status(_hash(11)) == DROPPED
+    assert state.status(_hash(12)) == PENDING
+
+    state.on_block(101, [_hash(12)])
+    assert state.status(_hash(12)) == INCLUDED
+    assert len(state) == 0
+    # A late pending copy of a mined tx is not re-added
+    assert state.observe(_tx(12, nonce=2)) == DUPLICATE
+
+
+def test_bounds_per_sender_and_global():
+    state = MempoolState(max_entries=4, max_per_sender=2)
+    state.observe(_tx(1, nonce=5))
+    state.observe(_tx(2, nonce=6))
+    # Higher nonce than everything tracked for a full sender is rejected
+    assert state.observe(_tx(3, nonce=7)) == REJECTED
+    # A lower nonce evicts the highest one
+    assert state.observe(_tx(4, nonce=4)) == NEW
+    assert [e.nonce for e in state.pending_for(SENDER)] == [4, 5]
+
+    for n in range(3):
+        state.observe(_tx(20 + n, sender="0x" + f"{n:040x}"))
+    assert len(state) == 4
+    # Oldest slot went first and eviction does not claim a final status
+    assert state.status(_hash(1)) == UNKNOWN
+    assert state.get_stats()["evicted"] == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_for_resolution_wakes_on_block():
+    state = MempoolState()
+    state.observe(_tx(1))
+
+    waiter = asyncio.create_task(state.wait_for_resolution(_hash(1), timeout=5))
+    await asyncio.sleep(0)
+    state.on_block(7, [_hash(1)])
+
+    assert await waiter == INCLUDED
+    assert await state.wait_for_resolution(_hash(1), timeout=5) == INCLUDED
+    state.observe(_tx(2, nonce=1))
+    assert await state.wait_for_resolution(_hash(2), timeout=0.01) == PENDING
+    assert state.get_stats()["waiters"] == 0
+
+
+@pytest.mark.asyncio
+async def test_waiter_timing_out_does_not_strand_the_others():
+    state = MempoolState()
+    state.observe(_tx(1))
+    loop = asyncio.get_running_loop()
+
+    short = asyncio.create_task(state.wait_for_resolution(_hash(1), timeout=0.05))
+    long = asyncio.create_task(state.wait_for_resolution(_hash(1), timeout=5))
+    assert await short == PENDING
+    started = loop.time()
+    state.on_block(7, [_hash(1)])
+
+    assert await long == INCLUDED
+    assert loop.time() - started < 1
+    assert state.get_stats()["waiters"] == 0
+
+
+class DummyABIRegistry:
+    def get_monitored_tokens(self, _chain_id):
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_scanner_drops_caches_of_replaced_tx(monkeypatch):
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.settings",
+        SimpleNamespace(contracts=SimpleNamespace(), chains=[1]),
+    )
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
+    )
+    scanner = TxPoolScanner(SimpleNamespace(eth=SimpleNamespace()), None, 1)
+
+    await scanner._analyze_and_cache(_hash(1), _tx(1))
+    scanner._opportunity_cache.put(_hash(1), [{"strategy_type": "back_run"}])
+    await scanner._analyze_and_cache(_hash(2), _tx(2, fee=20, tip=4))
+
+    assert _hash(1) not in scanner._tx_analysis_cache
+    assert _hash(1) not in scanner._opportunity_cache
+    assert scanner.mempool_state.replacement_of(_hash(1)) == _hash(2)
+
+    scanner.on_new_block(5, [_hash(2)])
+    scanner.on_new_block(4, [])
+    stats = scanner.get_performance_metrics()["mempool_state"]
+    assert stats["last_block"] == 5
+    assert stats["included"] == 1
+
+
+def _manager(state=None):
+    tm = TransactionManager.__new__(TransactionManager)
+    tm._mempool_state = state
+    tm.wait_for_receipt = AsyncMock(side_effect=TransactionError("timeout"))
+    tm.execute_swap = AsyncMock(return_value={"success": True})
+    return tm
+
+
+@pytest.mark.asyncio
+async def test_back_run_skips_replaced_target_without_polling_receipts():
+    state = MempoolState()
+    state.observe(_tx(1))
+    state.observe(_tx(2, fee=20, tip=4))
+    tm = _manager(state)
+
+    result = await tm.execute_back_run({"target_tx": {"hash": "01".rjust(64, "0")}})
+
+    assert result == {"success": False, "reason": "Target transaction replaced"}
+    tm.wait_for_receipt.assert_not_awaited()
+    tm.execute_swap.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_back_run_falls_back_to_receipt_for_unknown_target():
+    tm = _manager(MempoolState())
+
+    result = await tm.execute_back_run({"target_tx": {"hash": _hash(9)}})
+
+    assert result["reason"] == "Target transaction not confirmed in time"
+    tm.wait_for_receipt.assert_awaited_once()
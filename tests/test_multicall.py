@@ -0,0 +1,161 @@
+"""Tests for Multicall3 read batching."""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+import eth_abi
+import pytest
+
+from on1builder.core.balance_manager import BalanceManager
+from on1builder.core.call_encoders import (
+    BALANCE_OF,
+    DECIMALS,
+    GET_RESERVES,
+    TOKEN0,
+)
+from on1builder.core.multicall import AGGREGATE3, MULTICALL3_ADDRESS, MulticallBatcher
+from on1builder.integrations.external_apis import ExternalAPIManager
+
+TOKEN = "0x" + "22" * 20
+PAIR = "0x" + "33" * 20
+ME = "0x" + "ab" * 20
+
+
+class FakeEth:
+    """Answers plain calls and aggregate3 from a selector -> output table."""
+
+    def __init__(self, outputs, multicall_deployed=True):
+        self.outputs = outputs
+        self.multicall_deployed = multicall_deployed
+        self.requests = []
+
+    def _answer(self, data):
+        output = self.outputs.get(data[:4])
+        if output is None:
+            raise ValueError("execution reverted")
+        return output
+
+    async def call(self, tx):
+        self.requests.append(tx)
+        await asyncio.sleep(0)
+        data = bytes.fromhex(tx["data"][2:])
+        if tx["to"] != MULTICALL3_ADDRESS:
+            return self._answer(data)
+        if not self.multicall_deployed:
+            return b""
+        (calls,) = eth_abi.decode(AGGREGATE3.arg_types, data[4:])
+        results = []
+        for _target, _allow_failure, call_data in calls:
+            try:
+                results.append((True, self._answer(call_data)))
+            except ValueError:
+                results.append((False, b""))
+        return eth_abi.encode(AGGREGATE3.output_types, [results])
+
+
+def _outputs():
+    return {
+        BALANCE_OF.selector: eth_abi.encode(["uint256"], [5 * 10**6]),
+        DECIMALS.selector: eth_abi.encode(["uint8"], [6]),
+        GET_RESERVES.selector: eth_abi.encode(
+            ["uint112", "uint112", "uint32"], [10, 20, 1]
+        ),
+    }
+
+
+def _web3(eth):
+    return SimpleNamespace(eth=eth, to_checksum_address=lambda a: a)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_aggregate3_call():
+    eth = FakeEth(_outputs())
+    batcher = MulticallBatcher(_web3(eth), window_ms=5)
+
+    balance, decimals, reserves = await asyncio.gather(
+        batcher.call(BALANCE_OF, TOKEN, ME),
+        batcher.call(DECIMALS, TOKEN),
+        batcher.call(GET_RESERVES, PAIR),
+    )
+
+    assert (balance, decimals, tuple(reserves)) == (5 * 10**6, 6, (10, 20, 1))
+    assert len(eth.requests) == 1 and eth.requests[0]["to"] == MULTICALL3_ADDRESS
+    stats = batcher.get_stats()
+    assert stats["batches"] == 1
+    assert stats["mean_batch_size"] == 3
+    assert stats["batch_latency"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reverted_sub_call_only_fails_its_caller():
+    batcher = MulticallBatcher(_web3(FakeEth(_outputs())), window_ms=5)
+
+    results = await asyncio.gather(
+        batcher.call(DECIMALS, TOKEN),
+        batcher.call(TOKEN0, PAIR),
+        return_exceptions=True,
+    )
+
+    assert results[0] == 6
+    assert isinstance(results[1], Exception)
+    assert batcher.get_stats()["failed_calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_single_call_and_disabled_batcher_use_plain_eth_call():
+    eth = FakeEth(_outputs())
+    assert await MulticallBatcher(_web3(eth)).call(DECIMALS, TOKEN) == 6
+    assert await MulticallBatcher(_web3(eth), enabled=False).call(DECIMALS, TOKEN)
+    assert [r["to"] for r in eth.requests] == [TOKEN, TOKEN]
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_individual_calls_without_multicall3():
+    eth = FakeEth(_outputs(), multicall_deployed=False)
+    batcher = MulticallBatcher(_web3(eth), window_ms=5)
+
+    results = await asyncio.gather(
+        batcher.call(DECIMALS, TOKEN), batcher.call(BALANCE_OF, TOKEN, ME)
+    )
+
+    assert results == [6, 5 * 10**6]
+    assert batcher.get_stats()["fallback_batches"] == 1
+    assert len(eth.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting_for_the_window():
+    eth = FakeEth(_outputs())
+    batcher = MulticallBatcher(_web3(eth), window_ms=10_000, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.call(DECIMALS, TOKEN), batcher.call(DECIMALS, TOKEN)),
+        timeout=1,
+    )
+
+    assert results == [6, 6]
+    assert batcher.get_stats()["max_batch_size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_balance_manager_reads_balance_and_decimals_in_one_call():
+    eth = FakeEth(_outputs())
+    manager = BalanceManager.__new__(BalanceManager)
+    manager.web3 = _web3(eth)
+    manager.wallet_address = ME
+    manager._token_balance_cache = {}
+
+    balance = await manager._get_token_balance_by_address(TOKEN)
+
+    assert balance == Decimal("5")
+    assert len(eth.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_pair_reserves_use_multicall():
+    eth = FakeEth(_outputs())
+    manager = ExternalAPIManager.__new__(ExternalAPIManager)
+
+    assert await manager._get_pair_reserves(_web3(eth), PAIR) == (10, 20)
+    assert await manager._get_pair_token(_web3(eth), PAIR, 0) is None
@@ -1,5 +1,8 @@
 """Logical tests for NonceManager ensuring reliable nonce handling."""
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 
 from on1builder.core.nonce_manager import NonceManager
@@ -66,3 +69,121 @@ async def test_singleton_refresh_resets_cached_nonce_on_reuse():
 
     assert next_nonce == 15
     assert web3_new.eth.calls == 1
+
+
+class PendingEth:
+    """Node whose pending count is set directly by the test."""
+
+    def __init__(self, pending):
+        self.pending = pending
+
+    async def get_transaction_count(self, address, state):
+        return self.pending
+
+
+@pytest.mark.asyncio
+async def test_released_nonce_is_reused_first():
+    manager = NonceManager(SimpleNamespace(eth=PendingEth(5)), "0xabc")
+
+    first, second = await manager.reserve(), await manager.reserve()
+    second.commit("0x6")
+    first.release()  # the send failed before broadcast
+
+    assert await manager.get_next_nonce() == 5
+    assert await manager.get_next_nonce() == 7
+    assert manager.get_stats()["reused"] == 1
+
+
+@pytest.mark.asyncio
+async def test_release_at_the_top_lowers_the_next_nonce():
+    manager = NonceManager(SimpleNamespace(eth=PendingEth(5)), "0xabc")
+
+    a, b = await manager.get_next_nonces(2)
+    manager.release(b)
+    manager.release(a)
+
+    assert manager.get_stats()["next_nonce"] == 5
+    assert manager.get_stats()["free_released"] == []
+
+
+@pytest.mark.asyncio
+async def test_resync_keeps_in_flight_reservations():
+    eth = PendingEth(5)
+    manager = NonceManager(SimpleNamespace(eth=eth), "0xabc")
+    mined = await manager.reserve()
+    mined.commit("0x5")
+    in_flight = await manager.reserve()
+
+    eth.pending = 6  # nonce 5 reached the node; 6 is still being signed
+    await manager.resync_nonce()
+
+    assert await manager.get_next_nonce() == 7
+    in_flight.release()
+    assert await manager.get_next_nonce() == in_flight.nonce == 6
+
+
+@pytest.mark.asyncio
+async def test_dropped_tx_is_detected_after_grace_blocks():
+    eth = PendingEth(5)
+    manager = NonceManager(SimpleNamespace(eth=eth), "0xabc")
+    manager.notify_head(100)
+    for nonce in await manager.get_next_nonces(2):
+        manager.commit(nonce, f"0x{nonce}")
+
+    await manager.reconcile(101)
+    assert manager.get_stats()["gaps_detected"] == 0  # may still be private
+
+    await manager.reconcile(103)
+    stats = manager.get_stats()
+    assert stats["gaps_detected"] == 1 and stats["free_released"] == [5]
+    assert await manager.get_next_nonce() == 5
+
+
+@pytest.mark.asyncio
+async def test_blocking_gap_is_filled_with_noop():
+    eth = PendingEth(5)
+    manager = NonceManager(SimpleNamespace(eth=eth), "0xabc")
+    filled = []
+
+    async def filler(nonce):
+        filled.append(nonce)
+        return f"0xfill{nonce}"
+
+    manager.set_gap_filler(filler)
+    manager.notify_head(100)
+    first, second = await manager.reserve(), await manager.reserve()
+    second.commit("0x6")
+    first.release()
+
+    # Released this block: left for the next reservation to reuse
+    assert await manager.reconcile(100) == []
+    assert await manager.reconcile(101) == [5]
+    assert filled == [5]
+    stats = manager.get_stats()
+    assert stats["gaps_filled"] == 1 and stats["in_flight_committed"] == 2
+    assert await manager.get_next_nonce() == 7
+
+
+@pytest.mark.asyncio
+async def test_reserve_waits_for_reconcile_in_progress():
+    eth = PendingEth(5)
+    manager = NonceManager(SimpleNamespace(eth=eth), "0xabc")
+    manager.release((await manager.get_next_nonces(2))[0])  # 5 free, 6 held
+
+    gate = asyncio.Event()
+
+    async def slow_count(address, state):
+        await gate.wait()
+        return 7  # both 5 and 6 reached the node meanwhile
+
+    eth.get_transaction_count = slow_count
+    reconcile = asyncio.create_task(manager.reconcile(100))
+    await asyncio.sleep(0)
+    reserve = asyncio.create_task(manager.get_next_nonce())
+    await asyncio.sleep(0)
+    assert not reserve.done()
+
+    gate.set()
+    await reconcile
+    # Nonce 5 is gone from the node's view; it must not be handed out again
+    assert await reserve == 7
@@ -0,0 +1,175 @@
+"""Tests for the deadline-aware opportunity scheduler."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from on1builder.engines.opportunity_scheduler import OpportunityScheduler
+from on1builder.monitoring.txpool_scanner import TxPoolScanner
+
+
+def _opp(name, profit, seconds=60, priority=0.0):
+    return {
+        "name": name,
+        "expected_profit_eth": profit,
+        "priority_score": priority,
+        "execution_deadline": datetime.now() + timedelta(seconds=seconds),
+    }
+
+
+class Recorder:
+    def __init__(self, delay=0.0):
+        self.order = []
+        self.active = 0
+        self.max_active = 0
+        self._delay = delay
+
+    async def __call__(self, opportunity):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self._delay)
+            self.order.append(opportunity["name"])
+        finally:
+            self.active -= 1
+
+
+def test_score_favours_profit_priority_and_urgency():
+    scheduler = OpportunityScheduler(Recorder())
+    base = scheduler.score(_opp("a", 0.01, seconds=60))
+    assert scheduler.score(_opp("b", 0.02, seconds=60)) > base
+    assert scheduler.score(_opp("c", 0.01, seconds=60, priority=0.5)) > base
+    assert scheduler.score(_opp("d", 0.01, seconds=10)) > base
+
+
+@pytest.mark.asyncio
+async def test_executes_best_ranked_first():
+    recorder = Recorder()
+    scheduler = OpportunityScheduler(recorder, max_concurrency=1)
+    scheduler.submit(_opp("low", 0.001))
+    scheduler.submit(_opp("urgent", 0.01, seconds=5))
+    scheduler.submit(_opp("high", 0.05))
+
+    await scheduler.start()
+    await scheduler.join()
+    await scheduler.stop()
+
+    assert recorder.order == ["urgent", "high", "low"]
+    stats = scheduler.get_stats()
+    assert stats["executed"] == 3
+    assert stats["queue_wait"]["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    recorder = Recorder(delay=0.01)
+    scheduler = OpportunityScheduler(recorder, max_concurrency=2)
+    await scheduler.start()
+    for n in range(6):
+        scheduler.submit(_opp(str(n), 0.01))
+    await scheduler.join()
+    await scheduler.stop()
+
+    assert len(recorder.order) == 6
+    assert recorder.max_active == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_and_stale_work_is_dropped():
+    recorder = Recorder()
+    scheduler = OpportunityScheduler(
+        recorder, max_concurrency=1, is_stale=lambda target: target == "mined"
+    )
+    assert scheduler.submit(_opp("late", 0.01, seconds=-1)) is False
+    scheduler.submit(_opp("short", 0.01, seconds=0.01))
+    scheduler.submit(_opp("mined", 0.01), target="mined")
+    scheduler.submit(_opp("ok", 0.01), target="pending")
+    await asyncio.sleep(0.02)
+
+    await scheduler.start()
+    await scheduler.join()
+    await scheduler.stop()
+
+    assert recorder.order == ["ok"]
+    stats = scheduler.get_stats()
+    assert stats["expired"] == 2
+    assert stats["stale"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_sheds_lowest_ranked():
+    recorder = Recorder()
+    scheduler = OpportunityScheduler(recorder, max_concurrency=1, max_queued=2)
+    scheduler.submit(_opp("mid", 0.02))
+    scheduler.submit(_opp("low", 0.01))
+    assert scheduler.submit(_opp("high", 0.03)) is True
+    assert scheduler.submit(_opp("lowest", 0.001)) is False
+
+    await scheduler.start()
+    await scheduler.join()
+    await scheduler.stop()
+
+    assert recorder.order == ["high", "mid"]
+    assert scheduler.get_stats()["shed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_do_not_stop_workers():
+    async def execute(opportunity):
+        if opportunity["name"] == "boom":
+            raise RuntimeError("boom")
+
+    scheduler = OpportunityScheduler(execute, max_concurrency=1)
+    await scheduler.start()
+    scheduler.submit(_opp("boom", 0.02))
+    scheduler.submit(_opp("fine", 0.01))
+    await scheduler.join()
+    await scheduler.stop()
+
+    stats = scheduler.get_stats()
+    assert stats["failed"] == 1
+    assert stats["executed"] == 1
+
+
+class DummyABIRegistry:
+    def get_monitored_tokens(self, _chain_id):
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_started_scanner_does_not_block_on_execution(monkeypatch):
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.settings",
+        SimpleNamespace(
+            contracts=SimpleNamespace(), chains=[1], allow_unsimulated_trades=True
+        ),
+    )
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
+    )
+    release = asyncio.Event()
+
+    async def slow_execute(_opportunity):
+        await release.wait()
+
+    executor = SimpleNamespace(execute_opportunity=slow_execute)
+    scanner = TxPoolScanner(SimpleNamespace(eth=SimpleNamespace()), executor, 1)
+    scanner._is_relevant_for_mev = lambda _analysis: True
+    scanner._analyze_for_opportunities = AsyncMock(return_value=[_opp("a", 0.01)])
+    await scanner.start(subscribe=False)
+    try:
+        tx = {"hash": "0x" + "11" * 32, "from": "0x" + "aa" * 20, "nonce": 0}
+        analysis = await scanner._analyze_and_cache(tx["hash"], tx)
+        await asyncio.wait_for(
+            scanner._handle_analysis(analysis, tx["hash"], None), timeout=1
+        )
+        await asyncio.sleep(0)
+        assert scanner.get_performance_metrics()["scheduler"]["running"] == 1
+        release.set()
+        await scanner.wait_idle()
+        assert scanner.get_performance_metrics()["scheduler"]["executed"] == 1
+    finally:
+        await scanner.stop()
@@ -0,0 +1,518 @@
+"""Tests for the log-driven pool state cache."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import eth_abi
+import pytest
+
+from on1builder.core.call_encoders import (
+    FACTORY,
+    GET_PAIR,
+    GET_RESERVES,
+    LIQUIDITY,
+    POOL_FEE,
+    SLOT0,
+    TICK_BITMAP,
+    TICK_SPACING,
+    TICKS,
+    TOKEN0,
+    TOKEN1,
+)
+from on1builder.core.multicall import AGGREGATE3, MULTICALL3_ADDRESS
+from on1builder.core.transaction_manager import TransactionManager
+from on1builder.engines.amm_quoter import (
+    Q96,
+    V3PoolState,
+    get_amount_out,
+    get_amounts_out,
+    quote_exact_input_single,
+)
+from on1builder.monitoring import pool_state_cache
+from on1builder.monitoring.pool_state_cache import (
+    POOL_TOPICS,
+    SYNC_TOPIC,
+    V3_BURN_TOPIC,
+    V3_MINT_TOPIC,
+    V3_SWAP_TOPIC,
+    PoolStateCache,
+)
+from on1builder.monitoring.selector_index import make_swap_intent
+from on1builder.monitoring.txpool_scanner import TxPoolScanner
+
+ROUTER = "0x" + "01" * 20
+FACTORY_ADDRESS = "0x" + "02" * 20
+PAIR = "0x" + "03" * 20
+OTHER_PAIR = "0x" + "04" * 20
+V3_POOL = "0x" + "05" * 20
+WETH = "0x" + "aa" * 20
+USDC = "0x" + "bb" * 20
+
+
+def _word(value, kind):
+    return eth_abi.encode([kind], [value])
+
+
+class FakeChain:
+    """eth namespace answering plain calls, aggregate3, logs and blocks."""
+
+    def __init__(self):
+        self.head = 100
+        self.block_hashes = {}
+        self.logs = []
+        self.log_filters = []
+        self.calls = 0
+        # (target, selector) -> output, or callable(args) -> output
+        self.answers = {
+            (PAIR, GET_RESERVES.selector): GET_RESERVES,
+            (PAIR, TOKEN0.selector): _word(WETH, "address"),
+            (PAIR, TOKEN1.selector): _word(USDC, "address"),
+            (OTHER_PAIR, TOKEN0.selector): _word(USDC, "address"),
+            (OTHER_PAIR, TOKEN1.selector): _word(WETH, "address"),
+            (ROUTER, FACTORY.selector): _word(FACTORY_ADDRESS, "address"),
+            (FACTORY_ADDRESS, GET_PAIR.selector): _word(PAIR, "address"),
+        }
+        self.reserves = {PAIR: (10**21, 2 * 10**24), OTHER_PAIR: (5, 7)}
+        self.answers[(OTHER_PAIR, GET_RESERVES.selector)] = GET_RESERVES
+
+    def _answer(self, target, data):
+        output = self.answers.get((target.lower(), data[:4]))
+        if output is GET_RESERVES:
+            return eth_abi.encode(
+                ["uint112", "uint112", "uint32"], [*self.reserves[target.lower()], 1]
+            )
+        if callable(output):
+            return output(data[4:])
+        if output is None:
+            raise ValueError("execution reverted")
+        return output
+
+    async def call(self, tx):
+        self.calls += 1
+        await asyncio.sleep(0)
+        data = bytes.fromhex(tx["data"][2:])
+        if tx["to"] != MULTICALL3_ADDRESS:
+            return self._answer(tx["to"], data)
+        (calls,) = eth_abi.decode(AGGREGATE3.arg_types, data[4:])
+        results = []
+        for target, _allow_failure, call_data in calls:
+            try:
+                results.append((True, self._answer(target, call_data)))
+            except ValueError:
+                results.append((False, b""))
+        return eth_abi.encode(AGGREGATE3.output_types, [results])
+
+    @property
+    def block_number(self):
+        async def _head():
+            return self.head
+
+        return _head()
+
+    async def get_logs(self, params):
+        self.log_filters.append(params)
+        addresses = {address.lower() for address in params["address"]}
+        return [
+            log
+            for log in self.logs
+            if params["fromBlock"] <= log["blockNumber"] <= params["toBlock"]
+            and log["address"].lower() in addresses
+        ]
+
+    async def get_block(self, number):
+        return {"hash": self.block_hashes.get(number, "0x%064x" % number)}
+
+
+def _cache(chain):
+    web3 = SimpleNamespace(eth=chain, to_checksum_address=lambda a: a)
+    return PoolStateCache(web3, chain_id=1)
+
+
+def _sync_log(pool, block, index, reserve0, reserve1, block_hash=None):
+    return {
+        "address": pool,
+        "blockNumber": block,
+        "logIndex": index,
+        "blockHash": block_hash or "0x%064x" % block,
+        "topics": [SYNC_TOPIC],
+        "data": "0x"
+        + eth_abi.encode(["uint112", "uint112"], [reserve0, reserve1]).hex(),
+    }
+
+
+def _tick_topic(tick):
+    return "0x" + tick.to_bytes(32, "big", signed=True).hex()
+
+
+@pytest.mark.asyncio
+async def test_cold_load_reads_every_pair_in_one_multicall():
+    chain = FakeChain()
+    cache = _cache(chain)
+    cache.watch_v2(PAIR)
+    cache.watch_v2(OTHER_PAIR)
+
+    assert await cache.load() == 2
+
+    assert chain.calls == 1
+    assert cache.get_reserves(PAIR) == (10**21, 2 * 10**24, 100)
+    assert cache.get_reserves(OTHER_PAIR.upper().replace("0X", "0x")) == (5, 7, 100)
+    assert cache.get_reserves("0x" + "99" * 20) is None
+
+
+@pytest.mark.asyncio
+async def test_sync_logs_update_reserves_in_log_order():
+    chain = FakeChain()
+    cache = _cache(chain)
+    cache.watch_v2(PAIR)
+    await cache.load()
+
+    cache.handle_log(_sync_log(PAIR, 100, 3, 1, 1))  # already in the load
+    cache.handle_log(_sync_log(PAIR, 101, 5, 11, 22))
+    cache.handle_log(_sync_log(PAIR, 101, 2, 1, 1))  # earlier in the block
+    cache.handle_log(_sync_log(OTHER_PAIR, 101, 6, 1, 1))  # not watched
+
+    assert cache.get_reserves(PAIR) == (11, 22, 101)
+    stats = cache.get_stats()
+    assert stats["logs_applied"] == 1
+    assert stats["logs_ignored"] == 2
+
+
+@pytest.mark.asyncio
+async def test_logs_during_a_load_are_replayed_after_it():
+    chain = FakeChain()
+    cache = _cache(chain)
+    cache.watch_v2(PAIR)
+
+    cache.handle_log(_sync_log(PAIR, 99, 0, 1, 1))
+    cache.handle_log(_sync_log(PAIR, 101, 0, 33, 44))
+    await cache.load()
+
+    assert cache.get_reserves(PAIR) == (33, 44, 101)
+
+
+@pytest.mark.asyncio
+async def test_changed_block_hash_is_a_reorg_and_reloads_the_pool():
+    chain = FakeChain()
+    cache = _cache(chain)
+    cache.watch_v2(PAIR)
+    await cache.load()
+    cache.handle_log(_sync_log(PAIR, 101, 0, 11, 22, block_hash="0x" + "aa" * 32))
+
+    cache.handle_log(_sync_log(PAIR, 101, 0, 12, 24, block_hash="0x" + "bb" * 32))
+
+    assert cache.get_reserves(PAIR) is None
+    assert cache.get_stats()["reorgs"] == 1
+    await cache.load()
+    # Reloaded at block 100, then the canonical block 101 log is applied
+    assert cache.get_reserves(PAIR) == (12, 24, 101)
+
+
+@pytest.mark.asyncio
+async def test_poll_replays_missed_logs_and_checks_canonical_hashes():
+    chain = FakeChain()
+    cache = _cache(chain)
+    cache.watch_v2(PAIR)
+    await cache.load()
+    chain.head = 102
+    chain.logs = [_sync_log(PAIR, 101, 0, 11, 22), _sync_log(PAIR, 102, 0, 13, 26)]
+
+    await cache._poll()
+    assert cache.get_reserves(PAIR) == (13, 26, 102)
+
+    chain.block_hashes[102] = "0x" + "ee" * 32
+    await cache._poll()
+    assert cache.get_stats()["reorgs"] == 1
+    assert cache.get_reserves(PAIR) is None
+
+
+def _v3_answers(chain):
+    spacing = 60
+    chain.answers.update(
+        {
+            (V3_POOL, SLOT0.selector): eth_abi.encode(
+                SLOT0.output_types, [Q96, 0, 0, 1, 1, 0, True]
+            ),
+            (V3_POOL, LIQUIDITY.selector): _word(10**20, "uint128"),
+            (V3_POOL, POOL_FEE.selector): _word(3000, "uint24"),
+            (V3_POOL, TICK_SPACING.selector): _word(spacing, "int24"),
+            (V3_POOL, TOKEN0.selector): _word(USDC, "address"),
+            (V3_POOL, TOKEN1.selector): _word(WETH, "address"),
+        }
+    )
+    positions = {-spacing: (10**20, 10**20), spacing: (10**20, -(10**20))}
+
+    def _bitmap(args):
+        (word,) = eth_abi.decode(["int16"], args)
+        bits = 0
+        for tick in positions:
+            compressed = tick // spacing
+            if compressed >> 8 == word:
+                bits |= 1 << (compressed % 256)
+        return _word(bits, "uint256")
+
+    def _ticks(args):
+        (tick,) = eth_abi.decode(["int24"], args)
+        gross, net = positions[tick]
+        return eth_abi.encode(TICKS.output_types, [gross, net, 0, 0, 0, 0, 0, True])
+
+    chain.answers[(V3_POOL, TICK_BITMAP.selector)] = _bitmap
+    chain.answers[(V3_POOL, TICKS.selector)] = _ticks
+
+
+def _v3_log(topic, block, topics=(), data=b""):
+    return {
+        "address": V3_POOL,
+        "blockNumber": block,
+        "logIndex": 0,
+        "blockHash": "0x%064x" % block,
+        "topics": [topic, "0x" + "00" * 32, *topics],
+        "data": data,
+    }
+
+
+@pytest.mark.asyncio
+async def test_v3_pool_follows_swap_mint_and_burn():
+    chain = FakeChain()
+    _v3_answers(chain)
+    cache = _cache(chain)
+    cache.watch_v3(V3_POOL)
+    await cache.load()
+
+    state, block = cache.get_v3_state(V3_POOL)
+    assert block == 100
+    assert state.ticks == {-60: 10**20, 60: -(10**20)}
+    assert (state.liquidity, state.fee, state.tick_spacing) == (10**20, 3000, 60)
+
+    mint = eth_abi.encode(
+        ["address", "uint128", "uint256", "uint256"], [ROUTER, 5 * 10**19, 1, 1]
+    )
+    cache.handle_log(
+        _v3_log(V3_MINT_TOPIC, 101, (_tick_topic(-120), _tick_topic(60)), mint)
+    )
+    state, block = cache.get_v3_state(V3_POOL)
+    assert block == 101
+    assert state.liquidity == 15 * 10**19
+    assert state.ticks == {-120: 5 * 10**19, -60: 10**20, 60: -15 * 10**19}
+
+    # The cached state quotes like a freshly read one
+    fresh = V3PoolState(Q96, 0, 15 * 10**19, 3000, 60, dict(state.ticks))
+    assert quote_exact_input_single(state, True, 10**18) == (
+        quote_exact_input_single(fresh, True, 10**18)
+    )
+
+    burn = eth_abi.encode(["uint128", "uint256", "uint256"], [5 * 10**19, 1, 1])
+    cache.handle_log(
+        _v3_log(V3_BURN_TOPIC, 102, (_tick_topic(-120), _tick_topic(60)), burn)
+    )
+    assert state.ticks == {-60: 10**20, 60: -(10**20)}
+    assert state.liquidity == 10**20
+
+    swap = eth_abi.encode(
+        ["int256", "int256", "uint160", "uint128", "int24"],
+        [1, -1, Q96 // 2, 10**20, -13864],
+    )
+    cache.handle_log(_v3_log(V3_SWAP_TOPIC, 103, (), swap))
+    assert (state.sqrt_price_x96, state.tick) == (Q96 // 2, -13864)
+
+
+async def _running_cache(chain):
+    cache = _cache(chain)
+    assert await cache.resolve_v2_pair(ROUTER, USDC, WETH) == PAIR
+    cache.start()
+    for _ in range(100):
+        if cache.in_sync and cache.get_stats()["loaded"]:
+            break
+        await asyncio.sleep(0.01)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_quote_expected_output_uses_cached_reserves():
+    chain = FakeChain()
+    cache = await _running_cache(chain)
+    tm = TransactionManager.__new__(TransactionManager)
+    tm._pool_cache = cache
+    calls = chain.calls
+
+    try:
+        quoted = await tm._quote_expected_output(
+            SimpleNamespace(address=ROUTER), 10**18, [WETH, USDC]
+        )
+    finally:
+        await cache.stop()
+
+    assert quoted == get_amounts_out(10**18, [(10**21, 2 * 10**24)])[-1]
+    assert chain.calls == calls
+
+
+@pytest.mark.asyncio
+async def test_scanner_price_impact_comes_from_cached_reserves():
+    chain = FakeChain()
+    cache = await _running_cache(chain)
+    scanner = TxPoolScanner.__new__(TxPoolScanner)
+    scanner._pool_cache = cache
+    amount_in = 50 * 10**18
+    analysis = {
+        "to": ROUTER,
+        "target_dex": "uniswap_v2",
+        "swap_intent": make_swap_intent([WETH, USDC], amount_in, 0, dex="uniswap_v2"),
+    }
+
+    try:
+        impact = scanner._cached_price_impact(analysis)
+        # A V3 single-hop or exact-output swap is not quoted off V2 reserves
+        not_v2 = [
+            scanner._cached_price_impact(
+                {**analysis, "swap_intent": make_swap_intent(*args, **kwargs)}
+            )
+            for args, kwargs in (
+                (([WETH, USDC], amount_in, 0), {"dex": "uniswap_v3", "pool_fee": 500}),
+                (
+                    ([WETH, USDC], amount_in, 1),
+                    {"dex": "uniswap_v2", "exact_output": True},
+                ),
+            )
+        ]
+        analysis["swap_intent"]["path"] = [WETH, "0x" + "cc" * 20]
+        missing = scanner._cached_price_impact(analysis)
+    finally:
+        await cache.stop()
+
+    out = get_amount_out(amount_in, 10**21, 2 * 10**24)
+    expected = 1 - (2 * 10**24 - out) * 10**21 / ((10**21 + amount_in) * 2 * 10**24)
+    assert impact == pytest.approx(expected)
+    assert 0.09 < impact < 0.1
+    assert not_v2 == [None, None]
+    assert missing is None
+
+
+@pytest.mark.asyncio
+async def test_failed_lookups_are_cached_until_the_ttl_expires():
+    chain = FakeChain()
+    cache = _cache(chain)
+    bad_router = "0x" + "0e" * 20
+    chain.answers[(FACTORY_ADDRESS, GET_PAIR.selector)] = _word(
+        "0x" + "00" * 20, "address"
+    )
+
+    with pytest.raises(Exception):
+        await cache.resolve_v2_pair(bad_router, USDC, WETH)
+    assert await cache.resolve_v2_pair(ROUTER, USDC, WETH) is None
+    calls = chain.calls
+    assert await cache.resolve_v2_pair(bad_router, USDC, WETH) is None
+    assert await cache.resolve_v2_pair(ROUTER, WETH, USDC) is None
+    cache.track_v2_path(ROUTER, [USDC, WETH])
+    cache.track_v2_path(bad_router, [USDC, WETH])
+    assert chain.calls == calls
+    assert not cache._background
+    stats = cache.get_stats()
+    assert (stats["lookup_failures"], stats["lookups_skipped"]) == (2, 2)
+
+    # The pair is deployed later; it is picked up once the entry expires
+    chain.answers[(FACTORY_ADDRESS, GET_PAIR.selector)] = _word(PAIR, "address")
+    assert min(cache._failed.values()) > time.monotonic() + 60
+    cache._failed = {key: time.monotonic() - 1 for key in cache._failed}
+    assert await cache.resolve_v2_pair(ROUTER, USDC, WETH) == PAIR
+
+
+@pytest.mark.asyncio
+async def test_track_v2_path_skips_a_lookup_already_in_flight():
+    chain = FakeChain()
+    cache = _cache(chain)
+
+    cache.track_v2_path(ROUTER, [WETH, USDC])
+    cache.track_v2_path(ROUTER.upper().replace("0X", "0x"), [WETH, USDC])
+    assert len(cache._background) == 1
+    await asyncio.gather(*cache._background)
+
+    assert cache.find_v2_pair(ROUTER, WETH, USDC) == PAIR
+    # Resolved now: nothing left to look up
+    cache.track_v2_path(ROUTER, [WETH, USDC])
+    assert not cache._background
+    assert cache.get_stats()["lookups_skipped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_poll_filters_logs_by_watched_address(monkeypatch):
+    monkeypatch.setattr(PoolStateCache, "MAX_FILTER_ADDRESSES", 1)
+    chain = FakeChain()
+    cache = _cache(chain)
+    cache.watch_v2(PAIR)
+    cache.watch_v2(OTHER_PAIR)
+    await cache.load()
+    chain.head = 101
+    chain.logs = [_sync_log(PAIR, 101, 0, 11, 22), _sync_log(OTHER_PAIR, 101, 1, 3, 4)]
+
+    await cache._poll()
+
+    assert [f["address"] for f in chain.log_filters] == [[PAIR], [OTHER_PAIR]]
+    assert all(f["topics"] == [POOL_TOPICS] for f in chain.log_filters)
+    assert cache.get_reserves(PAIR) == (11, 22, 101)
+    assert cache.get_reserves(OTHER_PAIR) == (3, 4, 101)
+
+
+class FakeWsWeb3:
+    """Websocket AsyncWeb3 stand-in recording logs subscriptions."""
+
+    def __init__(self, provider):
+        self.subscriptions = {}
+        self.unsubscribed = []
+        self.eth = SimpleNamespace(subscribe=self._subscribe, unsubscribe=self._drop)
+        self.subscription_manager = SimpleNamespace(handle_subscriptions=self._handle)
+        FakeWsWeb3.last = self
+
+    async def _subscribe(self, kind, params, handler):
+        subscription_id = "0x%x" % (len(self.subscriptions) + 1)
+        self.subscriptions[subscription_id] = params
+        return subscription_id
+
+    async def _drop(self, subscription_id):
+        self.unsubscribed.append(subscription_id)
+
+    async def _handle(self, run_forever):
+        await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_subscription_is_replaced_when_pools_are_watched(monkeypatch):
+    import web3.providers
+
+    class FakeProvider:
+        def __init__(self, url):
+            pass
+
+        async def connect(self):
+            pass
+
+        async def disconnect(self):
+            pass
+
+    monkeypatch.setattr(web3.providers, "WebSocketProvider", FakeProvider)
+    monkeypatch.setattr(pool_state_cache, "AsyncWeb3", FakeWsWeb3)
+    monkeypatch.setattr(PoolStateCache, "RESUBSCRIBE_DELAY_SECONDS", 0)
+    chain = FakeChain()
+    cache = _cache(chain)
+    cache._ws_url = "ws://node"
+    cache.watch_v2(PAIR)
+    cache.start()
+    try:
+        for _ in range(100):
+            if cache.get_stats()["source"] == "logs":
+                break
+            await asyncio.sleep(0.01)
+        ws = FakeWsWeb3.last
+        assert [p["address"] for p in ws.subscriptions.values()] == [[PAIR]]
+
+        cache.watch_v2(OTHER_PAIR)
+        for _ in range(100):
+            if cache.get_reserves(OTHER_PAIR):
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await cache.stop()
+
+    assert ws.subscriptions["0x2"]["address"] == [PAIR, OTHER_PAIR]
+    assert ws.unsubscribed[0] == "0x1"
+    assert cache.get_reserves(OTHER_PAIR)[:2] == (5, 7)
+    assert cache.get_stats()["resubscribes"] == 1
@@ -0,0 +1,194 @@
+"""Tests for the concurrent swap pre-flight graph."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import eth_abi
+import pytest
+
+from on1builder.core.call_encoders import ALLOWANCE, BALANCE_OF, GET_AMOUNTS_OUT
+from on1builder.core.preflight import PreflightGraph
+from on1builder.core.transaction_manager import TransactionManager
+from on1builder.utils.custom_exceptions import StrategyExecutionError
+from on1builder.utils.http_session_pool import HttpSessionPool
+
+ROUTER = "0x" + "11" * 20
+TOKEN = "0x" + "22" * 20
+WETH = "0x" + "33" * 20
+DELAY = 0.05
+
+
+def _sleeping(value, delay=DELAY):
+    async def _stage(_results):
+        await asyncio.sleep(delay)
+        return value
+
+    return _stage
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_overlap_and_dependents_see_results():
+    latency = {}
+    graph = PreflightGraph(latency)
+    graph.add("a", _sleeping(1))
+    graph.add("b", _sleeping(2))
+    graph.add("c", _sleeping(3))
+
+    async def _sum(results):
+        return results["a"] + results["b"]
+
+    graph.add("sum", _sum, after=("a", "b"))
+
+    started = time.monotonic()
+    results = await graph.run()
+    elapsed = time.monotonic() - started
+
+    assert results == {"a": 1, "b": 2, "c": 3, "sum": 3}
+    assert elapsed < 2 * DELAY
+    assert set(latency) == {"a", "b", "c", "sum", "total"}
+    assert latency["a"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_first_failure_cancels_remaining_stages():
+    cancelled = asyncio.Event()
+
+    async def _slow(_results):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def _fail(_results):
+        raise StrategyExecutionError("allowance too low")
+
+    graph = PreflightGraph()
+    graph.add("slow", _slow)
+    graph.add("fail", _fail)
+    graph.add("after_slow", _sleeping(None), after=("slow",))
+
+    started = time.monotonic()
+    with pytest.raises(StrategyExecutionError, match="allowance"):
+        await graph.run()
+    assert time.monotonic() - started < 1
+    assert cancelled.is_set()
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(ValueError):
+        PreflightGraph().add("estimate_gas", _sleeping(1), after=("quote",))
+
+
+class SlowEth:
+    """Every RPC takes DELAY seconds."""
+
+    def __init__(self, allowance=10**30):
+        self.allowance = allowance
+        self.calls = []
+
+    async def call(self, tx):
+        await asyncio.sleep(DELAY)
+        selector = bytes.fromhex(tx["data"][2:10])
+        self.calls.append(selector)
+        if selector == GET_AMOUNTS_OUT.selector:
+            return eth_abi.encode(["uint256[]"], [[10**18, 2000 * 10**6]])
+        if selector == BALANCE_OF.selector:
+            return eth_abi.encode(["uint256"], [10**30])
+        if selector == ALLOWANCE.selector:
+            return eth_abi.encode(["uint256"], [self.allowance])
+        return b""  # simulation
+
+    async def estimate_gas(self, _tx):
+        await asyncio.sleep(DELAY)
+        return 100_000
+
+    @property
+    def gas_price(self):
+        async def _price():
+            await asyncio.sleep(DELAY)
+            return 10**9
+
+        return _price()
+
+
+def _manager(monkeypatch, eth):
+    monkeypatch.setattr(
+        "on1builder.core.transaction_manager.settings",
+        SimpleNamespace(
+            allow_unsimulated_trades=True,
+            slippage_tolerance=1.0,
+            dynamic_gas_pricing=False,
+            max_gas_price_gwei=100,
+            default_gas_limit=500_000,
+            simulation_backend="eth_call",
+        ),
+    )
+    tm = TransactionManager.__new__(TransactionManager)
+    tm._chain_id = 1
+    tm._address = "0x" + "ab" * 20
+    tm._web3 = SimpleNamespace(
+        eth=eth,
+        to_checksum_address=lambda a: a,
+        to_wei=lambda v, _u: int(v * 10**9),
+    )
+    tm._multicall = None
+    tm._pool_cache = None
+    tm._preflight_latency = {}
+    tm._sandwich_latency = {}
+    tm._sandwich_stats = {"built": 0, "submitted": 0, "included": 0}
+    tm._http = HttpSessionPool()
+    tm._private_relays = tm._bundle_relays = None
+    tm._bundle_scheduler = None
+    tm._execution_stats = {
+        "total_transactions": 0,
+        "successful_transactions": 0,
+        "total_profit_eth": 0.0,
+        "total_gas_spent_eth": 0.0,
+    }
+    tm._get_dex_contract = AsyncMock(return_value=SimpleNamespace(address=ROUTER))
+    tm._get_wrapped_native_address = lambda: WETH
+    tm._nonce_manager = SimpleNamespace(
+        get_next_nonce=AsyncMock(return_value=7), get_stats=lambda: {}
+    )
+    tm.execute_and_confirm = AsyncMock(return_value={"success": True})
+    return tm
+
+
+@pytest.mark.asyncio
+async def test_execute_swap_runs_reads_concurrently(monkeypatch):
+    eth = SlowEth()
+    tm = _manager(monkeypatch, eth)
+    opportunity = {"dex": "uniswap", "path": [TOKEN, WETH], "amount_in": 10**18}
+
+    started = time.monotonic()
+    result = await tm.execute_swap(opportunity, "arbitrage")
+    elapsed = time.monotonic() - started
+
+    assert result == {"success": True}
+    # quote/balance/allowance/gas price, then estimate+simulate: two waves
+    assert elapsed < 4 * DELAY
+    assert len(eth.calls) == 4
+    tx_params = tm.execute_and_confirm.await_args.args[0]
+    assert tx_params["nonce"] == 7
+    assert tx_params["gas"] == 120_000
+    assert tx_params["gasPrice"] == 10**9
+    assert opportunity["simulated"] is True
+    stats = await tm.get_performance_stats()
+    assert {"quote", "balance", "allowance", "gas_price", "simulate"} <= set(
+        stats["preflight_latency"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_check_does_not_take_a_nonce(monkeypatch):
+    tm = _manager(monkeypatch, SlowEth(allowance=0))
+    opportunity = {"dex": "uniswap", "path": [TOKEN, WETH], "amount_in": 10**18}
+
+    with pytest.raises(StrategyExecutionError, match="allowance too low"):
+        await tm.execute_swap(opportunity, "arbitrage")
+
+    tm._nonce_manager.get_next_nonce.assert_not_awaited()
+    tm.execute_and_confirm.assert_not_awaited()
@@ -0,0 +1,168 @@
+"""Tests for the head-driven shared receipt tracker."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from web3.exceptions import TransactionNotFound
+
+from on1builder.core.receipt_tracker import ReceiptTracker
+from on1builder.core.transaction_manager import TransactionManager
+
+
+def _hash(i):
+    return "0x" + f"{i:064x}"
+
+
+class FakeEth:
+    def __init__(self):
+        self.blocks = {}
+        self.mined = {}
+        self.get_block_receipts = AsyncMock(
+            side_effect=lambda n: self.blocks.get(n, [])
+        )
+        self.get_transaction_receipt = AsyncMock(side_effect=self._receipt)
+
+    async def _receipt(self, tx_hash):
+        if tx_hash not in self.mined:
+            raise TransactionNotFound(tx_hash)
+        return self.mined[tx_hash]
+
+    def mine(self, number, hashes):
+        receipts = [
+            {"transactionHash": h, "blockNumber": number, "status": 1} for h in hashes
+        ]
+        self.blocks[number] = receipts
+        self.mined.update({r["transactionHash"]: r for r in receipts})
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_one_block_receipts_call_resolves_many_waiters():
+    eth = FakeEth()
+    tracker = ReceiptTracker(SimpleNamespace(eth=eth), 1)
+    tracker.notify_head(100)
+    tracker.start()
+    try:
+        waits = [asyncio.create_task(tracker.wait(_hash(i), 5)) for i in range(50)]
+        await _settle()
+        eth.mine(101, [_hash(i) for i in range(50)])
+        tracker.notify_head(101)
+        receipts = await asyncio.gather(*waits)
+    finally:
+        await tracker.stop()
+
+    assert [r["blockNumber"] for r in receipts] == [101] * 50
+    eth.get_block_receipts.assert_awaited_with(101)
+    stats = tracker.get_stats()
+    assert stats["confirmed"] == 50
+    assert stats["in_flight"] == 0
+    assert stats["confirmation_blocks"]["p50"] == 1
+    assert stats["confirmation_latency"]["count"] == 50
+
+
+@pytest.mark.asyncio
+async def test_already_mined_hash_resolves_by_lookup():
+    eth = FakeEth()
+    eth.mine(100, [_hash(1)])
+    tracker = ReceiptTracker(SimpleNamespace(eth=eth), 1)
+    tracker.notify_head(101)
+    tracker.start()
+    try:
+        receipt = await tracker.wait(_hash(1), 5)
+    finally:
+        await tracker.stop()
+    assert receipt["blockNumber"] == 100
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_hash_lookups_without_block_receipts():
+    eth = FakeEth()
+    eth.get_block_receipts.side_effect = ValueError("method not found")
+    tracker = ReceiptTracker(SimpleNamespace(eth=eth), 1)
+    tracker.notify_head(100)
+    tracker.start()
+    try:
+        waiting = asyncio.create_task(tracker.wait(_hash(7), 5))
+        await _settle()
+        eth.mine(101, [_hash(7)])
+        tracker.notify_head(101)
+        receipt = await waiting
+        tracker.notify_head(102)
+        await _settle()
+    finally:
+        await tracker.stop()
+
+    assert receipt["blockNumber"] == 101
+    assert tracker.get_stats()["block_receipts_supported"] is False
+    assert eth.get_block_receipts.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_returns_none_and_forgets_hash():
+    tracker = ReceiptTracker(SimpleNamespace(eth=FakeEth()), 1)
+    tracker.notify_head(1)
+    tracker.start()
+    try:
+        assert await tracker.wait(_hash(3), 0.05) is None
+    finally:
+        await tracker.stop()
+    stats = tracker.get_stats()
+    assert stats["timed_out"] == 1 and stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_for_receipt_uses_running_tracker():
+    tm = TransactionManager.__new__(TransactionManager)
+    tm._web3 = SimpleNamespace(eth=SimpleNamespace(get_transaction_receipt=AsyncMock()))
+    tm._private_relays = tm._bundle_relays = None
+    tracker = SimpleNamespace(
+        running=True, wait=AsyncMock(return_value={"status": 1, "blockNumber": 5})
+    )
+    tm.set_receipt_tracker(tracker)
+
+    receipt = await tm.wait_for_receipt(_hash(9), timeout=3)
+
+    assert receipt["blockNumber"] == 5
+    tracker.wait.assert_awaited_once_with(_hash(9), 3)
+    tm._web3.eth.get_transaction_receipt.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_transient_block_receipts_error_is_retried():
+    eth = FakeEth()
+    calls = []
+
+    async def flaky(number):
+        calls.append(number)
+        if len(calls) == 1:
+            raise TimeoutError("read timed out")
+        return eth.blocks.get(number, [])
+
+    eth.get_block_receipts.side_effect = flaky
+    tracker = ReceiptTracker(SimpleNamespace(eth=eth), 1)
+    tracker.notify_head(100)
+    tracker.start()
+    try:
+        waiting = asyncio.create_task(tracker.wait(_hash(7), 5))
+        await _settle()
+        eth.mine(101, [_hash(7)])
+        tracker.notify_head(101)
+        await waiting
+        eth.mine(102, [_hash(8)])
+        second = asyncio.create_task(tracker.wait(_hash(9), 5))
+        await _settle()
+        eth.mine(103, [_hash(9)])
+        tracker.notify_head(103)
+        await second
+    finally:
+        await tracker.stop()
+
+    # The timeout did not switch block receipts off for good
+    assert len(calls) >= 2
+    assert tracker.get_stats()["block_receipts_supported"] is True
@@ -0,0 +1,164 @@
+"""Tests for concurrent relay fan-out against a local JSON-RPC server."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from eth_account import Account
+from eth_utils import keccak
+
+from on1builder.core.relay_broadcaster import RelayBroadcaster, merge_urls
+from on1builder.core.transaction_manager import TransactionManager
+from on1builder.utils.custom_exceptions import StrategyExecutionError
+from on1builder.utils.http_session_pool import HttpSessionPool
+
+SLOW_SECONDS = 0.3
+
+
+@pytest_asyncio.fixture
+async def relay_server():
+    """Relays at /fast, /slow and /fail; every request is recorded."""
+    requests = []
+    slow_done = asyncio.Event()
+
+    async def handle(request):
+        body = await request.read()
+        payload = json.loads(body)
+        name = request.match_info["name"]
+        requests.append((name, payload["method"], body, dict(request.headers)))
+        if name == "fail":
+            return web.json_response({"error": {"message": "bundle rejected"}})
+        if name == "slow":
+            await asyncio.sleep(SLOW_SECONDS)
+            slow_done.set()
+        if name == "noprivate" and payload["method"] == "eth_sendPrivateTransaction":
+            return web.json_response({"error": {"message": "method not found"}})
+        return web.json_response({"result": f"0x{name}"})
+
+    app = web.Application()
+    app.router.add_post("/{name}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield SimpleNamespace(
+        url=lambda name: f"http://127.0.0.1:{port}/{name}",
+        requests=requests,
+        slow_done=slow_done,
+    )
+    await runner.cleanup()
+
+
+async def _post_rpc(session, url):
+    async with session.post(url, json={"method": "eth_sendBundle"}) as resp:
+        data = await resp.json()
+        if "error" in data:
+            raise StrategyExecutionError(data["error"]["message"])
+        return data["result"]
+
+
+def test_merge_urls_keeps_order_and_drops_duplicates():
+    assert merge_urls("https://a", ["https://b", "https://a", " "], None) == [
+        "https://a",
+        "https://b",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_first_accept_returns_without_waiting_for_slow_relay(relay_server):
+    fast, slow, fail = (relay_server.url(n) for n in ("fast", "slow", "fail"))
+    relays = RelayBroadcaster([slow, fail, fast])
+    try:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result, url = await relays.broadcast(_post_rpc, key="0xAB")
+        assert (result, url) == ("0xfast", fast)
+        assert loop.time() - started < SLOW_SECONDS
+
+        # The slow relay still lands and is credited for the inclusion
+        await asyncio.wait_for(relay_server.slow_done.wait(), 2)
+        await asyncio.sleep(0.05)
+        assert sorted(relays.record_inclusion("0xab")) == sorted(
+            relays._labels[u] for u in (fast, slow)
+        )
+
+        stats = relays.get_stats()
+        fast_stats, slow_stats, fail_stats = (
+            stats[relays._labels[u]] for u in (fast, slow, fail)
+        )
+        assert (fast_stats["accepted"], fast_stats["included"]) == (1, 1)
+        assert slow_stats["accept_latency"]["p50_ms"] >= SLOW_SECONDS * 1000
+        assert (fail_stats["errors"], fail_stats["error_rate"]) == (1, 1.0)
+        assert fail_stats["included"] == 0
+    finally:
+        await relays.close()
+
+
+@pytest.mark.asyncio
+async def test_all_relays_failing_raises_with_each_error(relay_server):
+    relays = RelayBroadcaster([relay_server.url("fail")])
+    try:
+        with pytest.raises(StrategyExecutionError, match="bundle rejected"):
+            await relays.broadcast(_post_rpc)
+    finally:
+        await relays.close()
+
+
+def _manager(**attrs):
+    tm = TransactionManager.__new__(TransactionManager)
+    tm._bundle_target_block_offset = 1
+    tm._bundle_timeout_seconds = 30
+    tm._bundle_signer_account = Account.create()
+    tm._http = HttpSessionPool()
+    tm._private_relays = tm._bundle_relays = None
+    tm._bundle_scheduler = None
+    for name, value in attrs.items():
+        setattr(tm, name, value)
+    return tm
+
+
+@pytest.mark.asyncio
+async def test_bundle_goes_to_every_relay_with_auth_for_primary_only(relay_server):
+    primary, other = relay_server.url("fast"), relay_server.url("slow")
+    tm = _manager(
+        _bundle_relay_url=primary,
+        _bundle_relay_auth="secret",
+        _bundle_relays=RelayBroadcaster([primary, other]),
+    )
+    try:
+        bundle_hash = await tm._send_bundle([b"\x01", b"\x02"], target_block=10)
+        assert bundle_hash == "0xfast"
+        await asyncio.wait_for(relay_server.slow_done.wait(), 2)
+
+        (_, _, body_a, headers_a), (_, _, body_b, headers_b) = sorted(
+            relay_server.requests
+        )
+        assert body_a == body_b
+        assert json.loads(body_a)["params"][0]["blockNumber"] == hex(10)
+        assert headers_a["Authorization"] == "Bearer secret"
+        assert "Authorization" not in headers_b
+        assert headers_a["X-Flashbots-Signature"] == headers_b["X-Flashbots-Signature"]
+
+        # Inclusion of the first transaction is credited to both relays
+        tm._attribute_inclusion("0x" + keccak(b"\x01").hex())
+        stats = tm._bundle_relays.get_stats()
+        assert [s["included"] for s in stats.values()] == [1, 1]
+    finally:
+        await tm.close()
+
+
+@pytest.mark.asyncio
+async def test_private_tx_falls_back_to_raw_send_per_endpoint(relay_server):
+    tm = _manager(_private_relays=RelayBroadcaster([relay_server.url("noprivate")]))
+    try:
+        assert await tm._send_private_transaction(b"\x01") == "0xnoprivate"
+        assert [method for _, method, _, _ in relay_server.requests] == [
+            "eth_sendPrivateTransaction",
+            "eth_sendRawTransaction",
+        ]
+    finally:
+        await tm.close()
@@ -46,7 +46,10 @@ async def test_safety_guard_blocks_unsafe_tx(monkeypatch):
         sign_transaction=lambda p: SimpleNamespace(rawTransaction=b"0x")
     )
     tm._nonce_manager = SimpleNamespace(
-        get_next_nonce=lambda: 1, resync_nonce=lambda: None
+        get_next_nonce=lambda: 1,
+        resync_nonce=lambda: None,
+        commit=lambda *_: None,
+        release=lambda *_: None,
     )
     tm._db_interface = SimpleNamespace()  # unused in these paths
     tm._notification_service = SimpleNamespace()
@@ -78,7 +81,10 @@ async def test_gas_price_rejects_when_profit_too_low(monkeypatch):
         sign_transaction=lambda p: SimpleNamespace(rawTransaction=b"0x")
     )
     tm._nonce_manager = SimpleNamespace(
-        get_next_nonce=lambda: 1, resync_nonce=lambda: None
+        get_next_nonce=lambda: 1,
+        resync_nonce=lambda: None,
+        commit=lambda *_: None,
+        release=lambda *_: None,
     )
     tm._db_interface = SimpleNamespace()  # unused in these paths
     tm._notification_service = SimpleNamespace()
@@ -0,0 +1,375 @@
+"""Tests for bundle-native sandwich execution."""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, call
+
+import eth_abi
+import pytest
+import rlp
+from eth_account import Account
+from hexbytes import HexBytes
+from web3.datastructures import AttributeDict
+
+from on1builder.core.relay_broadcaster import RelayBroadcaster
+from on1builder.core.transaction_manager import TransactionManager
+from on1builder.engines.amm_quoter import (
+    get_amounts_out,
+    max_sandwich_front_in,
+    project_sandwich,
+)
+from on1builder.monitoring.selector_index import make_swap_intent
+from on1builder.utils.custom_exceptions import (
+    StrategyExecutionError,
+    TransactionError,
+)
+from on1builder.utils.latency_tracker import LatencyTracker
+
+ROUTER = "0x" + "11" * 20
+WETH = "0x" + "33" * 20
+TOKEN = "0x" + "44" * 20
+GAS_PRICE = 20 * 10**9
+HEAD = 100
+# 1000 WETH / 2M TOKEN pair; the victim buys with 20 WETH at 1% slippage
+HOPS = [(1000 * 10**18, 2_000_000 * 10**18)]
+VICTIM_IN = 20 * 10**18
+VICTIM_MIN_OUT = 39_000 * 10**18
+
+
+class StubWeb3:
+    def __init__(self, victim):
+        head = asyncio.get_running_loop().create_future()
+        head.set_result(HEAD)
+        self.eth = SimpleNamespace(
+            block_number=head,
+            get_transaction=AsyncMock(return_value=victim),
+            estimate_gas=AsyncMock(return_value=150_000),
+        )
+
+    def to_checksum_address(self, addr):
+        return addr
+
+    def to_wei(self, value, unit):
+        return int(Decimal(value) * 10**18) if unit == "ether" else int(value)
+
+    def from_wei(self, value, unit):
+        return Decimal(value) / 10**18
+
+
+def _victim_tx():
+    """A signed type-2 swap as a node returns it from eth_getTransactionByHash."""
+    fields = {
+        "type": 2,
+        "chainId": 1,
+        "nonce": 41,
+        "to": ROUTER,
+        "value": VICTIM_IN,
+        "gas": 200_000,
+        "maxFeePerGas": 30 * 10**9,
+        "maxPriorityFeePerGas": 10**9,
+        "data": "0x7ff36ab5",
+        "accessList": [],
+    }
+    victim = Account.create()
+    signed = victim.sign_transaction(fields)
+    node_tx = AttributeDict(
+        {
+            **{k: v for k, v in fields.items() if k != "data"},
+            "from": victim.address,
+            "input": HexBytes(fields["data"]),
+            "hash": HexBytes(signed.hash),
+            "blockNumber": None,
+            "v": signed.v,
+            "r": HexBytes(signed.r.to_bytes(32, "big")),
+            "s": HexBytes(signed.s.to_bytes(32, "big")),
+        }
+    )
+    return node_tx, bytes(signed.raw_transaction)
+
+
+def _target(min_out=VICTIM_MIN_OUT, path=(WETH, TOKEN), **intent):
+    return {
+        "hash": "ab" * 32,
+        "to": ROUTER,
+        "target_dex": "uniswap",
+        "swap_intent": make_swap_intent(
+            list(path), VICTIM_IN, min_out, dex="uniswap_v2", **intent
+        ),
+    }
+
+
+def build_manager(victim, **overrides):
+    account = Account.create()
+    tm = TransactionManager.__new__(TransactionManager)
+    tm._web3 = StubWeb3(victim)
+    tm._account = account
+    tm._address = account.address
+    tm._chain_id = 1
+    tm._abi_registry = SimpleNamespace(get_token_address=lambda *_: WETH)
+    tm._pool_cache = SimpleNamespace(
+        v2_hops=lambda router, path: HOPS if router == ROUTER else None,
+        track_v2_path=lambda *_: None,
+    )
+    tm._balance_manager = SimpleNamespace(
+        update_balance=AsyncMock(return_value=Decimal("1000"))
+    )
+    tm._safety_guard = SimpleNamespace(
+        check_transaction=AsyncMock(return_value=(True, ""))
+    )
+    tm._check_token_allowance = AsyncMock(return_value=2**256 - 1)
+    tm._nonce_manager = SimpleNamespace(
+        get_next_nonces=AsyncMock(return_value=[7, 8]),
+        commit=Mock(),
+        release=Mock(),
+    )
+    tm._send_bundle = AsyncMock(return_value="0xbundle")
+    tm.wait_for_receipt = AsyncMock(return_value={"status": 1, "blockNumber": 101})
+    tm._private_relays = None
+    tm._bundle_relays = RelayBroadcaster(["https://relay.example"])
+    tm._bundle_scheduler = None
+    tm._bundle_target_block_offset = 1
+    tm._bundle_timeout_seconds = 24
+    tm._last_bundle_hash = None
+    tm._sandwich_latency = {
+        "build": LatencyTracker(),
+        "build_to_submit": LatencyTracker(),
+    }
+    tm._sandwich_stats = {"built": 0, "submitted": 0, "included": 0}
+    for name, value in overrides.items():
+        setattr(tm, name, value)
+    return tm
+
+
+def _decode_leg(raw):
+    nonce, gas_price, gas, to, value, data, *_ = rlp.decode(raw)
+    return {
+        "nonce": int.from_bytes(nonce, "big"),
+        "gasPrice": int.from_bytes(gas_price, "big"),
+        "gas": int.from_bytes(gas, "big"),
+        "value": int.from_bytes(value, "big"),
+        "selector": data[:4],
+        "args": data[4:],
+    }
+
+
+def test_projection_respects_victim_slippage():
+    front_in = max_sandwich_front_in(500 * 10**18, VICTIM_IN, VICTIM_MIN_OUT, HOPS)
+    assert 0 < front_in < 500 * 10**18
+    assert project_sandwich(front_in, VICTIM_IN, VICTIM_MIN_OUT, HOPS) is not None
+    # A slightly larger front-run would make the victim revert
+    assert (
+        project_sandwich(front_in * 101 // 100, VICTIM_IN, VICTIM_MIN_OUT, HOPS) is None
+    )
+    front_out, back_out = project_sandwich(front_in, VICTIM_IN, VICTIM_MIN_OUT, HOPS)
+    assert back_out > front_in  # the victim's buy lifted the price
+
+
+@pytest.mark.asyncio
+async def test_signed_victim_is_re_encoded_bit_exact():
+    node_tx, raw = _victim_tx()
+    assert TransactionManager._encode_signed_transaction(node_tx) == raw
+
+    legacy = {
+        "nonce": 3,
+        "to": ROUTER,
+        "value": 5,
+        "gas": 21000,
+        "gasPrice": GAS_PRICE,
+        "data": b"",
+        "chainId": 56,
+    }
+    signed = Account.create().sign_transaction(legacy)
+    node_legacy = {
+        **{k: v for k, v in legacy.items() if k not in ("data", "chainId")},
+        "type": 0,
+        "input": HexBytes(b""),
+        "v": signed.v,
+        "r": HexBytes(signed.r.to_bytes(32, "big")),
+        "s": HexBytes(signed.s.to_bytes(32, "big")),
+    }
+    encoded = TransactionManager._encode_signed_transaction(node_legacy)
+    assert encoded == bytes(signed.raw_transaction)
+
+
+@pytest.mark.asyncio
+async def test_sandwich_is_one_signed_bundle_around_the_victim():
+    node_tx, victim_raw = _victim_tx()
+    tm = build_manager(node_tx)
+
+    result = await tm.execute_sandwich(
+        {"target_tx": _target(), "amount_in": 500.0, "gas_price_wei": GAS_PRICE}
+    )
+
+    assert result["success"] and result["included"]
+    assert result["bundle_hash"] == "0xbundle"
+    assert (result["target_block"], result["included_block"]) == (HEAD + 1, 101)
+    txs, target_block = tm._send_bundle.await_args.args
+    assert target_block == HEAD + 1
+    assert len(txs) == 3 and txs[1] == victim_raw
+
+    front, back = _decode_leg(txs[0]), _decode_leg(txs[2])
+    assert (front["nonce"], back["nonce"]) == (7, 8)
+    assert front["gasPrice"] == back["gasPrice"] == GAS_PRICE
+    assert front["gas"] == back["gas"] == 180_000
+
+    front_in = result["front_in"]
+    assert front["value"] == front_in and back["value"] == 0
+    front_min, front_path, *_ = eth_abi.decode(
+        ["uint256", "address[]", "address", "uint256"], front["args"]
+    )
+    assert front_min == result["front_out"]
+    back_in, back_min, back_path, *_ = eth_abi.decode(
+        ["uint256", "uint256", "address[]", "address", "uint256"], back["args"]
+    )
+    assert back_in == result["front_out"]
+    assert back_min == front_in + 2 * 180_000 * GAS_PRICE
+    assert [a.lower() for a in back_path] == [TOKEN, WETH]
+
+    assert tm._sandwich_stats == {"built": 1, "submitted": 1, "included": 1}
+    assert tm._sandwich_latency["build_to_submit"].count == 1
+    tm._nonce_manager.commit.assert_has_calls(
+        [call(7, result["front_run_tx"]), call(8, result["back_run_tx"])]
+    )
+    tm._nonce_manager.release.assert_not_called()
+    tm.wait_for_receipt.assert_awaited_once_with(result["front_run_tx"], timeout=24)
+
+
+@pytest.mark.asyncio
+async def test_missed_bundle_reports_not_included():
+    node_tx, _ = _victim_tx()
+    tm = build_manager(
+        node_tx,
+        wait_for_receipt=AsyncMock(side_effect=TransactionError("dropped")),
+    )
+
+    result = await tm.execute_sandwich(
+        {"target_tx": _target(), "amount_in": 500.0, "gas_price_wei": GAS_PRICE}
+    )
+
+    assert not result["success"] and not result["included"]
+    assert result["included_block"] is None
+    assert tm._sandwich_stats == {"built": 1, "submitted": 1, "included": 0}
+    tm._nonce_manager.release.assert_has_calls([call(7), call(8)])
+
+
+@pytest.mark.asyncio
+async def test_no_room_to_front_run_consumes_no_nonce():
+    node_tx, _ = _victim_tx()
+    tm = build_manager(node_tx)
+    # The victim accepts exactly its current quote: any front-run reverts it
+    tight = get_amounts_out(VICTIM_IN, HOPS)[-1]
+
+    result = await tm.execute_sandwich(
+        {"target_tx": _target(min_out=tight), "amount_in": 500.0}
+    )
+
+    assert not result["success"]
+    assert "no room" in result["reason"]
+    tm._nonce_manager.get_next_nonces.assert_not_awaited()
+    tm._send_bundle.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rejected_bundle_releases_nonces():
+    node_tx, _ = _victim_tx()
+    tm = build_manager(
+        node_tx, _send_bundle=AsyncMock(side_effect=RuntimeError("relay down"))
+    )
+
+    result = await tm.execute_sandwich(
+        {"target_tx": _target(), "amount_in": 500.0, "gas_price_wei": GAS_PRICE}
+    )
+
+    assert not result["success"]
+    assert "relay down" in result["reason"]
+    tm._nonce_manager.release.assert_has_calls([call(7), call(8)])
+    tm._nonce_manager.commit.assert_not_called()
+    tm.wait_for_receipt.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_scheduled_bundle_tracks_every_spent_nonce():
+    node_tx, victim_raw = _victim_tx()
+    outcome = {
+        "status": "included",
+        "included_block": 102,
+        "inclusion_distance": 1,
+    }
+    scheduled = SimpleNamespace(
+        bundle_hash="0xscheduled", wait=AsyncMock(return_value=outcome)
+    )
+    scheduler = SimpleNamespace(
+        running=True, schedule=AsyncMock(return_value=scheduled)
+    )
+    tm = build_manager(node_tx, _bundle_scheduler=scheduler)
+
+    result = await tm.execute_sandwich(
+        {"target_tx": _target(), "amount_in": 500.0, "gas_price_wei": GAS_PRICE}
+    )
+
+    assert result["success"] and result["bundle_hash"] == "0xscheduled"
+    assert (result["included_block"], result["inclusion_distance"]) == (102, 1)
+    txs, nonces = scheduler.schedule.await_args.args
+    assert txs[1] == victim_raw
+    assert nonces == [(tm._address, 7), (node_tx["from"], 41), (tm._address, 8)]
+    assert scheduler.schedule.await_args.kwargs == {"first_block": HEAD + 1}
+    tm._send_bundle.assert_not_awaited()
+    tm.wait_for_receipt.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "intent, reason",
+    [
+        ({"pool_fee": 3000}, "not a V2 swap"),
+        ({"fees": [500]}, "not a V2 swap"),
+        ({"exact_output": True}, "Exact-output"),
+    ],
+)
+async def test_only_v2_exact_input_targets_are_sandwiched(intent, reason):
+    node_tx, _ = _victim_tx()
+    tm = build_manager(node_tx)
+    target = _target(**intent)
+    if "pool_fee" in intent:
+        target["swap_intent"]["dex"] = "uniswap_v3"
+
+    result = await tm.execute_sandwich(
+        {"target_tx": target, "amount_in": 500.0, "gas_price_wei": GAS_PRICE}
+    )
+
+    assert not result["success"] and reason in result["reason"]
+    tm._nonce_manager.get_next_nonces.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_token_to_weth_victim_needs_no_weth_allowance():
+    node_tx, victim_raw = _victim_tx()
+
+    async def _allowance(token, spender, amount):
+        if token == WETH:
+            raise StrategyExecutionError("Insufficient WETH allowance")
+        return 2**256 - 1
+
+    tm = build_manager(
+        node_tx,
+        _check_token_allowance=AsyncMock(side_effect=_allowance),
+        _check_token_balance=AsyncMock(return_value=10**30),
+    )
+
+    result = await tm.execute_sandwich(
+        {
+            "target_tx": _target(path=(TOKEN, WETH)),
+            "amount_in": 500.0,
+            "gas_price_wei": GAS_PRICE,
+        }
+    )
+
+    assert result["success"], result.get("reason")
+    tm._check_token_allowance.assert_awaited_once_with(
+        TOKEN, ROUTER, result["front_in"]
+    )
+    txs, _ = tm._send_bundle.await_args.args
+    front, back = _decode_leg(txs[0]), _decode_leg(txs[2])
+    # Tokens in for ETH out, then ETH back in for tokens
+    assert front["value"] == 0 and back["value"] == result["front_out"]
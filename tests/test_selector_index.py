@@ -0,0 +1,122 @@
+"""Tests for the 4-byte selector index used for mempool classification."""
+
+import eth_abi
+import pytest
+from eth_utils import function_signature_to_4byte_selector
+
+from on1builder.monitoring.selector_index import (
+    SelectorIndex,
+    classify_function_name,
+    decode_v3_path,
+    get_selector_index,
+)
+
+TOKEN_A = "0x" + "aa" * 20
+TOKEN_B = "0x" + "bb" * 20
+TOKEN_C = "0x" + "cc" * 20
+RECIPIENT = "0x" + "dd" * 20
+
+
+@pytest.fixture(scope="module")
+def index():
+    return get_selector_index()
+
+
+@pytest.mark.parametrize(
+    "selector, name, mev_type, family",
+    [
+        ("38ed1739", "swapExactTokensForTokens", "sandwich_attack", "uniswap_v2"),
+        ("7ff36ab5", "swapExactETHForTokens", "sandwich_attack", "uniswap_v2"),
+        ("414bf389", "exactInputSingle", "sandwich_attack", "uniswap_v3"),
+        ("00a718a9", "liquidationCall", "liquidation", "aave_v3"),
+        ("42b0b77c", "flashLoanSimple", "flash_loan", "aave_v3"),
+        ("ac9650d8", "multicall", "arbitrage", "uniswap_v3"),
+        ("e8e33700", "addLiquidity", None, "uniswap_v2"),
+    ],
+)
+def test_index_classifies_by_selector(index, selector, name, mev_type, family):
+    entry = index.lookup(bytes.fromhex(selector) + b"\x00" * 32)
+    assert entry is not None
+    assert entry.name == name
+    assert entry.mev_type == mev_type
+    assert entry.dex_family == family
+
+
+def test_index_ignores_unknown_and_short_calldata(index):
+    assert index.lookup(b"\xde\xad\xbe\xef") is None
+    assert index.lookup(b"\x38\xed") is None
+    assert index.lookup(b"") is None
+
+
+def test_read_only_functions_have_no_decoder(index):
+    entry = index.lookup(bytes.fromhex("d06ca61f"))  # getAmountsOut
+    assert entry is not None
+    assert entry.decoder is None
+
+
+def test_v2_decoder_maps_named_arguments(index):
+    args = eth_abi.encode(
+        ["uint256", "uint256", "address[]", "address", "uint256"],
+        [5, 10, [TOKEN_A, TOKEN_B], RECIPIENT, 123],
+    )
+    # swapTokensForExactTokens(amountOut, amountInMax, path, to, deadline)
+    entry = index.lookup(bytes.fromhex("8803dbee"))
+    params = entry.decoder(args, 0)
+    assert params["amount_out_min"] == 5
+    assert params["amount_in"] == 10
+    assert params["path"] == [TOKEN_A, TOKEN_B]
+    assert params["recipient"] == RECIPIENT
+    assert params["deadline"] == 123
+    assert params["exact_output"] is True
+
+
+def test_eth_input_swap_uses_tx_value(index):
+    args = eth_abi.encode(
+        ["uint256", "address[]", "address", "uint256"],
+        [7, [TOKEN_A, TOKEN_B], RECIPIENT, 1],
+    )
+    params = index.lookup(bytes.fromhex("7ff36ab5")).decoder(args, 3 * 10**18)
+    assert params["amount_in"] == 3 * 10**18
+    assert params["amount_out_min"] == 7
+    assert params["exact_output"] is False
+
+
+def test_v3_decoders_handle_struct_params(index):
+    single = eth_abi.encode(
+        ["(address,address,uint24,address,uint256,uint256,uint256,uint160)"],
+        [(TOKEN_A, TOKEN_B, 3000, RECIPIENT, 99, 1000, 900, 0)],
+    )
+    params = index.lookup(bytes.fromhex("414bf389")).decoder(single, 0)
+    assert params["path"] == [TOKEN_A, TOKEN_B]
+    assert params["pool_fee"] == 3000
+    assert params["amount_in"] == 1000
+    assert params["amount_out_min"] == 900
+
+    path = (
+        bytes.fromhex(TOKEN_A[2:])
+        + (500).to_bytes(3, "big")
+        + bytes.fromhex(TOKEN_B[2:])
+        + (3000).to_bytes(3, "big")
+        + bytes.fromhex(TOKEN_C[2:])
+    )
+    multi = eth_abi.encode(
+        ["(bytes,address,uint256,uint256,uint256)"],
+        [(path, RECIPIENT, 99, 2000, 1800)],
+    )
+    params = index.lookup(bytes.fromhex("c04b8d59")).decoder(multi, 0)
+    assert params["path"] == [TOKEN_A, TOKEN_B, TOKEN_C]
+    assert params["fees"] == [500, 3000]
+    assert params["amount_in"] == 2000
+
+
+def test_decode_v3_path_rejects_truncated_paths():
+    assert decode_v3_path(b"\x00" * 42) == ([], [])
+    assert decode_v3_path(b"\x00" * 44) == ([], [])
+
+
+def test_register_signature_overrides_classification():
+    index = SelectorIndex()
+    entry = index.register_signature("seizeCollateral(address)", "custom")
+    assert entry.mev_type == "liquidation"
+    assert function_signature_to_4byte_selector("seizeCollateral(address)") in index
+    assert classify_function_name("transfer") is None
@@ -3,7 +3,7 @@
 import asyncio
 from decimal import Decimal
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from pytest import approx
@@ -64,7 +64,10 @@ def build_manager(override_sign_send: bool = True):
         sign_transaction=lambda params: SimpleNamespace(rawTransaction=b"0x")
     )
     tm._nonce_manager = SimpleNamespace(
-        get_next_nonce=AsyncMock(return_value=1), resync_nonce=AsyncMock()
+        get_next_nonce=AsyncMock(return_value=1),
+        resync_nonce=AsyncMock(),
+        commit=Mock(),
+        release=Mock(),
     )
     tm._db_interface = SimpleNamespace(
         save_transaction=AsyncMock(return_value=None),
@@ -293,6 +296,9 @@ async def test_sign_and_send_raises_when_safety_fails():
 
     with pytest.raises(StrategyExecutionError):
         await tm._sign_and_send(tx_params)
+    # Never broadcast: the nonce goes back for reuse
+    tm._nonce_manager.release.assert_called_once_with(1)
+    tm._nonce_manager.commit.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -321,7 +327,10 @@ async def test_sign_and_send_bypasses_balance_checks_when_flag(monkeypatch):
         sign_transaction=lambda params: SimpleNamespace(rawTransaction=b"0x")
     )
     tm._nonce_manager = SimpleNamespace(
-        get_next_nonce=AsyncMock(return_value=1), resync_nonce=AsyncMock()
+        get_next_nonce=AsyncMock(return_value=1),
+        resync_nonce=AsyncMock(),
+        commit=Mock(),
+        release=Mock(),
     )
     tm._db_interface = SimpleNamespace()
     tm._notification_service = SimpleNamespace()
@@ -338,3 +347,4 @@ async def test_sign_and_send_bypasses_balance_checks_when_flag(monkeypatch):
     tx_hash = await tm._sign_and_send(tx_params)
 
     assert tx_hash == "12"
+    tm._nonce_manager.commit.assert_called_once_with(1, "12")
@@ -0,0 +1,63 @@
+"""Tests for the slotted TxAnalysis record and its mapping adapter."""
+
+import pytest
+
+from on1builder.monitoring.tx_analysis import TxAnalysis
+
+TX = {
+    "hash": bytes.fromhex("ab" * 32),
+    "from": "0xdead",
+    "to": "0xbeef",
+    "value": 3 * 10**18,
+    "gasPrice": 40 * 10**9,
+    "gas": 210_000,
+}
+
+
+def _analysis(**overrides):
+    analysis = TxAnalysis.from_tx(TX, bytes.fromhex("38ed1739"))
+    for name, value in overrides.items():
+        setattr(analysis, name, value)
+    return analysis
+
+
+def test_record_is_slotted():
+    analysis = _analysis()
+    assert not hasattr(analysis, "__dict__")
+    with pytest.raises(AttributeError):
+        analysis.unexpected = 1
+
+
+def test_mapping_adapter_exposes_legacy_keys():
+    intent = {"path": ["0xa", "0xb"], "amount_in": 5, "pool_fee": 3000}
+    analysis = _analysis(swap_intent=intent, mev_type="sandwich_attack")
+
+    assert analysis["hash"] == analysis["tx_hash"] == "ab" * 32
+    assert analysis["gasPrice"] == analysis["gas_price"] == 40 * 10**9
+    assert analysis["value_eth"] == pytest.approx(3.0)
+    assert analysis["value_wei"] == 3 * 10**18
+    assert analysis["input_data"] == "0x38ed1739"
+    assert analysis["from"] == "0xdead"
+    assert analysis["swap_path"] == ["0xa", "0xb"]
+    assert analysis["amount_in"] == 5
+    assert analysis["pool_fee"] == 3000
+    assert analysis["fees"] is None
+    assert analysis.get("mev_type") == "sandwich_attack"
+    assert analysis.get("unknown", "fallback") == "fallback"
+    with pytest.raises(KeyError):
+        analysis["unknown"]
+
+
+def test_to_dict_matches_mapping_view():
+    analysis = _analysis()
+    as_dict = analysis.to_dict()
+    assert set(as_dict) == set(analysis)
+    assert len(analysis) == len(as_dict)
+    assert as_dict["swap_intent"] is None
+    assert as_dict["amount_in"] is None
+
+
+def test_string_hash_is_stored_as_bytes():
+    analysis = TxAnalysis.from_tx({**TX, "hash": "0x" + "cd" * 32}, b"")
+    assert analysis.tx_hash == bytes.fromhex("cd" * 32)
+    assert analysis["input_data"] == "0x"
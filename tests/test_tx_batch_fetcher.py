@@ -0,0 +1,119 @@
+"""Tests for the micro-batching pending transaction fetcher."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from web3.exceptions import TransactionNotFound
+
+from on1builder.monitoring.tx_batch_fetcher import TxBatchFetcher
+
+
+def _rpc_tx(tx_hash):
+    return {
+        "hash": tx_hash,
+        "from": "0x" + "a" * 40,
+        "to": "0x" + "b" * 40,
+        "value": "0xde0b6b3a7640000",
+        "gasPrice": "0x3b9aca00",
+        "gas": "0x5208",
+        "input": "0x",
+        "nonce": "0x1",
+    }
+
+
+class BatchProvider:
+    def __init__(self, missing=()):
+        self.batches = []
+        self.missing = set(missing)
+
+    async def make_batch_request(self, requests):
+        self.batches.append([params[0] for _, params in requests])
+        return [
+            {
+                "jsonrpc": "2.0",
+                "id": idx,
+                "result": None if params[0] in self.missing else _rpc_tx(params[0]),
+            }
+            for idx, (_, params) in enumerate(requests)
+        ]
+
+
+def _hash(n):
+    return "0x" + f"{n:064x}"
+
+
+@pytest.mark.asyncio
+async def test_fetcher_coalesces_hashes_into_one_batch():
+    provider = BatchProvider()
+    web3 = SimpleNamespace(provider=provider, eth=SimpleNamespace())
+    fetcher = TxBatchFetcher(web3, max_batch_size=10, linger_ms=5)
+
+    results = await asyncio.gather(*(fetcher.fetch(_hash(i)) for i in range(4)))
+
+    assert len(provider.batches) == 1
+    assert provider.batches[0] == [_hash(i) for i in range(4)]
+    assert results[2]["value"] == 10**18
+    assert results[2]["hash"].hex() == _hash(2)[2:]
+
+    stats = fetcher.get_stats()
+    assert stats["batching"] is True
+    assert stats["batches"] == 1
+    assert stats["fill_ratio"] == pytest.approx(0.4)
+    assert stats["fetch_latency"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fetcher_flushes_when_batch_is_full():
+    provider = BatchProvider()
+    web3 = SimpleNamespace(provider=provider, eth=SimpleNamespace())
+    fetcher = TxBatchFetcher(web3, max_batch_size=2, linger_ms=10_000)
+
+    await asyncio.wait_for(
+        asyncio.gather(*(fetcher.fetch(_hash(i)) for i in range(4))), timeout=1
+    )
+
+    assert [len(batch) for batch in provider.batches] == [2, 2]
+    assert fetcher.get_stats()["fill_ratio"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_fetcher_raises_not_found_and_deduplicates():
+    provider = BatchProvider(missing={_hash(1)})
+    web3 = SimpleNamespace(provider=provider, eth=SimpleNamespace())
+    fetcher = TxBatchFetcher(web3, max_batch_size=10, linger_ms=1)
+
+    results = await asyncio.gather(
+        fetcher.fetch(_hash(0)),
+        fetcher.fetch(_hash(0)),
+        fetcher.fetch(_hash(1)),
+        return_exceptions=True,
+    )
+
+    assert provider.batches == [[_hash(0), _hash(1)]]
+    assert results[0] == results[1]
+    assert isinstance(results[2], TransactionNotFound)
+    assert fetcher.get_stats()["deduplicated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fetcher_falls_back_without_batch_support():
+    class NoBatchProvider:
+        async def make_batch_request(self, requests):
+            raise NotImplementedError
+
+    get_transaction = AsyncMock(side_effect=lambda tx_hash: {"hash": tx_hash})
+    web3 = SimpleNamespace(
+        provider=NoBatchProvider(),
+        eth=SimpleNamespace(get_transaction=get_transaction),
+    )
+    fetcher = TxBatchFetcher(web3, max_batch_size=10, linger_ms=1)
+
+    first = await fetcher.fetch(_hash(0))
+    second = await fetcher.fetch(_hash(1))
+
+    assert first == {"hash": _hash(0)}
+    assert second == {"hash": _hash(1)}
+    assert fetcher.get_stats()["batching"] is False
+    assert get_transaction.await_count == 2
@@ -0,0 +1,160 @@
+"""Tests for new-block pruning of scanner caches and stale opportunities."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from on1builder.monitoring.txpool_scanner import TxPoolScanner
+
+SENDER = "0x" + "aa" * 20
+
+
+def _hash(n):
+    return "0x" + f"{n:064x}"
+
+
+def _tx(n, nonce=0):
+    return {
+        "hash": _hash(n),
+        "from": SENDER,
+        "nonce": nonce,
+        "gasPrice": 10,
+        "value": 0,
+        "input": "0x",
+    }
+
+
+class DummyABIRegistry:
+    def get_monitored_tokens(self, _chain_id):
+        return {}
+
+
+class DummyExecutor:
+    def __init__(self, on_simulate=None):
+        self.executed = []
+        self._on_simulate = on_simulate
+
+    async def simulate_opportunities_batch(self, opportunities):
+        if self._on_simulate:
+            self._on_simulate()
+        return opportunities
+
+    async def execute_opportunity(self, opportunity):
+        self.executed.append(opportunity)
+
+
+def _scanner(monkeypatch, executor=None, web3=None, allow_unsimulated=False):
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.settings",
+        SimpleNamespace(
+            contracts=SimpleNamespace(),
+            chains=[1],
+            allow_unsimulated_trades=allow_unsimulated,
+        ),
+    )
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
+    )
+    scanner = TxPoolScanner(web3 or SimpleNamespace(eth=SimpleNamespace()), executor, 1)
+    scanner._is_relevant_for_mev = lambda _analysis: True
+    return scanner
+
+
+@pytest.mark.asyncio
+async def test_new_block_evicts_included_hashes(monkeypatch):
+    scanner = _scanner(monkeypatch)
+    await scanner._analyze_and_cache(_hash(1), _tx(1))
+    await scanner._analyze_and_cache(_hash(2), _tx(2, nonce=1))
+    scanner._opportunity_cache.put(_hash(1), [{"strategy_type": "back_run"}])
+
+    scanner.on_new_block(10, [bytes.fromhex(_hash(1)[2:])])
+
+    assert _hash(1) not in scanner._tx_analysis_cache
+    assert _hash(1) not in scanner._opportunity_cache
+    assert _hash(2) in scanner._tx_analysis_cache
+    wasted = scanner.get_performance_metrics()["wasted_work_avoided"]
+    assert wasted["analyses_evicted"] == 1
+    assert wasted["opportunities_evicted"] == 1
+
+    # Re-delivered pending copies of a mined tx are not analyzed again
+    await scanner._process_pending_transaction(_tx(1))
+    assert (
+        scanner.get_performance_metrics()["wasted_work_avoided"]["analyses_skipped"]
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_opportunities_for_mined_target_skip_simulation(monkeypatch):
+    executor = DummyExecutor()
+    executor.simulate_opportunities_batch = AsyncMock(return_value=[])
+    scanner = _scanner(monkeypatch, executor)
+    analysis = await scanner._analyze_and_cache(_hash(1), _tx(1))
+    scanner._analyze_for_opportunities = AsyncMock(
+        return_value=[{"strategy_type": "back_run"}]
+    )
+    scanner.on_new_block(10, [_hash(1)])
+
+    await scanner._handle_analysis(analysis, _hash(1), None)
+
+    executor.simulate_opportunities_batch.assert_not_awaited()
+    wasted = scanner.get_performance_metrics()["wasted_work_avoided"]
+    assert wasted["dropped_before_simulation"] == 1
+
+
+@pytest.mark.asyncio
+async def test_target_mined_during_simulation_is_not_executed(monkeypatch):
+    holder = {}
+    executor = DummyExecutor(
+        on_simulate=lambda: holder["scanner"].on_new_block(11, [_hash(1)])
+    )
+    scanner = holder["scanner"] = _scanner(monkeypatch, executor)
+    analysis = await scanner._analyze_and_cache(_hash(1), _tx(1))
+    scanner._analyze_for_opportunities = AsyncMock(
+        return_value=[{"strategy_type": "front_run"}]
+    )
+
+    await scanner._handle_analysis(analysis, _hash(1), None)
+
+    assert executor.executed == []
+    wasted = scanner.get_performance_metrics()["wasted_work_avoided"]
+    assert wasted["dropped_before_execution"] == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_opportunities_are_dropped(monkeypatch):
+    executor = DummyExecutor()
+    scanner = _scanner(monkeypatch, executor, allow_unsimulated=True)
+    analysis = await scanner._analyze_and_cache(_hash(1), _tx(1))
+    fresh = {"execution_deadline": datetime.now() + timedelta(seconds=30)}
+    stale = {"execution_deadline": datetime.now() - timedelta(seconds=1)}
+    scanner._analyze_for_opportunities = AsyncMock(return_value=[fresh, stale])
+
+    await scanner._handle_analysis(analysis, _hash(1), None)
+
+    assert executor.executed == [fresh]
+    wasted = scanner.get_performance_metrics()["wasted_work_avoided"]
+    assert wasted["opportunities_expired"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_to_block_catches_up_with_a_bound(monkeypatch):
+    fetched = []
+
+    async def get_block(number):
+        fetched.append(number)
+        return {"transactions": [_hash(number)]}
+
+    web3 = SimpleNamespace(eth=SimpleNamespace(get_block=get_block))
+    scanner = _scanner(monkeypatch, web3=web3)
+
+    await scanner._sync_to_block(100)
+    await scanner._sync_to_block(100)
+    await scanner._sync_to_block(102)
+    await scanner._sync_to_block(150)
+
+    assert fetched[:3] == [100, 101, 102]
+    assert fetched[3:] == list(range(150 - scanner.MAX_BLOCK_CATCHUP + 1, 151))
+    assert scanner.mempool_state.get_stats()["last_block"] == 150
@@ -0,0 +1,295 @@
+"""Tests for the bounded mempool ingest queue and scanner worker pool."""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from on1builder.monitoring.ingest_queue import IngestQueue
+from on1builder.monitoring.txpool_scanner import TxPoolScanner
+from on1builder.utils.latency_tracker import LatencyTracker, percentile
+
+
+class DummyABIRegistry:
+    def get_monitored_tokens(self, _chain_id):
+        return {}
+
+
+class DummyWeb3:
+    def __init__(self, tx=None):
+        self.eth = SimpleNamespace(
+            get_transaction=AsyncMock(return_value=tx), chain_id=1
+        )
+
+    def from_wei(self, value, unit):
+        if unit == "ether":
+            return Decimal(value) / Decimal(10**18)
+        return value
+
+
+def _patch_scanner(monkeypatch, **overrides):
+    stub_settings = SimpleNamespace(
+        contracts=SimpleNamespace(),
+        chains=[1],
+        allow_unsimulated_trades=True,
+        connection_retry_delay=0.1,
+        **overrides,
+    )
+    monkeypatch.setattr("on1builder.monitoring.txpool_scanner.settings", stub_settings)
+    monkeypatch.setattr(
+        "on1builder.monitoring.txpool_scanner.ABIRegistry", lambda: DummyABIRegistry()
+    )
+    return stub_settings
+
+
+@pytest.mark.asyncio
+async def test_ingest_queue_drop_oldest_keeps_freshest_items():
+    queue = IngestQueue(maxsize=2, shed_policy="drop_oldest")
+    assert queue.put_nowait("a")
+    assert queue.put_nowait("b")
+    assert queue.put_nowait("c")
+
+    first, _ = await queue.get()
+    second, _ = await queue.get()
+    assert (first, second) == ("b", "c")
+
+    stats = queue.get_stats()
+    assert stats["dropped"] == 1
+    assert stats["enqueued"] == 3
+    assert stats["dequeued"] == 2
+    assert stats["high_watermark"] == 2
+    assert stats["depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_ingest_queue_drop_newest_rejects_incoming():
+    queue = IngestQueue(maxsize=1, shed_policy="drop_newest")
+    assert queue.put_nowait("a")
+    assert not queue.put_nowait("b")
+
+    item, enqueued_at = await queue.get()
+    assert item == "a"
+    assert enqueued_at > 0
+    assert queue.get_stats()["dropped"] == 1
+
+
+def test_ingest_queue_rejects_invalid_configuration():
+    with pytest.raises(ValueError):
+        IngestQueue(maxsize=0)
+    with pytest.raises(ValueError):
+        IngestQueue(maxsize=10, shed_policy="random")
+
+
+def test_latency_tracker_snapshot_percentiles():
+    tracker = LatencyTracker(window=100)
+    for value in range(1, 101):
+        tracker.record(float(value))
+
+    snapshot = tracker.snapshot()
+    assert snapshot["count"] == 100
+    assert snapshot["p50_ms"] == 50.0
+    assert snapshot["p99_ms"] == 99.0
+    assert snapshot["max_ms"] == 100.0
+    assert percentile([], 99) == 0.0
+
+
+def test_scanner_applies_per_chain_overrides(monkeypatch):
+    _patch_scanner(
+        monkeypatch,
+        txpool_ingest_queue_size=100,
+        txpool_ingest_workers=4,
+        txpool_shed_policy="drop_oldest",
+        txpool_chain_overrides={
+            "1": {"txpool_ingest_workers": 2, "txpool_shed_policy": "drop_newest"}
+        },
+    )
+    scanner = TxPoolScanner(DummyWeb3(), SimpleNamespace(), chain_id=1)
+
+    ingest = scanner.get_performance_metrics()["ingest"]
+    assert ingest["workers"] == 2
+    assert ingest["capacity"] == 100
+    assert ingest["shed_policy"] == "drop_newest"
+
+
+@pytest.mark.asyncio
+async def test_scanner_workers_drain_queue_and_record_decision_latency(monkeypatch):
+    _patch_scanner(monkeypatch, txpool_ingest_workers=2)
+    tx = {
+        "hash": bytes.fromhex("33" * 32),
+        "from": "0xdead",
+        "to": None,
+        "value": 0,
+        "gasPrice": 1,
+        "gas": 21000,
+        "input": "0x",
+    }
+    scanner = TxPoolScanner(DummyWeb3(tx), SimpleNamespace(), chain_id=1)
+    scanner._ingest_workers = [
+        asyncio.create_task(scanner._ingest_worker())
+        for _ in range(scanner._ingest_worker_count)
+    ]
+
+    for _ in range(5):
+        scanner._ingest_queue.put_nowait(tx["hash"])
+    for _ in range(50):
+        if scanner._processed_tx_count == 5:
+            break
+        await asyncio.sleep(0.01)
+
+    scanner._is_running = True
+    await scanner.stop()
+
+    metrics = scanner.get_performance_metrics()
+    assert scanner._processed_tx_count == 5
+    assert metrics["ingest"]["dequeued"] == 5
+    assert metrics["decision_latency"]["count"] == 5
+    assert scanner._ingest_workers == []
+
+
+class BatchingWeb3(DummyWeb3):
+    """Web3 whose provider answers JSON-RPC batches and records their sizes."""
+
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes = []
+        self.provider = SimpleNamespace(make_batch_request=self._batch)
+
+    async def _batch(self, requests):
+        self.batch_sizes.append(len(requests))
+        await asyncio.sleep(0.001)
+        return [
+            {
+                "jsonrpc": "2.0",
+                "id": idx,
+                "result": {
+                    "hash": params[0],
+                    "from": "0x" + "a" * 40,
+                    "to": None,
+                    "value": "0x0",
+                    "gasPrice": "0x1",
+                    "gas": "0x5208",
+                    "input": "0x",
+                    "nonce": "0x1",
+                },
+            }
+            for idx, (_, params) in enumerate(requests)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_scanner_fetches_a_hash_burst_in_full_batches(monkeypatch):
+    _patch_scanner(
+        monkeypatch,
+        txpool_ingest_workers=8,
+        txpool_fetch_batch_size=50,
+        txpool_load_shedding=False,
+    )
+    web3 = BatchingWeb3()
+    scanner = TxPoolScanner(web3, SimpleNamespace(), chain_id=1)
+    await scanner.start(subscribe=False)
+
+    for n in range(3000):
+        scanner.submit_pending("0x" + f"{n:064x}")
+    await asyncio.wait_for(scanner.wait_idle(), timeout=10)
+    await scanner.stop()
+
+    assert sum(web3.batch_sizes) == 3000
+    # Batches fill from the backlog, not from one hash per worker
+    assert web3.batch_sizes == [50] * 60
+    assert scanner._processed_tx_count == 3000
+    assert scanner.get_performance_metrics()["ingest"]["dequeued"] == 3000
+
+
+@pytest.mark.asyncio
+async def test_ingest_queue_get_batch_splits_backlog_between_consumers():
+    queue = IngestQueue(maxsize=100)
+    consumers = [asyncio.create_task(queue.get_batch(50)) for _ in range(2)]
+    await asyncio.sleep(0)
+    for n in range(10):
+        queue.put_nowait(n)
+
+    first, second = await asyncio.gather(*consumers)
+    for n in range(10, 20):
+        queue.put_nowait(n)
+    # A lone consumer takes the backlog up to its limit
+    third = await queue.get_batch(4)
+
+    assert [item for item, _ in first] == [0, 1, 2, 3, 4]
+    assert [item for item, _ in second] == [5, 6, 7, 8, 9]
+    assert [item for item, _ in third] == [10, 11, 12, 13]
+    assert queue.get_stats()["dequeued"] == 14
+
+
+@pytest.mark.asyncio
+async def test_full_payload_skips_get_transaction(monkeypatch):
+    _patch_scanner(monkeypatch)
+    tx = {
+        "hash": bytes.fromhex("44" * 32),
+        "from": "0xdead",
+        "to": None,
+        "value": 0,
+        "gasPrice": 1,
+        "gas": 21000,
+        "input": "0x",
+    }
+    web3 = DummyWeb3(tx)
+    scanner = TxPoolScanner(web3, SimpleNamespace(), chain_id=1)
+
+    await scanner._process_pending_transaction(tx)
+    await scanner._process_pending_transaction(tx)
+
+    web3.eth.get_transaction.assert_not_awaited()
+    assert scanner._processed_tx_count == 2
+    assert scanner.get_performance_metrics()["subscription"]["rpc_calls_avoided"] == 1
+
+
+class FakeSubscribeEth:
+    def __init__(self, reject_full):
+        self.reject_full = reject_full
+        self.calls = []
+
+    async def subscribe(self, subscription_type, subscription_arg=None, handler=None):
+        self.calls.append(subscription_arg)
+        if subscription_arg is True and self.reject_full:
+            raise ValueError("full transactions not supported")
+        return "0xsub"
+
+
+@pytest.mark.asyncio
+async def test_subscribe_pending_falls_back_to_hash_mode(monkeypatch):
+    _patch_scanner(monkeypatch, txpool_subscription_mode="auto")
+    scanner = TxPoolScanner(DummyWeb3(), SimpleNamespace(), chain_id=1)
+    eth = FakeSubscribeEth(reject_full=True)
+    ws_web3 = SimpleNamespace(eth=eth)
+
+    assert await scanner._subscribe_pending(ws_web3, None) == "0xsub"
+    assert scanner._subscription_mode == "hashes"
+    assert eth.calls == [True, None]
+
+    # Capability is remembered across reconnects
+    await scanner._subscribe_pending(ws_web3, None)
+    assert eth.calls == [True, None, None]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_pending_uses_full_mode_when_supported(monkeypatch):
+    _patch_scanner(monkeypatch, txpool_subscription_mode="auto")
+    scanner = TxPoolScanner(DummyWeb3(), SimpleNamespace(), chain_id=1)
+    eth = FakeSubscribeEth(reject_full=False)
+
+    await scanner._subscribe_pending(SimpleNamespace(eth=eth), None)
+    assert scanner._subscription_mode == "full"
+    assert eth.calls == [True]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_pending_forced_full_mode_raises(monkeypatch):
+    _patch_scanner(monkeypatch, txpool_subscription_mode="full")
+    scanner = TxPoolScanner(DummyWeb3(), SimpleNamespace(), chain_id=1)
+
+    with pytest.raises(ValueError):
+        await scanner._subscribe_pending(
+            SimpleNamespace(eth=FakeSubscribeEth(reject_full=True)), None
+        )
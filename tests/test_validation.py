@@ -473,6 +473,30 @@ class TestValidateCompleteConfig:
         result = validate_complete_config(config)
         assert result["bundle_signer_key"] == "b" * 64
 
+    def test_txpool_websocket_urls_must_be_websocket_lists(self):
+        """Test extra mempool endpoints must be ws:// or wss:// URL lists."""
+        result = validate_complete_config(
+            {"txpool_websocket_urls": {1: ["wss://a.example/ws", "ws://b:8546"]}}
+        )
+        assert result["txpool_websocket_urls"][1][1] == "ws://b:8546"
+
+        with pytest.raises(ValidationError):
+            validate_complete_config(
+                {"txpool_websocket_urls": {1: ["https://a.example"]}}
+            )
+
+    def test_txpool_shed_thresholds_must_be_ordered(self):
+        """Test load shedding exits below the utilization it enters at."""
+        validate_complete_config({"txpool_shed_exit_utilization": 0.5})
+
+        with pytest.raises(ValidationError):
+            validate_complete_config(
+                {
+                    "txpool_shed_enter_utilization": 0.8,
+                    "txpool_shed_exit_utilization": 0.9,
+                }
+            )
+
     def test_config_with_validation_error(self):
         """Test configuration with validation error."""
         config = {"wallet_address": "invalid_address"}